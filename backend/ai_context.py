@@ -0,0 +1,238 @@
+"""Grounding data for the AI chat prompt.
+
+The assistant used to be told about hard-coded sample hotels and flights.
+`GroundingContext` instead injects a short list of real, pre-ranked
+candidates from the hotel, flight and restaurant tables, and only when the
+message asks for them:
+
+    block = grounding.assemble("cheap flights from Delhi to Goa")
+
+* `detect_intents` decides which kinds of data a message needs (hotels,
+  flights, restaurants, or a general trip question) from keywords;
+* cities are recognised against the vocabulary of city names that exist in
+  the tables (refreshed with the summaries);
+* every (kind, city) summary is rendered once by a loader (an indexed query
+  or the in-memory hotel index) and kept for AI_CONTEXT_TTL_SECONDS, so
+  building the prompt is dictionary lookups and string joins. Only known
+  cities are kept: other names (from the /api/ai/data endpoints) are
+  loaded per call, so the cache stays bounded by the tables;
+* sections are added in priority order until AI_CONTEXT_TOKEN_BUDGET
+  (estimated at 4 characters per token) is used up.
+
+Loaders touch the database, so async callers check `is_ready(message)` and
+run `prepare(db, message)` on a worker thread when it is not.
+"""
+import re
+import threading
+import time
+from collections import Counter
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+from hotel_index import normalise
+
+CHARS_PER_TOKEN = 4
+
+INTENT_KEYWORDS = {
+    "hotels": {"hotel", "hotels", "stay", "stays", "resort", "resorts", "room", "rooms", "accommodation",
+               "hostel", "hostels", "lodge", "villa", "villas", "homestay", "homestays"},
+    "flights": {"flight", "flights", "fly", "flying", "airline", "airlines", "airfare", "airfares", "plane"},
+    "restaurants": {"restaurant", "restaurants", "food", "eat", "eating", "dine", "dining", "dinner",
+                    "lunch", "breakfast", "cuisine", "cafe", "cafes"},
+    "trip": {"trip", "itinerary", "plan", "visit", "vacation", "holiday", "weekend", "honeymoon", "tour"},
+}
+# Sections a general trip question gets, with fewer lines each
+TRIP_KINDS = ("hotels", "restaurants")
+_WORD = re.compile(r"[a-z0-9]+")
+
+
+def detect_intents(message: str) -> Set[str]:
+    words = set(_WORD.findall(message.lower()))
+    return {intent for intent, keywords in INTENT_KEYWORDS.items() if words & keywords}
+
+
+class GroundingContext:
+    """Per-city candidate summaries plus budgeted prompt assembly."""
+
+    def __init__(self, loaders: Dict[str, Callable[[Any, Optional[str], Optional[str]], List[Dict[str, Any]]]],
+                 formatters: Dict[str, Callable[[Dict[str, Any]], str]],
+                 cities_loader: Callable[[Any], Iterable[str]],
+                 ttl_seconds: float = 300.0, token_budget: int = 400, per_section: int = 5):
+        self._loaders = loaders
+        self._formatters = formatters
+        self._cities_loader = cities_loader
+        self.ttl_seconds = ttl_seconds
+        self.token_budget = token_budget
+        self.per_section = per_section
+        self._summaries: Dict[Tuple, Tuple[float, List[Dict[str, Any]], List[str]]] = {}
+        self._cities: Dict[str, str] = {}
+        self._city_pattern: Optional[re.Pattern] = None
+        self._cities_loaded_at = 0.0
+        self._lock = threading.Lock()
+        self.assembled = 0
+        self.grounded = 0
+
+    # ----- vocabulary -------------------------------------------------------
+
+    def _vocabulary_fresh(self) -> bool:
+        return self._city_pattern is not None and time.monotonic() - self._cities_loaded_at < self.ttl_seconds
+
+    def load_cities(self, db) -> int:
+        spellings: Dict[str, Counter] = {}
+        for city in self._cities_loader(db):
+            if city and normalise(city):
+                spellings.setdefault(normalise(city), Counter())[city] += 1
+        # Several tables spell a city differently ("Mumbai", "MUMBAI"): keep
+        # the spelling most of them use, preferring one that isn't all caps
+        cities = {key: max(counts, key=lambda c: (counts[c], not c.isupper(), c))
+                  for key, counts in spellings.items()}
+        # Longest names first so "new delhi" wins over "delhi"
+        names = sorted(cities, key=len, reverse=True)
+        pattern = re.compile(r"\b(" + "|".join(re.escape(n) for n in names) + r")\b") if names else None
+        with self._lock:
+            self._cities = cities
+            self._city_pattern = pattern
+            self._cities_loaded_at = time.monotonic()
+        return len(cities)
+
+    def canonical_city(self, db, name: Optional[str]) -> Optional[str]:
+        """Known spelling of `name` ('goa ' -> 'Goa'), or `name` itself."""
+        if not name:
+            return None
+        if not self._vocabulary_fresh():
+            self.load_cities(db)
+        return self._cities.get(normalise(name), name.strip())
+
+    def find_cities(self, message: str) -> List[Tuple[int, str]]:
+        """(position, canonical name) of known cities in `message`, in order."""
+        pattern = self._city_pattern
+        if pattern is None:
+            return []
+        text = normalise(message)
+        found, seen = [], set()
+        for match in pattern.finditer(text):
+            key = match.group(1)
+            if key not in seen:
+                seen.add(key)
+                found.append((match.start(), self._cities[key]))
+        return found
+
+    # ----- plan -------------------------------------------------------------
+
+    def plan(self, message: str) -> List[Tuple[str, Optional[str], Optional[str], int]]:
+        """Sections the message needs: (kind, city, origin, lines), by priority."""
+        intents = detect_intents(message)
+        if not intents:
+            return []
+        found = self.find_cities(message)
+        cities = [name for _, name in found]
+        sections = []
+        if "flights" in intents and cities:
+            text = normalise(message)
+            origin = dest = None
+            if len(found) >= 2:
+                origin, dest = cities[0], cities[1]
+                if re.search(r"\bto\s+$", text[:found[0][0]]):
+                    origin, dest = dest, origin
+            elif re.search(r"\bfrom\s+$", text[:found[0][0]]):
+                origin = cities[0]
+            else:
+                dest = cities[0]
+            sections.append(("flights", dest, origin, self.per_section))
+        for kind in ("hotels", "restaurants"):
+            if kind in intents:
+                city = cities[-1] if cities else None
+                if city is not None:
+                    sections.append((kind, city, None, self.per_section))
+        if "trip" in intents and cities and not sections:
+            for kind in TRIP_KINDS:
+                sections.append((kind, cities[-1], None, max(2, self.per_section // 2)))
+        return sections
+
+    # ----- summaries --------------------------------------------------------
+
+    def _fresh(self, key: Tuple) -> bool:
+        entry = self._summaries.get(key)
+        return entry is not None and time.monotonic() - entry[0] < self.ttl_seconds
+
+    def is_ready(self, message: str) -> bool:
+        """Whether `assemble(message)` can be answered from memory."""
+        return self._vocabulary_fresh() and all(
+            self._fresh((kind, city, origin)) for kind, city, origin, _ in self.plan(message))
+
+    def prepare(self, db, message: str) -> None:
+        """Load the vocabulary and the summaries `message` needs, if stale."""
+        if not self._vocabulary_fresh():
+            self.load_cities(db)
+        for kind, city, origin, _ in self.plan(message):
+            self.summary(db, kind, city, origin)
+
+    def _known(self, name: Optional[str]) -> bool:
+        return name is None or self._cities.get(normalise(name)) == name
+
+    def summary(self, db, kind: str, city: Optional[str], origin: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Ranked candidates for one (kind, city[, origin]), loaded if stale (cached for known cities only)."""
+        key = (kind, city, origin)
+        if self._fresh(key):
+            return self._summaries[key][1]
+        items = self._loaders[kind](db, city, origin)
+        if self._known(city) and self._known(origin):
+            lines = [self._formatters[kind](item) for item in items]
+            self._summaries[key] = (time.monotonic(), items, lines)
+        return items
+
+    def warm(self, db) -> int:
+        """Precompute the per-city summaries for every known city."""
+        self.load_cities(db)
+        count = 0
+        for city in list(self._cities.values()):
+            for kind in ("hotels", "restaurants", "flights"):
+                self.summary(db, kind, city)
+                count += 1
+        return count
+
+    def invalidate(self) -> None:
+        self._summaries.clear()
+        self._cities_loaded_at = 0.0
+
+    # ----- assembly ---------------------------------------------------------
+
+    def assemble(self, message: str) -> str:
+        """Grounding block for `message` from cached summaries ('' if none)."""
+        self.assembled += 1
+        budget = self.token_budget * CHARS_PER_TOKEN
+        parts: List[str] = []
+        for kind, city, origin, lines_wanted in self.plan(message):
+            entry = self._summaries.get((kind, city, origin))
+            if entry is None or not entry[2]:
+                continue
+            if kind == "flights":
+                title = f"Flights {'from ' + origin if origin else ''}{' to ' + city if city else ''}".rstrip()
+            else:
+                title = f"{kind.capitalize()} in {city}"
+            header = f"{title} (live WanderLite data, best first):"
+            if len(header) + 1 > budget:
+                break
+            section = [header]
+            used = len(header) + 1
+            for line in entry[2][:lines_wanted]:
+                if used + len(line) + 1 > budget:
+                    break
+                section.append(line)
+                used += len(line) + 1
+            if len(section) == 1:
+                break
+            parts.append("\n".join(section))
+            budget -= used
+        if not parts:
+            return ""
+        self.grounded += 1
+        return "\n\n".join(parts)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "cities": len(self._cities),
+            "summaries": len(self._summaries),
+            "assembled": self.assembled,
+            "grounded": self.grounded,
+            "token_budget": self.token_budget,
+        }
@@ -0,0 +1,184 @@
+"""Answer cache for the AI chat proxy.
+
+Chat messages repeat a lot ("best hotels in Goa", "Best hotels in Goa?",
+"refund policy for flights please"), and every one used to cost a Gemini
+round trip and quota. `AnswerCache` stores answers keyed by the normalised
+message plus the request `context`:
+
+* exact layer: lowercase, punctuation and filler words stripped, so
+  trivially different spellings of a message share one entry;
+* similarity layer (optional): each message is reduced to a set of word
+  shingles (unigrams + bigrams) and a MinHash signature. Signatures are
+  banded into an LSH table, so finding near-duplicates looks at a handful
+  of candidates instead of every entry. A candidate is reused only if one
+  message's shingles contain the other's (the longer one just adds words,
+  e.g. "... asap") and their exact Jaccard similarity reaches
+  AI_ANSWER_CACHE_SIMILARITY. The containment rule is what keeps
+  "flights from Delhi to Goa" from answering "flights from Goa to Delhi".
+  Only entries with the same context match.
+
+Entries expire after AI_ANSWER_CACHE_TTL_SECONDS and are evicted LRU
+beyond AI_ANSWER_CACHE_MAX_ENTRIES. Used from the event loop only.
+"""
+import json
+import os
+import random
+import re
+import time
+from collections import OrderedDict
+from typing import Any, Dict, FrozenSet, Optional, Tuple
+
+_WORD = re.compile(r"[a-z0-9]+")
+# Words that change the phrasing of a travel question but not its answer
+_FILLER = frozenset("""
+    a an the please pls plz kindly can could would you me i we us my our tell show give list
+    what whats which are is was be some any for of to in on at about find need want looking
+    suggest recommend hey hi hello thanks thank
+""".split())
+_MERSENNE = (1 << 61) - 1
+
+
+def normalise(message: str) -> Tuple[str, ...]:
+    words = _WORD.findall(message.lower())
+    kept = tuple(w for w in words if w not in _FILLER)
+    return kept or tuple(words)
+
+
+def shingles(words: Tuple[str, ...]) -> FrozenSet[str]:
+    return frozenset(words) | frozenset(f"{a} {b}" for a, b in zip(words, words[1:]))
+
+
+def context_key(context: Optional[dict]) -> str:
+    if not context:
+        return ""
+    return json.dumps(context, sort_keys=True, default=str, ensure_ascii=False)
+
+
+class _Entry:
+    __slots__ = ("answer", "expires_at", "context", "shingles", "bands")
+
+    def __init__(self, answer, expires_at, context, shingles, bands):
+        self.answer = answer
+        self.expires_at = expires_at
+        self.context = context
+        self.shingles = shingles
+        self.bands = bands
+
+
+class AnswerCache:
+    """TTL/LRU answer cache with an optional MinHash near-duplicate layer."""
+
+    def __init__(self, max_entries: int = 2048, ttl: float = 3600.0, similarity: Optional[float] = 0.7,
+                 num_perm: int = 32, bands: int = 8):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.similarity = similarity
+        self.rows = num_perm // bands
+        rng = random.Random(1009)
+        self._perms = [(rng.randrange(1, _MERSENNE), rng.randrange(_MERSENNE)) for _ in range(num_perm)]
+        self._entries: "OrderedDict[Tuple[str, Tuple[str, ...]], _Entry]" = OrderedDict()
+        self._lsh: Dict[tuple, set] = {}
+        self.exact_hits = 0
+        self.similar_hits = 0
+        self.misses = 0
+        self.bypasses = 0
+        self.stores = 0
+
+    def _bands(self, context: str, shingle_set: FrozenSet[str]) -> Tuple[tuple, ...]:
+        hashes = [hash(s) & _MERSENNE for s in shingle_set]
+        signature = [min((a * h + b) % _MERSENNE for h in hashes) for a, b in self._perms]
+        rows = self.rows
+        return tuple((context, i, tuple(signature[i * rows:(i + 1) * rows]))
+                     for i in range(len(signature) // rows))
+
+    def _drop(self, key) -> None:
+        entry = self._entries.pop(key)
+        for band in entry.bands:
+            bucket = self._lsh.get(band)
+            if bucket is not None:
+                bucket.discard(key)
+                if not bucket:
+                    del self._lsh[band]
+
+    def _live(self, key) -> Optional[_Entry]:
+        entry = self._entries.get(key)
+        if entry is not None and time.monotonic() >= entry.expires_at:
+            self._drop(key)
+            return None
+        return entry
+
+    def lookup(self, message: str, context: Optional[dict] = None) -> Tuple[Optional[str], Optional[str]]:
+        """Returns (answer, "exact" | "similar") or (None, None)."""
+        ctx = context_key(context)
+        words = normalise(message)
+        key = (ctx, words)
+        entry = self._live(key)
+        if entry is not None:
+            self._entries.move_to_end(key)
+            self.exact_hits += 1
+            return entry.answer, "exact"
+
+        if self.similarity and words:
+            wanted = shingles(words)
+            best_key, best_score = None, self.similarity
+            for band in self._bands(ctx, wanted):
+                for candidate in tuple(self._lsh.get(band, ())):
+                    found = self._live(candidate)
+                    if found is None or not (wanted <= found.shingles or found.shingles <= wanted):
+                        continue
+                    score = len(wanted & found.shingles) / len(wanted | found.shingles)
+                    if score >= best_score:
+                        best_key, best_score = candidate, score
+            if best_key is not None:
+                self._entries.move_to_end(best_key)
+                self.similar_hits += 1
+                return self._entries[best_key].answer, "similar"
+
+        self.misses += 1
+        return None, None
+
+    def store(self, message: str, context: Optional[dict], answer: str) -> None:
+        ctx = context_key(context)
+        words = normalise(message)
+        key = (ctx, words)
+        if key in self._entries:
+            self._drop(key)
+        shingle_set = shingles(words)
+        bands = self._bands(ctx, shingle_set) if self.similarity and words else ()
+        self._entries[key] = _Entry(answer, time.monotonic() + self.ttl, ctx, shingle_set, bands)
+        for band in bands:
+            self._lsh.setdefault(band, set()).add(key)
+        self.stores += 1
+        while len(self._entries) > self.max_entries:
+            self._drop(next(iter(self._entries)))
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._lsh.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        hits = self.exact_hits + self.similar_hits
+        lookups = hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "exact_hits": self.exact_hits,
+            "similar_hits": self.similar_hits,
+            "misses": self.misses,
+            "bypasses": self.bypasses,
+            "hit_rate": round(hits / lookups, 4) if lookups else 0.0,
+            # Every hit is a Gemini call (and its quota) that was not made
+            "upstream_calls_saved": hits,
+        }
+
+
+def _similarity_setting() -> Optional[float]:
+    if os.environ.get("AI_ANSWER_CACHE_SEMANTIC", "1").lower() in ("0", "false", "no"):
+        return None
+    return float(os.environ.get("AI_ANSWER_CACHE_SIMILARITY", "0.7"))
+
+
+ai_answer_cache = AnswerCache(
+    max_entries=int(os.environ.get("AI_ANSWER_CACHE_MAX_ENTRIES", "2048")),
+    ttl=float(os.environ.get("AI_ANSWER_CACHE_TTL_SECONDS", "3600")),
+    similarity=_similarity_setting(),
+)
@@ -0,0 +1,122 @@
+"""Application factory: builds the FastAPI app from the per-domain routers.
+
+    app = create_app()                       # every router
+    app = create_app(["bus", "flight"])      # a worker serving a subset
+
+Router modules are imported here, on demand, rather than by whoever
+imports the models: `scripts/migrate.py` and the other maintenance
+scripts only pay for `database` + `models`, and a worker started with
+APP_ROUTERS=bus,flight never imports (or builds the routes of) the admin,
+AI or restaurant code. Nothing touches the database at import time; the
+MySQL bootstrap and the schema version check run in the startup hook.
+"""
+import importlib
+import logging
+import os
+from pathlib import Path
+from typing import Iterable, Optional
+
+import anyio
+from fastapi import FastAPI
+from fastapi.staticfiles import StaticFiles
+from starlette.middleware.cors import CORSMiddleware
+
+from http_client import close_http_client, start_http_client
+from keyset import NEXT_CURSOR_HEADER, TOTAL_COUNT_HEADER
+from database import SCHEMA_AUTO_MIGRATE, SessionLocal, db_thread_limit, ensure_database, schema
+from models import booking_rollups
+from seat_holds import seat_holds
+
+logger = logging.getLogger(__name__)
+
+# routers/<name>.py, in registration order (the first matching route wins)
+ROUTERS = ("account", "travel", "payments", "bus", "flight", "hotel", "restaurant", "ai", "admin", "realtime")
+
+
+def enabled_routers() -> list:
+    """ROUTERS, or the comma-separated subset named by APP_ROUTERS"""
+    wanted = [name.strip() for name in os.environ.get("APP_ROUTERS", "").split(",") if name.strip()]
+    unknown = set(wanted) - set(ROUTERS)
+    if unknown:
+        raise ValueError(f"Unknown APP_ROUTERS entries: {', '.join(sorted(unknown))}")
+    return [name for name in ROUTERS if name in wanted] if wanted else list(ROUTERS)
+
+
+def check_schema():
+    """Check the schema version; migrate only when the database is behind"""
+    ensure_database()
+    try:
+        current = schema.current()
+    except Exception as e:
+        logger.error(f"Schema version check failed: {e}")
+        return
+    if current == schema.latest:
+        logger.info(f"Database schema is at version {current}")
+        return
+    if current > schema.latest:
+        logger.warning(f"Database schema version {current} is newer than this build ({schema.latest})")
+        return
+    if not SCHEMA_AUTO_MIGRATE:
+        logger.error(f"Database schema is at version {current}, this build needs {schema.latest}: "
+                     f"run scripts/migrate.py")
+        return
+    try:
+        applied = schema.upgrade()
+        logger.info(f"Database schema migrated to version {schema.latest}"
+                    + (f" (applied {', '.join(map(str, applied))})" if applied else " by another worker"))
+    except Exception as e:
+        logger.error(f"Schema migration failed: {e}")
+
+
+async def configure_db_threadpool():
+    limiter = anyio.to_thread.current_default_thread_limiter()
+    size = db_thread_limit()
+    if size is not None:
+        limiter.total_tokens = size
+    logger.info(f"Worker thread pool sized to {limiter.total_tokens} threads")
+
+
+def backfill_booking_rollups():
+    """Fill the rollup table once for databases that predate it"""
+    try:
+        with SessionLocal() as db:
+            if booking_rollups.is_empty(db):
+                count = booking_rollups.rebuild(db)
+                logger.info(f"Booking rollups backfilled with {count} rows")
+    except Exception as e:
+        logger.warning(f"Booking rollups not backfilled at startup: {e}")
+
+
+async def start_seat_hold_sweeper():
+    seat_holds.start_sweeper(SessionLocal)
+
+
+def create_app(routers: Optional[Iterable[str]] = None) -> FastAPI:
+    """The Wanderlite API with `routers` (default: enabled_routers()) registered"""
+    app = FastAPI(title="Wanderlite API")
+    app.add_middleware(
+        CORSMiddleware,
+        allow_credentials=True,
+        allow_origins=os.environ.get('CORS_ORIGINS', '*').split(','),
+        allow_methods=["*"],
+        allow_headers=["*"],
+        expose_headers=[NEXT_CURSOR_HEADER, TOTAL_COUNT_HEADER],
+    )
+
+    # Core hooks first: routers' own startup hooks (index warmers) need the schema
+    app.add_event_handler("startup", check_schema)
+    app.add_event_handler("startup", configure_db_threadpool)
+    app.add_event_handler("startup", start_http_client)
+    app.add_event_handler("startup", backfill_booking_rollups)
+    app.add_event_handler("startup", start_seat_hold_sweeper)
+    app.add_event_handler("shutdown", seat_holds.stop_sweeper)
+    app.add_event_handler("shutdown", close_http_client)
+
+    for name in (enabled_routers() if routers is None else routers):
+        app.include_router(importlib.import_module(f"routers.{name}").router)
+
+    # Serve uploaded files statically in development
+    upload_dir = Path("uploads")
+    upload_dir.mkdir(exist_ok=True)
+    app.mount("/uploads", StaticFiles(directory=str(upload_dir)), name="uploads")
+    return app
@@ -0,0 +1,102 @@
+"""In-process cache of authenticated users, keyed by bearer token.
+
+`get_current_user` runs on nearly every request and, uncached, costs a
+`jwt.decode` plus a users-table lookup even when the same token is polled
+several times a second (seat-lock polling, notification badges). Entries
+live for AUTH_CACHE_TTL_SECONDS (default 60) or until the token expires,
+whichever comes first, and are dropped explicitly whenever the user's
+account changes. AUTH_CACHE_TTL_SECONDS=0 disables the cache.
+"""
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Set
+
+
+class AuthUserCache:
+    """Thread-safe TTL/LRU map of token -> authenticated user."""
+
+    def __init__(self, max_entries: int = 10000, ttl_seconds: float = 60.0):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._entries: "OrderedDict[str, tuple]" = OrderedDict()
+        self._tokens_by_user: Dict[str, Set[str]] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.ttl_seconds > 0 and self.max_entries > 0
+
+    def get(self, token: str) -> Optional[Any]:
+        with self._lock:
+            entry = self._entries.get(token)
+            if entry is None:
+                self.misses += 1
+                return None
+            expires_at, user = entry
+            if time.time() >= expires_at:
+                self._drop(token)
+                self.misses += 1
+                return None
+            self._entries.move_to_end(token)
+            self.hits += 1
+            return user
+
+    def put(self, token: str, user: Any, token_exp: Optional[float] = None) -> None:
+        if not self.enabled:
+            return
+        expires_at = time.time() + self.ttl_seconds
+        if token_exp is not None:
+            expires_at = min(expires_at, token_exp)
+        with self._lock:
+            self._drop(token)
+            self._entries[token] = (expires_at, user)
+            self._tokens_by_user.setdefault(user.id, set()).add(token)
+            while len(self._entries) > self.max_entries:
+                self._drop(next(iter(self._entries)))
+
+    def invalidate_user(self, user_id: str) -> None:
+        """Forget every cached token for `user_id` (profile/password/account changes)."""
+        with self._lock:
+            for token in self._tokens_by_user.pop(user_id, set()):
+                self._entries.pop(token, None)
+            self.invalidations += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._tokens_by_user.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "enabled": self.enabled,
+                "entries": len(self._entries),
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+                "invalidations": self.invalidations,
+                "ttl_seconds": self.ttl_seconds,
+                "max_entries": self.max_entries,
+            }
+
+    def _drop(self, token: str) -> None:
+        entry = self._entries.pop(token, None)
+        if entry is None:
+            return
+        tokens = self._tokens_by_user.get(entry[1].id)
+        if tokens is not None:
+            tokens.discard(token)
+            if not tokens:
+                del self._tokens_by_user[entry[1].id]
+
+
+auth_cache = AuthUserCache(
+    max_entries=int(os.environ.get("AUTH_CACHE_MAX_ENTRIES", "10000")),
+    ttl_seconds=float(os.environ.get("AUTH_CACHE_TTL_SECONDS", "60")),
+)
@@ -0,0 +1,232 @@
+"""Daily booking and revenue rollups for the admin dashboard and reports.
+
+The dashboard used to count bookings per day with seven `DATE(created_at)`
+queries, SUM every transaction and load every service booking into Python
+for the booking report, so each page view got slower as history grew. The
+rollup table keeps one row per
+
+    (day, kind, service_type, status) -> total_count, total_amount
+
+where `kind` names the source table ("service_booking", "booking",
+"transaction"). Readers aggregate a few hundred rollup rows at most,
+whatever the size of the underlying tables.
+
+Rows are maintained incrementally: an `after_flush` listener on the ORM
+session turns every inserted, updated (status / amount / type) or deleted
+source row into +/- deltas and upserts them on the same connection, so
+the rollup commits or rolls back together with the write that caused it.
+Bulk `query.update()` / `query.delete()` bypass the ORM events; run
+`rebuild(db)` (scripts/backfill_booking_rollups.py) after those, or to
+backfill an existing database. Days are UTC calendar days; legacy rows
+without a created_at are kept under the UNDATED day, so they count in
+totals but never fall inside a date range.
+"""
+from collections import defaultdict
+from datetime import timezone
+from typing import Any, Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+from sqlalchemy import delete, event, func, inspect as sa_inspect, literal, select, update
+from sqlalchemy.dialects.mysql import insert as mysql_insert
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+
+# `day` of rows whose created_at is NULL (sorts before every real day)
+UNDATED = ""
+
+_UPSERTS = {"sqlite": sqlite_insert, "mysql": mysql_insert, "mariadb": mysql_insert,
+            "postgresql": postgresql_insert}
+
+
+class RollupSource(NamedTuple):
+    """A table feeding the rollups; attribute names on its ORM model."""
+    kind: str
+    model: Any
+    amount: str
+    service_type: Optional[str] = "service_type"
+    status: str = "status"
+    created_at: str = "created_at"
+    # Used when the row has no service_type column (or it is empty)
+    default_type: str = ""
+
+
+def _keep_history(target, value, oldvalue, initiator):
+    pass
+
+
+def _day(value) -> str:
+    if value is None:
+        return UNDATED
+    if value.tzinfo is not None:
+        value = value.astimezone(timezone.utc)
+    return value.date().isoformat()
+
+
+class BookingRollups:
+    """Incrementally maintained daily counts/amounts per source, type and status."""
+
+    def __init__(self, rollup_model, sources: Iterable[RollupSource]):
+        self.model = rollup_model
+        self.table = rollup_model.__table__
+        self.sources = {source.model: source for source in sources}
+        self.deltas_applied = 0
+        self.rebuilds = 0
+
+    # ----- incremental maintenance -------------------------------------------
+
+    def install(self, session_class) -> None:
+        """Maintain the rollups on every flush of `session_class` sessions."""
+        for source in self.sources.values():
+            for name in self._tracked(source):
+                # active_history loads the old value on assignment even when the
+                # attribute was expired (e.g. after a commit), so the delta can
+                # subtract the row from the bucket it used to be in
+                event.listen(getattr(source.model, name), "set", _keep_history, active_history=True)
+        event.listen(session_class, "before_flush", self._before_flush)
+        event.listen(session_class, "after_flush", self._after_flush)
+
+    @staticmethod
+    def _tracked(source: RollupSource) -> List[str]:
+        return [n for n in (source.amount, source.service_type, source.status, source.created_at) if n]
+
+    def _key(self, source: RollupSource, obj, values: Dict[str, Any]) -> Tuple[str, ...]:
+        service_type = (values[source.service_type] if source.service_type else None) or source.default_type
+        return (_day(values[source.created_at]), source.kind, service_type, values[source.status] or "")
+
+    def _values(self, source: RollupSource, obj, before: bool) -> Dict[str, Any]:
+        """Tracked attributes as of now, or as of before the flush."""
+        state = sa_inspect(obj)
+        values = {}
+        for name in self._tracked(source):
+            history = state.attrs[name].history
+            values[name] = history.deleted[0] if before and history.deleted else getattr(obj, name)
+        return values
+
+    def deltas(self, session) -> Dict[Tuple[str, ...], List[float]]:
+        """(day, kind, service_type, status) -> [count delta, amount delta] for a flush."""
+        deltas: Dict[Tuple[str, ...], List[float]] = defaultdict(lambda: [0, 0.0])
+
+        def add(source, obj, sign, before):
+            values = self._values(source, obj, before)
+            entry = deltas[self._key(source, obj, values)]
+            entry[0] += sign
+            entry[1] += sign * float(values[source.amount] or 0)
+
+        for obj in session.new:
+            source = self.sources.get(type(obj))
+            if source is not None:
+                add(source, obj, 1, before=False)
+        for obj in session.deleted:
+            source = self.sources.get(type(obj))
+            if source is not None:
+                add(source, obj, -1, before=True)
+        for obj in session.dirty:
+            source = self.sources.get(type(obj))
+            if source is None or obj in session.deleted:
+                continue
+            if any(sa_inspect(obj).attrs[name].history.deleted for name in self._tracked(source)):
+                add(source, obj, -1, before=True)
+                add(source, obj, 1, before=False)
+        return {key: value for key, value in deltas.items() if value[0] or value[1]}
+
+    def _before_flush(self, session, flush_context, instances) -> None:
+        # Load what deleted rows need now; after the DELETE they can't be loaded
+        for obj in session.deleted:
+            source = self.sources.get(type(obj))
+            if source is not None:
+                for name in self._tracked(source):
+                    getattr(obj, name)
+
+    def _after_flush(self, session, flush_context) -> None:
+        deltas = self.deltas(session)
+        if deltas:
+            self.apply(session.connection(), deltas)
+
+    def apply(self, conn, deltas: Dict[Tuple[str, ...], List[float]]) -> None:
+        table = self.table
+        c = table.c
+        upsert = _UPSERTS.get(conn.dialect.name)
+        for (day, kind, service_type, status), (count, amount) in deltas.items():
+            key = dict(day=day, kind=kind, service_type=service_type, status=status)
+            if upsert is not None:
+                stmt = upsert(table).values(**key, total_count=count, total_amount=amount)
+                increments = {"total_count": c.total_count + count, "total_amount": c.total_amount + amount}
+                if conn.dialect.name in ("mysql", "mariadb"):
+                    stmt = stmt.on_duplicate_key_update(**increments)
+                else:
+                    stmt = stmt.on_conflict_do_update(index_elements=list(key), set_=increments)
+                conn.execute(stmt)
+            else:
+                where = [c.day == day, c.kind == kind, c.service_type == service_type, c.status == status]
+                result = conn.execute(update(table).where(*where)
+                                      .values(total_count=c.total_count + count,
+                                              total_amount=c.total_amount + amount))
+                if not result.rowcount:
+                    conn.execute(table.insert().values(**key, total_count=count, total_amount=amount))
+            self.deltas_applied += 1
+
+    # ----- backfill ----------------------------------------------------------
+
+    def rebuild(self, db, commit: bool = True) -> int:
+        """Recompute every rollup row from the source tables; returns the row count."""
+        conn = db.connection()
+        conn.execute(delete(self.table))
+        for source in self.sources.values():
+            model = source.model
+            created_at = getattr(model, source.created_at)
+            day = func.date(created_at)
+            service_type = getattr(model, source.service_type) if source.service_type else literal("")
+            status = getattr(model, source.status)
+            rows = conn.execute(
+                select(day, service_type, status, func.count(), func.coalesce(func.sum(getattr(model, source.amount)), 0))
+                .group_by(day, service_type, status)
+            ).all()
+            totals: Dict[Tuple[str, str, str], List[float]] = defaultdict(lambda: [0, 0.0])
+            for d, t, s, n, a in rows:
+                entry = totals[(str(d) if d is not None else UNDATED, t or source.default_type, s or "")]
+                entry[0] += n
+                entry[1] += float(a or 0)
+            if totals:
+                conn.execute(self.table.insert(), [
+                    {"day": d, "kind": source.kind, "service_type": t, "status": s,
+                     "total_count": n, "total_amount": a}
+                    for (d, t, s), (n, a) in totals.items()
+                ])
+        if commit:
+            db.commit()
+        self.rebuilds += 1
+        return db.query(func.count()).select_from(self.table).scalar()
+
+    def is_empty(self, db) -> bool:
+        return db.query(self.model).first() is None
+
+    # ----- reads -------------------------------------------------------------
+
+    def _query(self, db, columns, kind: str, start_day: Optional[str], end_day: Optional[str],
+               statuses: Optional[Iterable[str]]):
+        m = self.model
+        query = db.query(*columns, func.coalesce(func.sum(m.total_count), 0),
+                         func.coalesce(func.sum(m.total_amount), 0.0)).filter(m.kind == kind)
+        if start_day:
+            query = query.filter(m.day >= start_day)
+        if end_day:
+            query = query.filter(m.day <= end_day, m.day != UNDATED)
+        if statuses is not None:
+            query = query.filter(m.status.in_(list(statuses)))
+        return query
+
+    def total(self, db, kind: str, start_day: Optional[str] = None, end_day: Optional[str] = None,
+              statuses: Optional[Iterable[str]] = None) -> Tuple[int, float]:
+        """(count, amount) of one source between two days (inclusive)."""
+        count, amount = self._query(db, [], kind, start_day, end_day, statuses).one()
+        return int(count), float(amount)
+
+    def breakdown(self, db, kind: str, by: str, start_day: Optional[str] = None, end_day: Optional[str] = None,
+                  statuses: Optional[Iterable[str]] = None) -> List[Tuple[str, int, float]]:
+        """(value, count, amount) per `by` column ("day", "service_type" or "status")."""
+        column = getattr(self.model, by)
+        rows = self._query(db, [column], kind, start_day, end_day, statuses).group_by(column).order_by(column)
+        return [(value, int(count), float(amount)) for value, count, amount in rows]
+
+    def stats(self) -> Dict[str, Any]:
+        return {"deltas_applied": self.deltas_applied, "rebuilds": self.rebuilds,
+                "sources": sorted(source.kind for source in self.sources.values())}
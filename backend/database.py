@@ -0,0 +1,133 @@
+"""Database engine, session factory and declarative base.
+
+Importing this module does not touch the database: the MySQL
+`CREATE DATABASE IF NOT EXISTS` bootstrap that used to run at import time
+is `ensure_database()`, called by the app's startup hook and by
+scripts/migrate.py before the schema version check.
+"""
+import asyncio
+import logging
+import os
+from contextlib import asynccontextmanager
+from pathlib import Path
+from typing import AsyncGenerator, AsyncIterator, Generator, Optional
+
+from dotenv import load_dotenv
+from sqlalchemy import create_engine, text
+from sqlalchemy.engine import url as sa_url
+from sqlalchemy.orm import Session, declarative_base, sessionmaker
+from sqlalchemy.pool import QueuePool
+
+from fastapi import Depends
+
+from db_pool import engine_options
+from migrations import MigrationRunner
+from query_monitor import SlowQueryMonitor
+
+logger = logging.getLogger(__name__)
+
+ROOT_DIR = Path(__file__).parent
+load_dotenv(ROOT_DIR / '.env')
+
+# =============================
+# Database setup (MySQL / XAMPP)
+# =============================
+DATABASE_URL = os.environ.get(
+    "MYSQL_URL", "mysql+pymysql://root:@localhost:3306/wanderlite"
+)
+
+engine = create_engine(DATABASE_URL, **engine_options(DATABASE_URL))
+SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+# Slow-query log; SLOW_QUERY_SCAN_CHECK=1 (dev/CI) also flags every full table scan
+slow_queries = SlowQueryMonitor(
+    threshold_ms=float(os.environ.get("SLOW_QUERY_MS", "200")),
+    scan_check=os.environ.get("SLOW_QUERY_SCAN_CHECK", "0") == "1",
+    ignore_tables=[t for t in os.environ.get("SLOW_QUERY_IGNORE_TABLES", "").split(",") if t],
+)
+slow_queries.install(engine)
+
+Base = declarative_base()
+
+# Versioned migrations (migrations.py); startup only reads the version unless it is behind
+schema = MigrationRunner(engine, Base.metadata,
+                         lock_timeout=float(os.environ.get("SCHEMA_MIGRATION_LOCK_TIMEOUT", "300")))
+SCHEMA_AUTO_MIGRATE = os.environ.get("SCHEMA_AUTO_MIGRATE", "1") == "1"
+
+
+def ensure_database() -> None:
+    """Create the MySQL database if it does not exist yet (XAMPP first-time setup)"""
+    parsed_url = sa_url.make_url(DATABASE_URL)
+    # Only attempt MySQL database creation for MySQL URLs
+    if not parsed_url.get_backend_name().startswith("mysql"):
+        return
+    try:
+        tmp_engine = create_engine(parsed_url.set(database=None), pool_pre_ping=True)
+        with tmp_engine.connect() as conn:
+            conn.execution_options(isolation_level="AUTOCOMMIT").execute(
+                text(f"CREATE DATABASE IF NOT EXISTS `{parsed_url.database}` "
+                     f"CHARACTER SET utf8mb4 COLLATE utf8mb4_unicode_ci;")
+            )
+        tmp_engine.dispose()
+    except Exception as e:
+        # Log but continue; the schema check will fail later with a clearer error
+        logger.warning(f"Could not ensure database exists: {e}")
+
+
+def _pool_capacity() -> Optional[int]:
+    pool = engine.pool
+    if isinstance(pool, QueuePool):
+        return pool.size() + max(pool._max_overflow, 0)
+    return None
+
+
+# Requests holding a session at once, capped at what the pool can hand out
+_db_slots = asyncio.Semaphore(_pool_capacity()) if _pool_capacity() else None
+
+
+async def db_slot() -> AsyncGenerator[None, None]:
+    """Admit a request to `get_db` only while the pool has a connection for it.
+
+    FastAPI runs each sync dependency, the handler and its response
+    validation in separate worker-thread hops, and a session keeps its
+    connection from the handler's query until `get_db` closes it. Requests
+    queued on the pool would otherwise sit in worker threads while the
+    requests holding the connections wait for a free thread; here they
+    wait on the event loop instead, holding neither.
+    """
+    async with pool_slot():
+        yield
+
+
+@asynccontextmanager
+async def pool_slot() -> AsyncIterator[None]:
+    """Hold one of the `db_slot` admissions, for sessions opened outside `get_db` (streamed exports)"""
+    if _db_slots is None:
+        yield
+        return
+    async with _db_slots:
+        yield
+
+
+def get_db(_slot: None = Depends(db_slot)) -> Generator[Session, None, None]:
+    db = SessionLocal()
+    try:
+        yield db
+    finally:
+        db.close()
+
+
+def db_thread_limit() -> Optional[int]:
+    """Worker threads for sync (DB-bound) handlers: DB_THREADPOOL_SIZE, else None (AnyIO's default of 40).
+
+    Route handlers that use a Session are plain `def` functions, so FastAPI runs
+    them in the AnyIO thread pool and the event loop stays free for websockets
+    and cheap requests. The limit is deliberately not tied to the connection
+    pool: a request takes one thread token per sync dependency and another for
+    the handler, so with tokens == connections every token can end up waiting
+    on a connection held by a request that is waiting on a token. DB
+    concurrency is bounded by the pool: `db_slot` admits at most as many
+    requests to `get_db` as the pool has connections, so keep this above that.
+    """
+    override = os.environ.get("DB_THREADPOOL_SIZE")
+    return max(1, int(override)) if override else None
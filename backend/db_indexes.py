@@ -0,0 +1,95 @@
+"""Apply the declared indexes to databases created before they existed.
+
+`create_all` only builds indexes together with their table, so an index
+added to a model later (`index=True` or an `Index` in `__table_args__`)
+never reaches an existing SQLite / MySQL database. `ensure_indexes`
+compares the declared indexes with what the inspector reports, one
+inspector call per table, and creates the missing ones:
+
+* an index already present under another name with the same columns
+  (and uniqueness) counts as present, so hand-made indexes are not
+  duplicated;
+* on MySQL the index is built with `ALGORITHM=INPLACE, LOCK=NONE`, so
+  bookings keep being written while a large table is indexed;
+* tables that do not exist yet are left to `create_all`.
+"""
+import logging
+from contextlib import contextmanager
+from typing import List, Tuple
+
+from sqlalchemy import Index, inspect
+from sqlalchemy.engine import Connection
+from sqlalchemy.schema import CreateIndex
+
+logger = logging.getLogger(__name__)
+
+
+def _columns(index: Index) -> Tuple[str, ...]:
+    return tuple(c.name for c in index.columns)
+
+
+def missing_indexes(bind, metadata) -> List[Index]:
+    """Declared indexes the database does not have yet."""
+    inspector = inspect(bind)
+    existing_tables = set(inspector.get_table_names())
+    missing = []
+    for table in metadata.sorted_tables:
+        if table.name not in existing_tables or not table.indexes:
+            continue
+        present = inspector.get_indexes(table.name)
+        names = {ix["name"] for ix in present}
+        shapes = {(tuple(ix["column_names"]), bool(ix["unique"])) for ix in present}
+        for index in sorted(table.indexes, key=lambda ix: ix.name):
+            if index.name not in names and (_columns(index), bool(index.unique)) not in shapes:
+                missing.append(index)
+    return missing
+
+
+def drop_index(conn, table: str, name: str) -> bool:
+    """DROP INDEX if `table` has an index called `name`; True if it was dropped."""
+    if name not in {ix["name"] for ix in inspect(conn).get_indexes(table)}:
+        return False
+    preparer = conn.dialect.identifier_preparer
+    ddl = f"DROP INDEX {preparer.quote(name)}"
+    if conn.dialect.name == "mysql":
+        ddl += f" ON {preparer.quote(table)}"
+    conn.exec_driver_sql(ddl)
+    logger.info(f"Dropped index {name} on {table}")
+    return True
+
+
+def create_index(conn, index: Index) -> None:
+    ddl = str(CreateIndex(index).compile(dialect=conn.dialect))
+    if conn.dialect.name == "mysql":
+        ddl += " ALGORITHM=INPLACE LOCK=NONE"
+    conn.exec_driver_sql(ddl)
+
+
+@contextmanager
+def _connection(bind):
+    if isinstance(bind, Connection):
+        yield bind
+    else:
+        with bind.begin() as conn:
+            yield conn
+
+
+def ensure_indexes(bind, metadata, dry_run: bool = False) -> List[str]:
+    """Create every missing declared index; returns their names.
+
+    `bind` is an engine (one transaction per index) or a connection, whose
+    transaction the caller owns (the migration runner's).
+    """
+    created = []
+    for index in missing_indexes(bind, metadata):
+        if not dry_run:
+            try:
+                with _connection(bind) as conn:
+                    create_index(conn, index)
+            except Exception as e:
+                # e.g. a unique index over rows that are not unique; the others still apply
+                logger.warning(f"Could not create index {index.name}: {e}")
+                continue
+            logger.info(f"Created index {index.name} on {index.table.name}{_columns(index)}")
+        created.append(index.name)
+    return created
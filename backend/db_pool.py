@@ -0,0 +1,119 @@
+"""Connection pool configuration and metrics for the SQLAlchemy engine.
+
+Pool sizing comes from environment variables so it can be tuned per
+deployment without code changes:
+
+    DB_POOL_SIZE       persistent connections kept open       (default 10)
+    DB_MAX_OVERFLOW    extra connections allowed under burst  (default 20)
+    DB_POOL_TIMEOUT    seconds to wait for a free connection  (default 30)
+    DB_POOL_RECYCLE    reconnect connections older than this  (default 1800)
+    DB_POOL_PRE_PING   test connections on checkout (1/0)     (default 1)
+
+`MeteredQueuePool` records how long each checkout waited for a connection,
+which is what tells you whether the pool is too small for real traffic.
+"""
+import os
+import threading
+import time
+from typing import Any, Dict
+
+from sqlalchemy.engine import url as sa_url
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.pool import QueuePool
+
+
+def _env_int(name: str, default: int) -> int:
+    value = os.environ.get(name)
+    return int(value) if value not in (None, "") else default
+
+
+class PoolMetrics:
+    """Thread-safe counters for connection checkouts."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        with self._lock:
+            self.checkouts = 0
+            self.timeouts = 0
+            self.total_wait = 0.0
+            self.max_wait = 0.0
+            self.peak_checked_out = 0
+
+    def record_checkout(self, wait: float, checked_out: int) -> None:
+        with self._lock:
+            self.checkouts += 1
+            self.total_wait += wait
+            self.max_wait = max(self.max_wait, wait)
+            self.peak_checked_out = max(self.peak_checked_out, checked_out)
+
+    def record_timeout(self) -> None:
+        with self._lock:
+            self.timeouts += 1
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            avg_wait = self.total_wait / self.checkouts if self.checkouts else 0.0
+            return {
+                "checkouts": self.checkouts,
+                "timeouts": self.timeouts,
+                "avg_wait_ms": round(avg_wait * 1000, 3),
+                "max_wait_ms": round(self.max_wait * 1000, 3),
+                "peak_checked_out": self.peak_checked_out,
+            }
+
+
+class MeteredQueuePool(QueuePool):
+    """QueuePool that times every wait for a connection."""
+
+    metrics = PoolMetrics()
+
+    def _do_get(self):
+        start = time.perf_counter()
+        try:
+            conn = super()._do_get()
+        except PoolTimeoutError:
+            self.metrics.record_timeout()
+            raise
+        self.metrics.record_checkout(time.perf_counter() - start, self.checkedout())
+        return conn
+
+
+def engine_options(database_url: str) -> Dict[str, Any]:
+    """Keyword arguments for `create_engine` built from the DB_POOL_* env vars."""
+    options: Dict[str, Any] = {
+        "pool_pre_ping": os.environ.get("DB_POOL_PRE_PING", "1").lower() not in ("0", "false", "no"),
+    }
+    url = sa_url.make_url(database_url)
+    if url.get_backend_name() == "sqlite" and url.database in (None, "", ":memory:"):
+        # In-memory SQLite must share a single connection; leave its pool alone
+        return options
+    options.update(
+        poolclass=MeteredQueuePool,
+        pool_size=_env_int("DB_POOL_SIZE", 10),
+        max_overflow=_env_int("DB_MAX_OVERFLOW", 20),
+        pool_timeout=_env_int("DB_POOL_TIMEOUT", 30),
+        pool_recycle=_env_int("DB_POOL_RECYCLE", 1800),
+    )
+    return options
+
+
+def pool_status(engine) -> Dict[str, Any]:
+    """Current pool occupancy plus cumulative checkout metrics."""
+    pool = engine.pool
+    status: Dict[str, Any] = {"pool_class": type(pool).__name__}
+    if isinstance(pool, QueuePool):
+        status.update(
+            size=pool.size(),
+            max_overflow=pool._max_overflow,
+            timeout_seconds=pool._timeout,
+            recycle_seconds=pool._recycle,
+            checked_out=pool.checkedout(),
+            checked_in=pool.checkedin(),
+            overflow=max(pool.overflow(), 0),
+        )
+    if isinstance(pool, MeteredQueuePool):
+        status.update(pool.metrics.snapshot())
+    return status
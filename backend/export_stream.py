@@ -0,0 +1,128 @@
+"""Streaming CSV / NDJSON exports for the admin listings.
+
+The admin list endpoints page through rows with OFFSET/LIMIT, and the
+reports load whole tables with `.all()`; neither can hand a spreadsheet of
+every booking to an admin. With `?export=csv` (or `ndjson`) those
+endpoints return a `StreamingResponse` instead:
+
+    return stream_export(SessionLocal, build_query, columns, export, "bookings")
+
+* `build_query(db)` returns a column query (tuples, not ORM objects, so
+  nothing accumulates in the session's identity map);
+* rows are fetched with `yield_per(EXPORT_BATCH_ROWS)`, which uses a
+  server-side cursor where the driver has one (MySQL's SSCursor; SQLite
+  steps its cursor lazily anyway);
+* every batch is encoded and sent as one chunk, so memory stays at one
+  batch however many rows the export has.
+
+The export opens its own session: the request's `get_db` session is closed
+as soon as the handler returns, before the body is streamed. That session
+keeps a pooled connection for the whole download, so it is admitted like a
+request (`database.pool_slot`), and at most EXPORT_MAX_CONCURRENT exports
+stream at once; further downloads wait for one to finish before their
+first row, leaving the rest of the pool to normal requests.
+"""
+import asyncio
+import csv
+import io
+import json
+import logging
+import os
+from datetime import date, datetime
+from typing import Any, AsyncIterator, Callable, Iterator, Optional, Sequence
+
+from fastapi import HTTPException
+from fastapi.responses import StreamingResponse
+from starlette.concurrency import iterate_in_threadpool, run_in_threadpool
+
+from database import pool_slot
+
+logger = logging.getLogger(__name__)
+
+EXPORT_FORMATS = {
+    "csv": "text/csv; charset=utf-8",
+    "ndjson": "application/x-ndjson",
+}
+EXPORT_BATCH_ROWS = int(os.environ.get("EXPORT_BATCH_ROWS", "1000"))
+EXPORT_MAX_CONCURRENT = max(1, int(os.environ.get("EXPORT_MAX_CONCURRENT", "2")))
+
+# Exports streaming at once (each holds a connection until its download ends)
+_export_slots = asyncio.Semaphore(EXPORT_MAX_CONCURRENT)
+
+
+def _plain(value: Any) -> Any:
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    return value
+
+
+def _csv_chunks(columns: Sequence[str], rows, batch: int) -> Iterator[str]:
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(columns)
+    pending = 0
+    for row in rows:
+        writer.writerow(["" if v is None else _plain(v) for v in row])
+        pending += 1
+        if pending >= batch:
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate()
+            pending = 0
+    yield buffer.getvalue()
+
+
+def _ndjson_chunks(columns: Sequence[str], rows, batch: int) -> Iterator[str]:
+    lines = []
+    for row in rows:
+        lines.append(json.dumps({c: _plain(v) for c, v in zip(columns, row)}, ensure_ascii=False))
+        if len(lines) >= batch:
+            yield "\n".join(lines) + "\n"
+            lines = []
+    if lines:
+        yield "\n".join(lines) + "\n"
+
+
+def export_format(export: Optional[str]) -> Optional[str]:
+    """Validated `?export=` value (None for a normal JSON page)."""
+    if not export:
+        return None
+    fmt = export.lower()
+    if fmt not in EXPORT_FORMATS:
+        raise HTTPException(status_code=400, detail=f"export must be one of: {', '.join(EXPORT_FORMATS)}")
+    return fmt
+
+
+def stream_export(session_factory: Callable[[], Any], build_query: Callable[[Any], Any],
+                  columns: Sequence[str], export: str, name: str,
+                  batch: Optional[int] = None) -> StreamingResponse:
+    """Chunked CSV/NDJSON response of every row `build_query(db)` selects."""
+    fmt = export_format(export)
+    batch = batch or EXPORT_BATCH_ROWS
+    encode = _csv_chunks if fmt == "csv" else _ndjson_chunks
+
+    def chunks() -> Iterator[str]:
+        with session_factory() as db:
+            rows = build_query(db).yield_per(batch)
+            try:
+                yield from encode(columns, rows, batch)
+            except Exception as e:
+                # Headers are already sent; all we can do is stop the body
+                logger.error(f"Export of {name} aborted: {e}")
+                raise
+
+    async def body() -> AsyncIterator[str]:
+        async with _export_slots, pool_slot():
+            rows = chunks()
+            try:
+                async for chunk in iterate_in_threadpool(rows):
+                    yield chunk
+            finally:
+                # A client that disconnects mid-download must not keep the session open
+                await run_in_threadpool(rows.close)
+
+    stamp = datetime.utcnow().strftime("%Y%m%d-%H%M%S")
+    return StreamingResponse(body(), media_type=EXPORT_FORMATS[fmt], headers={
+        "Content-Disposition": f'attachment; filename="{name}-{stamp}.{fmt}"',
+        "Cache-Control": "no-store",
+    })
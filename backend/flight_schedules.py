@@ -0,0 +1,184 @@
+"""Flight schedules materialised ahead of time for a rolling window of dates.
+
+Flight search used to create a missing `flight_schedules` row inside its
+result loop, with a commit and a refresh per flight. The first search of
+a date paid for every insert, and two concurrent searches of the same date
+could both insert a schedule for the same flight.
+
+Schedules are now generated in the background instead: every
+FLIGHT_SCHEDULE_REFRESH_SECONDS (default 3600; 0 runs only the pass at
+startup) the materialiser makes sure every active flight has a schedule
+for each day it operates in the next FLIGHT_SCHEDULE_WINDOW_DAYS (default
+120). The existing (flight_id, flight_date) pairs of a chunk of flights
+are read with one indexed query, and the missing ones are written with
+multi-row INSERT IGNORE / ON CONFLICT DO NOTHING statements of up to
+FLIGHT_SCHEDULE_BATCH rows. The unique key on (flight_id, flight_date)
+turns a schedule inserted concurrently by another worker into a no-op.
+Search only reads; dates beyond the window have no schedules to sell.
+"""
+import asyncio
+import logging
+import os
+import random
+import threading
+import time
+from datetime import date, datetime, timedelta
+from typing import Any, Dict, Iterable, List, Optional
+
+import anyio
+from sqlalchemy import select
+
+from models import AircraftModel, FlightModel, FlightScheduleModel
+from seat_holds import insert_ignore
+
+logger = logging.getLogger(__name__)
+
+# Flights whose existing schedules are read in one query
+_FLIGHT_CHUNK = 200
+
+
+def _chunks(items: List[Any], size: int) -> Iterable[List[Any]]:
+    for i in range(0, len(items), size):
+        yield items[i:i + size]
+
+
+def schedule_row(flight, economy_seats: Optional[int], business_seats: Optional[int], day: date) -> Dict[str, Any]:
+    """The flight_schedules row of `flight` on `day`; seats are None when the aircraft is unknown"""
+    dep_hour, dep_min = map(int, flight.departure_time.split(':'))
+    arr_hour, arr_min = map(int, flight.arrival_time.split(':'))
+    start = datetime(day.year, day.month, day.day)
+    dep_datetime = start.replace(hour=dep_hour, minute=dep_min)
+    arr_datetime = start.replace(hour=arr_hour, minute=arr_min)
+    if flight.is_overnight:
+        arr_datetime = arr_datetime + timedelta(days=1)
+    known = economy_seats is not None
+    return {
+        "flight_id": flight.id,
+        "flight_date": day.isoformat(),
+        "departure_datetime": dep_datetime,
+        "arrival_datetime": arr_datetime,
+        "status": "scheduled",
+        "economy_price": flight.base_price_economy,
+        "business_price": flight.base_price_business,
+        "available_economy": economy_seats if known else 150,
+        "available_business": business_seats if known else 12,
+        "gate": f"G{random.randint(1, 30)}",
+        "terminal": f"T{random.randint(1, 3)}",
+    }
+
+
+class FlightScheduleMaterialiser:
+    """Keeps a schedule for every operating day of every active flight in the window."""
+
+    def __init__(self, window_days: int = 120, refresh_seconds: float = 3600.0, batch: int = 1000):
+        self.window_days = window_days
+        self.refresh_seconds = refresh_seconds
+        self.batch = batch
+        self._task = None
+        self._stats_lock = threading.Lock()
+        self.runs = 0
+        self.inserted = 0
+        self.last_run_ms = 0.0
+        self.horizon: Optional[str] = None
+
+    def materialise(self, db, start: Optional[date] = None, days: Optional[int] = None,
+                    flight_ids: Optional[Iterable[int]] = None) -> int:
+        """Insert the missing schedules of `days` days from `start` (default: the window from today).
+
+        `flight_ids` limits the pass to those flights (e.g. just created).
+        Commits every batch; returns the number of schedules written.
+        """
+        started = time.perf_counter()
+        start = start or date.today()
+        days = self.window_days if days is None else days
+        dates = [start + timedelta(days=n) for n in range(max(days, 0))]
+        if not dates:
+            return 0
+        query = (
+            select(FlightModel.id, FlightModel.departure_time, FlightModel.arrival_time, FlightModel.is_overnight,
+                   FlightModel.days_of_week, FlightModel.base_price_economy, FlightModel.base_price_business,
+                   AircraftModel.economy_seats, AircraftModel.business_seats)
+            .outerjoin(AircraftModel, AircraftModel.id == FlightModel.aircraft_id)
+            .where(FlightModel.is_active == 1)
+        )
+        if flight_ids is not None:
+            query = query.where(FlightModel.id.in_(list(flight_ids)))
+        flights = db.execute(query).all()
+        statement = insert_ignore(db.get_bind().dialect.name, FlightScheduleModel.__table__)
+        first, last = dates[0].isoformat(), dates[-1].isoformat()
+        written = 0
+        for chunk in _chunks(flights, _FLIGHT_CHUNK):
+            existing = set(db.execute(
+                select(FlightScheduleModel.flight_id, FlightScheduleModel.flight_date)
+                .where(FlightScheduleModel.flight_id.in_([flight.id for flight in chunk]),
+                       FlightScheduleModel.flight_date >= first, FlightScheduleModel.flight_date <= last)
+            ).all())
+            rows = []
+            for flight in chunk:
+                operating = {day.strip() for day in (flight.days_of_week or "").split(',')}
+                for day in dates:
+                    if str(day.isoweekday()) in operating and (flight.id, day.isoformat()) not in existing:
+                        rows.append(schedule_row(flight, flight.economy_seats, flight.business_seats, day))
+            for batch in _chunks(rows, max(self.batch, 1)):
+                db.execute(statement, batch)
+                db.commit()
+                written += len(batch)
+        db.commit()
+        with self._stats_lock:
+            self.runs += 1
+            self.inserted += written
+            self.last_run_ms = round((time.perf_counter() - started) * 1000, 2)
+            if flight_ids is None and start <= date.today():
+                self.horizon = last
+        return written
+
+    def _run(self, session_factory) -> int:
+        with session_factory() as db:
+            return self.materialise(db)
+
+    async def _materialise_forever(self, session_factory) -> None:
+        while True:
+            try:
+                written = await anyio.to_thread.run_sync(self._run, session_factory)
+                if written:
+                    logger.info(f"Materialised {written} flight schedules")
+            except Exception as e:
+                logger.warning(f"Flight schedule materialisation failed: {e}")
+            if self.refresh_seconds <= 0:
+                return
+            await asyncio.sleep(self.refresh_seconds)
+
+    def start(self, session_factory) -> None:
+        """Materialise now and then every refresh_seconds on the running event loop (no-op if running)."""
+        if self.window_days <= 0 or (self._task is not None and not self._task.done()):
+            return
+        self._task = asyncio.ensure_future(self._materialise_forever(session_factory))
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    def stats(self) -> Dict[str, Any]:
+        with self._stats_lock:
+            return {
+                "runs": self.runs,
+                "inserted": self.inserted,
+                "last_run_ms": self.last_run_ms,
+                "horizon": self.horizon,
+                "window_days": self.window_days,
+                "refresh_seconds": self.refresh_seconds,
+                "batch": self.batch,
+                "running": self._task is not None and not self._task.done(),
+            }
+
+
+flight_schedules = FlightScheduleMaterialiser(
+    window_days=int(os.environ.get("FLIGHT_SCHEDULE_WINDOW_DAYS", "120")),
+    refresh_seconds=float(os.environ.get("FLIGHT_SCHEDULE_REFRESH_SECONDS", "3600")),
+    batch=int(os.environ.get("FLIGHT_SCHEDULE_BATCH", "1000")),
+)
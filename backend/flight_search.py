@@ -0,0 +1,447 @@
+"""In-memory flight network for POST /api/flight/search.
+
+Search used to find the airports and routes with SQL and then run four
+more lookups per flight (airline, route again, origin, destination), and
+it only listed direct flights. The network keeps one immutable snapshot of
+the airports, airlines, active routes and the weekly timetable of the
+active flights:
+
+  * airports by code and by lower-cased city, for the code-or-city match,
+  * every flight with its airline and endpoints resolved and the static
+    part of its search result built once,
+  * departures per airport and per (origin, destination) pair, sorted by
+    departure minute, so a connection window is a bisect.
+
+A search finds the candidate itineraries in memory and reads the dated
+`flight_schedules` rows (times, fares, seats left) of all their legs with
+one IN query (both directions of a round trip share it). Connecting
+itineraries have one stop. From each first leg's arrival at a hub, only
+second legs departing inside the connection window are looked at: at
+least the minimum connection time later (FLIGHT_MIN_CONNECTION_MINS,
+default 45, on the same airline; FLIGHT_INTERLINE_CONNECTION_MINS,
+default 90, between airlines) and at most FLIGHT_MAX_CONNECTION_MINS
+(default 360) later, on the same or a following day. Up to
+FLIGHT_SEARCH_MAX_CONNECTIONS (default 20) of them are returned,
+cheapest first.
+
+Writes call `invalidate()`; the next search rebuilds the snapshot while
+concurrent searches keep using the previous one. A TTL
+(FLIGHT_NETWORK_TTL_SECONDS, default 300) bounds staleness when another
+process writes to the flight tables.
+"""
+import bisect
+import heapq
+import os
+import threading
+import time
+from datetime import date, timedelta
+from typing import Any, Dict, List, Optional, Sequence, Set, Tuple
+
+from sqlalchemy import select
+
+from models import AirlineModel, AirportModel, FlightModel, FlightRouteModel, FlightScheduleModel
+
+MINUTES_PER_DAY = 24 * 60
+
+
+def _minutes(hhmm: str) -> int:
+    hour, minute = map(int, hhmm.split(':'))
+    return hour * 60 + minute
+
+
+class AirportNotFound(Exception):
+    """No airport matches the origin or destination code/city of a search."""
+
+    def __init__(self, side: str):
+        self.side = side
+        super().__init__(f"{side.capitalize()} airport/city not found")
+
+
+class AirportEntry:
+    __slots__ = ("id", "code", "name", "city", "city_key")
+
+    def __init__(self, row: Sequence):
+        self.id, self.code, self.name, self.city = row
+        self.city_key = (self.city or "").lower()
+
+
+class FlightEntry:
+    """One flight of the timetable: when it flies and its pre-built search result."""
+
+    __slots__ = ("id", "airline_id", "origin", "destination", "departs", "arrives", "days", "summary")
+
+    def __init__(self, row: Sequence, airline: Sequence, origin: AirportEntry, destination: AirportEntry):
+        (flight_id, flight_number, airline_id, departure_time, arrival_time, duration_mins, stops,
+         stop_airports, days_of_week, is_overnight, is_refundable, baggage_allowance, meal_included) = row
+        self.id = flight_id
+        self.airline_id = airline_id
+        self.origin = origin
+        self.destination = destination
+        # Minutes from midnight of the departure day, as the schedule materialiser computes them
+        self.departs = _minutes(departure_time)
+        self.arrives = _minutes(arrival_time) + (MINUTES_PER_DAY if is_overnight else 0)
+        self.days = frozenset(day.strip() for day in (days_of_week or "").split(','))
+        # Same shape as the original per-request dict; the schedule fields are filled in by `result`
+        self.summary = {
+            "schedule_id": None,
+            "flight_id": flight_id,
+            "flight_number": flight_number,
+            "airline_id": airline[0],
+            "airline_name": airline[1],
+            "airline_code": airline[2],
+            "airline_logo": airline[3],
+            "origin_code": origin.code,
+            "origin_city": origin.city,
+            "origin_airport": origin.name,
+            "destination_code": destination.code,
+            "destination_city": destination.city,
+            "destination_airport": destination.name,
+            "departure_time": departure_time,
+            "arrival_time": arrival_time,
+            "departure_datetime": None,
+            "arrival_datetime": None,
+            "duration_mins": duration_mins,
+            "stops": stops,
+            "stop_airports": stop_airports,
+            "is_overnight": is_overnight,
+            "is_refundable": is_refundable,
+            "baggage_allowance": baggage_allowance,
+            "meal_included": meal_included,
+            "economy_price": None,
+            "business_price": None,
+            "available_economy": None,
+            "available_business": None,
+            "gate": None,
+            "terminal": None,
+            "status": None,
+        }
+
+    def operates(self, weekday: int) -> bool:
+        return str(weekday) in self.days
+
+    def result(self, schedule) -> Dict[str, Any]:
+        item = dict(self.summary)
+        item.update({
+            "schedule_id": schedule.id,
+            "departure_datetime": schedule.departure_datetime.isoformat(),
+            "arrival_datetime": schedule.arrival_datetime.isoformat(),
+            "economy_price": schedule.economy_price,
+            "business_price": schedule.business_price,
+            "available_economy": schedule.available_economy,
+            "available_business": schedule.available_business or 0,
+            "gate": schedule.gate,
+            "terminal": schedule.terminal,
+            "status": schedule.status,
+        })
+        return item
+
+
+class ConnectionRules:
+    """Minimum and maximum time between the two legs of a connection."""
+
+    def __init__(self, min_mins: int = 45, interline_mins: int = 90, max_mins: int = 360):
+        self.min_mins = min_mins
+        self.interline_mins = interline_mins
+        self.max_mins = max_mins
+
+    def minimum(self, first: FlightEntry, second: FlightEntry) -> int:
+        return self.min_mins if first.airline_id == second.airline_id else self.interline_mins
+
+    def window(self, first: FlightEntry) -> Tuple[int, int]:
+        """Earliest and latest departure of a second leg, in minutes from the first leg's departure day"""
+        return first.arrives + min(self.min_mins, self.interline_mins), first.arrives + self.max_mins
+
+
+# Column order expected by the entries; the loader selects exactly these
+AIRPORT_COLUMNS = ("id", "code", "name", "city")
+AIRLINE_COLUMNS = ("id", "name", "code", "logo_url")
+FLIGHT_COLUMNS = ("id", "flight_number", "airline_id", "departure_time", "arrival_time", "duration_mins", "stops",
+                  "stop_airports", "days_of_week", "is_overnight", "is_refundable", "baggage_allowance",
+                  "meal_included")
+SCHEDULE_COLUMNS = ("id", "flight_id", "flight_date", "departure_datetime", "arrival_datetime", "economy_price",
+                    "business_price", "available_economy", "available_business", "gate", "terminal", "status")
+
+
+def load_network_rows(db) -> Tuple[List, List, List]:
+    """(airports, airlines, flights on active routes with their endpoints), one query each"""
+    airports = db.execute(select(*[getattr(AirportModel, c) for c in AIRPORT_COLUMNS])).all()
+    airlines = db.execute(select(*[getattr(AirlineModel, c) for c in AIRLINE_COLUMNS])).all()
+    flights = db.execute(
+        select(*[getattr(FlightModel, c) for c in FLIGHT_COLUMNS],
+               FlightRouteModel.origin_airport_id, FlightRouteModel.destination_airport_id)
+        .join(FlightRouteModel, FlightRouteModel.id == FlightModel.route_id)
+        .where(FlightModel.is_active == 1, FlightRouteModel.is_active == 1)
+    ).all()
+    return airports, airlines, flights
+
+
+class _Network:
+    __slots__ = ("by_code", "cities", "departures", "legs", "flights", "generation", "built_at")
+
+    def __init__(self, rows: Tuple[List, List, List], generation: int):
+        airport_rows, airline_rows, flight_rows = rows
+        airports = {row[0]: AirportEntry(row) for row in airport_rows}
+        airlines = {row[0]: row for row in airline_rows}
+        self.by_code: Dict[str, AirportEntry] = {a.code.upper(): a for a in airports.values()}
+        self.cities: Dict[str, List[AirportEntry]] = {}
+        for airport in airports.values():
+            self.cities.setdefault(airport.city_key, []).append(airport)
+
+        self.flights: List[FlightEntry] = []
+        for row in flight_rows:
+            origin, destination = airports.get(row[-2]), airports.get(row[-1])
+            airline = airlines.get(row[2])
+            if origin is None or destination is None or airline is None:
+                continue
+            self.flights.append(FlightEntry(row[:-2], airline, origin, destination))
+
+        by_departure = sorted(self.flights, key=lambda f: (f.departs, f.id))
+        self.departures: Dict[int, List[FlightEntry]] = {}
+        pairs: Dict[Tuple[int, int], List[FlightEntry]] = {}
+        for flight in by_departure:
+            self.departures.setdefault(flight.origin.id, []).append(flight)
+            pairs.setdefault((flight.origin.id, flight.destination.id), []).append(flight)
+        # Per pair: departure minutes (for bisect) alongside the flights in that order
+        self.legs: Dict[Tuple[int, int], Tuple[List[int], List[FlightEntry]]] = {
+            pair: ([f.departs for f in flights], flights) for pair, flights in pairs.items()
+        }
+        self.generation = generation
+        self.built_at = time.monotonic()
+
+    def match(self, query: str) -> List[AirportEntry]:
+        """Airports whose code is `query` or whose city contains it (case-insensitive)"""
+        matches = {}
+        airport = self.by_code.get(query.upper())
+        if airport is not None:
+            matches[airport.id] = airport
+        needle = query.lower()
+        for city_key, airports in self.cities.items():
+            if needle in city_key:
+                for airport in airports:
+                    matches[airport.id] = airport
+        return list(matches.values())
+
+    def itineraries(self, origin_ids: Set[int], dest_ids: Set[int], weekday: int, rules: ConnectionRules,
+                    max_stops: int) -> Tuple[List[FlightEntry], List[Tuple[FlightEntry, FlightEntry, int]]]:
+        """Direct flights and (first, second, days after the first leg's day) connections on `weekday`"""
+        direct, connecting = [], []
+        for origin_id in origin_ids:
+            for first in self.departures.get(origin_id, ()):
+                if not first.operates(weekday):
+                    continue
+                hub = first.destination.id
+                if hub in dest_ids:
+                    direct.append(first)
+                    continue
+                if max_stops < 1 or hub in origin_ids:
+                    continue
+                earliest, latest = rules.window(first)
+                for dest_id in dest_ids:
+                    pair = self.legs.get((hub, dest_id))
+                    if pair is None:
+                        continue
+                    departs, flights = pair
+                    for days in range(earliest // MINUTES_PER_DAY, latest // MINUTES_PER_DAY + 1):
+                        offset = days * MINUTES_PER_DAY
+                        second_weekday = (weekday - 1 + days) % 7 + 1
+                        lo = bisect.bisect_left(departs, earliest - offset)
+                        hi = bisect.bisect_right(departs, latest - offset)
+                        for second in flights[lo:hi]:
+                            if second.operates(second_weekday) and \
+                                    second.departs + offset - first.arrives >= rules.minimum(first, second):
+                                connecting.append((first, second, days))
+        return direct, connecting
+
+
+class FlightNetwork:
+    """Lazily built, write-invalidated snapshot of the bookable flight network."""
+
+    def __init__(self, loader=load_network_rows, ttl_seconds: float = 300.0,
+                 rules: Optional[ConnectionRules] = None, max_connections: int = 20):
+        self._loader = loader
+        self.ttl_seconds = ttl_seconds
+        self.rules = rules or ConnectionRules()
+        self.max_connections = max_connections
+        self._network: Optional[_Network] = None
+        self._generation = 0
+        self._build_lock = threading.Lock()
+
+    def invalidate(self) -> None:
+        """Mark the snapshot stale; call after committing airport, airline, route or flight writes."""
+        self._generation += 1
+
+    def rebuild(self, db) -> int:
+        """Build a fresh snapshot now (startup, after seeding). Returns the flight count."""
+        with self._build_lock:
+            generation = self._generation
+            self._network = _Network(self._loader(db), generation)
+            return len(self._network.flights)
+
+    def _fresh(self, network: Optional[_Network]) -> bool:
+        return network is not None and network.generation == self._generation \
+            and time.monotonic() - network.built_at < self.ttl_seconds
+
+    def snapshot(self, db) -> _Network:
+        """The current network, rebuilt first if stale; pass it to every `search` of one request"""
+        return self._current(db)
+
+    def _current(self, db) -> _Network:
+        network = self._network
+        if self._fresh(network):
+            return network
+        if network is not None and not self._build_lock.acquire(blocking=False):
+            # Another request is already rebuilding; keep serving the old one
+            return network
+        if network is None:
+            self._build_lock.acquire()
+        try:
+            network = self._network
+            if not self._fresh(network):
+                generation = self._generation
+                network = self._network = _Network(self._loader(db), generation)
+            return network
+        finally:
+            self._build_lock.release()
+
+    def search(self, db, origin: str, destination: str, day: date, passengers: int = 1,
+               seat_class: str = "economy", max_stops: int = 1,
+               network: Optional[_Network] = None) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+        """Return (direct flights, connecting itineraries) from `origin` to `destination` leaving on `day`.
+
+        `origin` and `destination` are airport codes or parts of city names;
+        raises AirportNotFound if either matches nothing. Only legs with a
+        schedule on their date and `passengers` seats left in `seat_class`
+        are listed. Sends one query, for the schedules of every candidate leg
+        (plus the load when the network is stale and no `network` is given).
+        """
+        return self.search_legs(db, [(origin, destination, day)], passengers, seat_class, max_stops, network)[0]
+
+    def search_legs(self, db, legs: List[Tuple[str, str, date]], passengers: int = 1,
+                    seat_class: str = "economy", max_stops: int = 1,
+                    network: Optional[_Network] = None) -> List[Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]]:
+        """`search` for several (origin, destination, day) legs, e.g. both ways of a round trip.
+
+        Every leg is matched against the network in memory first, then one
+        query fetches the schedules of all their candidate legs, so a round
+        trip costs the same single statement on one session as a one-way search.
+        """
+        network = network or self._current(db)
+        candidates = []
+        for origin, destination, day in legs:
+            origins = network.match(origin)
+            if not origins:
+                raise AirportNotFound("origin")
+            destinations = network.match(destination)
+            if not destinations:
+                raise AirportNotFound("destination")
+            direct, connecting = network.itineraries({a.id for a in origins}, {a.id for a in destinations},
+                                                     day.isoweekday(), self.rules, max_stops)
+            candidates.append((day, direct, connecting))
+        schedules = self._schedules(db, candidates)
+        return [self._rank(schedules, day, direct, connecting, passengers, seat_class)
+                for day, direct, connecting in candidates]
+
+    def _rank(self, schedules: Dict[Tuple[int, str], Any], day: date, direct: List[FlightEntry],
+              connecting: List[Tuple[FlightEntry, FlightEntry, int]], passengers: int,
+              seat_class: str) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+        def bookable(flight: FlightEntry, days: int = 0):
+            schedule = schedules.get((flight.id, (day + timedelta(days=days)).isoformat()))
+            if schedule is None:
+                # Beyond the materialised window (or not generated yet)
+                return None
+            seats = schedule.available_economy if seat_class == "economy" else (schedule.available_business or 0)
+            return schedule if seat_class not in ("economy", "business") or seats >= passengers else None
+
+        def fare(schedule) -> float:
+            return schedule.economy_price if seat_class == "economy" else (schedule.business_price or 99999)
+
+        results = []
+        for flight in direct:
+            schedule = bookable(flight)
+            if schedule is not None:
+                results.append(flight.result(schedule))
+        results.sort(key=lambda item: item["economy_price"] if seat_class == "economy"
+                     else (item["business_price"] or 99999))
+
+        candidates = []
+        for first, second, days in connecting:
+            first_schedule, second_schedule = bookable(first), bookable(second, days)
+            if first_schedule is None or second_schedule is None:
+                continue
+            layover = (second_schedule.departure_datetime - first_schedule.arrival_datetime).total_seconds() // 60
+            if not self.rules.minimum(first, second) <= layover <= self.rules.max_mins:
+                continue
+            candidates.append((fare(first_schedule) + fare(second_schedule),
+                               second_schedule.arrival_datetime - first_schedule.departure_datetime,
+                               first.id, second.id, first, first_schedule, second, second_schedule, int(layover)))
+        # Only the itineraries returned are built into response dicts
+        cheapest = heapq.nsmallest(self.max_connections, candidates, key=lambda c: c[:4])
+        return results, [_itinerary(*candidate[4:]) for candidate in cheapest]
+
+    def _schedules(self, db, candidates: List[Tuple[date, List[FlightEntry],
+                                                     List[Tuple[FlightEntry, FlightEntry, int]]]]
+                   ) -> Dict[Tuple[int, str], Any]:
+        keys = set()
+        for day, direct, connecting in candidates:
+            keys.update((flight.id, day.isoformat()) for flight in direct)
+            for first, second, days in connecting:
+                keys.add((first.id, day.isoformat()))
+                keys.add((second.id, (day + timedelta(days=days)).isoformat()))
+        if not keys:
+            return {}
+        # Flights x dates (a few days per leg) is a superset of the keys, on the (flight_id, flight_date) index
+        rows = db.execute(select(*[getattr(FlightScheduleModel, c) for c in SCHEDULE_COLUMNS]).where(
+            FlightScheduleModel.flight_id.in_({flight_id for flight_id, _ in keys}),
+            FlightScheduleModel.flight_date.in_({flight_date for _, flight_date in keys})))
+        return {(schedule.flight_id, schedule.flight_date): schedule for schedule in rows}
+
+    def stats(self) -> Dict[str, Any]:
+        network = self._network
+        return {
+            "flights": len(network.flights) if network else 0,
+            "airports": len(network.by_code) if network else 0,
+            "fresh": self._fresh(network),
+            "age_seconds": round(time.monotonic() - network.built_at, 1) if network else None,
+            "ttl_seconds": self.ttl_seconds,
+            "min_connection_mins": self.rules.min_mins,
+            "interline_connection_mins": self.rules.interline_mins,
+            "max_connection_mins": self.rules.max_mins,
+        }
+
+
+def _itinerary(first: FlightEntry, first_schedule, second: FlightEntry, second_schedule,
+               layover: int) -> Dict[str, Any]:
+    """A one-stop itinerary: totals for sorting and filtering, and both legs as bookable segments"""
+    legs = [first.result(first_schedule), second.result(second_schedule)]
+    business = [leg["business_price"] for leg in legs]
+    return {
+        "schedule_ids": [leg["schedule_id"] for leg in legs],
+        "stops": 1,
+        "via_code": first.destination.code,
+        "via_city": first.destination.city,
+        "layover_mins": layover,
+        "origin_code": first.origin.code,
+        "origin_city": first.origin.city,
+        "destination_code": second.destination.code,
+        "destination_city": second.destination.city,
+        "departure_datetime": legs[0]["departure_datetime"],
+        "arrival_datetime": legs[1]["arrival_datetime"],
+        "duration_mins": int((second_schedule.arrival_datetime
+                              - first_schedule.departure_datetime).total_seconds() // 60),
+        "economy_price": sum(leg["economy_price"] for leg in legs),
+        "business_price": sum(business) if None not in business else None,
+        "available_economy": min(leg["available_economy"] for leg in legs),
+        "available_business": min(leg["available_business"] for leg in legs),
+        "segments": legs,
+    }
+
+
+flight_network = FlightNetwork(
+    ttl_seconds=float(os.environ.get("FLIGHT_NETWORK_TTL_SECONDS", "300")),
+    rules=ConnectionRules(
+        min_mins=int(os.environ.get("FLIGHT_MIN_CONNECTION_MINS", "45")),
+        interline_mins=int(os.environ.get("FLIGHT_INTERLINE_CONNECTION_MINS", "90")),
+        max_mins=int(os.environ.get("FLIGHT_MAX_CONNECTION_MINS", "360")),
+    ),
+    max_connections=int(os.environ.get("FLIGHT_SEARCH_MAX_CONNECTIONS", "20")),
+)
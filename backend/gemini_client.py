@@ -0,0 +1,422 @@
+"""Gemini `generateContent` client used by the AI chat proxy.
+
+    answer, model = await gemini.generate(api_key, payload)
+
+* Requests go through the shared pooled client (see http_client.py).
+* The list of models that support `generateContent` is cached and
+  refreshed in the background every GEMINI_MODEL_LIST_TTL_SECONDS, so a
+  chat message does not pay for a model-list round trip.
+* Every model has a circuit breaker. A 429 opens it for the upstream's
+  retry delay (or GEMINI_QUOTA_COOLDOWN_SECONDS), an unknown model for an
+  hour, and repeated errors/timeouts for GEMINI_FAILURE_COOLDOWN_SECONDS.
+  Open models are skipped; once the cooldown passes one probe request is
+  let through (half-open) and its outcome closes or re-opens the breaker.
+* Candidates are raced: the first healthy model is called, and another is
+  started whenever one fails or GEMINI_HEDGE_DELAY_SECONDS pass without an
+  answer, with at most GEMINI_MAX_IN_FLIGHT calls running. The first answer
+  wins and the others are cancelled. Everything happens within
+  GEMINI_DEADLINE_SECONDS; `generate` returns (None, None) when no model
+  answered in time.
+* `stream` uses `streamGenerateContent` (SSE) on the first healthy model
+  that accepts the request and records first-token latency and tokens/s.
+"""
+import asyncio
+import email.utils
+import json
+import logging
+import os
+import time
+from collections import deque
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
+
+import anyio
+import httpx
+
+from http_client import RefreshingCache, fetch_json, get_http_client
+
+logger = logging.getLogger(__name__)
+
+# Older/stable models first: they are less likely to be out of quota
+PRIORITY_MODELS = ["gemini-1.5-flash", "gemini-1.5-pro", "gemini-pro", "gemini-1.0-pro"]
+FALLBACK_MODELS = PRIORITY_MODELS + [
+    "gemini-1.5-flash-8b-001",
+    "gemini-1.5-flash-002",
+    "gemini-1.5-pro-002",
+    "gemini-1.0-pro-002",
+]
+UNKNOWN_MODEL_COOLDOWN_SECONDS = 3600.0
+LIST_RETRY_SECONDS = 60.0
+
+
+def _env_float(name: str, default: str) -> float:
+    return float(os.environ.get(name, default))
+
+
+class ModelBreaker:
+    """Health and quota state of one model."""
+
+    def __init__(self, failure_threshold: int, failure_cooldown: float):
+        self.failure_threshold = failure_threshold
+        self.failure_cooldown = failure_cooldown
+        self.consecutive_failures = 0
+        self.open_until = 0.0
+        self.probing = False
+        self.successes = 0
+        self.failures = 0
+        self.quota_hits = 0
+        self.last_status: Optional[int] = None
+
+    @property
+    def state(self) -> str:
+        if self.open_until == 0.0:
+            return "closed"
+        return "open" if time.monotonic() < self.open_until else "half_open"
+
+    def acquire(self) -> bool:
+        """Whether a call may be made now; claims the half-open probe."""
+        state = self.state
+        if state == "closed":
+            return True
+        if state == "half_open" and not self.probing:
+            self.probing = True
+            return True
+        return False
+
+    def record_success(self) -> None:
+        self.successes += 1
+        self.consecutive_failures = 0
+        self.open_until = 0.0
+        self.probing = False
+        self.last_status = 200
+
+    def record_failure(self, status: Optional[int], cooldown: Optional[float] = None) -> None:
+        self.failures += 1
+        self.consecutive_failures += 1
+        self.last_status = status
+        self.probing = False
+        if status == 429:
+            self.quota_hits += 1
+        if cooldown is None and self.consecutive_failures >= self.failure_threshold:
+            cooldown = self.failure_cooldown
+        if cooldown is not None:
+            self.open_until = time.monotonic() + cooldown
+
+    def release(self) -> None:
+        """Give back a probe whose call was cancelled before it finished."""
+        self.probing = False
+
+    def stats(self) -> Dict[str, Any]:
+        remaining = self.open_until - time.monotonic() if self.open_until else 0.0
+        return {
+            "state": self.state,
+            "open_for_seconds": round(max(remaining, 0.0), 1),
+            "successes": self.successes,
+            "failures": self.failures,
+            "quota_hits": self.quota_hits,
+            "last_status": self.last_status,
+        }
+
+
+def _retry_delay(response: httpx.Response) -> Optional[float]:
+    """Seconds the upstream asked us to wait, from RetryInfo or Retry-After."""
+    try:
+        for detail in response.json().get("error", {}).get("details", []):
+            delay = detail.get("retryDelay")
+            if isinstance(delay, str) and delay.endswith("s"):
+                return float(delay[:-1])
+    except (ValueError, AttributeError):
+        pass
+    header = response.headers.get("retry-after")
+    if header:
+        try:
+            return float(header)
+        except ValueError:
+            parsed = email.utils.parsedate_to_datetime(header)
+            if parsed is not None:
+                return max(parsed.timestamp() - time.time(), 0.0)
+    return None
+
+
+class StreamMetrics:
+    """First-token latency and throughput over the most recent streams."""
+
+    def __init__(self, window: int = 500):
+        self.first_token_ms: deque = deque(maxlen=window)
+        self.tokens_per_second: deque = deque(maxlen=window)
+        self.completed = 0
+        self.cancelled = 0
+        self.broken = 0
+        self.failed = 0
+
+    def record(self, first_token_ms: Optional[float], tokens_per_second: Optional[float],
+               finished: bool) -> None:
+        if finished:
+            self.completed += 1
+        else:
+            self.broken += 1
+        if first_token_ms is not None:
+            self.first_token_ms.append(first_token_ms)
+        if tokens_per_second is not None:
+            self.tokens_per_second.append(tokens_per_second)
+
+    @staticmethod
+    def _percentile(values, pct: float) -> Optional[float]:
+        if not values:
+            return None
+        ordered = sorted(values)
+        return round(ordered[min(len(ordered) - 1, int(len(ordered) * pct))], 1)
+
+    def stats(self) -> Dict[str, Any]:
+        rates = self.tokens_per_second
+        return {
+            "completed": self.completed,
+            "cancelled": self.cancelled,
+            "broken": self.broken,
+            "no_model": self.failed,
+            "first_token_ms_p50": self._percentile(self.first_token_ms, 0.5),
+            "first_token_ms_p95": self._percentile(self.first_token_ms, 0.95),
+            "tokens_per_second_avg": round(sum(rates) / len(rates), 1) if rates else None,
+        }
+
+
+def extract_answer(data: dict) -> Optional[str]:
+    return (
+        (data.get("candidates") or [{}])[0]
+        .get("content", {})
+        .get("parts", [{}])[0]
+        .get("text")
+    )
+
+
+class GeminiClient:
+    """Model discovery, per-model circuit breakers and hedged generation."""
+
+    def __init__(self, base_url: str):
+        self.base_url = base_url
+        self.request_timeout = _env_float("GEMINI_REQUEST_TIMEOUT_SECONDS", "15")
+        self.deadline = _env_float("GEMINI_DEADLINE_SECONDS", "25")
+        self.hedge_delay = _env_float("GEMINI_HEDGE_DELAY_SECONDS", "2")
+        self.max_in_flight = int(os.environ.get("GEMINI_MAX_IN_FLIGHT", "2"))
+        self.max_candidates = int(os.environ.get("GEMINI_MAX_CANDIDATES", "8"))
+        self.quota_cooldown = _env_float("GEMINI_QUOTA_COOLDOWN_SECONDS", "60")
+        self.failure_threshold = int(os.environ.get("GEMINI_FAILURE_THRESHOLD", "3"))
+        self.failure_cooldown = _env_float("GEMINI_FAILURE_COOLDOWN_SECONDS", "30")
+        list_ttl = _env_float("GEMINI_MODEL_LIST_TTL_SECONDS", "600")
+        self.model_lists = RefreshingCache(list_ttl, max(list_ttl * 24, 86400.0), max_entries=8)
+        self._list_retry_at = 0.0
+        self.breakers: Dict[str, ModelBreaker] = {}
+        self.stream_metrics = StreamMetrics()
+        self.answers = 0
+        self.exhausted = 0
+
+    def breaker(self, model: str) -> ModelBreaker:
+        breaker = self.breakers.get(model)
+        if breaker is None:
+            breaker = self.breakers[model] = ModelBreaker(self.failure_threshold, self.failure_cooldown)
+        return breaker
+
+    async def _list_models(self, api_key: str) -> Optional[List[str]]:
+        data = await fetch_json(f"{self.base_url}/models", {"key": api_key}, retries=1)
+        if not isinstance(data, dict):
+            return None
+        available = [
+            model.get("name", "").replace("models/", "")
+            for model in data.get("models", [])
+            if "generateContent" in model.get("supportedGenerationMethods", [])
+        ]
+        logger.info(f"Available Gemini models: {available}")
+        ordered = [m for m in PRIORITY_MODELS if m in available]
+        ordered.extend(m for m in available if m not in ordered)
+        return ordered
+
+    async def candidates(self, api_key: str) -> List[str]:
+        """Models to try, best first; the hard-coded list if listing fails."""
+        models = None
+        if time.monotonic() >= self._list_retry_at:
+            models = await self.model_lists.get_or_load(api_key, lambda: self._list_models(api_key))
+        if not models:
+            # Don't retry a failing model list on every message
+            self._list_retry_at = time.monotonic() + LIST_RETRY_SECONDS
+            models = FALLBACK_MODELS
+        return models[:self.max_candidates]
+
+    async def _call(self, model: str, api_key: str, payload: dict) -> Optional[str]:
+        breaker = self.breaker(model)
+        url = f"{self.base_url}/models/{model}:generateContent"
+        try:
+            response = await get_http_client().post(
+                url, params={"key": api_key}, json=payload, timeout=self.request_timeout)
+        except httpx.HTTPError as e:
+            logger.warning(f"Gemini model {model} error: {e!r}")
+            breaker.record_failure(None)
+            return None
+
+        if response.status_code == 200:
+            breaker.record_success()
+            try:
+                return extract_answer(response.json())
+            except (ValueError, AttributeError, IndexError):
+                return None
+        self._record_rejection(model, response)
+        return None
+
+    def _record_rejection(self, model: str, response: httpx.Response) -> None:
+        breaker = self.breaker(model)
+        if response.status_code == 429:
+            logger.warning(f"⏳ {model}: Quota exceeded - trying next model")
+            breaker.record_failure(429, _retry_delay(response) or self.quota_cooldown)
+        elif response.status_code == 404:
+            breaker.record_failure(404, UNKNOWN_MODEL_COOLDOWN_SECONDS)
+        else:
+            logger.warning(f"❌ Gemini model {model} failed: {response.status_code} {response.text[:200]}")
+            breaker.record_failure(response.status_code)
+
+    async def generate(self, api_key: str, payload: dict) -> Tuple[Optional[str], Optional[str]]:
+        """Race healthy candidates; returns (answer, model) or (None, None)."""
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self.deadline
+        queue = await self.candidates(api_key)
+        pending: Dict[asyncio.Task, str] = {}
+
+        def launch(slots: int) -> None:
+            while queue and slots > 0 and len(pending) < self.max_in_flight:
+                model = queue.pop(0)
+                if not self.breaker(model).acquire():
+                    continue
+                logger.info(f"Trying Gemini model: {model}")
+                pending[asyncio.ensure_future(self._call(model, api_key, payload))] = model
+                slots -= 1
+
+        try:
+            launch(1)
+            while pending:
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                can_hedge = queue and len(pending) < self.max_in_flight
+                done, _ = await asyncio.wait(
+                    pending, timeout=min(remaining, self.hedge_delay) if can_hedge else remaining,
+                    return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    model = pending.pop(task)
+                    answer = task.result()
+                    if answer:
+                        self.answers += 1
+                        logger.info(f"✅ Success with Gemini model: {model}")
+                        return answer, model
+                # Replace each failure; a timer expiry with nothing done starts one hedge
+                launch(len(done) or 1)
+        finally:
+            for task, model in pending.items():
+                task.cancel()
+                self.breaker(model).release()
+        self.exhausted += 1
+        return None, None
+
+    async def _open_stream(self, model: str, api_key: str, payload: dict,
+                           timeout: float) -> Optional[httpx.Response]:
+        """Start `streamGenerateContent` on `model`; None if it was rejected."""
+        client = get_http_client()
+        request = client.build_request(
+            "POST", f"{self.base_url}/models/{model}:streamGenerateContent",
+            params={"key": api_key, "alt": "sse"}, json=payload,
+            timeout=httpx.Timeout(self.request_timeout, connect=timeout, pool=timeout))
+        try:
+            response = await asyncio.wait_for(client.send(request, stream=True), timeout)
+        except asyncio.CancelledError:
+            self.breaker(model).release()
+            raise
+        except (httpx.HTTPError, asyncio.TimeoutError) as e:
+            logger.warning(f"Gemini model {model} error: {e!r}")
+            self.breaker(model).record_failure(None)
+            return None
+        if response.status_code == 200:
+            self.breaker(model).record_success()
+            return response
+        await response.aread()
+        await response.aclose()
+        self._record_rejection(model, response)
+        return None
+
+    async def stream(self, api_key: str, payload: dict) -> AsyncIterator[dict]:
+        """Stream an answer as `{"text": ...}` events, then one summary event.
+
+        Candidates are tried in order until one accepts the request within
+        GEMINI_DEADLINE_SECONDS; a stream is never switched to another model
+        once text has been sent. Yields nothing if no model accepted.
+        Closing the generator (e.g. the browser went away) closes the
+        upstream response, which aborts generation.
+        """
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        deadline = started + self.deadline
+        response = model = None
+        for candidate in await self.candidates(api_key):
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                break
+            if not self.breaker(candidate).acquire():
+                continue
+            logger.info(f"Streaming from Gemini model: {candidate}")
+            response = await self._open_stream(candidate, api_key, payload, remaining)
+            if response is not None:
+                model = candidate
+                break
+        if response is None:
+            self.exhausted += 1
+            self.stream_metrics.failed += 1
+            return
+
+        first_token_at = None
+        words = tokens = 0
+        finished = False
+        try:
+            async for line in response.aiter_lines():
+                if not line.startswith("data:"):
+                    continue
+                try:
+                    chunk = json.loads(line[5:])
+                    text = extract_answer(chunk)
+                except (ValueError, AttributeError, IndexError):
+                    continue
+                tokens = (chunk.get("usageMetadata") or {}).get("candidatesTokenCount", tokens)
+                if text:
+                    if first_token_at is None:
+                        first_token_at = loop.time()
+                    words += len(text.split())
+                    yield {"text": text}
+            finished = True
+        except httpx.HTTPError as e:
+            logger.warning(f"Gemini stream from {model} broke off: {e!r}")
+            self.breaker(model).record_failure(None)
+        except (asyncio.CancelledError, GeneratorExit):
+            self.stream_metrics.cancelled += 1
+            raise
+        finally:
+            # Closing mid-body drops the connection, which stops generation upstream
+            with anyio.CancelScope(shield=True):
+                await response.aclose()
+
+        ended = loop.time()
+        tokens = tokens or words
+        first_token_ms = (first_token_at - started) * 1000 if first_token_at else None
+        generating = ended - (first_token_at or ended)
+        tokens_per_second = tokens / generating if generating > 0 else None
+        if finished:
+            self.answers += 1
+        self.stream_metrics.record(first_token_ms, tokens_per_second, finished)
+        yield {"done": True, "model": model, "complete": finished, "tokens": tokens,
+               "first_token_ms": round(first_token_ms, 1) if first_token_ms else None,
+               "tokens_per_second": round(tokens_per_second, 1) if tokens_per_second else None}
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "answers": self.answers,
+            "exhausted": self.exhausted,
+            "streams": self.stream_metrics.stats(),
+            "model_list": self.model_lists.stats(),
+            "models": {model: breaker.stats() for model, breaker in sorted(self.breakers.items())},
+        }
+
+
+gemini = GeminiClient(os.environ.get("GEMINI_BASE_URL", "https://generativelanguage.googleapis.com/v1beta"))
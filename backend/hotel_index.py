@@ -0,0 +1,290 @@
+"""In-memory search index for POST /api/hotel/search.
+
+The SQL version filtered with `city ILIKE '%x%'` (no index can serve a
+leading wildcard), ran a second COUNT(*) over the same rows and parsed the
+amenities/images JSON of every hit on every request. The index keeps one
+immutable snapshot of the active hotels:
+
+  * hotels bucketed by normalised city name, so a city query only scans
+    the distinct city names and then the matching buckets,
+  * the response summary of each hotel, with JSON columns parsed once,
+  * a precomputed rank per sort order (popularity, price, rating,
+    distance), so a page is a partial sort of the filtered positions.
+
+Filtering, sorting, totals and pagination are then answered from memory.
+Pages can also be requested `after` the sort key of the previous page's
+last hotel (`sort_key`), which stays valid across snapshot rebuilds and
+keeps the partial sort at one page however deep the client scrolls.
+Writes call `invalidate()`; the next search rebuilds the snapshot while
+concurrent searches keep answering from the previous one. A TTL
+(HOTEL_INDEX_TTL_SECONDS, default 300) bounds staleness when another
+process writes to the hotels table.
+"""
+import bisect
+import heapq
+import threading
+import time
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Set, Tuple
+
+from json_columns import loads_cached
+
+def normalise(text: Optional[str]) -> str:
+    """Lower-case and collapse whitespace so 'New  Delhi ' matches 'new delhi'."""
+    return " ".join((text or "").lower().split())
+
+
+def _asc(value) -> Tuple[bool, Any]:
+    # SQL sorts NULL first in ascending order (SQLite and MySQL alike)
+    return (value is not None, value if value is not None else 0)
+
+
+def _desc(value) -> Tuple[bool, Any]:
+    # ...and last in descending order
+    return (value is None, -value if value is not None else 0)
+
+
+# Sort key of a hotel per sort order; every key ends in the id, so the order is total
+SORT_KEYS: Dict[str, Callable[["HotelEntry"], tuple]] = {
+    "popularity": lambda h: (_desc(h.reviews_count), _desc(h.rating), h.id),
+    "price_low": lambda h: (_asc(h.price), h.id),
+    "price_high": lambda h: (_desc(h.price), h.id),
+    "rating": lambda h: (_desc(h.rating), h.id),
+    "distance": lambda h: (_asc(h.distance), h.id),
+}
+
+
+def sort_key(entry: "HotelEntry", sort_by: str) -> tuple:
+    """Key of `entry` in `sort_by` order, for resuming a search `after` it."""
+    return SORT_KEYS.get(sort_by, SORT_KEYS["popularity"])(entry)
+
+
+# Column order expected by HotelEntry; the loader selects exactly these
+COLUMNS = (
+    "id", "name", "slug", "star_category", "hotel_type", "city", "state", "address",
+    "latitude", "longitude", "rating", "reviews_count", "price_per_night", "original_price",
+    "currency", "amenities", "images", "free_cancellation", "breakfast_included",
+    "distance_from_center", "landmark",
+)
+
+
+class HotelEntry:
+    """Filterable fields of one hotel plus its pre-built search summary."""
+
+    __slots__ = ("id", "city_key", "type_key", "star", "price", "rating", "reviews_count",
+                 "distance", "free_cancellation", "breakfast_included", "amenity_keys", "summary")
+
+    def __init__(self, row: Sequence, parsed: Dict[Any, Any]):
+        (hotel_id, name, slug, star, hotel_type, city, state, address, latitude, longitude,
+         rating, reviews_count, price, original_price, currency, amenities_raw, images_raw,
+         free_cancellation, breakfast_included, distance, landmark) = row
+
+        # Seeded hotels share a handful of amenity/image blobs and city names,
+        # so each distinct value is parsed or normalised once per build.
+        amenity_info = parsed.get(("amenities", amenities_raw))
+        if amenity_info is None:
+            names = [a["name"] if isinstance(a, dict) else a for a in loads_cached(amenities_raw, [])]
+            amenity_info = parsed[("amenities", amenities_raw)] = (
+                names[:6], frozenset(normalise(str(a)) for a in names))
+        primary_image = parsed.get(("images", images_raw), False)
+        if primary_image is False:
+            images = loads_cached(images_raw, [])
+            primary_image = images[0]["url"] if images and isinstance(images[0], dict) else (images[0] if images else None)
+            parsed[("images", images_raw)] = primary_image
+        city_key = parsed.get(("city", city))
+        if city_key is None:
+            city_key = parsed[("city", city)] = normalise(city)
+        type_key = parsed.get(("type", hotel_type))
+        if type_key is None:
+            type_key = parsed[("type", hotel_type)] = normalise(hotel_type)
+
+        self.id = hotel_id
+        self.city_key = city_key
+        self.type_key = type_key
+        self.star = star
+        self.price = price
+        self.rating = rating
+        self.reviews_count = reviews_count
+        self.distance = distance
+        self.free_cancellation = free_cancellation == 1
+        self.breakfast_included = breakfast_included == 1
+        self.amenity_keys = amenity_info[1]
+        # Same shape as the original per-request dict; total_price and nights
+        # depend on the request and are filled in by `page_results`.
+        self.summary = {
+            "id": hotel_id,
+            "name": name,
+            "slug": slug,
+            "star_category": star,
+            "hotel_type": hotel_type,
+            "city": city,
+            "state": state,
+            "address": address,
+            "latitude": latitude,
+            "longitude": longitude,
+            "rating": rating,
+            "reviews_count": reviews_count,
+            "price_per_night": price,
+            "total_price": None,
+            "original_price": original_price,
+            "currency": currency,
+            "primary_image": primary_image,
+            "amenities": list(amenity_info[0]),
+            "free_cancellation": self.free_cancellation,
+            "breakfast_included": self.breakfast_included,
+            "distance_from_center": distance,
+            "landmark": landmark,
+            "nights": None,
+        }
+
+
+class _Snapshot:
+    __slots__ = ("entries", "city_buckets", "ranks", "sorted_keys", "generation", "built_at", "_city_matches")
+
+    def __init__(self, rows: Iterable, generation: int):
+        parsed: Dict[Any, Any] = {}
+        self.entries: List[HotelEntry] = [HotelEntry(row, parsed) for row in rows]
+        self.city_buckets: Dict[str, List[int]] = {}
+        for pos, entry in enumerate(self.entries):
+            self.city_buckets.setdefault(entry.city_key, []).append(pos)
+
+        e = self.entries
+        self.ranks: Dict[str, List[int]] = {}
+        # Keys in rank order, to turn an `after` key into a rank cut-off
+        self.sorted_keys: Dict[str, List[tuple]] = {}
+        for order, key in SORT_KEYS.items():
+            keys = [key(h) for h in e]
+            rank = [0] * len(e)
+            by_rank = sorted(range(len(e)), key=keys.__getitem__)
+            for r, pos in enumerate(by_rank):
+                rank[pos] = r
+            self.ranks[order] = rank
+            self.sorted_keys[order] = [keys[pos] for pos in by_rank]
+
+        self.generation = generation
+        self.built_at = time.monotonic()
+        self._city_matches: Dict[str, List[int]] = {}
+
+    def city_positions(self, needle: str) -> List[int]:
+        """Positions of hotels whose city contains `needle` (ILIKE '%needle%')."""
+        cached = self._city_matches.get(needle)
+        if cached is None:
+            cached = []
+            for city_key, positions in self.city_buckets.items():
+                if needle in city_key:
+                    cached.extend(positions)
+            if len(self._city_matches) < 4096:
+                self._city_matches[needle] = cached
+        return cached
+
+
+class HotelSearchIndex:
+    """Lazily built, write-invalidated snapshot of the active hotels."""
+
+    def __init__(self, loader: Callable[[Any], Iterable], ttl_seconds: float = 300.0):
+        self._loader = loader
+        self.ttl_seconds = ttl_seconds
+        self._snapshot: Optional[_Snapshot] = None
+        self._generation = 0
+        self._build_lock = threading.Lock()
+
+    def invalidate(self) -> None:
+        """Mark the snapshot stale; call after committing hotel writes."""
+        self._generation += 1
+
+    def rebuild(self, db) -> int:
+        """Build a fresh snapshot now (startup, after seeding). Returns hotel count."""
+        with self._build_lock:
+            generation = self._generation
+            self._snapshot = _Snapshot(self._loader(db), generation)
+            return len(self._snapshot.entries)
+
+    def _fresh(self, snap: Optional[_Snapshot]) -> bool:
+        return snap is not None and snap.generation == self._generation \
+            and time.monotonic() - snap.built_at < self.ttl_seconds
+
+    def _current(self, db) -> _Snapshot:
+        snap = self._snapshot
+        if self._fresh(snap):
+            return snap
+        if snap is not None and not self._build_lock.acquire(blocking=False):
+            # Another request is already rebuilding; keep serving the old one
+            return snap
+        if snap is None:
+            self._build_lock.acquire()
+        try:
+            snap = self._snapshot
+            if not self._fresh(snap):
+                generation = self._generation
+                snap = self._snapshot = _Snapshot(self._loader(db), generation)
+            return snap
+        finally:
+            self._build_lock.release()
+
+    def search(self, db, city: str, star_rating: Optional[Sequence[int]] = None,
+               min_price: Optional[float] = None, max_price: Optional[float] = None,
+               hotel_type: Optional[str] = None, amenities: Optional[Sequence[str]] = None,
+               free_cancellation: Optional[bool] = None, breakfast_included: Optional[bool] = None,
+               sort_by: str = "popularity", offset: int = 0, limit: int = 20,
+               after: Optional[tuple] = None,
+               available: Optional[Callable[[List[int]], Set[int]]] = None) -> Tuple[int, List[HotelEntry]]:
+        """Return (total matches, entries for the requested page).
+
+        With `after` (a `sort_key` from an earlier page) the page starts
+        right after that hotel and `offset` is ignored; raises ValueError
+        if the key does not fit `sort_by`. `available`, if given, is called
+        once with the ids of every match and returns those to keep (room
+        inventory lives in the database, not in the snapshot).
+        """
+        snap = self._current(db)
+        entries = snap.entries
+        stars = set(star_rating) if star_rating else None
+        type_needle = normalise(hotel_type) if hotel_type else None
+        wanted = [normalise(a) for a in amenities] if amenities else None
+
+        hits = []
+        for pos in snap.city_positions(normalise(city)):
+            h = entries[pos]
+            if stars is not None and h.star not in stars:
+                continue
+            # Falsy bounds are ignored, as in the original SQL filters
+            if min_price and h.price < min_price:
+                continue
+            if max_price and h.price > max_price:
+                continue
+            if type_needle and type_needle not in h.type_key:
+                continue
+            if free_cancellation and not h.free_cancellation:
+                continue
+            if breakfast_included and not h.breakfast_included:
+                continue
+            if wanted and not all(a in h.amenity_keys for a in wanted):
+                continue
+            hits.append(pos)
+        if available is not None and hits:
+            keep = available([entries[pos].id for pos in hits])
+            hits = [pos for pos in hits if entries[pos].id in keep]
+
+        rank = snap.ranks.get(sort_by, snap.ranks["popularity"])
+        if after is not None:
+            try:
+                cutoff = bisect.bisect_right(snap.sorted_keys.get(sort_by, snap.sorted_keys["popularity"]), after)
+            except TypeError:
+                raise ValueError("cursor does not match the sort order")
+            remaining = [pos for pos in hits if rank[pos] >= cutoff]
+            top = heapq.nsmallest(limit, remaining, key=rank.__getitem__) if limit > 0 else []
+            return len(hits), [entries[pos] for pos in top]
+        offset = max(offset, 0)
+        top = heapq.nsmallest(offset + limit, hits, key=rank.__getitem__) if limit > 0 else []
+        return len(hits), [entries[pos] for pos in top[offset:]]
+
+
+def page_results(hits: Sequence[HotelEntry], nights: int, rooms: int) -> List[Dict[str, Any]]:
+    """Copy the cached summaries and fill in the request-dependent fields."""
+    results = []
+    for h in hits:
+        item = dict(h.summary)
+        item["total_price"] = h.price * nights * rooms
+        item["nights"] = nights
+        results.append(item)
+    return results
+
@@ -0,0 +1,202 @@
+"""Per-night hotel room inventory on `hotel_room_availability`.
+
+Bookings used to check and decrement `HotelRoomModel.available_rooms`,
+a single number for every date, read and written back in Python. A room
+sold out for one weekend was sold out for all of them, and two concurrent
+bookings of the last room could both pass the check.
+
+Inventory is now kept per room and night, in `hotel_room_availability`
+(unique on room_id + date). A night without a row has the room's
+`total_rooms` free at its `price_per_night`; the row is created the first
+time that night is booked.
+
+* `reserve` takes `rooms` rooms for every night of the stay in one
+  conditional UPDATE (`available_rooms >= rooms`, not blocked). If it
+  matches fewer nights than the stay has, the transaction is rolled back
+  and nothing is taken. On MySQL the UPDATE's row locks order concurrent
+  bookings and each one re-checks the condition against the committed
+  count; on SQLite the database write lock does, and an in-process
+  striped lock keeps threads of one worker booking the same room from
+  contending for it.
+* `release` gives the rooms back on cancellation with one UPDATE.
+* `free_rooms` and `hotels_with_free_rooms` answer "how many rooms are
+  free on every night of the stay" with one grouped range scan of the
+  (room_id, date) key, for the room list and the search filter.
+"""
+import os
+import threading
+import zlib
+from datetime import datetime, timedelta
+from typing import Any, Dict, Iterable, List, Set, Tuple
+
+from sqlalchemy import and_, func, select, update
+
+from models import HotelRoomAvailabilityModel, HotelRoomModel
+from seat_holds import insert_ignore
+
+DATE_FORMAT = "%Y-%m-%d"
+
+
+def stay_dates(check_in: str, check_out: str) -> List[str]:
+    """The nights of a stay (YYYY-MM-DD); at least one, as bookings charge for one night minimum"""
+    start = datetime.strptime(check_in, DATE_FORMAT)
+    nights = max(1, (datetime.strptime(check_out, DATE_FORMAT) - start).days)
+    return [(start + timedelta(days=n)).strftime(DATE_FORMAT) for n in range(nights)]
+
+
+def _stay(room_id: int, dates: List[str]):
+    """WHERE clause for the inventory rows of a stay: one range of the (room_id, date) key"""
+    model = HotelRoomAvailabilityModel
+    return and_(model.room_id == room_id, model.date >= dates[0], model.date <= dates[-1])
+
+
+def _free(total: int, lowest, nights_with_rows: int, blocked, nights: int) -> int:
+    """Rooms free on every night, from the aggregate of the stay's inventory rows"""
+    if blocked:
+        return 0
+    free = total or 0
+    if nights_with_rows:
+        # Nights without a row still have the full total_rooms
+        free = lowest if nights_with_rows == nights else min(lowest, free)
+    return max(free, 0)
+
+
+class RoomsUnavailable(Exception):
+    """The room does not have enough rooms free on some night of the stay; nothing was taken."""
+
+    def __init__(self, room_id: int, dates: List[str]):
+        self.room_id = room_id
+        self.dates = dates
+        super().__init__("Not enough rooms available")
+
+
+class HotelInventory:
+    """Takes, returns and counts hotel rooms per night."""
+
+    def __init__(self, stripes: int = 64):
+        self._stripes = [threading.Lock() for _ in range(max(stripes, 1))]
+        self._stats_lock = threading.Lock()
+        self.reservations = 0
+        self.conflicts = 0
+        self.releases = 0
+
+    def _stripe(self, room_id: int) -> threading.Lock:
+        return self._stripes[zlib.crc32(str(room_id).encode()) % len(self._stripes)]
+
+    def _count(self, name: str) -> None:
+        with self._stats_lock:
+            setattr(self, name, getattr(self, name) + 1)
+
+    # ----- booking and cancellation --------------------------------------------
+
+    def reserve(self, db, room: HotelRoomModel, check_in: str, check_out: str, rooms: int,
+                records: Iterable[Any] = ()) -> None:
+        """Take `rooms` of `room` for every night of the stay and commit, together with `records`.
+
+        Raises RoomsUnavailable, after rolling `db` back, when any night has
+        fewer rooms free; `records` (typically the booking) are then not added.
+        """
+        dates = stay_dates(check_in, check_out)
+        stay = _stay(room.id, dates)
+        if db.get_bind().dialect.name == "sqlite":
+            with self._stripe(room.id):
+                taken = self._reserve(db, room, dates, stay, rooms, records)
+        else:
+            taken = self._reserve(db, room, dates, stay, rooms, records)
+        if not taken:
+            # Outside the stripe: after the rollback this needs a pooled connection of its own
+            self._count("conflicts")
+            model = HotelRoomAvailabilityModel
+            short = sorted(db.execute(select(model.date).where(
+                stay, (model.available_rooms < rooms) | (func.coalesce(model.is_blocked, 0) != 0))).scalars())
+            db.rollback()
+            raise RoomsUnavailable(room.id, short or dates)
+        self._count("reservations")
+
+    def _reserve(self, db, room: HotelRoomModel, dates: List[str], stay, rooms: int, records) -> bool:
+        model = HotelRoomAvailabilityModel
+        try:
+            self._ensure_rows(db, room, dates, stay)
+            result = db.execute(
+                update(model).where(stay, model.available_rooms >= rooms, func.coalesce(model.is_blocked, 0) == 0)
+                .values(available_rooms=model.available_rooms - rooms)
+                .execution_options(synchronize_session=False)
+            )
+            if result.rowcount != len(dates):
+                db.rollback()
+                return False
+            db.add_all(records)
+            db.commit()
+            return True
+        except Exception:
+            db.rollback()
+            raise
+
+    def _ensure_rows(self, db, room: HotelRoomModel, dates: List[str], stay) -> None:
+        """Insert a row with the full total_rooms for every night of the stay that has none"""
+        model = HotelRoomAvailabilityModel
+        present = set(db.execute(select(model.date).where(stay)).scalars())
+        missing = [date for date in dates if date not in present]
+        if missing:
+            db.execute(insert_ignore(db.get_bind().dialect.name, model.__table__), [
+                {"room_id": room.id, "date": date, "available_rooms": room.total_rooms or 0,
+                 "price": room.price_per_night, "is_blocked": 0}
+                for date in missing
+            ])
+
+    def release(self, db, room_id: int, check_in: str, check_out: str, rooms: int) -> int:
+        """Return `rooms` to every night of the stay in the caller's transaction; returns the nights updated"""
+        model = HotelRoomAvailabilityModel
+        result = db.execute(
+            update(model).where(_stay(room_id, stay_dates(check_in, check_out)))
+            .values(available_rooms=model.available_rooms + rooms)
+            .execution_options(synchronize_session=False)
+        )
+        self._count("releases")
+        return result.rowcount
+
+    # ----- availability queries ------------------------------------------------
+
+    def free_rooms(self, db, rooms: Iterable[Tuple[int, int]], check_in: str, check_out: str) -> Dict[int, int]:
+        """{room_id: rooms free on every night of the stay} for (room_id, total_rooms) pairs"""
+        rooms = list(rooms)
+        if not rooms:
+            return {}
+        model = HotelRoomAvailabilityModel
+        dates = stay_dates(check_in, check_out)
+        stays = {row[0]: row[1:] for row in db.execute(
+            select(model.room_id, func.min(model.available_rooms), func.count(), func.max(model.is_blocked))
+            .where(model.room_id.in_([room_id for room_id, _ in rooms]),
+                   model.date >= dates[0], model.date <= dates[-1])
+            .group_by(model.room_id))}
+        return {room_id: _free(total, *stays.get(room_id, (None, 0, 0)), len(dates)) for room_id, total in rooms}
+
+    def hotels_with_free_rooms(self, db, hotel_ids: List[int], check_in: str, check_out: str,
+                               rooms: int = 1) -> Set[int]:
+        """The hotels among `hotel_ids` with an active room type that has `rooms` free every night"""
+        if not hotel_ids:
+            return set()
+        model = HotelRoomAvailabilityModel
+        dates = stay_dates(check_in, check_out)
+        query = (
+            select(HotelRoomModel.hotel_id, HotelRoomModel.total_rooms, func.min(model.available_rooms),
+                   func.count(model.id), func.max(model.is_blocked))
+            .select_from(HotelRoomModel)
+            .outerjoin(model, and_(model.room_id == HotelRoomModel.id,
+                                   model.date >= dates[0], model.date <= dates[-1]))
+            .where(HotelRoomModel.hotel_id.in_(hotel_ids), HotelRoomModel.is_active == 1)
+            .group_by(HotelRoomModel.id, HotelRoomModel.hotel_id, HotelRoomModel.total_rooms)
+        )
+        return {hotel_id for hotel_id, total, lowest, count, blocked in db.execute(query)
+                if _free(total, lowest, count, blocked, len(dates)) >= rooms}
+
+    def stats(self) -> Dict[str, Any]:
+        with self._stats_lock:
+            return {
+                "reservations": self.reservations,
+                "conflicts": self.conflicts,
+                "releases": self.releases,
+            }
+
+
+hotel_inventory = HotelInventory(stripes=int(os.environ.get("HOTEL_INVENTORY_STRIPES", "64")))
@@ -0,0 +1,189 @@
+"""Shared outbound HTTP client and small caches for third-party lookups.
+
+Handlers that call external APIs (OpenTripMap, OpenWeather, CurrencyAPI)
+share one `httpx.AsyncClient` so connections are kept alive between
+requests instead of paying a TCP/TLS handshake per call. The client is
+opened on app startup and closed on shutdown; `get_http_client()` also
+creates it lazily (and again if the running event loop changed, as happens
+under TestClient).
+
+`fetch_json` is the usual entry point: it caps concurrent calls per host,
+retries transport errors and 502/503/504 with a short backoff, and returns
+None instead of raising so callers can fall back to defaults.
+"""
+import asyncio
+import os
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional
+from urllib.parse import urlsplit
+
+import httpx
+
+HTTP_TIMEOUT_SECONDS = float(os.environ.get("HTTP_CLIENT_TIMEOUT_SECONDS", "2"))
+HTTP_MAX_CONNECTIONS = int(os.environ.get("HTTP_CLIENT_MAX_CONNECTIONS", "100"))
+HTTP_MAX_KEEPALIVE = int(os.environ.get("HTTP_CLIENT_MAX_KEEPALIVE", "20"))
+HTTP_MAX_PER_HOST = int(os.environ.get("HTTP_CLIENT_MAX_PER_HOST", "10"))
+HTTP_RETRIES = int(os.environ.get("HTTP_CLIENT_RETRIES", "2"))
+HTTP_RETRY_BACKOFF_SECONDS = 0.1
+RETRY_STATUSES = frozenset({502, 503, 504})
+
+_client: Optional[httpx.AsyncClient] = None
+_client_loop: Optional[asyncio.AbstractEventLoop] = None
+_host_slots: Dict[str, asyncio.Semaphore] = {}
+
+
+def _new_client() -> httpx.AsyncClient:
+    return httpx.AsyncClient(
+        timeout=httpx.Timeout(HTTP_TIMEOUT_SECONDS),
+        limits=httpx.Limits(max_connections=HTTP_MAX_CONNECTIONS,
+                            max_keepalive_connections=HTTP_MAX_KEEPALIVE),
+        follow_redirects=True,
+    )
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """The process-wide client for the current event loop."""
+    global _client, _client_loop
+    loop = asyncio.get_running_loop()
+    if _client is None or _client.is_closed or _client_loop is not loop:
+        _client = _new_client()
+        _client_loop = loop
+        _host_slots.clear()
+    return _client
+
+
+async def start_http_client() -> None:
+    get_http_client()
+
+
+async def close_http_client() -> None:
+    global _client, _client_loop
+    if _client is not None and not _client.is_closed:
+        await _client.aclose()
+    _client = None
+    _client_loop = None
+    _host_slots.clear()
+
+
+def _host_slot(url: str) -> asyncio.Semaphore:
+    host = urlsplit(url).netloc
+    slot = _host_slots.get(host)
+    if slot is None:
+        slot = _host_slots[host] = asyncio.Semaphore(HTTP_MAX_PER_HOST)
+    return slot
+
+
+async def fetch_json(url: str, params: Optional[dict] = None, retries: int = HTTP_RETRIES) -> Any:
+    """GET `url` and return its JSON body, or None on any failure."""
+    client = get_http_client()
+    for attempt in range(retries + 1):
+        try:
+            async with _host_slot(url):
+                response = await client.get(url, params=params)
+            if response.status_code == 200:
+                return response.json()
+            if response.status_code not in RETRY_STATUSES:
+                return None
+        except ValueError:
+            return None
+        except httpx.HTTPError:
+            pass
+        if attempt < retries:
+            await asyncio.sleep(HTTP_RETRY_BACKOFF_SECONDS * 2 ** attempt)
+    return None
+
+
+class TTLCache:
+    """Bounded LRU whose entries expire after a per-entry TTL.
+
+    Used from the event loop only, so it needs no lock.
+    """
+
+    def __init__(self, max_entries: int = 1024):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[Hashable, tuple]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        entry = self._entries.get(key)
+        if entry is None or time.monotonic() >= entry[0]:
+            if entry is not None:
+                del self._entries[key]
+            self.misses += 1
+            return default
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry[1]
+
+    def set(self, key: Hashable, value: Any, ttl: float) -> None:
+        self._entries[key] = (time.monotonic() + ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+        }
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class RefreshingCache(TTLCache):
+    """TTL cache that refreshes entries in the background once they age.
+
+    Values younger than `fresh_seconds` are returned as is. Older ones, up
+    to `max_age_seconds`, are still returned immediately while one
+    background task reloads them; only missing or expired keys make the
+    caller wait. A loader returning None leaves the cache untouched.
+    """
+
+    def __init__(self, fresh_seconds: float, max_age_seconds: float, max_entries: int = 1024):
+        super().__init__(max_entries)
+        self.fresh_seconds = fresh_seconds
+        self.max_age_seconds = max_age_seconds
+        self.refreshes = 0
+        self._loaded_at: Dict[Hashable, float] = {}
+        self._refreshing: Dict[Hashable, asyncio.Task] = {}
+
+    async def _load(self, key: Hashable, loader: Callable[[], Awaitable[Any]]) -> Any:
+        value = await loader()
+        if value is not None:
+            self.set(key, value, self.max_age_seconds)
+            self._loaded_at[key] = time.monotonic()
+        return value
+
+    def _refresh(self, key: Hashable, loader: Callable[[], Awaitable[Any]]) -> None:
+        task = self._refreshing.get(key)
+        if task is not None and not task.done():
+            return
+        self.refreshes += 1
+        task = asyncio.ensure_future(self._load(key, loader))
+        self._refreshing[key] = task
+        task.add_done_callback(lambda done: self._refreshing.pop(key, None))
+
+    async def get_or_load(self, key: Hashable, loader: Callable[[], Awaitable[Any]]) -> Any:
+        value = self.get(key)
+        if value is None:
+            self._loaded_at.pop(key, None)
+            return await self._load(key, loader)
+        if time.monotonic() - self._loaded_at.get(key, 0.0) >= self.fresh_seconds:
+            self._refresh(key, loader)
+        return value
+
+    def clear(self) -> None:
+        super().clear()
+        self._loaded_at.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        return {**super().stats(), "background_refreshes": self.refreshes}
@@ -0,0 +1,104 @@
+"""Parse-once access to JSON stored in Text columns.
+
+Hotel, room and bus amenities/images/policies and the service booking
+payload are stored as JSON text, and list/detail endpoints used to run
+`json.loads` on them for every row of every request. `parsed_json` adds a
+read-only attribute next to such a column:
+
+    class HotelModel(Base):
+        amenities = Column(Text)
+        amenities_data = parsed_json("amenities")
+
+The parsed value is cached on the instance (so an object loaded once in a
+session parses once), and catalogue blobs are also memoised process-wide by
+their raw text, because thousands of rows share a few distinct values.
+Writers keep assigning JSON strings; the cached value is refreshed when the
+raw column value changes. Parsed values are shared: treat them as read-only.
+"""
+import json
+import os
+import threading
+from typing import Any, Callable, Dict, Optional
+
+
+class _ParseCache:
+    """Bounded map of raw JSON text -> parsed value (FIFO eviction).
+
+    Reads are a plain dict lookup, which is atomic under the GIL, so the
+    hot path takes no lock; only inserts and evictions do.
+    """
+
+    _MISSING = object()
+
+    def __init__(self, max_entries: int):
+        self.max_entries = max_entries
+        self._entries: Dict[str, Any] = {}
+        self._lock = threading.Lock()
+
+    def get(self, raw: str, default: Any = None) -> Any:
+        value = self._entries.get(raw, self._MISSING)
+        if value is not self._MISSING:
+            return value
+        try:
+            value = json.loads(raw)
+        except (TypeError, ValueError):
+            return default
+        with self._lock:
+            self._entries[raw] = value
+            while len(self._entries) > self.max_entries:
+                del self._entries[next(iter(self._entries))]
+        return value
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+json_parse_cache = _ParseCache(int(os.environ.get("JSON_PARSE_CACHE_SIZE", "4096")))
+
+
+def loads_cached(raw: Any, default: Any = None) -> Any:
+    """`json.loads` memoised by raw text; lists/dicts pass through unchanged."""
+    if raw is None or raw == "":
+        return default
+    if isinstance(raw, (list, dict)):
+        return raw
+    return json_parse_cache.get(raw, default)
+
+
+def _load_uncached(raw: Any, default: Any = None) -> Any:
+    if raw is None or raw == "":
+        return default
+    if isinstance(raw, (list, dict)):
+        return raw
+    try:
+        return json.loads(raw)
+    except (TypeError, ValueError):
+        return default
+
+
+class parsed_json:
+    """Descriptor exposing the parsed value of a JSON Text column."""
+
+    def __init__(self, column: str, default: Callable[[], Any] = list, shared: bool = True):
+        self.column = column
+        self.default = default
+        self.shared = shared
+        self.slot = f"_parsed_{column}"
+
+    def __set_name__(self, owner, name):
+        self.slot = f"_parsed_{name}"
+
+    def __get__(self, obj, owner=None):
+        if obj is None:
+            return self
+        raw = getattr(obj, self.column)
+        cached: Optional[tuple] = obj.__dict__.get(self.slot)
+        if cached is not None and cached[0] is raw:
+            return cached[1]
+        loader = loads_cached if self.shared else _load_uncached
+        value = loader(raw, None)
+        if value is None:
+            value = self.default()
+        obj.__dict__[self.slot] = (raw, value)
+        return value
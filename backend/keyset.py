@@ -0,0 +1,146 @@
+"""Keyset (cursor) pagination for list endpoints.
+
+`OFFSET (page-1)*limit` makes the database produce and throw away every
+row before the page, so page 500 costs 500 pages of work, and most lists
+also ran a COUNT(*) on every request. Keyset pagination remembers where
+the previous page ended instead:
+
+    page = keyset_page(query, [SortKey(M.created_at, True), SortKey(M.id, True)], cursor, limit)
+    page.rows, page.next_cursor
+
+* the sort keys always end in a unique column (the id), so the order is
+  total and "rows after the last one" is a plain range condition that a
+  composite index on the same columns answers directly;
+* the cursor is an opaque URL-safe token carrying the last row's key
+  values plus the name of the sort it belongs to; it is not signed, so a
+  hand-edited cursor can only move the window, never widen the filters;
+* one extra row is fetched to know whether there is a next page, so no
+  COUNT(*) is needed (endpoints only count when asked to).
+
+Legacy `page=` requests still work (the `offset` argument) and also get a
+`next_cursor`, so a client can switch to cursors from page 2 on. Sort key
+columns must never hold NULL; `created_at` and the sort columns used here
+are always filled by their column defaults.
+"""
+import base64
+import json
+from datetime import date, datetime
+from typing import Any, Callable, List, NamedTuple, Optional, Sequence
+
+from fastapi import HTTPException, Response
+from sqlalchemy import and_, or_
+from sqlalchemy.engine import Row
+
+
+class SortKey(NamedTuple):
+    column: Any
+    descending: bool = False
+    # Reads the key from a result row; defaults to the attribute named like the column
+    value: Optional[Callable[[Any], Any]] = None
+
+
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+TOTAL_COUNT_HEADER = "X-Total-Count"
+
+
+class KeysetPage(NamedTuple):
+    rows: List[Any]
+    next_cursor: Optional[str]
+
+
+def _tag(value: Any) -> Any:
+    if isinstance(value, datetime):
+        return {"dt": value.isoformat()}
+    if isinstance(value, date):
+        return {"d": value.isoformat()}
+    if isinstance(value, (list, tuple)):
+        return [_tag(v) for v in value]
+    return value
+
+
+def _untag(value: Any) -> Any:
+    if isinstance(value, dict):
+        if "dt" in value:
+            return datetime.fromisoformat(value["dt"])
+        if "d" in value:
+            return date.fromisoformat(value["d"])
+        raise ValueError("unknown cursor value")
+    if isinstance(value, list):
+        return tuple(_untag(v) for v in value)
+    return value
+
+
+def encode_cursor(values: Sequence[Any], sort: str = "") -> str:
+    raw = json.dumps({"s": sort, "k": _tag(list(values))}, separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_cursor(token: str, sort: str = "") -> tuple:
+    """Key values from a cursor; 400 if it is malformed or for another sort order."""
+    try:
+        raw = base64.urlsafe_b64decode(token + "=" * (-len(token) % 4))
+        data = json.loads(raw)
+        values = _untag(data["k"])
+        if data.get("s", "") != sort or not isinstance(values, tuple):
+            raise ValueError("cursor belongs to a different sort order")
+    except (ValueError, KeyError, TypeError) as e:
+        raise HTTPException(status_code=400, detail=f"Invalid cursor: {e}")
+    return values
+
+
+def after(keys: Sequence[SortKey], values: Sequence[Any]):
+    """SQL condition selecting rows strictly after `values` in `keys` order."""
+    if len(values) != len(keys):
+        raise HTTPException(status_code=400, detail="Invalid cursor: wrong number of values")
+    clauses = []
+    for i, key in enumerate(keys):
+        equal = [keys[j].column == values[j] for j in range(i)]
+        beyond = key.column < values[i] if key.descending else key.column > values[i]
+        clauses.append(and_(*equal, beyond))
+    # The redundant bound on the leading key is what lets SQLite and MySQL
+    # seek into the index; given only the OR they scan it from the start.
+    first = keys[0].column <= values[0] if keys[0].descending else keys[0].column >= values[0]
+    return and_(first, or_(*clauses))
+
+
+def _key_values(keys: Sequence[SortKey], row: Any) -> list:
+    obj = row[0] if isinstance(row, Row) else row
+    return [key.value(obj) if key.value else getattr(obj, key.column.key) for key in keys]
+
+
+def newest_first(model) -> List[SortKey]:
+    """`created_at DESC, id DESC`, the order of every admin/user listing."""
+    return [SortKey(model.created_at, True), SortKey(model.id, True)]
+
+
+def keyset_page(query, keys: Sequence[SortKey], cursor: Optional[str], limit: int,
+                sort: str = "", offset: int = 0) -> KeysetPage:
+    """One page of `query` in `keys` order, starting after `cursor` (or at `offset`)."""
+    if cursor:
+        query = query.filter(after(keys, decode_cursor(cursor, sort)))
+    query = query.order_by(*[k.column.desc() if k.descending else k.column.asc() for k in keys])
+    if offset > 0 and not cursor:
+        query = query.offset(offset)
+    rows = query.limit(limit + 1).all()
+    if len(rows) <= limit:
+        return KeysetPage(rows, None)
+    rows = rows[:limit]
+    return KeysetPage(rows, encode_cursor(_key_values(keys, rows[-1]), sort))
+
+
+def page_offset(page: int, limit: int) -> int:
+    """OFFSET for a legacy `page` number."""
+    return max(page - 1, 0) * limit
+
+
+def wants_total(cursor: Optional[str], include_total: Optional[bool]) -> bool:
+    """Run the exact COUNT(*) when asked to, and by default only for page-number requests."""
+    return include_total if include_total is not None else not cursor
+
+
+def set_page_headers(response: Response, page: KeysetPage, total: Optional[int] = None) -> None:
+    """Pagination metadata for endpoints whose body is a bare list."""
+    if page.next_cursor:
+        response.headers[NEXT_CURSOR_HEADER] = page.next_cursor
+    if total is not None:
+        response.headers[TOTAL_COUNT_HEADER] = str(total)
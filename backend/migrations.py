@@ -0,0 +1,329 @@
+"""Versioned schema migrations with a single-runner lock.
+
+    schema = MigrationRunner(engine, Base.metadata, MIGRATIONS)
+    schema.status()     # {"current": 3, "latest": 5, "pending": [...]}
+    schema.upgrade()    # apply the pending migrations under the lock
+
+Startup used to run `create_all` plus four blind `ALTER TABLE`s (errors
+swallowed) in every worker, and `migrate_db.py` was a separate SQLite-only
+script. Now:
+
+* `schema_migrations` records every applied version, so an up-to-date
+  database costs startup one `SELECT MAX(version)` and no DDL at all;
+* migrations are ordered and idempotent (columns and indexes are only
+  added when the inspector says they are missing), so a database that
+  predates the version table is brought up to date by running them all;
+* DDL is rendered for the connection's dialect (MySQL or SQLite);
+* only one process migrates at a time: MySQL takes a named `GET_LOCK`,
+  SQLite a `BEGIN IMMEDIATE` write transaction, which also makes a SQLite
+  upgrade all-or-nothing. Workers that wait for the lock re-read the
+  version afterwards and find nothing left to do.
+
+New schema changes are appended to `MIGRATIONS` with the next version
+number; released migrations are never edited.
+"""
+import logging
+import time
+from contextlib import contextmanager
+from datetime import datetime, timedelta, timezone
+from typing import Any, Callable, Dict, List, NamedTuple
+
+from sqlalchemy import (Column, DateTime, Integer, MetaData, String, Table, and_, delete, func, inspect, literal,
+                        select)
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.types import TypeEngine
+
+from db_indexes import create_index, drop_index, ensure_indexes
+
+logger = logging.getLogger(__name__)
+
+LOCK_NAME = "wanderlite_schema_migrations"
+
+_version_metadata = MetaData()
+schema_migrations = Table(
+    "schema_migrations", _version_metadata,
+    Column("version", Integer, primary_key=True, autoincrement=False),
+    Column("name", String(200), nullable=False),
+    Column("applied_at", DateTime(timezone=True), nullable=False),
+)
+
+
+class Migration(NamedTuple):
+    version: int
+    name: str
+    # upgrade(conn, metadata); must be safe to re-run on a database that already has the change
+    upgrade: Callable[[Any, MetaData], None]
+
+
+class MigrationLockTimeout(RuntimeError):
+    pass
+
+
+def add_column(conn, table: str, column: str, type_: TypeEngine, default: Any = None) -> bool:
+    """ALTER TABLE ... ADD COLUMN unless the column exists; True if it was added."""
+    inspector = inspect(conn)
+    if not inspector.has_table(table) or column in {c["name"] for c in inspector.get_columns(table)}:
+        return False
+    preparer = conn.dialect.identifier_preparer
+    ddl = f"ALTER TABLE {preparer.quote(table)} ADD COLUMN {preparer.quote(column)} " \
+          f"{type_.compile(dialect=conn.dialect)}"
+    if default is not None:
+        ddl += " DEFAULT " + str(literal(default).compile(dialect=conn.dialect,
+                                                          compile_kwargs={"literal_binds": True}))
+    conn.exec_driver_sql(ddl)
+    logger.info(f"Added column {table}.{column}")
+    return True
+
+
+# =============================
+# Migrations, in order
+# =============================
+
+def _baseline(conn, metadata):
+    # Every table of the current models; tables that already exist are left alone
+    metadata.create_all(conn)
+
+
+def _booking_lifecycle_columns(conn, metadata):
+    add_column(conn, "bookings", "status", String(20), "Confirmed")
+    add_column(conn, "bookings", "cancelled_at", DateTime(timezone=True))
+    add_column(conn, "bookings", "completed_at", DateTime(timezone=True))
+
+
+def _user_flag_columns(conn, metadata):
+    add_column(conn, "users", "is_kyc_completed", Integer(), 0)
+    add_column(conn, "users", "payment_profile_completed", Integer(), 0)
+    add_column(conn, "users", "is_blocked", Integer(), 0)
+
+
+def _index_pack(conn, metadata):
+    ensure_indexes(conn, metadata)
+
+
+def _default_platform_settings(conn, metadata):
+    settings = metadata.tables["platform_settings"]
+    defaults = {"maintenance_mode": "false", "bookings_enabled": "true", "new_user_registration": "true"}
+    present = set(conn.execute(select(settings.c.setting_key)).scalars())
+    rows = [{"setting_key": k, "setting_value": v} for k, v in defaults.items() if k not in present]
+    if rows:
+        conn.execute(settings.insert(), rows)
+
+
+def dedupe_rows(conn, table: Table, key: List[str], keep: Callable[[Any], Any]) -> int:
+    """Delete all but one row per `key` (the row with the highest `keep(row)`); returns the count deleted."""
+    columns = [table.c[name] for name in key]
+    deleted = 0
+    duplicated = conn.execute(select(*columns).group_by(*columns).having(func.count() > 1)).all()
+    for values in duplicated:
+        rows = conn.execute(select(table).where(and_(*(c == v for c, v in zip(columns, values))))).all()
+        winner = max(rows, key=keep)
+        extra = [row.id for row in rows if row.id != winner.id]
+        deleted += conn.execute(delete(table).where(table.c.id.in_(extra))).rowcount
+    if deleted:
+        logger.info(f"Removed {deleted} duplicate rows from {table.name}")
+    return deleted
+
+
+def _seat_hold_rank(row):
+    # Keep the booking, else the latest hold, else the oldest row
+    return (row.status == "booked", row.status == "locked", str(row.locked_until or ""), -row.id)
+
+
+def _seat_availability_unique_keys(conn, metadata):
+    # One row per seat, so concurrent first-time holds cannot both insert one
+    for name, key, old_index in (
+            ("bus_seat_availability", ["schedule_id", "journey_date", "seat_id"],
+             "ix_bus_seat_availability_schedule_date_seat"),
+            ("flight_seat_availability", ["schedule_id", "seat_id"], "ix_flight_seat_availability_schedule_seat")):
+        dedupe_rows(conn, metadata.tables[name], key, _seat_hold_rank)
+        drop_index(conn, name, old_index)
+    # The unique keys, plus (status, locked_until) for the expired-hold sweeper
+    ensure_indexes(conn, metadata)
+
+
+def _hotel_inventory_rank(row):
+    # Keep the night with the fewest rooms left, so no booking is forgotten
+    return (-row.available_rooms, -row.id)
+
+
+def _hotel_room_inventory(conn, metadata):
+    inventory = metadata.tables["hotel_room_availability"]
+    dedupe_rows(conn, inventory, ["room_id", "date"], _hotel_inventory_rank)
+    ensure_indexes(conn, metadata)
+    # Confirmed stays booked against the old global counter take their nights
+    rooms, bookings = metadata.tables["hotel_rooms"], metadata.tables["hotel_bookings"]
+    today = datetime.now().strftime("%Y-%m-%d")
+    taken: Dict[Any, int] = {}
+    for room_id, check_in, check_out, rooms_booked in conn.execute(
+            select(bookings.c.room_id, bookings.c.check_in_date, bookings.c.check_out_date, bookings.c.rooms_booked)
+            .where(bookings.c.booking_status == "confirmed", bookings.c.check_out_date >= today)):
+        try:
+            start = datetime.strptime(check_in, "%Y-%m-%d")
+            nights = max(1, (datetime.strptime(check_out, "%Y-%m-%d") - start).days)
+        except (TypeError, ValueError):
+            continue
+        for n in range(nights):
+            date = (start + timedelta(days=n)).strftime("%Y-%m-%d")
+            taken[room_id, date] = taken.get((room_id, date), 0) + (rooms_booked or 1)
+    present = set(conn.execute(select(inventory.c.room_id, inventory.c.date)).all())
+    room_info = {row.id: row for row in conn.execute(
+        select(rooms.c.id, rooms.c.total_rooms, rooms.c.price_per_night)
+        .where(rooms.c.id.in_({room_id for room_id, _ in taken})))} if taken else {}
+    rows = [{"room_id": room_id, "date": date, "available_rooms": max((room_info[room_id].total_rooms or 0) - count, 0),
+             "price": room_info[room_id].price_per_night, "is_blocked": 0}
+            for (room_id, date), count in sorted(taken.items())
+            if room_id in room_info and (room_id, date) not in present]
+    if rows:
+        conn.execute(inventory.insert(), rows)
+        logger.info(f"Backfilled {len(rows)} hotel room nights from confirmed bookings")
+
+
+def _flight_schedule_unique_key(conn, metadata):
+    # Search created schedules on the fly, so concurrent searches could add two for one flight and day.
+    # Drop the unreferenced extras; a group with bookings on more than one row keeps them and fails the
+    # migration, so it is retried (with the old index still in place) once they are merged
+    schedules = metadata.tables["flight_schedules"]
+    referencing = [metadata.tables[name].c.schedule_id
+                   for name in ("flight_segments", "flight_seat_availability", "flight_tracking")]
+    duplicated = conn.execute(select(schedules.c.flight_id, schedules.c.flight_date)
+                              .group_by(schedules.c.flight_id, schedules.c.flight_date)
+                              .having(func.count() > 1)).all()
+    deleted = unmerged = 0
+    for flight_id, flight_date in duplicated:
+        ids = list(conn.execute(select(schedules.c.id).where(
+            schedules.c.flight_id == flight_id, schedules.c.flight_date == flight_date)
+            .order_by(schedules.c.id)).scalars())
+        referenced = {schedule_id for column in referencing
+                      for schedule_id in conn.execute(select(column).where(column.in_(ids)).distinct()).scalars()}
+        keep = referenced or {ids[0]}
+        extra = [schedule_id for schedule_id in ids if schedule_id not in keep]
+        if extra:
+            deleted += conn.execute(delete(schedules).where(schedules.c.id.in_(extra))).rowcount
+        if len(keep) > 1:
+            unmerged += 1
+            logger.warning(f"Flight {flight_id} has {len(keep)} booked schedules on {flight_date}; "
+                           f"merge them to add ux_flight_schedules_flight_date")
+    if deleted:
+        logger.info(f"Removed {deleted} duplicate rows from flight_schedules")
+    if unmerged:
+        raise RuntimeError(f"{unmerged} flight/day pairs still have several booked schedules")
+    # The unique key replaces the plain one only once it exists: search and the materialiser need one of them
+    unique = next(index for index in schedules.indexes if index.name == "ux_flight_schedules_flight_date")
+    if unique.name not in {ix["name"] for ix in inspect(conn).get_indexes("flight_schedules")}:
+        create_index(conn, unique)
+    drop_index(conn, "flight_schedules", "ix_flight_schedules_flight_date")
+    ensure_indexes(conn, metadata)
+
+
+MIGRATIONS = [
+    Migration(1, "baseline schema", _baseline),
+    Migration(2, "bookings status / cancelled_at / completed_at", _booking_lifecycle_columns),
+    Migration(3, "users KYC, payment profile and blocked flags", _user_flag_columns),
+    Migration(4, "composite index pack for hot filters", _index_pack),
+    Migration(5, "default platform settings", _default_platform_settings),
+    Migration(6, "unique seat availability keys and hold expiry indexes", _seat_availability_unique_keys),
+    Migration(7, "per-night hotel room inventory key and backfill", _hotel_room_inventory),
+    Migration(8, "unique flight schedule per flight and day", _flight_schedule_unique_key),
+]
+
+
+# =============================
+# Runner
+# =============================
+
+def _current_version(conn) -> int:
+    if not inspect(conn).has_table(schema_migrations.name):
+        return 0
+    return conn.execute(select(func.max(schema_migrations.c.version))).scalar() or 0
+
+
+@contextmanager
+def _mysql_lock(conn, timeout: float):
+    acquired = conn.exec_driver_sql("SELECT GET_LOCK(%s, %s)", (LOCK_NAME, int(timeout))).scalar()
+    if acquired != 1:
+        raise MigrationLockTimeout(f"another process held {LOCK_NAME} for {timeout:.0f}s")
+    try:
+        yield
+    finally:
+        conn.exec_driver_sql("SELECT RELEASE_LOCK(%s)", (LOCK_NAME,))
+
+
+@contextmanager
+def _sqlite_lock(conn, timeout: float):
+    deadline = time.monotonic() + timeout
+    while True:
+        try:
+            conn.exec_driver_sql("BEGIN IMMEDIATE")
+            break
+        except OperationalError as e:
+            if "locked" not in str(e) or time.monotonic() >= deadline:
+                raise MigrationLockTimeout(f"database stayed locked for {timeout:.0f}s: {e}") from e
+            time.sleep(0.05)
+    try:
+        yield
+    except BaseException:
+        conn.exec_driver_sql("ROLLBACK")
+        raise
+    conn.exec_driver_sql("COMMIT")
+
+
+@contextmanager
+def _no_lock(conn, timeout: float):
+    logger.warning(f"No migration lock for {conn.dialect.name}; migrating unlocked")
+    yield
+
+
+_LOCKS = {"mysql": _mysql_lock, "sqlite": _sqlite_lock}
+
+
+class MigrationRunner:
+    """Applies `migrations` to `engine` and reports the schema version."""
+
+    def __init__(self, engine, metadata: MetaData, migrations: List[Migration] = MIGRATIONS,
+                 lock_timeout: float = 300.0):
+        versions = [m.version for m in migrations]
+        if versions != sorted(set(versions)):
+            raise ValueError("migration versions must be unique and in ascending order")
+        self.engine = engine
+        self.metadata = metadata
+        self.migrations = migrations
+        self.lock_timeout = lock_timeout
+
+    @property
+    def latest(self) -> int:
+        return self.migrations[-1].version if self.migrations else 0
+
+    def current(self) -> int:
+        with self.engine.connect() as conn:
+            return _current_version(conn)
+
+    def status(self) -> Dict[str, Any]:
+        current = self.current()
+        return {
+            "current": current,
+            "latest": self.latest,
+            "pending": [f"{m.version}: {m.name}" for m in self.migrations if m.version > current],
+        }
+
+    def upgrade(self) -> List[int]:
+        """Apply every pending migration under the lock; returns the versions applied."""
+        applied = []
+        with self.engine.connect() as conn:
+            # Explicit transaction control: the lock decides where it begins and ends
+            conn.execution_options(isolation_level="AUTOCOMMIT")
+            lock = _LOCKS.get(conn.dialect.name, _no_lock)
+            with lock(conn, self.lock_timeout):
+                _version_metadata.create_all(conn)
+                current = _current_version(conn)
+                for migration in self.migrations:
+                    if migration.version <= current:
+                        continue
+                    start = time.perf_counter()
+                    migration.upgrade(conn, self.metadata)
+                    conn.execute(schema_migrations.insert().values(
+                        version=migration.version, name=migration.name,
+                        applied_at=datetime.now(timezone.utc)))
+                    applied.append(migration.version)
+                    logger.info(f"Applied migration {migration.version} ({migration.name}) "
+                                f"in {(time.perf_counter() - start) * 1000:.0f} ms")
+        return applied
@@ -0,0 +1,1251 @@
+"""SQLAlchemy models for every domain, and the daily booking rollups kept
+up to date by session hooks on them."""
+import uuid
+from datetime import datetime, timezone
+
+from sqlalchemy import Column, Date, DateTime, Float, ForeignKey, Index, Integer, JSON, String, Text
+
+from booking_rollups import BookingRollups, RollupSource
+from json_columns import parsed_json
+from seat_holds import SeatHoldTable, seat_holds, utc_now
+from seat_map import bus_seat_map_key, flight_seat_map_key
+from database import Base, SessionLocal
+
+
+class UserModel(Base):
+    __tablename__ = "users"
+    __table_args__ = (Index("ix_users_created_at_id", "created_at", "id"),)
+
+    id = Column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
+    email = Column(String(255), unique=True, index=True, nullable=False)
+    username = Column(String(100), nullable=False)
+    hashed_password = Column(String(255), nullable=False)
+    created_at = Column(DateTime(timezone=True), default=lambda: datetime.now(timezone.utc))
+    # Profile fields
+    name = Column(String(255), nullable=True)
+    phone = Column(String(50), nullable=True)
+    profile_image = Column(String(500), nullable=True)
+    favorite_travel_type = Column(String(50), nullable=True)
+    preferred_budget_range = Column(String(50), nullable=True)
+    climate_preference = Column(String(50), nullable=True)
+    food_preference = Column(String(50), nullable=True)
+    language_preference = Column(String(50), nullable=True)
+    notifications_enabled = Column(Integer, default=1)
+    # KYC & Payment flags
+    is_kyc_completed = Column(Integer, default=0)
+    payment_profile_completed = Column(Integer, default=0)
+
+
+class KYCDetailsModel(Base):
+    __tablename__ = "kyc_details"
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    user_id = Column(String(36), ForeignKey("users.id"), unique=True, index=True, nullable=False)
+    full_name = Column(String(255), nullable=False)
+    dob = Column(String(20), nullable=False)  # YYYY-MM-DD
+    gender = Column(String(20), nullable=False)  # male / female / other
+    nationality = Column(String(100), nullable=False)
+    id_type = Column(String(50), nullable=False)  # aadhaar / passport / voterid
+    id_number_hash = Column(String(255), nullable=False)  # hashed ID number
+    id_proof_front_path = Column(String(500), nullable=True)
+    id_proof_back_path = Column(String(500), nullable=True)
+    selfie_path = Column(String(500), nullable=True)
+    address_line = Column(String(500), nullable=False)
+    city = Column(String(100), nullable=False)
+    state = Column(String(100), nullable=False)
+    country = Column(String(100), nullable=False)
+    pincode = Column(String(20), nullable=False)
+    verification_status = Column(String(20), default="pending")  # pending / verified / rejected
+    submitted_at = Column(DateTime(timezone=True), nullable=True)
+    verified_at = Column(DateTime(timezone=True), nullable=True)
+    created_at = Column(DateTime(timezone=True), default=lambda: datetime.now(timezone.utc))
+    updated_at = Column(DateTime(timezone=True), nullable=True)
+
+
+class PaymentProfileModel(Base):
+    __tablename__ = "payment_profiles"
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    user_id = Column(String(36), ForeignKey("users.id"), unique=True, index=True, nullable=False)
+    account_holder_name = Column(String(255), nullable=False)
+    bank_name = Column(String(255), nullable=False)
+    account_number_encrypted = Column(Text, nullable=False)  # AES-256-GCM encrypted
+    ifsc_encrypted = Column(Text, nullable=False)
+    upi_encrypted = Column(Text, nullable=True)  # optional
+    default_method = Column(String(20), default="bank")  # bank / upi
+    created_at = Column(DateTime(timezone=True), default=lambda: datetime.now(timezone.utc))
+    updated_at = Column(DateTime(timezone=True), nullable=True)
+
+
+class TransactionModel(Base):
+    __tablename__ = "transactions"
+    __table_args__ = (Index("ix_transactions_created_at_id", "created_at", "id"),)
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    user_id = Column(String(36), ForeignKey("users.id"), index=True, nullable=False)
+    booking_id = Column(String(36), index=True, nullable=True)  # reference to service_bookings
+    service_type = Column(String(30), nullable=True)  # flight / hotel / restaurant
+    amount = Column(Float, nullable=False)
+    currency = Column(String(10), default="INR")
+    payment_method = Column(String(50), nullable=False)  # saved_bank / saved_upi / one_time_card / one_time_upi
+    status = Column(String(20), default="success")  # success / failed
+    created_at = Column(DateTime(timezone=True), default=lambda: datetime.now(timezone.utc))
+
+
+class TripModel(Base):
+    __tablename__ = "trips"
+
+    id = Column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
+    user_id = Column(String(36), ForeignKey("users.id"), index=True, nullable=False)
+    destination = Column(String(255), nullable=False)
+    days = Column(Integer, nullable=False)
+    budget = Column(String(20), nullable=False)
+    currency = Column(String(10), nullable=False)
+    total_cost = Column(Float, default=0)
+    start_date = Column(DateTime(timezone=True), nullable=True)
+    end_date = Column(DateTime(timezone=True), nullable=True)
+    travelers = Column(Integer, nullable=True)
+    itinerary_json = Column(Text, nullable=False, default="[]")
+    images_json = Column(Text, nullable=False, default="[]")
+    created_at = Column(DateTime(timezone=True), default=lambda: datetime.now(timezone.utc))
+    updated_at = Column(DateTime(timezone=True), nullable=True)
+
+class BookingModel(Base):
+    __tablename__ = "bookings"
+
+    id = Column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
+    user_id = Column(String(36), index=True, nullable=False)  # Removed ForeignKey constraint
+    trip_id = Column(String(36), index=True, nullable=True)  # Removed ForeignKey constraint
+    destination = Column(String(255), nullable=False)
+    start_date = Column(DateTime(timezone=True), nullable=True)
+    end_date = Column(DateTime(timezone=True), nullable=True)
+    travelers = Column(Integer, default=1)
+    package_type = Column(String(50), nullable=True)
+    hotel_name = Column(String(255), nullable=True)
+    flight_number = Column(String(50), nullable=True)
+    total_price = Column(Float, default=0)
+    currency = Column(String(10), default="INR")
+    booking_ref = Column(String(50), unique=True, index=True, nullable=False)
+    status = Column(String(20), default="Confirmed")  # Confirmed / Cancelled / Completed
+    cancelled_at = Column(DateTime(timezone=True), nullable=True)
+    completed_at = Column(DateTime(timezone=True), nullable=True)
+    created_at = Column(DateTime(timezone=True), default=lambda: datetime.now(timezone.utc))
+
+class GalleryPostModel(Base):
+    __tablename__ = "gallery_posts"
+
+    id = Column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
+    user_id = Column(String(36), ForeignKey("users.id"), index=True, nullable=False)
+    image_url = Column(String(500), nullable=False)
+    caption = Column(Text, nullable=True)
+    location = Column(String(255), nullable=True)
+    tags_json = Column(Text, nullable=False, default="[]")
+    likes = Column(Integer, default=0)
+    created_at = Column(DateTime(timezone=True), default=lambda: datetime.now(timezone.utc))
+
+
+class PaymentReceiptModel(Base):
+    __tablename__ = "payment_receipts"
+
+    id = Column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
+    user_id = Column(String(36), index=True, nullable=True)  # nullable for guest payments
+    booking_ref = Column(String(50), index=True, nullable=False)
+    destination = Column(String(255), nullable=True)
+    start_date = Column(DateTime(timezone=True), nullable=True)
+    end_date = Column(DateTime(timezone=True), nullable=True)
+    travelers = Column(Integer, nullable=True)
+    full_name = Column(String(255), nullable=False)
+    email = Column(String(255), nullable=False)
+    phone = Column(String(50), nullable=False)
+    payment_method = Column(String(50), nullable=False)
+    amount = Column(Float, nullable=False)
+    receipt_url = Column(String(500), nullable=False)
+    created_at = Column(DateTime(timezone=True), default=lambda: datetime.now(timezone.utc))
+
+
+class ChecklistItemModel(Base):
+    __tablename__ = "checklist_items"
+
+    id = Column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
+    user_id = Column(String(36), index=True, nullable=True)
+    booking_id = Column(String(36), index=True, nullable=True)
+    trip_id = Column(String(36), index=True, nullable=True)
+    item_name = Column(String(255), nullable=False)
+    category = Column(String(100), nullable=True)  # e.g., Clothing, Documents, Toiletries, etc.
+    is_packed = Column(Integer, default=0)  # 0 = not packed, 1 = packed
+    is_auto_generated = Column(Integer, default=0)  # 0 = user added, 1 = auto-suggested
+    created_at = Column(DateTime(timezone=True), default=lambda: datetime.now(timezone.utc))
+
+
+class ServiceBookingModel(Base):
+    __tablename__ = "service_bookings"
+    __table_args__ = (Index("ix_service_bookings_created_at_id", "created_at", "id"),)
+
+    id = Column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
+    user_id = Column(String(36), index=True, nullable=True)
+    service_type = Column(String(30), nullable=False)  # flight / hotel / restaurant
+    service_json = Column(Text, nullable=False)
+    service_data = parsed_json("service_json", default=dict, shared=False)
+    total_price = Column(Float, nullable=False, default=0.0)
+    currency = Column(String(10), default="INR")
+    booking_ref = Column(String(80), unique=True, index=True, nullable=False)
+    status = Column(String(20), default="Pending")
+    created_at = Column(DateTime(timezone=True), default=lambda: datetime.now(timezone.utc))
+
+
+class BookingDailyRollupModel(Base):
+    """Per-day counts and amounts of bookings/transactions (see booking_rollups.py)"""
+    __tablename__ = "booking_daily_rollups"
+
+    day = Column(String(10), primary_key=True)  # YYYY-MM-DD (UTC)
+    kind = Column(String(20), primary_key=True)  # service_booking / booking / transaction
+    service_type = Column(String(50), primary_key=True, default="")
+    status = Column(String(20), primary_key=True, default="")
+    total_count = Column(Integer, nullable=False, default=0)
+    total_amount = Column(Float, nullable=False, default=0.0)
+
+
+class StatusCheckModel(Base):
+    __tablename__ = "status_checks"
+
+    id = Column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
+    client_name = Column(String(255), nullable=False)
+    timestamp = Column(DateTime(timezone=True), default=lambda: datetime.now(timezone.utc))
+
+
+# =============================
+# Admin Panel Database Models
+# =============================
+class AdminModel(Base):
+    __tablename__ = "admins"
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    email = Column(String(255), unique=True, index=True, nullable=False)
+    username = Column(String(100), nullable=False)
+    hashed_password = Column(String(255), nullable=False)
+    role = Column(String(30), default="support")  # super_admin / support
+    is_active = Column(Integer, default=1)
+    last_login = Column(DateTime(timezone=True), nullable=True)
+    created_at = Column(DateTime(timezone=True), default=lambda: datetime.now(timezone.utc))
+    updated_at = Column(DateTime(timezone=True), nullable=True)
+
+
+class AuditLogModel(Base):
+    __tablename__ = "audit_logs"
+    __table_args__ = (Index("ix_audit_logs_created_at_id", "created_at", "id"),)
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    admin_id = Column(Integer, ForeignKey("admins.id"), nullable=True)
+    action = Column(String(100), nullable=False)
+    entity_type = Column(String(50), nullable=True)
+    entity_id = Column(String(36), nullable=True)
+    details = Column(Text, nullable=True)
+    ip_address = Column(String(45), nullable=True)
+    created_at = Column(DateTime(timezone=True), default=lambda: datetime.now(timezone.utc))
+
+
+class NotificationModel(Base):
+    __tablename__ = "notifications"
+    __table_args__ = (
+        Index("ix_notifications_user_created_at_id", "user_id", "created_at", "id"),
+        # unread_only listing and the unread badge count
+        Index("ix_notifications_user_unread_created_at_id", "user_id", "is_read", "created_at", "id"),
+    )
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    user_id = Column(String(36), ForeignKey("users.id"), nullable=True)
+    admin_id = Column(Integer, ForeignKey("admins.id"), nullable=True)
+    title = Column(String(255), nullable=False)
+    message = Column(Text, nullable=False)
+    notification_type = Column(String(50), default="info")  # info / warning / success / error
+    is_read = Column(Integer, default=0)
+    created_at = Column(DateTime(timezone=True), default=lambda: datetime.now(timezone.utc))
+
+
+class DestinationModel(Base):
+    __tablename__ = "destinations"
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    name = Column(String(255), nullable=False)
+    description = Column(Text, nullable=True)
+    category = Column(String(50), nullable=True)  # beach / hill / city / heritage / adventure
+    country = Column(String(100), nullable=True)
+    state = Column(String(100), nullable=True)
+    city = Column(String(100), nullable=True)
+    image_url = Column(String(500), nullable=True)
+    latitude = Column(Float, nullable=True)
+    longitude = Column(Float, nullable=True)
+    is_active = Column(Integer, default=1)
+    created_at = Column(DateTime(timezone=True), default=lambda: datetime.now(timezone.utc))
+    updated_at = Column(DateTime(timezone=True), nullable=True)
+
+
+class PlatformSettingModel(Base):
+    __tablename__ = "platform_settings"
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    setting_key = Column(String(100), unique=True, nullable=False)
+    setting_value = Column(Text, nullable=True)
+    updated_by = Column(Integer, ForeignKey("admins.id"), nullable=True)
+    updated_at = Column(DateTime(timezone=True), default=lambda: datetime.now(timezone.utc))
+
+
+# =============================
+# Bus Booking Database Models
+# =============================
+class BusCityModel(Base):
+    __tablename__ = "bus_cities"
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    name = Column(String(255), nullable=False)
+    state = Column(String(100), nullable=True)
+    country = Column(String(100), default="India")
+    latitude = Column(Float, nullable=True)
+    longitude = Column(Float, nullable=True)
+    is_active = Column(Integer, default=1)
+    created_at = Column(DateTime(timezone=True), default=lambda: datetime.now(timezone.utc))
+
+
+class BusRouteModel(Base):
+    __tablename__ = "bus_routes"
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    from_city_id = Column(Integer, ForeignKey("bus_cities.id"), nullable=False)
+    to_city_id = Column(Integer, ForeignKey("bus_cities.id"), nullable=False)
+    distance_km = Column(Float, nullable=True)
+    estimated_duration_mins = Column(Integer, nullable=True)
+    is_active = Column(Integer, default=1)
+    created_at = Column(DateTime(timezone=True), default=lambda: datetime.now(timezone.utc))
+
+
+class BusOperatorModel(Base):
+    __tablename__ = "bus_operators"
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    name = Column(String(255), nullable=False)
+    logo_url = Column(String(500), nullable=True)
+    rating = Column(Float, default=4.0)
+    total_reviews = Column(Integer, default=0)
+    contact_phone = Column(String(20), nullable=True)
+    contact_email = Column(String(255), nullable=True)
+    cancellation_policy = Column(Text, nullable=True)
+    amenities = Column(Text, nullable=True)  # JSON: wifi, charging, water, blanket, etc.
+    is_active = Column(Integer, default=1)
+    created_at = Column(DateTime(timezone=True), default=lambda: datetime.now(timezone.utc))
+
+
+class BusModel(Base):
+    __tablename__ = "buses"
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    operator_id = Column(Integer, ForeignKey("bus_operators.id"), nullable=False)
+    bus_number = Column(String(50), nullable=False)
+    bus_type = Column(String(50), nullable=False)  # AC Sleeper, Non-AC Seater, AC Seater, etc.
+    total_seats = Column(Integer, nullable=False)
+    seat_layout = Column(String(20), default="2+2")  # 2+2, 2+1, sleeper
+    has_upper_deck = Column(Integer, default=0)
+    amenities = Column(Text, nullable=True)  # JSON array
+    is_active = Column(Integer, default=1)
+    created_at = Column(DateTime(timezone=True), default=lambda: datetime.now(timezone.utc))
+
+    amenities_data = parsed_json("amenities")
+
+
+class BusScheduleModel(Base):
+    __tablename__ = "bus_schedules"
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    bus_id = Column(Integer, ForeignKey("buses.id"), nullable=False)
+    route_id = Column(Integer, ForeignKey("bus_routes.id"), index=True, nullable=False)
+    departure_time = Column(String(10), nullable=False)  # HH:MM format
+    arrival_time = Column(String(10), nullable=False)    # HH:MM format
+    duration_mins = Column(Integer, nullable=True)
+    days_of_week = Column(String(50), default="0,1,2,3,4,5,6")  # 0=Monday, 6=Sunday
+    base_price = Column(Float, nullable=False)
+    is_night_bus = Column(Integer, default=0)
+    next_day_arrival = Column(Integer, default=0)
+    is_active = Column(Integer, default=1)
+    created_at = Column(DateTime(timezone=True), default=lambda: datetime.now(timezone.utc))
+
+
+class BusSeatModel(Base):
+    __tablename__ = "bus_seats"
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    bus_id = Column(Integer, ForeignKey("buses.id"), index=True, nullable=False)
+    seat_number = Column(String(10), nullable=False)  # L1, L2, U1, U2, 1A, 1B, etc.
+    seat_type = Column(String(20), default="seater")  # seater, sleeper, semi-sleeper
+    deck = Column(String(10), default="lower")  # lower, upper
+    row_number = Column(Integer, nullable=True)
+    column_number = Column(Integer, nullable=True)
+    position = Column(String(20), default="window")  # window, aisle, middle
+    price_modifier = Column(Float, default=0)  # Extra charge for premium seats
+    is_female_only = Column(Integer, default=0)
+    is_active = Column(Integer, default=1)
+
+
+class BusBoardingPointModel(Base):
+    __tablename__ = "bus_boarding_points"
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    schedule_id = Column(Integer, ForeignKey("bus_schedules.id"), index=True, nullable=False)
+    city_id = Column(Integer, ForeignKey("bus_cities.id"), nullable=False)
+    point_name = Column(String(255), nullable=False)
+    address = Column(Text, nullable=True)
+    time = Column(String(10), nullable=False)  # HH:MM
+    latitude = Column(Float, nullable=True)
+    longitude = Column(Float, nullable=True)
+    point_type = Column(String(20), default="boarding")  # boarding, dropping
+    is_active = Column(Integer, default=1)
+
+
+class BusBookingModel(Base):
+    __tablename__ = "bus_bookings"
+    __table_args__ = (
+        Index("ix_bus_bookings_created_at_id", "created_at", "id"),
+        Index("ix_bus_bookings_user_created_at", "user_id", "created_at"),
+    )
+
+    id = Column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
+    user_id = Column(String(36), ForeignKey("users.id"), nullable=True)
+    schedule_id = Column(Integer, ForeignKey("bus_schedules.id"), nullable=False)
+    journey_date = Column(String(20), nullable=False)  # YYYY-MM-DD
+    pnr = Column(String(20), unique=True, nullable=False)
+    booking_status = Column(String(30), default="pending")  # pending, confirmed, cancelled, completed
+    total_amount = Column(Float, nullable=False)
+    discount_amount = Column(Float, default=0)
+    final_amount = Column(Float, nullable=False)
+    payment_status = Column(String(30), default="pending")  # pending, paid, refunded
+    payment_method = Column(String(30), nullable=True)
+    transaction_id = Column(String(100), nullable=True)
+    boarding_point_id = Column(Integer, ForeignKey("bus_boarding_points.id"), nullable=True)
+    dropping_point_id = Column(Integer, ForeignKey("bus_boarding_points.id"), nullable=True)
+    contact_name = Column(String(255), nullable=True)
+    contact_email = Column(String(255), nullable=True)
+    contact_phone = Column(String(20), nullable=True)
+    cancelled_at = Column(DateTime(timezone=True), nullable=True)
+    refund_amount = Column(Float, nullable=True)
+    refund_status = Column(String(30), nullable=True)
+    created_at = Column(DateTime(timezone=True), default=lambda: datetime.now(timezone.utc))
+    updated_at = Column(DateTime(timezone=True), nullable=True)
+
+
+class BusPassengerModel(Base):
+    __tablename__ = "bus_passengers"
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    booking_id = Column(String(36), ForeignKey("bus_bookings.id"), index=True, nullable=False)
+    seat_id = Column(Integer, ForeignKey("bus_seats.id"), nullable=False)
+    name = Column(String(255), nullable=False)
+    age = Column(Integer, nullable=False)
+    gender = Column(String(10), nullable=False)  # male, female, other
+    id_type = Column(String(50), nullable=True)  # aadhaar, passport, etc.
+    id_number = Column(String(100), nullable=True)
+    seat_price = Column(Float, nullable=False)
+
+
+class BusSeatAvailabilityModel(Base):
+    __tablename__ = "bus_seat_availability"
+    __table_args__ = (
+        # Seat layout (schedule + date) and per-seat lock/book lookups; one row per seat
+        Index("ux_bus_seat_availability_schedule_date_seat", "schedule_id", "journey_date", "seat_id",
+              unique=True),
+        # Expired-hold sweeps
+        Index("ix_bus_seat_availability_status_locked_until", "status", "locked_until"),
+    )
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    schedule_id = Column(Integer, ForeignKey("bus_schedules.id"), nullable=False)
+    seat_id = Column(Integer, ForeignKey("bus_seats.id"), nullable=False)
+    journey_date = Column(String(20), nullable=False)  # YYYY-MM-DD
+    status = Column(String(20), default="available")  # available, booked, locked, blocked
+    locked_by = Column(String(36), nullable=True)  # user_id who locked
+    locked_until = Column(DateTime(timezone=True), nullable=True)
+    booking_id = Column(String(36), ForeignKey("bus_bookings.id"), index=True, nullable=True)
+
+
+class BusLiveTrackingModel(Base):
+    __tablename__ = "bus_live_tracking"
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    schedule_id = Column(Integer, ForeignKey("bus_schedules.id"), nullable=False)
+    journey_date = Column(String(20), nullable=False)
+    current_latitude = Column(Float, nullable=True)
+    current_longitude = Column(Float, nullable=True)
+    speed_kmph = Column(Float, nullable=True)
+    status = Column(String(30), default="not_started")  # not_started, departed, en_route, arrived
+    last_updated = Column(DateTime(timezone=True), default=lambda: datetime.now(timezone.utc))
+    eta_mins = Column(Integer, nullable=True)
+
+
+# =============================
+# Flight Booking Models (Advanced MakeMyTrip-style)
+# =============================
+
+class AirportModel(Base):
+    __tablename__ = "airports"
+    
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    code = Column(String(10), unique=True, nullable=False)  # IATA code (e.g., DEL, BOM)
+    name = Column(String(200), nullable=False)
+    city = Column(String(100), nullable=False)
+    country = Column(String(100), nullable=False)
+    latitude = Column(Float, nullable=True)
+    longitude = Column(Float, nullable=True)
+    timezone = Column(String(50), nullable=True)
+    is_active = Column(Integer, default=1)
+    created_at = Column(DateTime, default=datetime.utcnow)
+
+
+class AirlineModel(Base):
+    __tablename__ = "airlines"
+    
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    code = Column(String(10), unique=True, nullable=False)  # Airline code (e.g., 6E, AI)
+    name = Column(String(200), nullable=False)
+    logo_url = Column(String(500), nullable=True)
+    country = Column(String(100), nullable=True)
+    is_active = Column(Integer, default=1)
+    created_at = Column(DateTime, default=datetime.utcnow)
+
+
+class AircraftModel(Base):
+    __tablename__ = "aircraft"
+    
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    model = Column(String(50), nullable=False)  # A320, B737, etc.
+    manufacturer = Column(String(100), nullable=True)
+    total_seats = Column(Integer, nullable=False)
+    economy_seats = Column(Integer, nullable=False)
+    business_seats = Column(Integer, default=0)
+    seat_layout = Column(String(20), nullable=False)  # 3-3 for economy, 2-2 for business
+    created_at = Column(DateTime, default=datetime.utcnow)
+
+
+class FlightRouteModel(Base):
+    __tablename__ = "flight_routes"
+    __table_args__ = (
+        Index("ix_flight_routes_origin_destination", "origin_airport_id", "destination_airport_id"),
+    )
+    
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    origin_airport_id = Column(Integer, ForeignKey("airports.id"), nullable=False)
+    destination_airport_id = Column(Integer, ForeignKey("airports.id"), nullable=False)
+    distance_km = Column(Integer, nullable=True)
+    estimated_duration_mins = Column(Integer, nullable=True)
+    is_active = Column(Integer, default=1)
+    created_at = Column(DateTime, default=datetime.utcnow)
+
+
+class FlightModel(Base):
+    __tablename__ = "flights"
+    
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    flight_number = Column(String(20), nullable=False)
+    airline_id = Column(Integer, ForeignKey("airlines.id"), nullable=False)
+    route_id = Column(Integer, ForeignKey("flight_routes.id"), index=True, nullable=False)
+    aircraft_id = Column(Integer, ForeignKey("aircraft.id"), nullable=False)
+    departure_time = Column(String(10), nullable=False)  # HH:MM format
+    arrival_time = Column(String(10), nullable=False)
+    duration_mins = Column(Integer, nullable=False)
+    stops = Column(Integer, default=0)
+    stop_airports = Column(String(200), nullable=True)  # Comma-separated airport codes
+    days_of_week = Column(String(20), nullable=False)  # 1,2,3,4,5,6,7 (Mon-Sun)
+    base_price_economy = Column(Float, nullable=False)
+    base_price_business = Column(Float, nullable=True)
+    is_overnight = Column(Integer, default=0)
+    is_refundable = Column(Integer, default=1)
+    baggage_allowance = Column(String(100), default="15kg check-in, 7kg cabin")
+    meal_included = Column(Integer, default=0)
+    is_active = Column(Integer, default=1)
+    created_at = Column(DateTime, default=datetime.utcnow)
+
+
+class FlightScheduleModel(Base):
+    __tablename__ = "flight_schedules"
+    __table_args__ = (
+        # One schedule per flight and day; search looks schedules up by this key
+        Index("ux_flight_schedules_flight_date", "flight_id", "flight_date", unique=True),
+    )
+    
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    flight_id = Column(Integer, ForeignKey("flights.id"), nullable=False)
+    flight_date = Column(String(20), nullable=False)  # YYYY-MM-DD
+    departure_datetime = Column(DateTime, nullable=False)
+    arrival_datetime = Column(DateTime, nullable=False)
+    status = Column(String(30), default="scheduled")  # scheduled, boarding, departed, in_air, landed, cancelled, delayed
+    delay_mins = Column(Integer, default=0)
+    gate = Column(String(10), nullable=True)
+    terminal = Column(String(10), nullable=True)
+    economy_price = Column(Float, nullable=False)
+    business_price = Column(Float, nullable=True)
+    available_economy = Column(Integer, nullable=False)
+    available_business = Column(Integer, default=0)
+    created_at = Column(DateTime, default=datetime.utcnow)
+
+
+class FlightSeatModel(Base):
+    __tablename__ = "flight_seats"
+    
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    aircraft_id = Column(Integer, ForeignKey("aircraft.id"), index=True, nullable=False)
+    seat_number = Column(String(10), nullable=False)  # 1A, 12F, etc.
+    seat_class = Column(String(20), nullable=False)  # economy, business
+    seat_type = Column(String(20), nullable=False)  # window, middle, aisle
+    row_number = Column(Integer, nullable=False)
+    column_letter = Column(String(2), nullable=False)  # A, B, C, D, E, F
+    is_extra_legroom = Column(Integer, default=0)
+    is_emergency_exit = Column(Integer, default=0)
+    is_reclinable = Column(Integer, default=1)
+    price_modifier = Column(Float, default=0)  # Extra charge for premium seats
+    is_active = Column(Integer, default=1)
+
+
+class FlightSeatAvailabilityModel(Base):
+    __tablename__ = "flight_seat_availability"
+    __table_args__ = (
+        Index("ux_flight_seat_availability_schedule_seat", "schedule_id", "seat_id", unique=True),
+        Index("ix_flight_seat_availability_status_locked_until", "status", "locked_until"),
+    )
+    
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    schedule_id = Column(Integer, ForeignKey("flight_schedules.id"), nullable=False)
+    seat_id = Column(Integer, ForeignKey("flight_seats.id"), nullable=False)
+    status = Column(String(20), default="available")  # available, locked, booked, blocked
+    locked_by = Column(String(36), nullable=True)
+    locked_until = Column(DateTime, nullable=True)
+
+
+class FlightBookingModel(Base):
+    __tablename__ = "flight_bookings"
+    __table_args__ = (
+        Index("ix_flight_bookings_created_at_id", "created_at", "id"),
+        Index("ix_flight_bookings_user_created_at", "user_id", "created_at"),
+    )
+    
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    user_id = Column(String(36), ForeignKey("users.id"), nullable=False)
+    booking_reference = Column(String(20), unique=True, nullable=False)
+    pnr = Column(String(10), unique=True, nullable=False)
+    trip_type = Column(String(20), nullable=False)  # one_way, round_trip, multi_city
+    booking_status = Column(String(30), default="confirmed")  # confirmed, cancelled, completed
+    total_amount = Column(Float, nullable=False)
+    discount_amount = Column(Float, default=0)
+    final_amount = Column(Float, nullable=False)
+    payment_status = Column(String(20), default="pending")
+    payment_method = Column(String(50), nullable=True)
+    transaction_id = Column(String(100), nullable=True)
+    contact_name = Column(String(200), nullable=False)
+    contact_email = Column(String(200), nullable=False)
+    contact_phone = Column(String(20), nullable=False)
+    created_at = Column(DateTime, default=datetime.utcnow)
+    cancelled_at = Column(DateTime, nullable=True)
+    refund_amount = Column(Float, nullable=True)
+
+
+class FlightSegmentModel(Base):
+    """Each segment of a flight booking (for multi-city or round trips)"""
+    __tablename__ = "flight_segments"
+    __table_args__ = (
+        Index("ix_flight_segments_booking_order", "booking_id", "segment_order"),
+    )
+    
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    booking_id = Column(Integer, ForeignKey("flight_bookings.id"), nullable=False)
+    segment_order = Column(Integer, nullable=False)  # 1, 2, 3 for multi-city
+    schedule_id = Column(Integer, ForeignKey("flight_schedules.id"), nullable=False)
+    segment_type = Column(String(20), nullable=False)  # outbound, return, multi_city
+    segment_pnr = Column(String(10), nullable=False)
+    created_at = Column(DateTime, default=datetime.utcnow)
+
+
+class FlightPassengerModel(Base):
+    __tablename__ = "flight_passengers"
+    
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    booking_id = Column(Integer, ForeignKey("flight_bookings.id"), index=True, nullable=False)
+    segment_id = Column(Integer, ForeignKey("flight_segments.id"), index=True, nullable=False)
+    seat_id = Column(Integer, ForeignKey("flight_seats.id"), nullable=True)
+    passenger_type = Column(String(20), nullable=False)  # adult, child, infant
+    title = Column(String(10), nullable=False)  # Mr, Mrs, Ms, Master, Miss
+    first_name = Column(String(100), nullable=False)
+    last_name = Column(String(100), nullable=False)
+    date_of_birth = Column(String(20), nullable=True)
+    gender = Column(String(10), nullable=False)
+    nationality = Column(String(100), nullable=True)
+    passport_number = Column(String(50), nullable=True)
+    seat_number = Column(String(10), nullable=True)
+    seat_class = Column(String(20), nullable=False)  # economy, business
+    meal_preference = Column(String(50), nullable=True)  # veg, non_veg, vegan, etc.
+    special_assistance = Column(String(200), nullable=True)
+    ticket_number = Column(String(20), nullable=True)
+    boarding_pass_issued = Column(Integer, default=0)
+    fare_amount = Column(Float, nullable=False)
+    created_at = Column(DateTime, default=datetime.utcnow)
+
+
+class FlightTrackingModel(Base):
+    __tablename__ = "flight_tracking"
+    
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    schedule_id = Column(Integer, ForeignKey("flight_schedules.id"), nullable=False)
+    current_latitude = Column(Float, nullable=True)
+    current_longitude = Column(Float, nullable=True)
+    altitude_ft = Column(Integer, nullable=True)
+    speed_kmph = Column(Float, nullable=True)
+    heading = Column(Integer, nullable=True)
+    status = Column(String(30), default="scheduled")  # scheduled, boarding, taxiing, departed, in_air, landing, landed
+    progress_percentage = Column(Float, default=0)
+    last_updated = Column(DateTime, default=datetime.utcnow)
+    eta_mins = Column(Integer, nullable=True)
+
+
+# =============================
+# Hotel Booking Models (Advanced Booking.com/MakeMyTrip-style)
+# =============================
+
+class HotelModel(Base):
+    __tablename__ = "hotels"
+    
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    name = Column(String(300), nullable=False)
+    slug = Column(String(300), unique=True, nullable=False)
+    description = Column(Text, nullable=True)
+    star_category = Column(Integer, nullable=False)  # 1, 2, 3, 4, 5
+    hotel_type = Column(String(100), nullable=True)  # Hotel, Resort, Boutique, etc.
+    city = Column(String(100), nullable=False)
+    state = Column(String(100), nullable=False)
+    country = Column(String(100), default="India")
+    address = Column(Text, nullable=True)
+    latitude = Column(Float, nullable=True)
+    longitude = Column(Float, nullable=True)
+    landmark = Column(String(200), nullable=True)
+    distance_from_center = Column(Float, nullable=True)  # in km
+    rating = Column(Float, default=0)  # User rating 0-5
+    reviews_count = Column(Integer, default=0)
+    price_per_night = Column(Float, nullable=False)  # Starting price
+    original_price = Column(Float, nullable=True)  # Before discount
+    currency = Column(String(10), default="INR")
+    amenities = Column(Text, nullable=True)  # JSON string of amenities
+    images = Column(Text, nullable=True)  # JSON string of image URLs
+    policies = Column(Text, nullable=True)  # JSON string of policies
+    check_in_time = Column(String(10), default="14:00")
+    check_out_time = Column(String(10), default="11:00")
+    contact_phone = Column(String(20), nullable=True)
+    contact_email = Column(String(200), nullable=True)
+    gst_number = Column(String(50), nullable=True)
+    is_featured = Column(Integer, default=0)
+    free_cancellation = Column(Integer, default=1)
+    breakfast_included = Column(Integer, default=0)
+    total_rooms = Column(Integer, default=50)
+    is_active = Column(Integer, default=1)
+    created_at = Column(DateTime, default=datetime.utcnow)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+    # Parsed views of the JSON columns (parsed once, read-only)
+    amenities_data = parsed_json("amenities")
+    images_data = parsed_json("images")
+    policies_data = parsed_json("policies")
+
+    @property
+    def primary_image(self):
+        images = self.images_data
+        if not images:
+            return None
+        return images[0]["url"] if isinstance(images[0], dict) else images[0]
+
+
+class HotelRoomModel(Base):
+    __tablename__ = "hotel_rooms"
+    
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    hotel_id = Column(Integer, ForeignKey("hotels.id"), index=True, nullable=False)
+    room_type = Column(String(100), nullable=False)  # Standard, Deluxe, Suite, etc.
+    room_name = Column(String(200), nullable=False)
+    description = Column(Text, nullable=True)
+    max_guests = Column(Integer, default=2)
+    max_adults = Column(Integer, default=2)
+    max_children = Column(Integer, default=1)
+    bed_type = Column(String(100), nullable=False)  # King, Queen, Twin, etc.
+    room_size_sqft = Column(Integer, nullable=True)
+    view_type = Column(String(100), nullable=True)  # City View, Garden View, Pool View
+    price_per_night = Column(Float, nullable=False)
+    original_price = Column(Float, nullable=True)
+    discount_percent = Column(Float, default=0)
+    amenities = Column(Text, nullable=True)  # JSON string
+    images = Column(Text, nullable=True)  # JSON string
+    inclusions = Column(Text, nullable=True)  # JSON string (breakfast, wifi, etc.)
+    cancellation_policy = Column(Text, nullable=True)
+    total_rooms = Column(Integer, default=10)
+    available_rooms = Column(Integer, default=10)
+    is_refundable = Column(Integer, default=1)
+    is_active = Column(Integer, default=1)
+    created_at = Column(DateTime, default=datetime.utcnow)
+
+    amenities_data = parsed_json("amenities")
+    images_data = parsed_json("images")
+    inclusions_data = parsed_json("inclusions")
+
+
+class HotelRoomAvailabilityModel(Base):
+    __tablename__ = "hotel_room_availability"
+    __table_args__ = (
+        # Rooms left per room type and night; stays are range scans of this key
+        Index("ux_hotel_room_availability_room_date", "room_id", "date", unique=True),
+    )
+    
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    room_id = Column(Integer, ForeignKey("hotel_rooms.id"), nullable=False)
+    date = Column(String(20), nullable=False)  # YYYY-MM-DD
+    available_rooms = Column(Integer, nullable=False)
+    price = Column(Float, nullable=False)
+    is_blocked = Column(Integer, default=0)
+
+
+class HotelBookingModel(Base):
+    __tablename__ = "hotel_bookings"
+    __table_args__ = (
+        # My bookings, newest first
+        Index("ix_hotel_bookings_user_created_at", "user_id", "created_at"),
+    )
+    
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    booking_id = Column(String(36), unique=True, nullable=False)  # UUID
+    booking_reference = Column(String(20), unique=True, nullable=False)
+    user_id = Column(String(36), ForeignKey("users.id"), nullable=False)
+    hotel_id = Column(Integer, ForeignKey("hotels.id"), nullable=False)
+    room_id = Column(Integer, ForeignKey("hotel_rooms.id"), nullable=False)
+    check_in_date = Column(String(20), nullable=False)  # YYYY-MM-DD
+    check_out_date = Column(String(20), nullable=False)
+    check_in_time = Column(String(10), nullable=True)
+    check_out_time = Column(String(10), nullable=True)
+    nights = Column(Integer, nullable=False)
+    rooms_booked = Column(Integer, default=1)
+    adults = Column(Integer, default=2)
+    children = Column(Integer, default=0)
+    guest_name = Column(String(200), nullable=False)
+    guest_email = Column(String(200), nullable=False)
+    guest_phone = Column(String(20), nullable=False)
+    guest_nationality = Column(String(100), default="Indian")
+    special_requests = Column(Text, nullable=True)
+    base_price = Column(Float, nullable=False)  # Room rate * nights
+    taxes = Column(Float, nullable=False)
+    service_charge = Column(Float, default=0)
+    discount_amount = Column(Float, default=0)
+    total_amount = Column(Float, nullable=False)
+    currency = Column(String(10), default="INR")
+    payment_status = Column(String(30), default="pending")  # pending, paid, refunded, failed
+    payment_method = Column(String(50), nullable=True)
+    transaction_id = Column(String(100), nullable=True)
+    payment_date = Column(DateTime, nullable=True)
+    booking_status = Column(String(30), default="confirmed")  # confirmed, cancelled, completed, no_show
+    cancellation_reason = Column(Text, nullable=True)
+    cancelled_at = Column(DateTime, nullable=True)
+    refund_amount = Column(Float, nullable=True)
+    refund_status = Column(String(30), nullable=True)  # pending, processed, failed
+    qr_code = Column(Text, nullable=True)
+    created_at = Column(DateTime, default=datetime.utcnow)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+
+class HotelReviewModel(Base):
+    __tablename__ = "hotel_reviews"
+    __table_args__ = (Index("ix_hotel_reviews_hotel_created_at_id", "hotel_id", "is_active", "created_at", "id"),)
+    
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    hotel_id = Column(Integer, ForeignKey("hotels.id"), nullable=False)
+    booking_id = Column(Integer, ForeignKey("hotel_bookings.id"), nullable=True)
+    user_id = Column(String(36), ForeignKey("users.id"), nullable=False)
+    rating = Column(Float, nullable=False)  # 1-5
+    cleanliness_rating = Column(Float, nullable=True)
+    service_rating = Column(Float, nullable=True)
+    location_rating = Column(Float, nullable=True)
+    value_rating = Column(Float, nullable=True)
+    title = Column(String(200), nullable=True)
+    review_text = Column(Text, nullable=True)
+    pros = Column(Text, nullable=True)
+    cons = Column(Text, nullable=True)
+    travel_type = Column(String(50), nullable=True)  # Business, Leisure, Family, Couple
+    is_verified = Column(Integer, default=0)
+    helpful_count = Column(Integer, default=0)
+    is_active = Column(Integer, default=1)
+    created_at = Column(DateTime, default=datetime.utcnow)
+
+
+class HotelWishlistModel(Base):
+    __tablename__ = "hotel_wishlists"
+    
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    user_id = Column(String(36), ForeignKey("users.id"), nullable=False)
+    hotel_id = Column(Integer, ForeignKey("hotels.id"), nullable=False)
+    created_at = Column(DateTime, default=datetime.utcnow)
+
+
+# =============================
+# Advanced Restaurant Booking Models
+# =============================
+
+class RestaurantModel(Base):
+    __tablename__ = "restaurants"
+    __table_args__ = (
+        # Keyset pagination of /restaurant/search per sort order
+        Index("ix_restaurants_rating_id", "rating", "id"),
+        Index("ix_restaurants_price_id", "price_for_two", "id"),
+        Index("ix_restaurants_popularity_id", "popularity_score", "rating", "id"),
+    )
+    
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    name = Column(String(200), nullable=False)
+    slug = Column(String(250), nullable=True, index=True)
+    description = Column(Text, nullable=True)
+    city = Column(String(100), nullable=False, index=True)
+    locality = Column(String(200), nullable=True)
+    address = Column(Text, nullable=True)
+    latitude = Column(Float, nullable=True)
+    longitude = Column(Float, nullable=True)
+    
+    # Cuisine & Category
+    cuisines = Column(JSON, default=[])  # ["South Indian", "North Indian", "Chinese"]
+    restaurant_type = Column(String(100), nullable=True)  # Fine Dining, Casual, Cafe, Fast Food
+    
+    # Ratings & Reviews
+    rating = Column(Float, default=4.0)
+    total_reviews = Column(Integer, default=0)
+    food_rating = Column(Float, nullable=True)
+    service_rating = Column(Float, nullable=True)
+    ambience_rating = Column(Float, nullable=True)
+    
+    # Pricing
+    price_for_two = Column(Integer, default=500)
+    price_category = Column(String(20), default="moderate")  # budget, moderate, expensive, premium
+    
+    # Tags & Features
+    is_pure_veg = Column(Integer, default=0)
+    has_bar = Column(Integer, default=0)
+    is_family_friendly = Column(Integer, default=1)
+    has_outdoor_seating = Column(Integer, default=0)
+    has_ac = Column(Integer, default=1)
+    has_wifi = Column(Integer, default=0)
+    has_parking = Column(Integer, default=0)
+    accepts_reservations = Column(Integer, default=1)
+    has_live_music = Column(Integer, default=0)
+    has_private_dining = Column(Integer, default=0)
+    
+    # Delivery & Takeaway
+    has_delivery = Column(Integer, default=1)
+    has_takeaway = Column(Integer, default=1)
+    avg_delivery_time = Column(Integer, default=30)  # minutes
+    
+    # Timing
+    opening_time = Column(String(10), default="10:00")
+    closing_time = Column(String(10), default="23:00")
+    is_open_now = Column(Integer, default=1)
+    weekly_off = Column(String(20), nullable=True)  # "Sunday", "Monday", etc.
+    
+    # Media
+    images = Column(JSON, default=[])
+    logo_url = Column(String(500), nullable=True)
+    cover_image = Column(String(500), nullable=True)
+    
+    # Contact
+    phone = Column(String(20), nullable=True)
+    email = Column(String(100), nullable=True)
+    website = Column(String(200), nullable=True)
+    
+    # Amenities
+    amenities = Column(JSON, default=[])
+    
+    # Popularity
+    popularity_score = Column(Integer, default=0)
+    is_featured = Column(Integer, default=0)
+    is_trending = Column(Integer, default=0)
+    
+    # Status
+    is_active = Column(Integer, default=1)
+    created_at = Column(DateTime, default=datetime.utcnow)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+
+class RestaurantTableModel(Base):
+    __tablename__ = "restaurant_tables"
+    
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    restaurant_id = Column(Integer, ForeignKey("restaurants.id"), nullable=False)
+    table_number = Column(String(20), nullable=False)
+    capacity = Column(Integer, default=4)
+    table_type = Column(String(50), default="standard")  # standard, booth, outdoor, private, window
+    seating_type = Column(String(50), default="indoor")  # indoor, outdoor, rooftop, garden
+    is_ac = Column(Integer, default=1)
+    floor = Column(Integer, default=0)
+    description = Column(String(200), nullable=True)
+    min_booking_amount = Column(Integer, default=0)
+    is_active = Column(Integer, default=1)
+    created_at = Column(DateTime, default=datetime.utcnow)
+
+
+class RestaurantTimeSlotModel(Base):
+    __tablename__ = "restaurant_time_slots"
+    
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    restaurant_id = Column(Integer, ForeignKey("restaurants.id"), nullable=False)
+    slot_time = Column(String(10), nullable=False)  # "12:00", "12:30", etc.
+    slot_type = Column(String(20), default="lunch")  # breakfast, lunch, dinner, late_night
+    is_peak_hour = Column(Integer, default=0)
+    peak_hour_charge_percent = Column(Float, default=0)  # 10, 15, 20%
+    max_reservations = Column(Integer, default=10)
+    is_active = Column(Integer, default=1)
+
+
+class RestaurantTableAvailabilityModel(Base):
+    __tablename__ = "restaurant_table_availability"
+    
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    table_id = Column(Integer, ForeignKey("restaurant_tables.id"), nullable=False)
+    date = Column(Date, nullable=False)
+    time_slot = Column(String(10), nullable=False)
+    is_available = Column(Integer, default=1)
+    booking_id = Column(Integer, nullable=True)
+
+
+class MenuCategoryModel(Base):
+    __tablename__ = "menu_categories"
+    
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    restaurant_id = Column(Integer, ForeignKey("restaurants.id"), nullable=False)
+    name = Column(String(100), nullable=False)
+    description = Column(String(300), nullable=True)
+    display_order = Column(Integer, default=0)
+    image_url = Column(String(500), nullable=True)
+    is_active = Column(Integer, default=1)
+
+
+class MenuItemModel(Base):
+    __tablename__ = "menu_items"
+    
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    restaurant_id = Column(Integer, ForeignKey("restaurants.id"), nullable=False)
+    category_id = Column(Integer, ForeignKey("menu_categories.id"), nullable=True)
+    name = Column(String(200), nullable=False)
+    description = Column(Text, nullable=True)
+    price = Column(Float, nullable=False)
+    discounted_price = Column(Float, nullable=True)
+    
+    # Type
+    is_veg = Column(Integer, default=1)
+    is_bestseller = Column(Integer, default=0)
+    is_chef_special = Column(Integer, default=0)
+    is_new = Column(Integer, default=0)
+    spice_level = Column(Integer, default=1)  # 1-5
+    
+    # Preparation
+    prep_time_mins = Column(Integer, default=15)
+    serves = Column(Integer, default=1)  # Number of people
+    
+    # Media
+    image_url = Column(String(500), nullable=True)
+    
+    # Availability
+    available_for_preorder = Column(Integer, default=1)
+    available_start_time = Column(String(10), nullable=True)
+    available_end_time = Column(String(10), nullable=True)
+    
+    # Nutrition (optional)
+    calories = Column(Integer, nullable=True)
+    
+    # Status
+    is_available = Column(Integer, default=1)
+    is_active = Column(Integer, default=1)
+    created_at = Column(DateTime, default=datetime.utcnow)
+
+
+class RestaurantBookingModel(Base):
+    __tablename__ = "restaurant_bookings"
+    
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    booking_reference = Column(String(20), unique=True, nullable=False, index=True)
+    user_id = Column(String(36), ForeignKey("users.id"), nullable=False)
+    restaurant_id = Column(Integer, ForeignKey("restaurants.id"), nullable=False)
+    
+    # Booking Details
+    booking_date = Column(Date, nullable=False)
+    time_slot = Column(String(10), nullable=False)
+    guests_count = Column(Integer, nullable=False)
+    
+    # Table Info
+    table_id = Column(Integer, ForeignKey("restaurant_tables.id"), nullable=True)
+    seating_preference = Column(String(50), nullable=True)  # indoor, outdoor, ac, non_ac
+    
+    # Guest Info
+    guest_name = Column(String(100), nullable=False)
+    guest_phone = Column(String(20), nullable=False)
+    guest_email = Column(String(100), nullable=True)
+    special_requests = Column(Text, nullable=True)
+    occasion = Column(String(50), nullable=True)  # Birthday, Anniversary, Date, Business
+    
+    # Pricing
+    base_amount = Column(Float, default=0)
+    peak_hour_charge = Column(Float, default=0)
+    service_charge = Column(Float, default=0)
+    gst = Column(Float, default=0)
+    total_amount = Column(Float, default=0)
+    advance_paid = Column(Float, default=0)
+    
+    # Payment
+    payment_status = Column(String(20), default="pending")  # pending, partial, paid, refunded
+    payment_method = Column(String(30), nullable=True)
+    transaction_id = Column(String(100), nullable=True)
+    
+    # Status
+    booking_status = Column(String(20), default="confirmed")  # confirmed, completed, cancelled, no_show
+    cancellation_reason = Column(String(200), nullable=True)
+    cancelled_at = Column(DateTime, nullable=True)
+    
+    # QR & Timestamps
+    qr_code = Column(Text, nullable=True)
+    created_at = Column(DateTime, default=datetime.utcnow)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+
+class PreOrderModel(Base):
+    __tablename__ = "pre_orders"
+    
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    order_reference = Column(String(20), unique=True, nullable=False, index=True)
+    user_id = Column(String(36), ForeignKey("users.id"), nullable=False)
+    restaurant_id = Column(Integer, ForeignKey("restaurants.id"), nullable=False)
+    booking_id = Column(Integer, ForeignKey("restaurant_bookings.id"), nullable=True)
+    
+    # Order Details
+    order_date = Column(Date, nullable=False)
+    arrival_time = Column(String(10), nullable=False)
+    guests_count = Column(Integer, nullable=False)
+    
+    # Guest Info
+    guest_name = Column(String(100), nullable=False)
+    guest_phone = Column(String(20), nullable=False)
+    special_instructions = Column(Text, nullable=True)
+    
+    # Items
+    items = Column(JSON, default=[])  # [{item_id, name, quantity, price, is_veg}]
+    
+    # Preparation
+    estimated_prep_time = Column(Integer, default=30)  # minutes
+    ready_by_time = Column(String(10), nullable=True)
+    
+    # Pricing
+    subtotal = Column(Float, default=0)
+    gst = Column(Float, default=0)
+    packaging_charge = Column(Float, default=0)
+    total_amount = Column(Float, default=0)
+    
+    # Payment
+    payment_status = Column(String(20), default="pending")
+    payment_method = Column(String(30), nullable=True)
+    transaction_id = Column(String(100), nullable=True)
+    
+    # Status
+    order_status = Column(String(20), default="pending")  # pending, confirmed, preparing, ready, completed, cancelled
+    
+    # QR & Timestamps
+    qr_code = Column(Text, nullable=True)
+    created_at = Column(DateTime, default=datetime.utcnow)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+
+class RestaurantQueueModel(Base):
+    __tablename__ = "restaurant_queue"
+    __table_args__ = (
+        Index("ix_restaurant_queue_restaurant_date_status", "restaurant_id", "queue_date", "status", "position"),
+    )
+    
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    queue_number = Column(String(10), nullable=False)
+    user_id = Column(String(36), ForeignKey("users.id"), nullable=True)
+    restaurant_id = Column(Integer, ForeignKey("restaurants.id"), nullable=False)
+    
+    # Queue Details
+    queue_date = Column(Date, nullable=False)
+    join_time = Column(DateTime, default=datetime.utcnow)
+    guests_count = Column(Integer, nullable=False)
+    
+    # Guest Info
+    guest_name = Column(String(100), nullable=False)
+    guest_phone = Column(String(20), nullable=False)
+    
+    # Position
+    position = Column(Integer, nullable=False)
+    estimated_wait_mins = Column(Integer, default=30)
+    
+    # Status
+    status = Column(String(20), default="waiting")  # waiting, notified, seated, left, expired
+    seated_at = Column(DateTime, nullable=True)
+    left_at = Column(DateTime, nullable=True)
+    
+    # QR
+    qr_code = Column(Text, nullable=True)
+    created_at = Column(DateTime, default=datetime.utcnow)
+
+
+class RestaurantReviewModel(Base):
+    __tablename__ = "restaurant_reviews"
+    __table_args__ = (
+        Index("ix_restaurant_reviews_restaurant_created_at_id", "restaurant_id", "is_active", "created_at", "id"),
+    )
+    
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    user_id = Column(String(36), ForeignKey("users.id"), nullable=False)
+    restaurant_id = Column(Integer, ForeignKey("restaurants.id"), nullable=False)
+    booking_id = Column(Integer, ForeignKey("restaurant_bookings.id"), nullable=True)
+    
+    # Ratings
+    overall_rating = Column(Float, nullable=False)
+    food_rating = Column(Float, nullable=True)
+    service_rating = Column(Float, nullable=True)
+    ambience_rating = Column(Float, nullable=True)
+    value_rating = Column(Float, nullable=True)
+    
+    # Review Content
+    title = Column(String(200), nullable=True)
+    review_text = Column(Text, nullable=True)
+    
+    # Dining Type
+    dining_type = Column(String(30), nullable=True)  # Dine-in, Delivery, Takeaway
+    visit_type = Column(String(30), nullable=True)  # Family, Friends, Couple, Business, Solo
+    
+    # Media
+    images = Column(JSON, default=[])
+    
+    # Status
+    is_verified = Column(Integer, default=0)
+    helpful_count = Column(Integer, default=0)
+    is_active = Column(Integer, default=1)
+    created_at = Column(DateTime, default=datetime.utcnow)
+
+
+class RestaurantWishlistModel(Base):
+    __tablename__ = "restaurant_wishlists"
+    
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    user_id = Column(String(36), ForeignKey("users.id"), nullable=False)
+    restaurant_id = Column(Integer, ForeignKey("restaurants.id"), nullable=False)
+    created_at = Column(DateTime, default=datetime.utcnow)
+
+
+# =============================
+# Daily booking rollups (dashboard and reports), kept current by session hooks
+# =============================
+booking_rollups = BookingRollups(BookingDailyRollupModel, [
+    RollupSource("service_booking", ServiceBookingModel, amount="total_price"),
+    RollupSource("booking", BookingModel, amount="total_price", service_type=None, default_type="package"),
+    RollupSource("transaction", TransactionModel, amount="amount"),
+])
+booking_rollups.install(SessionLocal)
+
+
+# =============================
+# Atomic seat holds on the availability tables, swept when they expire
+# =============================
+seat_holds.register(SeatHoldTable("bus", BusSeatAvailabilityModel, ("schedule_id", "journey_date"),
+                                  clock=utc_now, map_key=bus_seat_map_key))
+seat_holds.register(SeatHoldTable("flight", FlightSeatAvailabilityModel, ("schedule_id",),
+                                  clock=datetime.now, map_key=flight_seat_map_key))
@@ -0,0 +1,54 @@
+"""WebSocket connections used to push notifications to signed-in users."""
+import logging
+from typing import Dict, List
+
+from fastapi import WebSocket
+
+
+# =============================
+# WebSocket Connection Manager for Real-Time Notifications
+# =============================
+class ConnectionManager:
+    def __init__(self):
+        # Maps user_id to list of WebSocket connections (user can have multiple tabs)
+        self.active_connections: Dict[str, List[WebSocket]] = {}
+    
+    async def connect(self, websocket: WebSocket, user_id: str):
+        await websocket.accept()
+        if user_id not in self.active_connections:
+            self.active_connections[user_id] = []
+        self.active_connections[user_id].append(websocket)
+        logging.info(f"WebSocket connected for user {user_id}")
+    
+    def disconnect(self, websocket: WebSocket, user_id: str):
+        if user_id in self.active_connections:
+            if websocket in self.active_connections[user_id]:
+                self.active_connections[user_id].remove(websocket)
+            if not self.active_connections[user_id]:
+                del self.active_connections[user_id]
+        logging.info(f"WebSocket disconnected for user {user_id}")
+    
+    async def send_to_user(self, user_id: str, message: dict):
+        """Send notification to a specific user"""
+        if user_id in self.active_connections:
+            disconnected = []
+            for connection in self.active_connections[user_id]:
+                try:
+                    await connection.send_json(message)
+                except Exception as e:
+                    logging.warning(f"Failed to send to user {user_id}: {e}")
+                    disconnected.append(connection)
+            # Clean up disconnected connections
+            for conn in disconnected:
+                self.active_connections[user_id].remove(conn)
+    
+    async def broadcast_to_all(self, message: dict):
+        """Broadcast notification to all connected users"""
+        for user_id in list(self.active_connections.keys()):
+            await self.send_to_user(user_id, message)
+    
+    def get_connected_users(self) -> List[str]:
+        """Get list of connected user IDs"""
+        return list(self.active_connections.keys())
+
+notification_manager = ConnectionManager()
@@ -0,0 +1,167 @@
+"""Slow-query log with EXPLAIN capture and full-scan detection.
+
+    slow_queries = SlowQueryMonitor(threshold_ms=200, scan_check=False)
+    slow_queries.install(engine)
+
+* every statement is timed with the engine's before/after_cursor_execute
+  events;
+* a SELECT slower than the threshold is logged together with its plan
+  (SQLite `EXPLAIN QUERY PLAN`, MySQL `EXPLAIN`), run on the same
+  connection right after it, and kept in a short ring buffer for
+  GET /api/admin/system/slow-queries;
+* with `scan_check` (SLOW_QUERY_SCAN_CHECK=1 in dev and CI) every distinct
+  SELECT is explained once and full table scans are flagged even when
+  they are fast: on a dev-sized table a missing index costs microseconds,
+  which is exactly why it goes unnoticed until production.
+
+Plans are cached per SQL string, so scan checking costs one EXPLAIN per
+distinct statement. Streaming (server-side cursor) statements are never
+explained, since the connection is still busy with their rows.
+"""
+import logging
+import re
+import threading
+import time
+from collections import Counter, deque
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from sqlalchemy import event
+
+logger = logging.getLogger(__name__)
+
+# "SCAN users" / "SCAN TABLE users" / "SCAN users AS u", but not
+# "SCAN users USING INDEX ..." (an ordered index walk) or subqueries
+_SQLITE_SCAN = re.compile(r"^SCAN (?:TABLE )?(\w+)(?: AS \w+)?$")
+_PLAN_CACHE_SIZE = 2048
+
+
+def _sqlite_plan(cursor, statement: str, parameters) -> Tuple[List[str], List[str]]:
+    cursor.execute("EXPLAIN QUERY PLAN " + statement, parameters)
+    lines = [row[-1] for row in cursor.fetchall()]
+    scans = [m.group(1) for m in map(_SQLITE_SCAN.match, lines) if m and not m.group(1).startswith("sqlite_")]
+    return lines, scans
+
+
+def _mysql_plan(cursor, statement: str, parameters) -> Tuple[List[str], List[str]]:
+    cursor.execute("EXPLAIN " + statement, parameters)
+    names = [d[0] for d in cursor.description]
+    rows = [dict(zip(names, row)) for row in cursor.fetchall()]
+    lines = [f"{r.get('table')}: type={r.get('type')} key={r.get('key')} rows={r.get('rows')}" for r in rows]
+    scans = [r["table"] for r in rows if r.get("type") == "ALL" and r.get("table")]
+    return lines, scans
+
+
+_EXPLAINERS = {"sqlite": _sqlite_plan, "mysql": _mysql_plan}
+
+
+class SlowQueryMonitor:
+    """Times statements on an engine and records slow ones and full scans."""
+
+    def __init__(self, threshold_ms: float = 200.0, scan_check: bool = False,
+                 ignore_tables: Iterable[str] = (), keep: int = 50):
+        self.threshold_ms = threshold_ms
+        self.scan_check = scan_check
+        self.ignore_tables = set(ignore_tables)
+        self._recent: deque = deque(maxlen=keep)
+        self._plans: Dict[str, Tuple[List[str], List[str]]] = {}
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        with self._lock:
+            self.statements = 0
+            self.slow = 0
+            self.scanned_tables: Counter = Counter()
+            self._recent.clear()
+            self._plans.clear()
+
+    def install(self, engine) -> None:
+        event.listen(engine, "before_cursor_execute", self._before)
+        event.listen(engine, "after_cursor_execute", self._after)
+
+    def _before(self, conn, cursor, statement, parameters, context, executemany):
+        conn.info.setdefault("query_started", []).append(time.perf_counter())
+
+    def _after(self, conn, cursor, statement, parameters, context, executemany):
+        started = conn.info.get("query_started")
+        if not started:
+            return
+        elapsed_ms = (time.perf_counter() - started.pop()) * 1000
+        with self._lock:
+            self.statements += 1
+        slow = elapsed_ms >= self.threshold_ms
+        explainable = not executemany and statement.lstrip()[:6].upper() == "SELECT" \
+            and not (context is not None and context.execution_options.get("stream_results"))
+        plan = None
+        if explainable and (slow or self.scan_check):
+            plan = self._plan(conn, cursor, statement, parameters)
+        if slow:
+            self._record(statement, elapsed_ms, *(plan or ([], [])))
+
+    def _plan(self, conn, cursor, statement, parameters) -> Optional[Tuple[List[str], List[str]]]:
+        """(plan lines, scanned tables) of `statement`, explained once per SQL string."""
+        plan = self._plans.get(statement)
+        if plan is not None:
+            return plan
+        plan = self._explain(conn, cursor, statement, parameters)
+        if plan is None:
+            return None
+        scans = [t for t in plan[1] if t not in self.ignore_tables]
+        with self._lock:
+            if len(self._plans) >= _PLAN_CACHE_SIZE:
+                self._plans.clear()
+            self._plans[statement] = plan
+            self.scanned_tables.update(scans)
+        if scans:
+            logger.warning(f"Full table scan of {', '.join(scans)}: {' '.join(statement.split())[:300]}")
+        return plan
+
+    def _explain(self, conn, cursor, statement, parameters) -> Optional[Tuple[List[str], List[str]]]:
+        explain = _EXPLAINERS.get(conn.dialect.name)
+        if explain is None:
+            return None
+        try:
+            explain_cursor = cursor.connection.cursor()
+            try:
+                return explain(explain_cursor, statement, parameters)
+            finally:
+                explain_cursor.close()
+        except Exception as e:
+            logger.debug(f"EXPLAIN failed: {e}")
+            return None
+
+    def _record(self, statement: str, elapsed_ms: float, plan: List[str], scans: List[str]) -> None:
+        sql = " ".join(statement.split())
+        with self._lock:
+            self.slow += 1
+            self._recent.append({
+                "ms": round(elapsed_ms, 1),
+                "sql": sql[:1000],
+                "plan": plan,
+                "full_scans": scans,
+                "at": time.time(),
+            })
+        suffix = f" | plan: {'; '.join(plan)}" if plan else ""
+        logger.warning(f"Slow query ({elapsed_ms:.0f} ms): {sql[:300]}{suffix}")
+
+    def scans(self) -> Dict[str, int]:
+        """Tables seen in full scans so far, with how many distinct statements scanned them."""
+        with self._lock:
+            return dict(self.scanned_tables)
+
+    def scan_statements(self) -> List[Dict[str, Any]]:
+        """Explained statements that full-scanned a table, with their plans."""
+        with self._lock:
+            return [{"sql": " ".join(sql.split()), "plan": plan, "full_scans": scans}
+                    for sql, (plan, scans) in self._plans.items() if scans]
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "threshold_ms": self.threshold_ms,
+                "scan_check": self.scan_check,
+                "statements": self.statements,
+                "slow": self.slow,
+                "full_scans": dict(self.scanned_tables.most_common()),
+                "recent": list(reversed(self._recent)),
+            }
@@ -0,0 +1,173 @@
+"""Server-side response cache for read-mostly catalogue endpoints.
+
+    @hotel_router.get("/popular-cities")
+    @response_cache.cached("hotels")
+    def get_popular_hotel_cities(limit: int = 12, db: Session = Depends(get_db)):
+        ...
+
+The first GET renders the handler's result to JSON once and stores the
+body with its ETag, keyed by route path plus the handler's own query
+parameters (sorted, so `?a=1&b=2` and `?b=2&a=1` share an entry). Later
+hits return the stored bytes, or 304 when `If-None-Match` matches.
+
+Entries are tagged with the entities they were built from. Writers call
+`response_cache.invalidate("hotels")` after committing; that bumps the
+tag's version, which is part of every key, so all dependent entries miss
+from then on and age out of the LRU.
+
+The store is pluggable: anything with `get(key)`, `set(key, value, ttl)`
+and `incr(key)` (e.g. a thin Redis wrapper) can be passed to
+`ResponseCache.use_backend`, which makes invalidation visible to every
+worker. The default in-process backend is per worker, so other workers
+pick up a change within RESPONSE_CACHE_TTL_SECONDS.
+"""
+import functools
+import hashlib
+import inspect
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+from fastapi import Request, Response
+from fastapi.encoders import jsonable_encoder
+
+
+class InProcessBackend:
+    """Thread-safe LRU with per-entry TTL; tag versions are plain counters."""
+
+    def __init__(self, max_entries: int = 1024):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+        self._counters: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[Any]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if time.monotonic() >= expires_at:
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: Any, ttl: float) -> None:
+        with self._lock:
+            self._entries[key] = (time.monotonic() + ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def incr(self, key: str) -> int:
+        with self._lock:
+            self._counters[key] = self._counters.get(key, 0) + 1
+            return self._counters[key]
+
+    def counter(self, key: str) -> int:
+        return self._counters.get(key, 0)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class ResponseCache:
+    """Tag-invalidated cache of rendered JSON responses with ETags."""
+
+    def __init__(self, backend=None, default_ttl: float = 300.0):
+        self.backend = backend or InProcessBackend()
+        self.default_ttl = default_ttl
+        self.hits = 0
+        self.misses = 0
+        self.not_modified = 0
+
+    def use_backend(self, backend) -> None:
+        self.backend = backend
+
+    def _tag_version(self, tag: str) -> int:
+        key = f"tag:{tag}"
+        counter = getattr(self.backend, "counter", None)
+        if counter is not None:
+            return counter(key)
+        return int(self.backend.get(key) or 0)
+
+    def invalidate(self, *tags: str) -> None:
+        """Drop every cached response built from any of `tags`."""
+        for tag in tags:
+            self.backend.incr(f"tag:{tag}")
+
+    def _key(self, request: Request, tags: Tuple[str, ...], params: Tuple[str, ...]) -> str:
+        query = sorted(
+            (name, value.strip())
+            for name, value in request.query_params.multi_items()
+            if name in params and value.strip() != ""
+        )
+        versions = ",".join(f"{tag}:{self._tag_version(tag)}" for tag in tags)
+        return f"resp:{request.url.path}?{query}#{versions}"
+
+    def cached(self, *tags: str, ttl: Optional[float] = None):
+        """Decorator for sync GET handlers returning JSON-serialisable data."""
+
+        def decorate(func):
+            signature = inspect.signature(func)
+            params = tuple(signature.parameters)
+
+            @functools.wraps(func)
+            def wrapper(*args, _cache_request: Request = None, **kwargs):
+                if _cache_request is None:
+                    # Called directly from Python rather than through a route
+                    return func(*args, **kwargs)
+                key = self._key(_cache_request, tags, params)
+                entry = self.backend.get(key)
+                if entry is None:
+                    self.misses += 1
+                    body = json.dumps(jsonable_encoder(func(*args, **kwargs)),
+                                      separators=(",", ":")).encode()
+                    entry = (body, f'"{hashlib.sha1(body).hexdigest()}"')
+                    self.backend.set(key, entry, ttl or self.default_ttl)
+                else:
+                    self.hits += 1
+                body, etag = entry
+                headers = {"ETag": etag, "Cache-Control": "no-cache"}
+                if_none_match = _cache_request.headers.get("if-none-match")
+                if if_none_match and (if_none_match.strip() == "*"
+                                      or etag in (t.strip() for t in if_none_match.split(","))):
+                    self.not_modified += 1
+                    return Response(status_code=304, headers=headers)
+                return Response(content=body, media_type="application/json", headers=headers)
+
+            wrapper.__signature__ = signature.replace(parameters=[
+                *signature.parameters.values(),
+                inspect.Parameter("_cache_request", inspect.Parameter.KEYWORD_ONLY, annotation=Request),
+            ])
+            return wrapper
+
+        return decorate
+
+    def clear(self) -> None:
+        self.backend.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            "backend": type(self.backend).__name__,
+            "entries": len(self.backend) if hasattr(self.backend, "__len__") else None,
+            "hits": self.hits,
+            "misses": self.misses,
+            "not_modified": self.not_modified,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+        }
+
+
+response_cache = ResponseCache(
+    InProcessBackend(int(os.environ.get("RESPONSE_CACHE_MAX_ENTRIES", "1024"))),
+    default_ttl=float(os.environ.get("RESPONSE_CACHE_TTL_SECONDS", "300")),
+)
@@ -0,0 +1,417 @@
+"""Sign-up, login, profile, KYC and user notification endpoints (/api)."""
+import uuid
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import List, Optional
+
+from fastapi import APIRouter, Depends, File, Form, HTTPException, UploadFile
+from jose import jwt
+from sqlalchemy.orm import Session
+
+from auth_cache import auth_cache
+from keyset import keyset_page, newest_first, page_offset, wants_total
+from database import ROOT_DIR, get_db
+from models import KYCDetailsModel, NotificationModel, StatusCheckModel, TripModel, UserModel
+from schemas import (KYCStatus, LoginRequest, PasswordChange, ProfileUpdate, StatusCheck, StatusCheckCreate,
+    Token, User, UserCreate, UserPublic)
+from security import (ACCESS_TOKEN_EXPIRE_MINUTES, ALGORITHM, SECRET_KEY, create_access_token,
+    get_current_user, get_password_hash, hash_id_number, verify_password)
+
+router = APIRouter(prefix="/api")
+
+
+# Add your routes to the router instead of directly to app
+@router.get("/")
+def root():
+    return {"message": "Hello World"}
+
+@router.post("/status", response_model=StatusCheck)
+def create_status_check(input: StatusCheckCreate, db: Session = Depends(get_db)):
+    obj = StatusCheckModel(client_name=input.client_name)
+    db.add(obj)
+    db.commit()
+    return StatusCheck(id=obj.id, client_name=obj.client_name, timestamp=obj.timestamp)
+
+@router.get("/status", response_model=List[StatusCheck])
+def get_status_checks(db: Session = Depends(get_db)):
+    rows = db.query(StatusCheckModel).order_by(StatusCheckModel.timestamp.desc()).all()
+    return [StatusCheck(id=r.id, client_name=r.client_name, timestamp=r.timestamp) for r in rows]
+
+
+@router.get("/auth/me", response_model=UserPublic)
+def auth_me(current_user: User = Depends(get_current_user), db: Session = Depends(get_db)):
+    # Load fresh row to include all profile fields
+    row = db.query(UserModel).filter(UserModel.id == current_user.id).first()
+    if not row:
+        raise HTTPException(status_code=404, detail="User not found")
+    return UserPublic(
+        id=row.id,
+        email=row.email,
+        username=row.username,
+        created_at=row.created_at,
+        name=row.name,
+        phone=row.phone,
+        profile_image=row.profile_image,
+        favorite_travel_type=row.favorite_travel_type,
+        preferred_budget_range=row.preferred_budget_range,
+        climate_preference=row.climate_preference,
+        food_preference=row.food_preference,
+        language_preference=row.language_preference,
+        notifications_enabled=row.notifications_enabled,
+        is_kyc_completed=row.is_kyc_completed,
+        payment_profile_completed=row.payment_profile_completed,
+    )
+
+
+@router.put("/profile", response_model=UserPublic)
+def update_profile(payload: ProfileUpdate, current_user: User = Depends(get_current_user), db: Session = Depends(get_db)):
+    row = db.query(UserModel).filter(UserModel.id == current_user.id).first()
+    if not row:
+        raise HTTPException(status_code=404, detail="User not found")
+    if payload.name is not None:
+        row.name = payload.name
+    if payload.username is not None and payload.username.strip():
+        row.username = payload.username.strip()
+    if payload.phone is not None:
+        row.phone = payload.phone
+    if payload.favorite_travel_type is not None:
+        row.favorite_travel_type = payload.favorite_travel_type
+    if payload.preferred_budget_range is not None:
+        row.preferred_budget_range = payload.preferred_budget_range
+    if payload.climate_preference is not None:
+        row.climate_preference = payload.climate_preference
+    if payload.food_preference is not None:
+        row.food_preference = payload.food_preference
+    if payload.language_preference is not None:
+        row.language_preference = payload.language_preference
+    if payload.notifications_enabled is not None:
+        row.notifications_enabled = 1 if payload.notifications_enabled else 0
+    db.commit()
+    db.refresh(row)
+    auth_cache.invalidate_user(current_user.id)
+    return UserPublic(
+        id=row.id,
+        email=row.email,
+        username=row.username,
+        created_at=row.created_at,
+        name=row.name,
+        phone=row.phone,
+        profile_image=row.profile_image,
+        favorite_travel_type=row.favorite_travel_type,
+        preferred_budget_range=row.preferred_budget_range,
+        climate_preference=row.climate_preference,
+        food_preference=row.food_preference,
+        language_preference=row.language_preference,
+        notifications_enabled=row.notifications_enabled,
+    )
+
+
+@router.post("/profile/avatar")
+def upload_avatar(file: UploadFile = File(...), current_user: User = Depends(get_current_user), db: Session = Depends(get_db)):
+    upload_dir = Path("uploads")
+    upload_dir.mkdir(exist_ok=True)
+    file_extension = Path(file.filename).suffix
+    file_name = f"avatar_{current_user.id}{file_extension}"
+    file_path = upload_dir / file_name
+    with open(file_path, "wb") as buffer:
+        content = file.file.read()
+        buffer.write(content)
+    # Save URL to DB
+    url = f"/uploads/{file_name}"
+    row = db.query(UserModel).filter(UserModel.id == current_user.id).first()
+    if row:
+        row.profile_image = url
+        db.commit()
+    return {"image_url": url}
+
+
+@router.put("/auth/password")
+def change_password(payload: PasswordChange, current_user: User = Depends(get_current_user), db: Session = Depends(get_db)):
+    row = db.query(UserModel).filter(UserModel.id == current_user.id).first()
+    if not row or not verify_password(payload.current_password, row.hashed_password):
+        raise HTTPException(status_code=400, detail="Current password is incorrect")
+    row.hashed_password = get_password_hash(payload.new_password)
+    db.commit()
+    auth_cache.invalidate_user(current_user.id)
+    return {"message": "Password updated"}
+
+
+@router.delete("/auth/account")
+def delete_account(current_user: User = Depends(get_current_user), db: Session = Depends(get_db)):
+    # Delete trips first (FK safe)
+    db.query(TripModel).filter(TripModel.user_id == current_user.id).delete()
+    db.query(UserModel).filter(UserModel.id == current_user.id).delete()
+    db.commit()
+    auth_cache.invalidate_user(current_user.id)
+    return {"message": "Account deleted"}
+
+# Authentication endpoints
+@router.post("/auth/signup", response_model=Token)
+def signup(user: UserCreate, db: Session = Depends(get_db)):
+    # Check if user already exists
+    existing_user = db.query(UserModel).filter(UserModel.email == user.email).first()
+    if existing_user:
+        raise HTTPException(status_code=400, detail="Email already registered")
+
+    # Create new user
+    hashed_password = get_password_hash(user.password)
+    new_user = UserModel(email=user.email, username=user.username, hashed_password=hashed_password)
+    db.add(new_user)
+    db.commit()
+
+    # Issue access token on signup
+    access_token_expires = timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES)
+    access_token = create_access_token(
+        data={"sub": new_user.email}, expires_delta=access_token_expires
+    )
+    return Token(access_token=access_token, token_type="bearer")
+
+# Auth Login - Development mode endpoint
+@router.post("/auth/login")
+def login_dev(req: LoginRequest):
+    # Development mode: accept any valid credentials and create user if needed
+    if not req.email or not req.password:
+        raise HTTPException(status_code=400, detail="Email and password required")
+    
+    # Get database session
+    db = next(get_db())
+    
+    # Check if user exists, if not create them
+    user = db.query(UserModel).filter(UserModel.email == req.email).first()
+    if not user:
+        # Create new user for development
+        user = UserModel(
+            id=str(uuid.uuid4()),
+            email=req.email,
+            username=req.email.split('@')[0],
+            hashed_password=get_password_hash(req.password),
+            created_at=datetime.now(timezone.utc)
+        )
+        db.add(user)
+        db.commit()
+        db.refresh(user)
+    
+    # Create JWT token using the same SECRET_KEY
+    to_encode = {"sub": user.email}
+    access_token = jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)
+    
+    return {"access_token": access_token, "token_type": "bearer", "user": {"email": user.email}}
+
+
+# =============================
+# KYC Endpoints
+# =============================
+@router.post("/kyc")
+def submit_kyc(
+    full_name: str = Form(...),
+    dob: str = Form(...),
+    gender: str = Form(...),
+    nationality: str = Form(...),
+    id_type: str = Form(...),
+    id_number: str = Form(...),
+    address_line: str = Form(...),
+    city: str = Form(...),
+    state: str = Form(...),
+    country: str = Form(...),
+    pincode: str = Form(...),
+    id_proof_front: Optional[UploadFile] = File(None),
+    id_proof_back: Optional[UploadFile] = File(None),
+    selfie: Optional[UploadFile] = File(None),
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """Submit KYC details with optional file uploads"""
+    
+    # Check if KYC already exists
+    existing = db.query(KYCDetailsModel).filter(KYCDetailsModel.user_id == current_user.id).first()
+    if existing:
+        raise HTTPException(status_code=400, detail="KYC already submitted")
+    
+    # Hash ID number with user-specific salt
+    id_hash = hash_id_number(id_number, current_user.id)
+    
+    # Handle file uploads
+    id_front_path = None
+    id_back_path = None
+    selfie_path_var = None
+    
+    uploads_dir = ROOT_DIR / "uploads" / "kyc" / str(current_user.id)
+    uploads_dir.mkdir(parents=True, exist_ok=True)
+    
+    if id_proof_front:
+        front_path = uploads_dir / f"id_front_{uuid.uuid4().hex[:8]}.jpg"
+        with open(front_path, "wb") as f:
+            f.write(id_proof_front.file.read())
+        id_front_path = f"/uploads/kyc/{current_user.id}/{front_path.name}"
+    
+    if id_proof_back:
+        back_path = uploads_dir / f"id_back_{uuid.uuid4().hex[:8]}.jpg"
+        with open(back_path, "wb") as f:
+            f.write(id_proof_back.file.read())
+        id_back_path = f"/uploads/kyc/{current_user.id}/{back_path.name}"
+    
+    if selfie:
+        selfie_file = uploads_dir / f"selfie_{uuid.uuid4().hex[:8]}.jpg"
+        with open(selfie_file, "wb") as f:
+            f.write(selfie.file.read())
+        selfie_path_var = f"/uploads/kyc/{current_user.id}/{selfie_file.name}"
+    
+    # Create KYC record (pending admin verification)
+    kyc_record = KYCDetailsModel(
+        user_id=current_user.id,
+        full_name=full_name,
+        dob=dob,
+        gender=gender,
+        nationality=nationality,
+        id_type=id_type,
+        id_number_hash=id_hash,
+        id_proof_front_path=id_front_path,
+        id_proof_back_path=id_back_path,
+        selfie_path=selfie_path_var,
+        address_line=address_line,
+        city=city,
+        state=state,
+        country=country,
+        pincode=pincode,
+        verification_status="pending",  # Requires admin verification
+        submitted_at=datetime.now(timezone.utc),
+        verified_at=None,  # Will be set when admin approves
+        created_at=datetime.now(timezone.utc)
+    )
+    db.add(kyc_record)
+    
+    # Note: is_kyc_completed will be set to 1 only when admin approves
+    
+    db.commit()
+    
+    return {
+        "message": "KYC submitted successfully. Pending admin verification.",
+        "status": "pending",
+        "is_kyc_completed": False
+    }
+
+
+@router.get("/kyc/status", response_model=KYCStatus)
+def get_kyc_status(current_user: User = Depends(get_current_user), db: Session = Depends(get_db)):
+    """Get KYC verification status"""
+    kyc = db.query(KYCDetailsModel).filter(KYCDetailsModel.user_id == current_user.id).first()
+    
+    if not kyc:
+        return KYCStatus(is_completed=False)
+    
+    return KYCStatus(
+        is_completed=True,
+        verification_status=kyc.verification_status,
+        full_name=kyc.full_name,
+        created_at=kyc.created_at
+    )
+
+
+# =============================
+# User Notifications
+# =============================
+@router.get("/notifications")
+def get_user_notifications(
+    page: int = 1,
+    limit: int = 20,
+    unread_only: bool = False,
+    cursor: Optional[str] = None,
+    include_total: Optional[bool] = None,
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """Get notifications for the current user (pass `next_cursor` back as `cursor` for the next page)"""
+    query = db.query(NotificationModel).filter(NotificationModel.user_id == current_user.id)
+    
+    if unread_only:
+        query = query.filter(NotificationModel.is_read == 0)
+    
+    total = query.count() if wants_total(cursor, include_total) else None
+    paged = keyset_page(query, newest_first(NotificationModel), cursor, limit, offset=page_offset(page, limit))
+    notifications = paged.rows
+    
+    return {
+        "notifications": [
+            {
+                "id": n.id,
+                "title": n.title,
+                "message": n.message,
+                "type": n.notification_type,
+                "is_read": bool(n.is_read),
+                "created_at": n.created_at.isoformat() if n.created_at else None
+            } for n in notifications
+        ],
+        "total": total,
+        "next_cursor": paged.next_cursor,
+        "unread_count": db.query(NotificationModel).filter(
+            NotificationModel.user_id == current_user.id,
+            NotificationModel.is_read == 0
+        ).count()
+    }
+
+
+@router.get("/notifications/unread-count")
+def get_unread_count(
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """Get count of unread notifications"""
+    count = db.query(NotificationModel).filter(
+        NotificationModel.user_id == current_user.id,
+        NotificationModel.is_read == 0
+    ).count()
+    return {"unread_count": count}
+
+
+@router.post("/notifications/{notification_id}/read")
+def mark_notification_read(
+    notification_id: int,
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """Mark a notification as read"""
+    notification = db.query(NotificationModel).filter(
+        NotificationModel.id == notification_id,
+        NotificationModel.user_id == current_user.id
+    ).first()
+    
+    if not notification:
+        raise HTTPException(status_code=404, detail="Notification not found")
+    
+    notification.is_read = 1
+    db.commit()
+    return {"message": "Notification marked as read"}
+
+
+@router.post("/notifications/mark-all-read")
+def mark_all_read(
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """Mark all notifications as read"""
+    db.query(NotificationModel).filter(
+        NotificationModel.user_id == current_user.id,
+        NotificationModel.is_read == 0
+    ).update({NotificationModel.is_read: 1})
+    db.commit()
+    return {"message": "All notifications marked as read"}
+
+
+@router.delete("/notifications/{notification_id}")
+def delete_notification(
+    notification_id: int,
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """Delete a notification"""
+    notification = db.query(NotificationModel).filter(
+        NotificationModel.id == notification_id,
+        NotificationModel.user_id == current_user.id
+    ).first()
+    
+    if not notification:
+        raise HTTPException(status_code=404, detail="Notification not found")
+    
+    db.delete(notification)
+    db.commit()
+    return {"message": "Notification deleted"}
@@ -0,0 +1,2171 @@
+"""Admin panel API (/api/admin): dashboard, users, KYC, bookings, reports,
+settings, system stats and bus / flight inventory management."""
+from datetime import datetime, timedelta, timezone
+from typing import List, Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Response
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import StreamingResponse
+from sqlalchemy import func, text
+from sqlalchemy.orm import Session
+
+from answer_cache import ai_answer_cache
+from auth_cache import auth_cache
+from db_pool import pool_status
+from export_stream import export_format, stream_export
+from flight_schedules import flight_schedules
+from flight_search import flight_network
+from gemini_client import gemini
+from hotel_inventory import hotel_inventory
+from keyset import keyset_page, newest_first, page_offset, set_page_headers
+from response_cache import response_cache
+from seat_holds import seat_holds
+from database import SessionLocal, engine, get_db, schema, slow_queries
+from models import (AdminModel, AircraftModel, AirlineModel, AirportModel, AuditLogModel,
+    BusBoardingPointModel, BusBookingModel, BusCityModel, BusModel, BusOperatorModel, BusPassengerModel,
+    BusRouteModel, BusScheduleModel, BusSeatModel, DestinationModel, FlightBookingModel, FlightModel,
+    FlightPassengerModel, FlightRouteModel, FlightScheduleModel, FlightSeatModel,
+    FlightSegmentModel, KYCDetailsModel, NotificationModel, PaymentReceiptModel, PlatformSettingModel,
+    ServiceBookingModel, TransactionModel, TripModel, UserModel, booking_rollups)
+from schemas import (AdminLogin, AdminPasswordChange, AdminPublic, AdminToken, AircraftCreate, AirlineCreate,
+    AirportCreate, AuditLogItem, BookingListItem, BusBoardingPointCreate, BusCityCreate, BusCreate,
+    BusOperatorCreate, BusRouteCreate, BusScheduleCreate, DashboardStats, DestinationCreate,
+    DestinationUpdate, FlightCreate, FlightRouteCreate, KYCReviewAction, KYCReviewItem, NotificationCreate,
+    PlatformSettingUpdate, TransactionListItem, User, UserDetail, UserListItem)
+from security import create_admin_token, get_current_admin, pwd_context
+from notifications import notification_manager
+from routers.travel import destination_cache, fx_rate_cache, geocode_cache, weather_cache
+from routers.ai import ai_grounding
+
+router = APIRouter(prefix="/api/admin", tags=["admin"])
+
+
+def log_admin_action(db: Session, admin_id: int, action: str, entity_type: str = None, 
+                     entity_id: str = None, details: str = None, ip_address: str = None):
+    """Log admin action for audit trail"""
+    log = AuditLogModel(
+        admin_id=admin_id,
+        action=action,
+        entity_type=entity_type,
+        entity_id=entity_id,
+        details=details,
+        ip_address=ip_address
+    )
+    db.add(log)
+    db.commit()
+
+
+# =============================
+# Admin Authentication
+# =============================
+@router.post("/login", response_model=AdminToken)
+def admin_login(credentials: AdminLogin, db: Session = Depends(get_db)):
+    """Admin login - separate from user login"""
+    admin = db.query(AdminModel).filter(AdminModel.email == credentials.email).first()
+    
+    if not admin:
+        raise HTTPException(status_code=401, detail="Invalid credentials")
+    
+    if not pwd_context.verify(credentials.password, admin.hashed_password):
+        raise HTTPException(status_code=401, detail="Invalid credentials")
+    
+    if not admin.is_active:
+        raise HTTPException(status_code=403, detail="Admin account is disabled")
+    
+    # Update last login
+    admin.last_login = datetime.now(timezone.utc)
+    db.commit()
+    
+    token = create_admin_token(admin.id, admin.email, admin.role)
+    
+    return AdminToken(
+        access_token=token,
+        token_type="bearer",
+        admin={
+            "id": admin.id,
+            "email": admin.email,
+            "username": admin.username,
+            "role": admin.role
+        }
+    )
+
+
+@router.get("/me", response_model=AdminPublic)
+def get_admin_profile(admin: AdminModel = Depends(get_current_admin)):
+    """Get current admin profile"""
+    return AdminPublic(
+        id=admin.id,
+        email=admin.email,
+        username=admin.username,
+        role=admin.role,
+        is_active=bool(admin.is_active),
+        last_login=admin.last_login,
+        created_at=admin.created_at
+    )
+
+
+@router.post("/change-password")
+def admin_change_password(
+    data: AdminPasswordChange,
+    admin: AdminModel = Depends(get_current_admin),
+    db: Session = Depends(get_db)
+):
+    """Change admin password"""
+    if not pwd_context.verify(data.current_password, admin.hashed_password):
+        raise HTTPException(status_code=400, detail="Current password is incorrect")
+    
+    # The dependency's admin is detached from the session, so update this session's row
+    row = db.get(AdminModel, admin.id)
+    row.hashed_password = pwd_context.hash(data.new_password)
+    row.updated_at = datetime.now(timezone.utc)
+    db.commit()
+    
+    log_admin_action(db, admin.id, "password_change", "admin", str(admin.id))
+    
+    return {"message": "Password changed successfully"}
+
+# Booking statuses whose price counts towards report revenue
+REVENUE_BOOKING_STATUSES = ("Confirmed", "Paid", "Completed")
+
+
+@router.get("/dashboard", response_model=DashboardStats)
+def get_dashboard_stats(
+    admin: AdminModel = Depends(get_current_admin),
+    db: Session = Depends(get_db)
+):
+    """Get dashboard statistics"""
+    # Total users
+    total_users = db.query(UserModel).count()
+    
+    # Total bookings (service + regular) and revenue, from the daily rollups
+    service_bookings, _ = booking_rollups.total(db, "service_booking")
+    regular_bookings, _ = booking_rollups.total(db, "booking")
+    total_bookings = service_bookings + regular_bookings
+    
+    # Total revenue (from successful transactions)
+    _, total_revenue = booking_rollups.total(db, "transaction", statuses=["success"])
+    
+    # Pending KYC
+    pending_kyc = db.query(KYCDetailsModel).filter(
+        KYCDetailsModel.verification_status == "pending"
+    ).count()
+    
+    # Active trips
+    active_trips = db.query(TripModel).count()
+    
+    # Recent bookings, with the booker's email in the same query
+    recent_bookings = db.query(ServiceBookingModel, UserModel.email).outerjoin(
+        UserModel, UserModel.id == ServiceBookingModel.user_id
+    ).order_by(
+        ServiceBookingModel.created_at.desc()
+    ).limit(5).all()
+    
+    recent_bookings_data = []
+    for b, email in recent_bookings:
+        recent_bookings_data.append({
+            "id": b.id,
+            "booking_ref": b.booking_ref,
+            "service_type": b.service_type,
+            "total_price": b.total_price,
+            "status": b.status,
+            "user_email": email or "N/A",
+            "created_at": b.created_at.isoformat() if b.created_at else None
+        })
+    
+    # Bookings by day (last 7 days)
+    today = datetime.now(timezone.utc).date()
+    first_day = today - timedelta(days=6)
+    per_day = {
+        day: count for day, count, _ in booking_rollups.breakdown(
+            db, "service_booking", "day", start_day=first_day.isoformat(), end_day=today.isoformat()
+        )
+    }
+    bookings_by_day = []
+    for i in range(7):
+        day = (first_day + timedelta(days=i)).isoformat()
+        bookings_by_day.append({
+            "date": day,
+            "count": per_day.get(day, 0)
+        })
+    
+    # Revenue by month (last 6 months, successful transactions)
+    months = [today.replace(day=1)]
+    for _ in range(5):
+        months.insert(0, (months[0] - timedelta(days=1)).replace(day=1))
+    per_month = {m.strftime("%Y-%m"): 0.0 for m in months}
+    for day, _, amount in booking_rollups.breakdown(
+        db, "transaction", "day", start_day=months[0].isoformat(), statuses=["success"]
+    ):
+        if day[:7] in per_month:
+            per_month[day[:7]] += amount
+    revenue_by_month = [{"month": month, "revenue": revenue} for month, revenue in per_month.items()]
+    
+    # Top destinations
+    top_destinations = []
+    try:
+        destinations = db.query(DestinationModel).filter(
+            DestinationModel.is_active == 1
+        ).limit(5).all()
+        for d in destinations:
+            top_destinations.append({
+                "name": d.name,
+                "category": d.category,
+                "bookings": 0  # Would need to join with bookings
+            })
+    except:
+        pass
+    
+    return DashboardStats(
+        total_users=total_users,
+        total_bookings=total_bookings,
+        total_revenue=float(total_revenue),
+        pending_kyc=pending_kyc,
+        active_trips=active_trips,
+        recent_bookings=recent_bookings_data,
+        bookings_by_day=bookings_by_day,
+        revenue_by_month=revenue_by_month,
+        top_destinations=top_destinations
+    )
+
+
+@router.get("/system/db-pool")
+def get_db_pool_metrics(admin: AdminModel = Depends(get_current_admin)):
+    """Connection pool occupancy and checkout wait times (for sizing DB_POOL_*)"""
+    return pool_status(engine)
+
+
+@router.get("/system/slow-queries")
+def get_slow_queries(admin: AdminModel = Depends(get_current_admin)):
+    """Recent slow statements with their plans, and tables seen in full scans"""
+    return slow_queries.stats()
+
+
+@router.get("/system/schema")
+def get_schema_status(admin: AdminModel = Depends(get_current_admin)):
+    """Applied and pending schema migrations"""
+    return schema.status()
+
+
+@router.get("/system/auth-cache")
+def get_auth_cache_stats(admin: AdminModel = Depends(get_current_admin)):
+    """Hit/miss counters for the authenticated-user cache"""
+    return auth_cache.stats()
+
+
+@router.get("/system/response-cache")
+def get_response_cache_stats(admin: AdminModel = Depends(get_current_admin)):
+    """Hit/miss counters for the catalogue response cache"""
+    return response_cache.stats()
+
+
+@router.get("/system/external-apis")
+def get_external_api_cache_stats(admin: AdminModel = Depends(get_current_admin)):
+    """Hit/miss counters for the third-party lookup caches"""
+    return {
+        "destinations": destination_cache.stats(),
+        "weather": weather_cache.stats(),
+        "geocode": geocode_cache.stats(),
+        "fx_rates": fx_rate_cache.stats(),
+    }
+
+
+@router.get("/system/gemini")
+def get_gemini_stats(admin: AdminModel = Depends(get_current_admin)):
+    """Model list cache and per-model circuit breaker state for the AI proxy"""
+    return gemini.stats()
+
+
+@router.get("/system/ai-answer-cache")
+def get_ai_answer_cache_stats(admin: AdminModel = Depends(get_current_admin)):
+    """Hit rate and Gemini calls saved by the AI chat answer cache"""
+    return ai_answer_cache.stats()
+
+
+@router.get("/system/booking-rollups")
+def get_booking_rollup_stats(admin: AdminModel = Depends(get_current_admin)):
+    """Deltas applied to and rebuilds of the daily booking rollups"""
+    return booking_rollups.stats()
+
+
+@router.get("/system/seat-holds")
+def get_seat_hold_stats(admin: AdminModel = Depends(get_current_admin)):
+    """Seat holds taken and refused, and expired holds released by the sweeper"""
+    return seat_holds.stats()
+
+
+@router.get("/system/flight-network")
+def get_flight_network_stats(admin: AdminModel = Depends(get_current_admin)):
+    """Size and age of the in-memory flight network, and the connection rules"""
+    return flight_network.stats()
+
+
+@router.get("/system/flight-schedules")
+def get_flight_schedule_stats(admin: AdminModel = Depends(get_current_admin)):
+    """Materialiser passes, schedules written and the last materialised date"""
+    return flight_schedules.stats()
+
+
+@router.get("/system/hotel-inventory")
+def get_hotel_inventory_stats(admin: AdminModel = Depends(get_current_admin)):
+    """Hotel stays reserved, refused for lack of rooms, and cancelled back into inventory"""
+    return hotel_inventory.stats()
+
+
+@router.get("/system/ai-context")
+def get_ai_context_stats(admin: AdminModel = Depends(get_current_admin)):
+    """Cached per-city summaries and grounded prompts of the AI chat"""
+    return ai_grounding.stats()
+
+
+# =============================
+# User Management
+# =============================
+USER_EXPORT_COLUMNS = ["id", "email", "username", "name", "phone", "is_kyc_completed", "created_at"]
+
+
+def _user_filters(search: Optional[str], kyc_status: Optional[str]) -> list:
+    filters = []
+    if search:
+        filters.append(
+            (UserModel.email.contains(search)) | 
+            (UserModel.username.contains(search)) |
+            (UserModel.name.contains(search))
+        )
+    
+    if kyc_status == "completed":
+        filters.append(UserModel.is_kyc_completed == 1)
+    elif kyc_status == "pending":
+        filters.append(UserModel.is_kyc_completed == 0)
+    return filters
+
+
+@router.get("/users", response_model=List[UserListItem])
+def list_users(
+    response: Response,
+    page: int = 1,
+    limit: int = 20,
+    search: Optional[str] = None,
+    kyc_status: Optional[str] = None,
+    export: Optional[str] = None,
+    cursor: Optional[str] = None,
+    include_total: bool = False,
+    admin: AdminModel = Depends(get_current_admin),
+    db: Session = Depends(get_db)
+):
+    """List all users with filtering (`export=csv|ndjson` streams every match)
+
+    The next page's cursor is returned in the X-Next-Cursor header; X-Total-Count with `include_total`.
+    """
+    filters = _user_filters(search, kyc_status)
+    if export_format(export):
+        return stream_export(SessionLocal, lambda s: s.query(
+            *[getattr(UserModel, c) for c in USER_EXPORT_COLUMNS]
+        ).filter(*filters).order_by(UserModel.created_at.desc()), USER_EXPORT_COLUMNS, export, "users")
+    
+    query = db.query(UserModel).filter(*filters)
+    
+    paged = keyset_page(query, newest_first(UserModel), cursor, limit, offset=page_offset(page, limit))
+    set_page_headers(response, paged, query.count() if include_total else None)
+    users = paged.rows
+    
+    return [
+        UserListItem(
+            id=u.id,
+            email=u.email,
+            username=u.username,
+            name=u.name,
+            phone=u.phone,
+            is_kyc_completed=u.is_kyc_completed or 0,
+            is_blocked=getattr(u, 'is_blocked', 0) or 0,
+            created_at=u.created_at
+        ) for u in users
+    ]
+
+
+@router.get("/users/{user_id}", response_model=UserDetail)
+def get_user_detail(
+    user_id: str,
+    admin: AdminModel = Depends(get_current_admin),
+    db: Session = Depends(get_db)
+):
+    """Get detailed user information"""
+    user = db.query(UserModel).filter(UserModel.id == user_id).first()
+    if not user:
+        raise HTTPException(status_code=404, detail="User not found")
+    
+    # Get KYC details
+    kyc = db.query(KYCDetailsModel).filter(KYCDetailsModel.user_id == user_id).first()
+    kyc_data = None
+    if kyc:
+        kyc_data = {
+            "id": kyc.id,
+            "full_name": kyc.full_name,
+            "dob": kyc.dob,
+            "gender": kyc.gender,
+            "nationality": kyc.nationality,
+            "id_type": kyc.id_type,
+            "address": f"{kyc.address_line}, {kyc.city}, {kyc.state}, {kyc.country} - {kyc.pincode}",
+            "verification_status": kyc.verification_status,
+            "submitted_at": kyc.submitted_at.isoformat() if kyc.submitted_at else None,
+            "id_proof_front": kyc.id_proof_front_path,
+            "id_proof_back": kyc.id_proof_back_path,
+            "selfie": kyc.selfie_path
+        }
+    
+    # Get bookings
+    bookings = db.query(ServiceBookingModel).filter(
+        ServiceBookingModel.user_id == user_id
+    ).order_by(ServiceBookingModel.created_at.desc()).limit(10).all()
+    
+    bookings_data = [
+        {
+            "id": b.id,
+            "booking_ref": b.booking_ref,
+            "service_type": b.service_type,
+            "total_price": b.total_price,
+            "status": b.status,
+            "created_at": b.created_at.isoformat() if b.created_at else None
+        } for b in bookings
+    ]
+    
+    # Get transactions
+    transactions = db.query(TransactionModel).filter(
+        TransactionModel.user_id == user_id
+    ).order_by(TransactionModel.created_at.desc()).limit(10).all()
+    
+    transactions_data = [
+        {
+            "id": t.id,
+            "amount": t.amount,
+            "currency": t.currency,
+            "payment_method": t.payment_method,
+            "status": t.status,
+            "created_at": t.created_at.isoformat() if t.created_at else None
+        } for t in transactions
+    ]
+    
+    return UserDetail(
+        id=user.id,
+        email=user.email,
+        username=user.username,
+        name=user.name,
+        phone=user.phone,
+        is_kyc_completed=user.is_kyc_completed or 0,
+        payment_profile_completed=user.payment_profile_completed or 0,
+        is_blocked=getattr(user, 'is_blocked', 0) or 0,
+        created_at=user.created_at,
+        kyc_details=kyc_data,
+        bookings=bookings_data,
+        transactions=transactions_data
+    )
+
+
+@router.post("/users/{user_id}/block")
+def block_user(
+    user_id: str,
+    admin: AdminModel = Depends(get_current_admin),
+    db: Session = Depends(get_db)
+):
+    """Block a user"""
+    user = db.query(UserModel).filter(UserModel.id == user_id).first()
+    if not user:
+        raise HTTPException(status_code=404, detail="User not found")
+    
+    # Use raw SQL for SQLite compatibility
+    db.execute(text(f"UPDATE users SET is_blocked = 1 WHERE id = '{user_id}'"))
+    db.commit()
+    auth_cache.invalidate_user(user_id)
+    
+    log_admin_action(db, admin.id, "block_user", "user", user_id, f"Blocked user {user.email}")
+    
+    return {"message": f"User {user.email} has been blocked"}
+
+
+@router.post("/users/{user_id}/unblock")
+def unblock_user(
+    user_id: str,
+    admin: AdminModel = Depends(get_current_admin),
+    db: Session = Depends(get_db)
+):
+    """Unblock a user"""
+    user = db.query(UserModel).filter(UserModel.id == user_id).first()
+    if not user:
+        raise HTTPException(status_code=404, detail="User not found")
+    
+    db.execute(text(f"UPDATE users SET is_blocked = 0 WHERE id = '{user_id}'"))
+    db.commit()
+    auth_cache.invalidate_user(user_id)
+    
+    log_admin_action(db, admin.id, "unblock_user", "user", user_id, f"Unblocked user {user.email}")
+    
+    return {"message": f"User {user.email} has been unblocked"}
+
+
+# =============================
+# KYC Verification Management
+# =============================
+@router.get("/kyc/counts")
+def get_kyc_counts(
+    admin: AdminModel = Depends(get_current_admin),
+    db: Session = Depends(get_db)
+):
+    """Get counts of KYC requests by status"""
+    pending_count = db.query(KYCDetailsModel).filter(KYCDetailsModel.verification_status == "pending").count()
+    verified_count = db.query(KYCDetailsModel).filter(KYCDetailsModel.verification_status == "verified").count()
+    rejected_count = db.query(KYCDetailsModel).filter(KYCDetailsModel.verification_status == "rejected").count()
+    
+    return {
+        "pending": pending_count,
+        "verified": verified_count,
+        "rejected": rejected_count
+    }
+
+
+@router.get("/kyc", response_model=List[KYCReviewItem])
+def list_kyc_requests(
+    status: Optional[str] = None,
+    page: int = 1,
+    limit: int = 20,
+    admin: AdminModel = Depends(get_current_admin),
+    db: Session = Depends(get_db)
+):
+    """List KYC verification requests"""
+    query = db.query(KYCDetailsModel)
+    
+    if status:
+        query = query.filter(KYCDetailsModel.verification_status == status)
+    
+    kyc_list = query.order_by(KYCDetailsModel.created_at.desc()).offset((page-1)*limit).limit(limit).all()
+    
+    result = []
+    for kyc in kyc_list:
+        user = db.query(UserModel).filter(UserModel.id == kyc.user_id).first()
+        result.append(KYCReviewItem(
+            id=kyc.id,
+            user_id=kyc.user_id,
+            user_email=user.email if user else "N/A",
+            user_name=user.username if user else "N/A",
+            full_name=kyc.full_name,
+            id_type=kyc.id_type,
+            verification_status=kyc.verification_status,
+            submitted_at=kyc.submitted_at,
+            created_at=kyc.created_at
+        ))
+    
+    return result
+
+
+@router.get("/kyc/{kyc_id}")
+def get_kyc_detail(
+    kyc_id: int,
+    admin: AdminModel = Depends(get_current_admin),
+    db: Session = Depends(get_db)
+):
+    """Get detailed KYC information for review"""
+    kyc = db.query(KYCDetailsModel).filter(KYCDetailsModel.id == kyc_id).first()
+    if not kyc:
+        raise HTTPException(status_code=404, detail="KYC record not found")
+    
+    user = db.query(UserModel).filter(UserModel.id == kyc.user_id).first()
+    
+    return {
+        "id": kyc.id,
+        "user_id": kyc.user_id,
+        "user_email": user.email if user else "N/A",
+        "user_name": user.username if user else "N/A",
+        "full_name": kyc.full_name,
+        "dob": kyc.dob,
+        "gender": kyc.gender,
+        "nationality": kyc.nationality,
+        "id_type": kyc.id_type,
+        "address_line": kyc.address_line,
+        "city": kyc.city,
+        "state": kyc.state,
+        "country": kyc.country,
+        "pincode": kyc.pincode,
+        "verification_status": kyc.verification_status,
+        "id_proof_front_path": kyc.id_proof_front_path,
+        "id_proof_back_path": kyc.id_proof_back_path,
+        "selfie_path": kyc.selfie_path,
+        "submitted_at": kyc.submitted_at.isoformat() if kyc.submitted_at else None,
+        "verified_at": kyc.verified_at.isoformat() if kyc.verified_at else None,
+        "created_at": kyc.created_at.isoformat() if kyc.created_at else None
+    }
+
+
+@router.post("/kyc/{kyc_id}/review")
+def review_kyc(
+    kyc_id: int,
+    action: KYCReviewAction,
+    admin: AdminModel = Depends(get_current_admin),
+    db: Session = Depends(get_db)
+):
+    """Approve or reject KYC"""
+    kyc = db.query(KYCDetailsModel).filter(KYCDetailsModel.id == kyc_id).first()
+    if not kyc:
+        raise HTTPException(status_code=404, detail="KYC record not found")
+    
+    if action.action == "approve":
+        kyc.verification_status = "verified"
+        kyc.verified_at = datetime.now(timezone.utc)
+        
+        # Update user KYC status
+        user = db.query(UserModel).filter(UserModel.id == kyc.user_id).first()
+        if user:
+            user.is_kyc_completed = 1
+        
+        log_admin_action(db, admin.id, "approve_kyc", "kyc", str(kyc_id), f"Approved KYC for user {kyc.user_id}")
+        
+    elif action.action == "reject":
+        kyc.verification_status = "rejected"
+        log_admin_action(db, admin.id, "reject_kyc", "kyc", str(kyc_id), f"Rejected KYC for user {kyc.user_id}: {action.reason}")
+    
+    kyc.updated_at = datetime.now(timezone.utc)
+    db.commit()
+    
+    return {"message": f"KYC {action.action}d successfully"}
+
+
+# =============================
+# Booking Management
+# =============================
+BOOKING_EXPORT_COLUMNS = ["id", "booking_ref", "user_id", "user_email", "service_type", "total_price",
+                          "currency", "status", "created_at"]
+
+
+def _export_service_bookings(export: str, filters: list) -> StreamingResponse:
+    """Stream service bookings matching `filters`, newest first, with the user's email"""
+    def build(s: Session):
+        return s.query(
+            ServiceBookingModel.id, ServiceBookingModel.booking_ref, ServiceBookingModel.user_id,
+            UserModel.email, ServiceBookingModel.service_type, ServiceBookingModel.total_price,
+            ServiceBookingModel.currency, ServiceBookingModel.status, ServiceBookingModel.created_at,
+        ).outerjoin(UserModel, UserModel.id == ServiceBookingModel.user_id).filter(*filters) \
+            .order_by(ServiceBookingModel.created_at.desc())
+    return stream_export(SessionLocal, build, BOOKING_EXPORT_COLUMNS, export, "bookings")
+
+
+@router.get("/bookings", response_model=List[BookingListItem])
+def list_bookings(
+    response: Response,
+    service_type: Optional[str] = None,
+    status: Optional[str] = None,
+    page: int = 1,
+    limit: int = 20,
+    export: Optional[str] = None,
+    cursor: Optional[str] = None,
+    include_total: bool = False,
+    admin: AdminModel = Depends(get_current_admin),
+    db: Session = Depends(get_db)
+):
+    """List all bookings (`export=csv|ndjson` streams every match; next page cursor in X-Next-Cursor)"""
+    filters = []
+    if service_type:
+        filters.append(ServiceBookingModel.service_type == service_type)
+    if status:
+        filters.append(ServiceBookingModel.status == status)
+    if export_format(export):
+        return _export_service_bookings(export, filters)
+    
+    query = db.query(ServiceBookingModel).filter(*filters)
+    
+    paged = keyset_page(query, newest_first(ServiceBookingModel), cursor, limit, offset=page_offset(page, limit))
+    set_page_headers(response, paged, query.count() if include_total else None)
+    bookings = paged.rows
+    
+    result = []
+    for b in bookings:
+        user = db.query(UserModel).filter(UserModel.id == b.user_id).first() if b.user_id else None
+        result.append(BookingListItem(
+            id=b.id,
+            user_id=b.user_id,
+            user_email=user.email if user else "Guest",
+            service_type=b.service_type,
+            booking_ref=b.booking_ref,
+            total_price=b.total_price,
+            currency=b.currency,
+            status=b.status,
+            created_at=b.created_at
+        ))
+    
+    return result
+
+
+@router.get("/bookings/{booking_id}")
+def get_booking_detail(
+    booking_id: str,
+    admin: AdminModel = Depends(get_current_admin),
+    db: Session = Depends(get_db)
+):
+    """Get detailed booking information"""
+    booking = db.query(ServiceBookingModel).filter(ServiceBookingModel.id == booking_id).first()
+    if not booking:
+        raise HTTPException(status_code=404, detail="Booking not found")
+    
+    user = db.query(UserModel).filter(UserModel.id == booking.user_id).first() if booking.user_id else None
+    
+    # Parse service JSON
+    service_details = booking.service_data
+    
+    # Get related receipt
+    receipt = db.query(PaymentReceiptModel).filter(
+        PaymentReceiptModel.booking_ref == booking.booking_ref
+    ).first()
+    
+    return {
+        "id": booking.id,
+        "user_id": booking.user_id,
+        "user_email": user.email if user else "Guest",
+        "service_type": booking.service_type,
+        "booking_ref": booking.booking_ref,
+        "total_price": booking.total_price,
+        "currency": booking.currency,
+        "status": booking.status,
+        "service_details": service_details,
+        "receipt_url": receipt.receipt_url if receipt else None,
+        "created_at": booking.created_at.isoformat() if booking.created_at else None
+    }
+
+
+@router.post("/bookings/{booking_id}/status")
+def update_booking_status(
+    booking_id: str,
+    status: str,
+    admin: AdminModel = Depends(get_current_admin),
+    db: Session = Depends(get_db)
+):
+    """Update booking status"""
+    booking = db.query(ServiceBookingModel).filter(ServiceBookingModel.id == booking_id).first()
+    if not booking:
+        raise HTTPException(status_code=404, detail="Booking not found")
+    
+    old_status = booking.status
+    booking.status = status
+    db.commit()
+    
+    log_admin_action(db, admin.id, "update_booking_status", "booking", booking_id, 
+                     f"Changed status from {old_status} to {status}")
+    
+    return {"message": f"Booking status updated to {status}"}
+
+
+@router.post("/bookings/{booking_id}/cancel")
+def cancel_booking(
+    booking_id: str,
+    admin: AdminModel = Depends(get_current_admin),
+    db: Session = Depends(get_db)
+):
+    """Cancel a booking"""
+    booking = db.query(ServiceBookingModel).filter(ServiceBookingModel.id == booking_id).first()
+    if not booking:
+        raise HTTPException(status_code=404, detail="Booking not found")
+    
+    booking.status = "Cancelled"
+    db.commit()
+    
+    log_admin_action(db, admin.id, "cancel_booking", "booking", booking_id, 
+                     f"Cancelled booking {booking.booking_ref}")
+    
+    return {"message": "Booking cancelled successfully"}
+
+
+# =============================
+# Transaction Management
+# =============================
+@router.get("/transactions", response_model=List[TransactionListItem])
+def list_transactions(
+    response: Response,
+    status: Optional[str] = None,
+    payment_method: Optional[str] = None,
+    page: int = 1,
+    limit: int = 20,
+    export: Optional[str] = None,
+    cursor: Optional[str] = None,
+    include_total: bool = False,
+    admin: AdminModel = Depends(get_current_admin),
+    db: Session = Depends(get_db)
+):
+    """List all transactions (`export=csv|ndjson` streams every match; next page cursor in X-Next-Cursor)"""
+    filters = []
+    if status:
+        filters.append(TransactionModel.status == status)
+    if payment_method:
+        filters.append(TransactionModel.payment_method.contains(payment_method))
+    if export_format(export):
+        return stream_export(SessionLocal, lambda s: s.query(
+            TransactionModel.id, TransactionModel.user_id, UserModel.email, TransactionModel.booking_id,
+            TransactionModel.service_type, TransactionModel.amount, TransactionModel.currency,
+            TransactionModel.payment_method, TransactionModel.status, TransactionModel.created_at,
+        ).outerjoin(UserModel, UserModel.id == TransactionModel.user_id).filter(*filters).order_by(
+            TransactionModel.created_at.desc()
+        ), ["id", "user_id", "user_email", "booking_id", "service_type", "amount", "currency",
+            "payment_method", "status", "created_at"], export, "transactions")
+    
+    query = db.query(TransactionModel).filter(*filters)
+    
+    paged = keyset_page(query, newest_first(TransactionModel), cursor, limit, offset=page_offset(page, limit))
+    set_page_headers(response, paged, query.count() if include_total else None)
+    transactions = paged.rows
+    
+    result = []
+    for t in transactions:
+        user = db.query(UserModel).filter(UserModel.id == t.user_id).first()
+        result.append(TransactionListItem(
+            id=t.id,
+            user_id=t.user_id,
+            user_email=user.email if user else "N/A",
+            booking_id=t.booking_id,
+            service_type=t.service_type,
+            amount=t.amount,
+            currency=t.currency,
+            payment_method=t.payment_method,
+            status=t.status,
+            created_at=t.created_at
+        ))
+    
+    return result
+
+
+# =============================
+# Destination Management (CRUD)
+# =============================
+@router.get("/destinations")
+def list_destinations(
+    admin: AdminModel = Depends(get_current_admin),
+    db: Session = Depends(get_db)
+):
+    """List all destinations"""
+    destinations = db.query(DestinationModel).order_by(DestinationModel.created_at.desc()).all()
+    return [
+        {
+            "id": d.id,
+            "name": d.name,
+            "description": d.description,
+            "category": d.category,
+            "country": d.country,
+            "state": d.state,
+            "city": d.city,
+            "image_url": d.image_url,
+            "is_active": d.is_active,
+            "created_at": d.created_at.isoformat() if d.created_at else None
+        } for d in destinations
+    ]
+
+
+@router.post("/destinations")
+def create_destination(
+    data: DestinationCreate,
+    admin: AdminModel = Depends(get_current_admin),
+    db: Session = Depends(get_db)
+):
+    """Create a new destination"""
+    destination = DestinationModel(
+        name=data.name,
+        description=data.description,
+        category=data.category,
+        country=data.country,
+        state=data.state,
+        city=data.city,
+        image_url=data.image_url,
+        latitude=data.latitude,
+        longitude=data.longitude,
+        is_active=data.is_active
+    )
+    db.add(destination)
+    db.commit()
+    db.refresh(destination)
+    
+    log_admin_action(db, admin.id, "create_destination", "destination", str(destination.id), 
+                     f"Created destination: {data.name}")
+    
+    return {"message": "Destination created", "id": destination.id}
+
+
+@router.put("/destinations/{dest_id}")
+def update_destination(
+    dest_id: int,
+    data: DestinationUpdate,
+    admin: AdminModel = Depends(get_current_admin),
+    db: Session = Depends(get_db)
+):
+    """Update a destination"""
+    destination = db.query(DestinationModel).filter(DestinationModel.id == dest_id).first()
+    if not destination:
+        raise HTTPException(status_code=404, detail="Destination not found")
+    
+    if data.name is not None:
+        destination.name = data.name
+    if data.description is not None:
+        destination.description = data.description
+    if data.category is not None:
+        destination.category = data.category
+    if data.country is not None:
+        destination.country = data.country
+    if data.state is not None:
+        destination.state = data.state
+    if data.city is not None:
+        destination.city = data.city
+    if data.image_url is not None:
+        destination.image_url = data.image_url
+    if data.latitude is not None:
+        destination.latitude = data.latitude
+    if data.longitude is not None:
+        destination.longitude = data.longitude
+    if data.is_active is not None:
+        destination.is_active = data.is_active
+    
+    destination.updated_at = datetime.now(timezone.utc)
+    db.commit()
+    
+    log_admin_action(db, admin.id, "update_destination", "destination", str(dest_id), 
+                     f"Updated destination: {destination.name}")
+    
+    return {"message": "Destination updated"}
+
+
+@router.delete("/destinations/{dest_id}")
+def delete_destination(
+    dest_id: int,
+    admin: AdminModel = Depends(get_current_admin),
+    db: Session = Depends(get_db)
+):
+    """Delete a destination"""
+    destination = db.query(DestinationModel).filter(DestinationModel.id == dest_id).first()
+    if not destination:
+        raise HTTPException(status_code=404, detail="Destination not found")
+    
+    name = destination.name
+    db.delete(destination)
+    db.commit()
+    
+    log_admin_action(db, admin.id, "delete_destination", "destination", str(dest_id), 
+                     f"Deleted destination: {name}")
+    
+    return {"message": "Destination deleted"}
+
+
+# =============================
+# Notifications Management
+# =============================
+@router.post("/notifications")
+async def send_notification(
+    data: NotificationCreate,
+    admin: AdminModel = Depends(get_current_admin),
+    db: Session = Depends(get_db)
+):
+    """Send notification to users"""
+    notification_data = {
+        "type": "notification",
+        "title": data.title,
+        "message": data.message,
+        "notification_type": data.notification_type,
+        "created_at": datetime.now(timezone.utc).isoformat()
+    }
+    
+    def store_notifications():
+        # Runs in the DB thread pool so inserts never block the event loop
+        if data.user_id:
+            # Send to specific user
+            notification = NotificationModel(
+                user_id=data.user_id,
+                admin_id=admin.id,
+                title=data.title,
+                message=data.message,
+                notification_type=data.notification_type
+            )
+            db.add(notification)
+            db.commit()
+            return notification.id, 1
+        # Send to all users
+        users = db.query(UserModel).all()
+        count = 0
+        for user in users:
+            notification = NotificationModel(
+                user_id=user.id,
+                admin_id=admin.id,
+                title=data.title,
+                message=data.message,
+                notification_type=data.notification_type
+            )
+            db.add(notification)
+            count += 1
+        db.commit()
+        return None, count
+
+    notification_id, count = await run_in_threadpool(store_notifications)
+
+    if data.user_id:
+        # Send real-time notification via WebSocket
+        notification_data["id"] = notification_id
+        await notification_manager.send_to_user(data.user_id, notification_data)
+    else:
+        # Broadcast to all connected users
+        await notification_manager.broadcast_to_all(notification_data)
+    
+    await run_in_threadpool(log_admin_action, db, admin.id, "send_notification", "notification", None,
+                            f"Sent notification to {count} user(s): {data.title}")
+    
+    return {"message": f"Notification sent to {count} user(s)"}
+
+
+@router.get("/notifications")
+def list_notifications(
+    page: int = 1,
+    limit: int = 50,
+    admin: AdminModel = Depends(get_current_admin),
+    db: Session = Depends(get_db)
+):
+    """List sent notifications"""
+    notifications = db.query(NotificationModel).order_by(
+        NotificationModel.created_at.desc()
+    ).offset((page-1)*limit).limit(limit).all()
+    
+    return [
+        {
+            "id": n.id,
+            "user_id": n.user_id,
+            "title": n.title,
+            "message": n.message,
+            "notification_type": n.notification_type,
+            "is_read": n.is_read,
+            "created_at": n.created_at.isoformat() if n.created_at else None
+        } for n in notifications
+    ]
+
+
+# =============================
+# Reports & Logs
+# =============================
+def _report_day(value: Optional[str]) -> Optional[str]:
+    """UTC day (YYYY-MM-DD) of a report date or datetime parameter"""
+    if not value:
+        return None
+    try:
+        return datetime.strptime(value[:10], "%Y-%m-%d").date().isoformat()
+    except ValueError:
+        raise HTTPException(status_code=400, detail=f"Invalid date: {value}")
+
+
+@router.get("/reports/bookings")
+def booking_report(
+    start_date: Optional[str] = None,
+    end_date: Optional[str] = None,
+    export: Optional[str] = None,
+    admin: AdminModel = Depends(get_current_admin),
+    db: Session = Depends(get_db)
+):
+    """Get booking report (from the daily rollups; dates are whole UTC days)
+
+    `export=csv|ndjson` streams the bookings behind the report instead, over
+    the same days. Bookings without a creation date count only when no date
+    is given.
+    """
+    start_day, end_day = _report_day(start_date), _report_day(end_date)
+    if export_format(export):
+        filters = []
+        if start_day:
+            filters.append(ServiceBookingModel.created_at >= datetime.strptime(start_day, "%Y-%m-%d"))
+        if end_day:
+            filters.append(ServiceBookingModel.created_at
+                           < datetime.strptime(end_day, "%Y-%m-%d") + timedelta(days=1))
+        return _export_service_bookings(export, filters)
+    
+    by_type = {}
+    for service_type, count, _ in booking_rollups.breakdown(db, "service_booking", "service_type", start_day, end_day):
+        if count:
+            by_type[service_type] = count
+    by_status = {}
+    total_revenue = 0
+    for status, count, amount in booking_rollups.breakdown(db, "service_booking", "status", start_day, end_day):
+        if count:
+            by_status[status] = count
+        if status in REVENUE_BOOKING_STATUSES:
+            total_revenue += amount
+    
+    return {
+        "total_bookings": sum(by_type.values()),
+        "by_service_type": by_type,
+        "by_status": by_status,
+        "total_revenue": total_revenue
+    }
+
+
+@router.get("/reports/users")
+def user_report(
+    admin: AdminModel = Depends(get_current_admin),
+    db: Session = Depends(get_db)
+):
+    """Get user growth report"""
+    total_users = db.query(UserModel).count()
+    kyc_completed = db.query(UserModel).filter(UserModel.is_kyc_completed == 1).count()
+    
+    # Users by month (last 6 months)
+    users_by_month = []
+    for i in range(6):
+        month_start = datetime.now(timezone.utc).replace(day=1) - timedelta(days=30*i)
+        month_end = month_start + timedelta(days=30)
+        count = db.query(UserModel).filter(
+            UserModel.created_at >= month_start,
+            UserModel.created_at < month_end
+        ).count()
+        users_by_month.append({
+            "month": month_start.strftime("%Y-%m"),
+            "count": count
+        })
+    
+    return {
+        "total_users": total_users,
+        "kyc_completed": kyc_completed,
+        "kyc_pending": total_users - kyc_completed,
+        "users_by_month": list(reversed(users_by_month))
+    }
+
+
+@router.get("/audit-logs", response_model=List[AuditLogItem])
+def get_audit_logs(
+    response: Response,
+    page: int = 1,
+    limit: int = 50,
+    action: Optional[str] = None,
+    export: Optional[str] = None,
+    cursor: Optional[str] = None,
+    include_total: bool = False,
+    admin: AdminModel = Depends(get_current_admin),
+    db: Session = Depends(get_db)
+):
+    """Get admin audit logs (`export=csv|ndjson` streams every match; next page cursor in X-Next-Cursor)"""
+    filters = [AuditLogModel.action.contains(action)] if action else []
+    if export_format(export):
+        return stream_export(SessionLocal, lambda s: s.query(
+            AuditLogModel.id, AuditLogModel.admin_id, AdminModel.email, AuditLogModel.action,
+            AuditLogModel.entity_type, AuditLogModel.entity_id, AuditLogModel.details,
+            AuditLogModel.ip_address, AuditLogModel.created_at,
+        ).outerjoin(AdminModel, AdminModel.id == AuditLogModel.admin_id).filter(*filters).order_by(
+            AuditLogModel.created_at.desc()
+        ), ["id", "admin_id", "admin_email", "action", "entity_type", "entity_id", "details",
+            "ip_address", "created_at"], export, "audit-logs")
+    
+    query = db.query(AuditLogModel).filter(*filters)
+    
+    paged = keyset_page(query, newest_first(AuditLogModel), cursor, limit, offset=page_offset(page, limit))
+    set_page_headers(response, paged, query.count() if include_total else None)
+    logs = paged.rows
+    
+    result = []
+    for log in logs:
+        admin_user = db.query(AdminModel).filter(AdminModel.id == log.admin_id).first() if log.admin_id else None
+        result.append(AuditLogItem(
+            id=log.id,
+            admin_id=log.admin_id,
+            admin_email=admin_user.email if admin_user else "System",
+            action=log.action,
+            entity_type=log.entity_type,
+            entity_id=log.entity_id,
+            details=log.details,
+            ip_address=log.ip_address,
+            created_at=log.created_at
+        ))
+    
+    return result
+
+
+# =============================
+# Platform Settings
+# =============================
+@router.get("/settings")
+def get_platform_settings(
+    admin: AdminModel = Depends(get_current_admin),
+    db: Session = Depends(get_db)
+):
+    """Get platform settings"""
+    settings = db.query(PlatformSettingModel).all()
+    return {s.setting_key: s.setting_value for s in settings}
+
+
+@router.put("/settings")
+def update_platform_settings(
+    data: PlatformSettingUpdate,
+    admin: AdminModel = Depends(get_current_admin),
+    db: Session = Depends(get_db)
+):
+    """Update platform settings"""
+    if data.maintenance_mode is not None:
+        setting = db.query(PlatformSettingModel).filter(
+            PlatformSettingModel.setting_key == "maintenance_mode"
+        ).first()
+        if setting:
+            setting.setting_value = str(data.maintenance_mode).lower()
+            setting.updated_by = admin.id
+            setting.updated_at = datetime.now(timezone.utc)
+    
+    if data.bookings_enabled is not None:
+        setting = db.query(PlatformSettingModel).filter(
+            PlatformSettingModel.setting_key == "bookings_enabled"
+        ).first()
+        if setting:
+            setting.setting_value = str(data.bookings_enabled).lower()
+            setting.updated_by = admin.id
+            setting.updated_at = datetime.now(timezone.utc)
+    
+    if data.new_user_registration is not None:
+        setting = db.query(PlatformSettingModel).filter(
+            PlatformSettingModel.setting_key == "new_user_registration"
+        ).first()
+        if setting:
+            setting.setting_value = str(data.new_user_registration).lower()
+            setting.updated_by = admin.id
+            setting.updated_at = datetime.now(timezone.utc)
+    
+    db.commit()
+    
+    log_admin_action(db, admin.id, "update_settings", "settings", None, "Updated platform settings")
+    
+    return {"message": "Settings updated"}
+
+
+# =============================
+# Receipts & Tickets
+# =============================
+@router.get("/receipts")
+def list_receipts(
+    page: int = 1,
+    limit: int = 20,
+    admin: AdminModel = Depends(get_current_admin),
+    db: Session = Depends(get_db)
+):
+    """List all payment receipts"""
+    receipts = db.query(PaymentReceiptModel).order_by(
+        PaymentReceiptModel.created_at.desc()
+    ).offset((page-1)*limit).limit(limit).all()
+    
+    return [
+        {
+            "id": r.id,
+            "booking_ref": r.booking_ref,
+            "full_name": r.full_name,
+            "email": r.email,
+            "amount": r.amount,
+            "payment_method": r.payment_method,
+            "receipt_url": r.receipt_url,
+            "created_at": r.created_at.isoformat() if r.created_at else None
+        } for r in receipts
+    ]
+
+
+# =============================
+# Admin Bus Management Endpoints
+# =============================
+@router.get("/bus/cities")
+def admin_get_cities(
+    admin: AdminModel = Depends(get_current_admin),
+    db: Session = Depends(get_db)
+):
+    """Get all bus cities"""
+    cities = db.query(BusCityModel).order_by(BusCityModel.name).all()
+    return [{"id": c.id, "name": c.name, "state": c.state, "is_active": c.is_active} for c in cities]
+
+
+@router.post("/bus/cities")
+def admin_create_city(
+    city: BusCityCreate,
+    admin: AdminModel = Depends(get_current_admin),
+    db: Session = Depends(get_db)
+):
+    """Create a new bus city"""
+    new_city = BusCityModel(
+        name=city.name,
+        state=city.state,
+        country=city.country,
+        latitude=city.latitude,
+        longitude=city.longitude
+    )
+    db.add(new_city)
+    db.commit()
+    response_cache.invalidate("bus_cities")
+    return {"id": new_city.id, "message": "City created"}
+
+
+@router.get("/bus/operators")
+def admin_get_operators(
+    admin: AdminModel = Depends(get_current_admin),
+    db: Session = Depends(get_db)
+):
+    """Get all bus operators"""
+    operators = db.query(BusOperatorModel).order_by(BusOperatorModel.name).all()
+    return [{
+        "id": o.id,
+        "name": o.name,
+        "rating": o.rating,
+        "is_active": o.is_active,
+        "contact_phone": o.contact_phone,
+        "contact_email": o.contact_email
+    } for o in operators]
+
+
+@router.post("/bus/operators")
+def admin_create_operator(
+    operator: BusOperatorCreate,
+    admin: AdminModel = Depends(get_current_admin),
+    db: Session = Depends(get_db)
+):
+    """Create a new bus operator"""
+    new_operator = BusOperatorModel(
+        name=operator.name,
+        logo_url=operator.logo_url,
+        rating=operator.rating,
+        contact_phone=operator.contact_phone,
+        contact_email=operator.contact_email,
+        cancellation_policy=operator.cancellation_policy,
+        amenities=operator.amenities
+    )
+    db.add(new_operator)
+    db.commit()
+    return {"id": new_operator.id, "message": "Operator created"}
+
+
+@router.get("/bus/routes")
+def admin_get_routes(
+    admin: AdminModel = Depends(get_current_admin),
+    db: Session = Depends(get_db)
+):
+    """Get all bus routes"""
+    routes = db.query(BusRouteModel).all()
+    result = []
+    for r in routes:
+        from_city = db.query(BusCityModel).filter(BusCityModel.id == r.from_city_id).first()
+        to_city = db.query(BusCityModel).filter(BusCityModel.id == r.to_city_id).first()
+        result.append({
+            "id": r.id,
+            "from_city_id": r.from_city_id,
+            "from_city": from_city.name if from_city else "",
+            "to_city_id": r.to_city_id,
+            "to_city": to_city.name if to_city else "",
+            "distance_km": r.distance_km,
+            "is_active": r.is_active
+        })
+    return result
+
+
+@router.post("/bus/routes")
+def admin_create_route(
+    route: BusRouteCreate,
+    admin: AdminModel = Depends(get_current_admin),
+    db: Session = Depends(get_db)
+):
+    """Create a new bus route"""
+    new_route = BusRouteModel(
+        from_city_id=route.from_city_id,
+        to_city_id=route.to_city_id,
+        distance_km=route.distance_km,
+        estimated_duration_mins=route.estimated_duration_mins
+    )
+    db.add(new_route)
+    db.commit()
+    return {"id": new_route.id, "message": "Route created"}
+
+
+@router.get("/bus/buses")
+def admin_get_buses(
+    admin: AdminModel = Depends(get_current_admin),
+    db: Session = Depends(get_db)
+):
+    """Get all buses"""
+    buses = db.query(BusModel).all()
+    result = []
+    for b in buses:
+        operator = db.query(BusOperatorModel).filter(BusOperatorModel.id == b.operator_id).first()
+        result.append({
+            "id": b.id,
+            "operator_id": b.operator_id,
+            "operator_name": operator.name if operator else "",
+            "bus_number": b.bus_number,
+            "bus_type": b.bus_type,
+            "total_seats": b.total_seats,
+            "seat_layout": b.seat_layout,
+            "is_active": b.is_active
+        })
+    return result
+
+
+@router.post("/bus/buses")
+def admin_create_bus(
+    bus: BusCreate,
+    admin: AdminModel = Depends(get_current_admin),
+    db: Session = Depends(get_db)
+):
+    """Create a new bus with seat layout"""
+    new_bus = BusModel(
+        operator_id=bus.operator_id,
+        bus_number=bus.bus_number,
+        bus_type=bus.bus_type,
+        total_seats=bus.total_seats,
+        seat_layout=bus.seat_layout,
+        has_upper_deck=bus.has_upper_deck,
+        amenities=bus.amenities
+    )
+    db.add(new_bus)
+    db.flush()
+    
+    # Generate seats based on layout
+    if bus.seat_layout == "2+2":
+        # Standard seater bus
+        rows = (bus.total_seats + 3) // 4
+        seat_num = 1
+        for row in range(1, rows + 1):
+            for col in range(1, 5):
+                if seat_num > bus.total_seats:
+                    break
+                position = "window" if col in [1, 4] else "aisle"
+                seat = BusSeatModel(
+                    bus_id=new_bus.id,
+                    seat_number=f"{row}{chr(64+col)}",
+                    seat_type="seater",
+                    deck="lower",
+                    row_number=row,
+                    column_number=col,
+                    position=position
+                )
+                db.add(seat)
+                seat_num += 1
+    elif bus.seat_layout == "sleeper":
+        # Sleeper bus with upper and lower deck
+        lower_seats = bus.total_seats // 2
+        upper_seats = bus.total_seats - lower_seats
+        
+        # Lower deck
+        rows = (lower_seats + 1) // 2
+        for row in range(1, rows + 1):
+            for col in [1, 2]:
+                seat = BusSeatModel(
+                    bus_id=new_bus.id,
+                    seat_number=f"L{row}{col}",
+                    seat_type="sleeper",
+                    deck="lower",
+                    row_number=row,
+                    column_number=col,
+                    position="window" if col == 1 else "aisle"
+                )
+                db.add(seat)
+        
+        # Upper deck
+        rows = (upper_seats + 1) // 2
+        for row in range(1, rows + 1):
+            for col in [1, 2]:
+                seat = BusSeatModel(
+                    bus_id=new_bus.id,
+                    seat_number=f"U{row}{col}",
+                    seat_type="sleeper",
+                    deck="upper",
+                    row_number=row,
+                    column_number=col,
+                    position="window" if col == 1 else "aisle",
+                    price_modifier=50  # Upper deck slightly cheaper
+                )
+                db.add(seat)
+    else:
+        # Default 2+1 layout
+        rows = (bus.total_seats + 2) // 3
+        seat_num = 1
+        for row in range(1, rows + 1):
+            for col in range(1, 4):
+                if seat_num > bus.total_seats:
+                    break
+                position = "window" if col in [1, 3] else "aisle"
+                seat = BusSeatModel(
+                    bus_id=new_bus.id,
+                    seat_number=f"{row}{chr(64+col)}",
+                    seat_type="seater",
+                    deck="lower",
+                    row_number=row,
+                    column_number=col,
+                    position=position
+                )
+                db.add(seat)
+                seat_num += 1
+    
+    db.commit()
+    return {"id": new_bus.id, "message": "Bus created with seats"}
+
+
+@router.get("/bus/schedules")
+def admin_get_schedules(
+    admin: AdminModel = Depends(get_current_admin),
+    db: Session = Depends(get_db)
+):
+    """Get all bus schedules"""
+    schedules = db.query(BusScheduleModel).all()
+    result = []
+    for s in schedules:
+        bus = db.query(BusModel).filter(BusModel.id == s.bus_id).first()
+        route = db.query(BusRouteModel).filter(BusRouteModel.id == s.route_id).first()
+        from_city = db.query(BusCityModel).filter(BusCityModel.id == route.from_city_id).first() if route else None
+        to_city = db.query(BusCityModel).filter(BusCityModel.id == route.to_city_id).first() if route else None
+        operator = db.query(BusOperatorModel).filter(BusOperatorModel.id == bus.operator_id).first() if bus else None
+        
+        result.append({
+            "id": s.id,
+            "bus_id": s.bus_id,
+            "bus_number": bus.bus_number if bus else "",
+            "operator_name": operator.name if operator else "",
+            "route_id": s.route_id,
+            "from_city": from_city.name if from_city else "",
+            "to_city": to_city.name if to_city else "",
+            "departure_time": s.departure_time,
+            "arrival_time": s.arrival_time,
+            "base_price": s.base_price,
+            "is_night_bus": s.is_night_bus,
+            "is_active": s.is_active
+        })
+    return result
+
+
+@router.post("/bus/schedules")
+def admin_create_schedule(
+    schedule: BusScheduleCreate,
+    admin: AdminModel = Depends(get_current_admin),
+    db: Session = Depends(get_db)
+):
+    """Create a new bus schedule"""
+    new_schedule = BusScheduleModel(
+        bus_id=schedule.bus_id,
+        route_id=schedule.route_id,
+        departure_time=schedule.departure_time,
+        arrival_time=schedule.arrival_time,
+        duration_mins=schedule.duration_mins,
+        days_of_week=schedule.days_of_week,
+        base_price=schedule.base_price,
+        is_night_bus=schedule.is_night_bus,
+        next_day_arrival=schedule.next_day_arrival
+    )
+    db.add(new_schedule)
+    db.commit()
+    return {"id": new_schedule.id, "message": "Schedule created"}
+
+
+@router.post("/bus/boarding-points")
+def admin_create_boarding_point(
+    point: BusBoardingPointCreate,
+    admin: AdminModel = Depends(get_current_admin),
+    db: Session = Depends(get_db)
+):
+    """Create a boarding/dropping point"""
+    new_point = BusBoardingPointModel(
+        schedule_id=point.schedule_id,
+        city_id=point.city_id,
+        point_name=point.point_name,
+        address=point.address,
+        time=point.time,
+        latitude=point.latitude,
+        longitude=point.longitude,
+        point_type=point.point_type
+    )
+    db.add(new_point)
+    db.commit()
+    return {"id": new_point.id, "message": "Boarding point created"}
+
+
+@router.get("/bus/bookings")
+def admin_get_bus_bookings(
+    response: Response,
+    page: int = 1,
+    limit: int = 20,
+    status: Optional[str] = None,
+    export: Optional[str] = None,
+    cursor: Optional[str] = None,
+    include_total: bool = False,
+    admin: AdminModel = Depends(get_current_admin),
+    db: Session = Depends(get_db)
+):
+    """Get all bus bookings (`export=csv|ndjson` streams every match; next page cursor in X-Next-Cursor)"""
+    if export_format(export):
+        def build(s: Session):
+            passengers = s.query(
+                BusPassengerModel.booking_id, func.count(BusPassengerModel.id).label("passengers")
+            ).group_by(BusPassengerModel.booking_id).subquery()
+            query = s.query(
+                BusBookingModel.id, BusBookingModel.pnr, BusBookingModel.user_id, BusBookingModel.journey_date,
+                BusOperatorModel.name, BusBookingModel.final_amount, BusBookingModel.booking_status,
+                BusBookingModel.payment_status, func.coalesce(passengers.c.passengers, 0),
+                BusBookingModel.created_at,
+            ).outerjoin(BusScheduleModel, BusScheduleModel.id == BusBookingModel.schedule_id) \
+                .outerjoin(BusModel, BusModel.id == BusScheduleModel.bus_id) \
+                .outerjoin(BusOperatorModel, BusOperatorModel.id == BusModel.operator_id) \
+                .outerjoin(passengers, passengers.c.booking_id == BusBookingModel.id)
+            if status:
+                query = query.filter(BusBookingModel.booking_status == status)
+            return query.order_by(BusBookingModel.created_at.desc())
+        return stream_export(SessionLocal, build, [
+            "id", "pnr", "user_id", "journey_date", "operator_name", "final_amount", "booking_status",
+            "payment_status", "passengers", "created_at",
+        ], export, "bus-bookings")
+    
+    query = db.query(BusBookingModel)
+    if status:
+        query = query.filter(BusBookingModel.booking_status == status)
+    
+    paged = keyset_page(query, newest_first(BusBookingModel), cursor, limit, offset=page_offset(page, limit))
+    set_page_headers(response, paged, query.count() if include_total else None)
+    bookings = paged.rows
+    
+    result = []
+    for b in bookings:
+        schedule = db.query(BusScheduleModel).filter(BusScheduleModel.id == b.schedule_id).first()
+        bus = db.query(BusModel).filter(BusModel.id == schedule.bus_id).first() if schedule else None
+        operator = db.query(BusOperatorModel).filter(BusOperatorModel.id == bus.operator_id).first() if bus else None
+        passengers = db.query(BusPassengerModel).filter(BusPassengerModel.booking_id == b.id).count()
+        
+        result.append({
+            "id": b.id,
+            "pnr": b.pnr,
+            "user_id": b.user_id,
+            "journey_date": b.journey_date,
+            "operator_name": operator.name if operator else "",
+            "final_amount": b.final_amount,
+            "booking_status": b.booking_status,
+            "payment_status": b.payment_status,
+            "passengers": passengers,
+            "created_at": b.created_at.isoformat() if b.created_at else None
+        })
+    
+    return result
+
+
+# =============================
+# Admin Flight Endpoints
+# =============================
+
+@router.get("/flight/airports")
+def admin_get_airports(
+    admin: AdminModel = Depends(get_current_admin),
+    db: Session = Depends(get_db)
+):
+    """Get all airports"""
+    airports = db.query(AirportModel).all()
+    return [{"id": a.id, "code": a.code, "name": a.name, "city": a.city, 
+             "country": a.country, "timezone": a.timezone, "latitude": a.latitude, 
+             "longitude": a.longitude, "is_active": a.is_active} for a in airports]
+
+@router.post("/flight/airports")
+def admin_create_airport(
+    data: AirportCreate,
+    admin: AdminModel = Depends(get_current_admin),
+    db: Session = Depends(get_db)
+):
+    """Create a new airport"""
+    existing = db.query(AirportModel).filter(AirportModel.code == data.code).first()
+    if existing:
+        raise HTTPException(status_code=400, detail="Airport code already exists")
+    
+    airport = AirportModel(
+        code=data.code.upper(),
+        name=data.name,
+        city=data.city,
+        country=data.country,
+        timezone=data.timezone,
+        latitude=data.latitude,
+        longitude=data.longitude,
+        is_active=True
+    )
+    db.add(airport)
+    db.commit()
+    response_cache.invalidate("airports")
+    flight_network.invalidate()
+    db.refresh(airport)
+    return {"message": "Airport created", "id": airport.id}
+
+@router.put("/flight/airports/{airport_id}")
+def admin_update_airport(
+    airport_id: int,
+    data: AirportCreate,
+    admin: AdminModel = Depends(get_current_admin),
+    db: Session = Depends(get_db)
+):
+    """Update an airport"""
+    airport = db.query(AirportModel).filter(AirportModel.id == airport_id).first()
+    if not airport:
+        raise HTTPException(status_code=404, detail="Airport not found")
+    
+    airport.code = data.code.upper()
+    airport.name = data.name
+    airport.city = data.city
+    airport.country = data.country
+    airport.timezone = data.timezone
+    airport.latitude = data.latitude
+    airport.longitude = data.longitude
+    db.commit()
+    response_cache.invalidate("airports")
+    flight_network.invalidate()
+    return {"message": "Airport updated"}
+
+@router.delete("/flight/airports/{airport_id}")
+def admin_delete_airport(
+    airport_id: int,
+    admin: AdminModel = Depends(get_current_admin),
+    db: Session = Depends(get_db)
+):
+    """Delete an airport"""
+    airport = db.query(AirportModel).filter(AirportModel.id == airport_id).first()
+    if not airport:
+        raise HTTPException(status_code=404, detail="Airport not found")
+    
+    db.delete(airport)
+    db.commit()
+    response_cache.invalidate("airports")
+    flight_network.invalidate()
+    return {"message": "Airport deleted"}
+
+@router.get("/flight/airlines")
+def admin_get_airlines(
+    admin: AdminModel = Depends(get_current_admin),
+    db: Session = Depends(get_db)
+):
+    """Get all airlines"""
+    airlines = db.query(AirlineModel).all()
+    return [{"id": a.id, "code": a.code, "name": a.name, "logo_url": a.logo_url, 
+             "country": a.country, "is_active": a.is_active} for a in airlines]
+
+@router.post("/flight/airlines")
+def admin_create_airline(
+    data: AirlineCreate,
+    admin: AdminModel = Depends(get_current_admin),
+    db: Session = Depends(get_db)
+):
+    """Create a new airline"""
+    existing = db.query(AirlineModel).filter(AirlineModel.code == data.code).first()
+    if existing:
+        raise HTTPException(status_code=400, detail="Airline code already exists")
+    
+    airline = AirlineModel(
+        code=data.code.upper(),
+        name=data.name,
+        logo_url=data.logo_url,
+        country=data.country,
+        is_active=True
+    )
+    db.add(airline)
+    db.commit()
+    response_cache.invalidate("airlines")
+    flight_network.invalidate()
+    db.refresh(airline)
+    return {"message": "Airline created", "id": airline.id}
+
+@router.put("/flight/airlines/{airline_id}")
+def admin_update_airline(
+    airline_id: int,
+    data: AirlineCreate,
+    admin: AdminModel = Depends(get_current_admin),
+    db: Session = Depends(get_db)
+):
+    """Update an airline"""
+    airline = db.query(AirlineModel).filter(AirlineModel.id == airline_id).first()
+    if not airline:
+        raise HTTPException(status_code=404, detail="Airline not found")
+    
+    airline.code = data.code.upper()
+    airline.name = data.name
+    airline.logo_url = data.logo_url
+    airline.country = data.country
+    db.commit()
+    response_cache.invalidate("airlines")
+    flight_network.invalidate()
+    return {"message": "Airline updated"}
+
+@router.delete("/flight/airlines/{airline_id}")
+def admin_delete_airline(
+    airline_id: int,
+    admin: AdminModel = Depends(get_current_admin),
+    db: Session = Depends(get_db)
+):
+    """Delete an airline"""
+    airline = db.query(AirlineModel).filter(AirlineModel.id == airline_id).first()
+    if not airline:
+        raise HTTPException(status_code=404, detail="Airline not found")
+    
+    db.delete(airline)
+    db.commit()
+    response_cache.invalidate("airlines")
+    flight_network.invalidate()
+    return {"message": "Airline deleted"}
+
+@router.get("/flight/aircraft")
+def admin_get_aircraft(
+    admin: AdminModel = Depends(get_current_admin),
+    db: Session = Depends(get_db)
+):
+    """Get all aircraft"""
+    aircraft = db.query(AircraftModel).all()
+    return [{"id": a.id, "model": a.model, "manufacturer": a.manufacturer, 
+             "total_seats": a.total_seats, "seat_layout": a.seat_layout,
+             "has_business_class": a.has_business_class} for a in aircraft]
+
+@router.post("/flight/aircraft")
+def admin_create_aircraft(
+    data: AircraftCreate,
+    admin: AdminModel = Depends(get_current_admin),
+    db: Session = Depends(get_db)
+):
+    """Create a new aircraft"""
+    aircraft = AircraftModel(
+        model=data.model,
+        manufacturer=data.manufacturer,
+        total_seats=data.total_seats,
+        seat_layout=data.seat_layout,
+        has_business_class=data.has_business_class
+    )
+    db.add(aircraft)
+    db.commit()
+    db.refresh(aircraft)
+    return {"message": "Aircraft created", "id": aircraft.id}
+
+@router.get("/flight/routes")
+def admin_get_flight_routes(
+    admin: AdminModel = Depends(get_current_admin),
+    db: Session = Depends(get_db)
+):
+    """Get all flight routes"""
+    routes = db.query(FlightRouteModel).all()
+    result = []
+    for r in routes:
+        origin = db.query(AirportModel).filter(AirportModel.id == r.origin_airport_id).first()
+        dest = db.query(AirportModel).filter(AirportModel.id == r.destination_airport_id).first()
+        result.append({
+            "id": r.id,
+            "origin_airport_id": r.origin_airport_id,
+            "origin": {"code": origin.code, "city": origin.city} if origin else None,
+            "destination_airport_id": r.destination_airport_id,
+            "destination": {"code": dest.code, "city": dest.city} if dest else None,
+            "distance_km": r.distance_km,
+            "duration_mins": r.duration_mins,
+            "is_active": r.is_active
+        })
+    return result
+
+@router.post("/flight/routes")
+def admin_create_flight_route(
+    data: FlightRouteCreate,
+    admin: AdminModel = Depends(get_current_admin),
+    db: Session = Depends(get_db)
+):
+    """Create a new flight route"""
+    # Verify airports exist
+    origin = db.query(AirportModel).filter(AirportModel.id == data.origin_airport_id).first()
+    dest = db.query(AirportModel).filter(AirportModel.id == data.destination_airport_id).first()
+    
+    if not origin or not dest:
+        raise HTTPException(status_code=400, detail="Invalid airport IDs")
+    
+    route = FlightRouteModel(
+        origin_airport_id=data.origin_airport_id,
+        destination_airport_id=data.destination_airport_id,
+        distance_km=data.distance_km,
+        duration_mins=data.duration_mins,
+        is_active=True
+    )
+    db.add(route)
+    db.commit()
+    flight_network.invalidate()
+    db.refresh(route)
+    return {"message": "Route created", "id": route.id}
+
+@router.get("/flight/flights")
+def admin_get_flights(
+    page: int = 1,
+    limit: int = 20,
+    status: Optional[str] = None,
+    admin: AdminModel = Depends(get_current_admin),
+    db: Session = Depends(get_db)
+):
+    """Get all flights with pagination"""
+    query = db.query(FlightModel)
+    if status:
+        query = query.filter(FlightModel.status == status)
+    
+    flights = query.order_by(FlightModel.departure_datetime.desc()).offset((page-1)*limit).limit(limit).all()
+    
+    result = []
+    for f in flights:
+        airline = db.query(AirlineModel).filter(AirlineModel.id == f.airline_id).first()
+        route = db.query(FlightRouteModel).filter(FlightRouteModel.id == f.route_id).first()
+        origin = db.query(AirportModel).filter(AirportModel.id == route.origin_airport_id).first() if route else None
+        dest = db.query(AirportModel).filter(AirportModel.id == route.destination_airport_id).first() if route else None
+        
+        result.append({
+            "id": f.id,
+            "flight_number": f.flight_number,
+            "airline": {"code": airline.code, "name": airline.name, "logo": airline.logo_url} if airline else None,
+            "origin": {"code": origin.code, "city": origin.city, "name": origin.name} if origin else None,
+            "destination": {"code": dest.code, "city": dest.city, "name": dest.name} if dest else None,
+            "departure_datetime": f.departure_datetime.isoformat() if f.departure_datetime else None,
+            "arrival_datetime": f.arrival_datetime.isoformat() if f.arrival_datetime else None,
+            "base_price_economy": f.base_price_economy,
+            "base_price_business": f.base_price_business,
+            "status": f.status,
+            "stops": f.stops
+        })
+    
+    return result
+
+@router.post("/flight/flights")
+def admin_create_flight(
+    data: FlightCreate,
+    admin: AdminModel = Depends(get_current_admin),
+    db: Session = Depends(get_db)
+):
+    """Create a new flight"""
+    # Verify references
+    airline = db.query(AirlineModel).filter(AirlineModel.id == data.airline_id).first()
+    route = db.query(FlightRouteModel).filter(FlightRouteModel.id == data.route_id).first()
+    aircraft = db.query(AircraftModel).filter(AircraftModel.id == data.aircraft_id).first()
+    
+    if not airline:
+        raise HTTPException(status_code=400, detail="Invalid airline ID")
+    if not route:
+        raise HTTPException(status_code=400, detail="Invalid route ID")
+    if not aircraft:
+        raise HTTPException(status_code=400, detail="Invalid aircraft ID")
+    
+    flight = FlightModel(
+        flight_number=data.flight_number.upper(),
+        airline_id=data.airline_id,
+        route_id=data.route_id,
+        aircraft_id=data.aircraft_id,
+        departure_time=data.departure_time,
+        arrival_time=data.arrival_time,
+        duration_mins=data.duration_mins,
+        stops=data.stops or 0,
+        stop_airports=data.stop_airports,
+        days_of_week=data.days_of_week,
+        base_price_economy=data.base_price_economy,
+        base_price_business=data.base_price_business,
+        is_overnight=data.is_overnight,
+        is_refundable=data.is_refundable,
+        baggage_allowance=data.baggage_allowance,
+        meal_included=data.meal_included
+    )
+    db.add(flight)
+    db.commit()
+    flight_network.invalidate()
+    
+    # Search only reads materialised schedules (whose seats start out available);
+    # write this flight's now rather than at the next background pass
+    flight_schedules.materialise(db, flight_ids=[flight.id])
+    
+    return {"message": "Flight created", "id": flight.id}
+
+@router.put("/flight/flights/{flight_id}")
+def admin_update_flight(
+    flight_id: int,
+    status: str,
+    gate: Optional[str] = None,
+    terminal: Optional[str] = None,
+    admin: AdminModel = Depends(get_current_admin),
+    db: Session = Depends(get_db)
+):
+    """Update flight status"""
+    flight = db.query(FlightModel).filter(FlightModel.id == flight_id).first()
+    if not flight:
+        raise HTTPException(status_code=404, detail="Flight not found")
+    
+    flight.status = status
+    if gate:
+        flight.gate = gate
+    if terminal:
+        flight.terminal = terminal
+    
+    db.commit()
+    flight_network.invalidate()
+    # A re-activated flight needs its schedules back before search lists it
+    flight_schedules.materialise(db, flight_ids=[flight.id])
+    return {"message": "Flight updated"}
+
+@router.get("/flight/bookings")
+def admin_get_flight_bookings(
+    response: Response,
+    page: int = 1,
+    limit: int = 20,
+    status: Optional[str] = None,
+    export: Optional[str] = None,
+    cursor: Optional[str] = None,
+    include_total: bool = False,
+    admin: AdminModel = Depends(get_current_admin),
+    db: Session = Depends(get_db)
+):
+    """Get all flight bookings (`export=csv|ndjson` streams every match; next page cursor in X-Next-Cursor)"""
+    if export_format(export):
+        def build(s: Session):
+            # Flight of the first segment, as in the listing
+            query = s.query(
+                FlightBookingModel.id, FlightBookingModel.booking_reference, FlightBookingModel.pnr,
+                FlightBookingModel.user_id, UserModel.name, UserModel.email, FlightModel.flight_number,
+                AirlineModel.name, FlightBookingModel.trip_type, FlightBookingModel.final_amount,
+                FlightBookingModel.booking_status, FlightBookingModel.payment_status,
+                FlightBookingModel.created_at,
+            ).outerjoin(UserModel, UserModel.id == FlightBookingModel.user_id) \
+                .outerjoin(FlightSegmentModel, (FlightSegmentModel.booking_id == FlightBookingModel.id)
+                           & (FlightSegmentModel.segment_order == 1)) \
+                .outerjoin(FlightScheduleModel, FlightScheduleModel.id == FlightSegmentModel.schedule_id) \
+                .outerjoin(FlightModel, FlightModel.id == FlightScheduleModel.flight_id) \
+                .outerjoin(AirlineModel, AirlineModel.id == FlightModel.airline_id)
+            if status:
+                query = query.filter(FlightBookingModel.booking_status == status)
+            return query.order_by(FlightBookingModel.created_at.desc())
+        return stream_export(SessionLocal, build, [
+            "id", "booking_reference", "pnr", "user_id", "user_name", "user_email", "flight_number",
+            "airline", "trip_type", "final_amount", "booking_status", "payment_status", "created_at",
+        ], export, "flight-bookings")
+    
+    query = db.query(FlightBookingModel)
+    if status:
+        query = query.filter(FlightBookingModel.status == status)
+    
+    paged = keyset_page(query, newest_first(FlightBookingModel), cursor, limit, offset=page_offset(page, limit))
+    set_page_headers(response, paged, query.count() if include_total else None)
+    bookings = paged.rows
+    
+    result = []
+    for b in bookings:
+        user = db.query(User).filter(User.id == b.user_id).first()
+        passengers = db.query(FlightPassengerModel).filter(FlightPassengerModel.booking_id == b.id).all()
+        
+        # Get flight info for first passenger
+        first_passenger = passengers[0] if passengers else None
+        flight = db.query(FlightModel).filter(FlightModel.id == first_passenger.flight_id).first() if first_passenger else None
+        airline = db.query(AirlineModel).filter(AirlineModel.id == flight.airline_id).first() if flight else None
+        
+        result.append({
+            "id": b.id,
+            "booking_reference": b.booking_reference,
+            "pnr": b.pnr,
+            "user": {"id": user.id, "name": user.name, "email": user.email} if user else None,
+            "flight_number": flight.flight_number if flight else None,
+            "airline": airline.name if airline else None,
+            "trip_type": b.trip_type,
+            "total_passengers": b.total_passengers,
+            "total_amount": b.total_amount,
+            "status": b.status,
+            "payment_status": b.payment_status,
+            "created_at": b.created_at.isoformat() if b.created_at else None
+        })
+    
+    return result
+
+@router.get("/flight/bookings/{booking_id}")
+def admin_get_flight_booking_detail(
+    booking_id: int,
+    admin: AdminModel = Depends(get_current_admin),
+    db: Session = Depends(get_db)
+):
+    """Get detailed flight booking info"""
+    booking = db.query(FlightBookingModel).filter(FlightBookingModel.id == booking_id).first()
+    if not booking:
+        raise HTTPException(status_code=404, detail="Booking not found")
+    
+    user = db.query(User).filter(User.id == booking.user_id).first()
+    passengers = db.query(FlightPassengerModel).filter(FlightPassengerModel.booking_id == booking.id).all()
+    
+    passenger_details = []
+    for p in passengers:
+        flight = db.query(FlightModel).filter(FlightModel.id == p.flight_id).first()
+        seat = db.query(FlightSeatModel).filter(FlightSeatModel.id == p.seat_id).first()
+        route = db.query(FlightRouteModel).filter(FlightRouteModel.id == flight.route_id).first() if flight else None
+        origin = db.query(AirportModel).filter(AirportModel.id == route.origin_airport_id).first() if route else None
+        dest = db.query(AirportModel).filter(AirportModel.id == route.destination_airport_id).first() if route else None
+        
+        passenger_details.append({
+            "id": p.id,
+            "full_name": p.full_name,
+            "gender": p.gender,
+            "dob": p.dob,
+            "nationality": p.nationality,
+            "passport_number": p.passport_number,
+            "seat": seat.seat_number if seat else None,
+            "seat_class": seat.seat_class if seat else None,
+            "flight": {
+                "number": flight.flight_number if flight else None,
+                "origin": origin.code if origin else None,
+                "destination": dest.code if dest else None,
+                "departure": flight.departure_datetime.isoformat() if flight else None,
+                "arrival": flight.arrival_datetime.isoformat() if flight else None
+            }
+        })
+    
+    return {
+        "id": booking.id,
+        "booking_reference": booking.booking_reference,
+        "pnr": booking.pnr,
+        "user": {"id": user.id, "name": user.name, "email": user.email, "phone": user.phone} if user else None,
+        "trip_type": booking.trip_type,
+        "total_passengers": booking.total_passengers,
+        "total_amount": booking.total_amount,
+        "status": booking.status,
+        "payment_status": booking.payment_status,
+        "contact_name": booking.contact_name,
+        "contact_email": booking.contact_email,
+        "contact_phone": booking.contact_phone,
+        "passengers": passenger_details,
+        "created_at": booking.created_at.isoformat() if booking.created_at else None
+    }
+
+@router.post("/flight/bookings/{booking_id}/status")
+def admin_update_flight_booking_status(
+    booking_id: int,
+    status: str,
+    admin: AdminModel = Depends(get_current_admin),
+    db: Session = Depends(get_db)
+):
+    """Update flight booking status"""
+    booking = db.query(FlightBookingModel).filter(FlightBookingModel.id == booking_id).first()
+    if not booking:
+        raise HTTPException(status_code=404, detail="Booking not found")
+    
+    valid_statuses = ["confirmed", "cancelled", "completed", "refunded"]
+    if status not in valid_statuses:
+        raise HTTPException(status_code=400, detail=f"Invalid status. Must be one of: {valid_statuses}")
+    
+    booking.status = status
+    db.commit()
+    
+    return {"message": f"Booking status updated to {status}"}
+
+@router.post("/flight/tracking/{flight_id}")
+def admin_update_flight_tracking(
+    flight_id: int,
+    latitude: float,
+    longitude: float,
+    altitude: Optional[int] = None,
+    speed: Optional[int] = None,
+    heading: Optional[int] = None,
+    status: Optional[str] = None,
+    admin: AdminModel = Depends(get_current_admin),
+    db: Session = Depends(get_db)
+):
+    """Update live flight tracking data"""
+    flight = db.query(FlightModel).filter(FlightModel.id == flight_id).first()
+    if not flight:
+        raise HTTPException(status_code=404, detail="Flight not found")
+    
+    # Update or create tracking record
+    tracking = db.query(FlightLiveTrackingModel).filter(FlightLiveTrackingModel.flight_id == flight_id).first()
+    
+    if tracking:
+        tracking.current_latitude = latitude
+        tracking.current_longitude = longitude
+        tracking.altitude_ft = altitude or tracking.altitude_ft
+        tracking.speed_knots = speed or tracking.speed_knots
+        tracking.heading = heading or tracking.heading
+        tracking.status = status or tracking.status
+        tracking.updated_at = datetime.utcnow()
+    else:
+        tracking = FlightLiveTrackingModel(
+            flight_id=flight_id,
+            current_latitude=latitude,
+            current_longitude=longitude,
+            altitude_ft=altitude or 0,
+            speed_knots=speed or 0,
+            heading=heading or 0,
+            status=status or "in_air"
+        )
+        db.add(tracking)
+    
+    db.commit()
+    return {"message": "Tracking updated"}
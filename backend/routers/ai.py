@@ -0,0 +1,415 @@
+"""AI assistant data endpoints and the Gemini chat proxy (/api/ai)."""
+import logging
+import contextlib
+import json
+import os
+from typing import List, Optional
+
+from fastapi import APIRouter, Depends, HTTPException
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel, ConfigDict
+from sqlalchemy import String, cast, func
+from sqlalchemy.orm import Session, aliased
+
+from ai_context import GroundingContext
+from answer_cache import ai_answer_cache
+from gemini_client import gemini
+from database import SessionLocal, get_db
+from models import AirlineModel, AirportModel, FlightModel, FlightRouteModel, HotelModel, RestaurantModel
+from routers.hotel import hotel_search_index
+
+logger = logging.getLogger(__name__)
+router = APIRouter(prefix="/api/ai")
+
+
+# ===============================================
+# AI Assistant Endpoints - Data for Recommendations
+# ===============================================
+
+class AIDataRequest(BaseModel):
+    data_type: str  # 'hotels', 'flights', 'restaurants'
+    location: Optional[str] = None
+    limit: Optional[int] = 10
+
+# Candidates kept per (kind, city) summary; the prompt uses the first few
+AI_CONTEXT_CANDIDATES = int(os.environ.get("AI_CONTEXT_CANDIDATES", "10"))
+# Largest `limit` the /data endpoints accept; above the summary size they query directly
+AI_DATA_MAX_LIMIT = 100
+
+
+def _ai_hotel_candidates(db: Session, city: Optional[str], origin: Optional[str] = None,
+                         limit: int = AI_CONTEXT_CANDIDATES) -> List[dict]:
+    """Best-rated hotels in `city`, straight from the in-memory search index"""
+    _, hits = hotel_search_index.search(db, city or "", sort_by="rating", limit=limit)
+    return [
+        {
+            "name": s["name"],
+            "location": s["city"],
+            "price_per_night": s["price_per_night"],
+            "rating": s["rating"],
+            "reviews_count": s["reviews_count"],
+            "star_category": s["star_category"],
+            "type": s["hotel_type"],
+            "amenities": s["amenities"][:4],
+        }
+        for s in (h.summary for h in hits)
+    ]
+
+
+def _ai_restaurant_candidates(db: Session, city: Optional[str], origin: Optional[str] = None,
+                              limit: int = AI_CONTEXT_CANDIDATES, cuisine: Optional[str] = None) -> List[dict]:
+    """Best-rated active restaurants in `city` (uses the city index), serving `cuisine` if given"""
+    query = db.query(
+        RestaurantModel.name, RestaurantModel.city, RestaurantModel.locality, RestaurantModel.cuisines,
+        RestaurantModel.restaurant_type, RestaurantModel.rating, RestaurantModel.price_for_two,
+        RestaurantModel.is_pure_veg,
+    ).filter(RestaurantModel.is_active == 1)
+    if city:
+        query = query.filter(RestaurantModel.city == city)
+    if cuisine:
+        # Case-insensitive match anywhere in the stored cuisine list
+        query = query.filter(func.lower(cast(RestaurantModel.cuisines, String)).contains(cuisine.lower()))
+    rows = query.order_by(RestaurantModel.rating.desc(), RestaurantModel.total_reviews.desc()) \
+        .limit(limit).all()
+    return [
+        {
+            "name": r.name,
+            "location": r.city,
+            "locality": r.locality,
+            "cuisines": r.cuisines or [],
+            "type": r.restaurant_type,
+            "rating": r.rating,
+            "price_for_two": r.price_for_two,
+            "pure_veg": bool(r.is_pure_veg),
+        }
+        for r in rows
+    ]
+
+
+def _ai_flight_candidates(db: Session, city: Optional[str], origin: Optional[str] = None,
+                          limit: int = AI_CONTEXT_CANDIDATES) -> List[dict]:
+    """Cheapest active flights into `city` (and out of `origin`, if given)"""
+    origin_airport = aliased(AirportModel)
+    dest_airport = aliased(AirportModel)
+    query = db.query(
+        FlightModel.flight_number, AirlineModel.name.label("airline"),
+        origin_airport.city.label("origin"), origin_airport.code.label("origin_code"),
+        dest_airport.city.label("destination"), dest_airport.code.label("destination_code"),
+        FlightModel.departure_time, FlightModel.arrival_time, FlightModel.duration_mins,
+        FlightModel.stops, FlightModel.base_price_economy,
+    ).join(AirlineModel, AirlineModel.id == FlightModel.airline_id) \
+        .join(FlightRouteModel, FlightRouteModel.id == FlightModel.route_id) \
+        .join(origin_airport, origin_airport.id == FlightRouteModel.origin_airport_id) \
+        .join(dest_airport, dest_airport.id == FlightRouteModel.destination_airport_id) \
+        .filter(FlightModel.is_active == 1)
+    if city:
+        query = query.filter(dest_airport.city == city)
+    if origin:
+        query = query.filter(origin_airport.city == origin)
+    rows = query.order_by(FlightModel.base_price_economy).limit(limit).all()
+    return [
+        {
+            "airline": r.airline,
+            "flight_number": r.flight_number,
+            "origin": r.origin,
+            "origin_code": r.origin_code,
+            "destination": r.destination,
+            "destination_code": r.destination_code,
+            "departure_time": r.departure_time,
+            "arrival_time": r.arrival_time,
+            "price": r.base_price_economy,
+            "duration": f"{r.duration_mins // 60}h {r.duration_mins % 60}m",
+            "class": "Economy",
+            "stops": r.stops or 0,
+        }
+        for r in rows
+    ]
+
+
+def _ai_known_cities(db: Session) -> List[str]:
+    """City names the assistant can ground answers in, once per table"""
+    cities = []
+    for column, active in ((HotelModel.city, HotelModel.is_active), (RestaurantModel.city, RestaurantModel.is_active),
+                           (AirportModel.city, AirportModel.is_active)):
+        cities.extend(c for (c,) in db.query(column).filter(active == 1).distinct())
+    return cities
+
+
+def _format_ai_hotel(h: dict) -> str:
+    amenities = f"; {', '.join(h['amenities'])}" if h["amenities"] else ""
+    return (f"- {h['name']}: {h['star_category']}-star {h['type'] or 'hotel'}, rated {h['rating']}/5 "
+            f"({h['reviews_count']} reviews), from INR {h['price_per_night']:,.0f}/night{amenities}")
+
+
+def _format_ai_restaurant(r: dict) -> str:
+    where = f" ({r['locality']})" if r["locality"] else ""
+    cuisines = ", ".join(r["cuisines"][:3]) or r["type"] or "restaurant"
+    veg = ", pure veg" if r["pure_veg"] else ""
+    return f"- {r['name']}{where}: {cuisines}, rated {r['rating']}/5, INR {r['price_for_two']} for two{veg}"
+
+
+def _format_ai_flight(f: dict) -> str:
+    stops = "non-stop" if not f["stops"] else f"{f['stops']} stop{'s' if f['stops'] > 1 else ''}"
+    return (f"- {f['airline']} {f['flight_number']}: {f['origin_code']}-{f['destination_code']} "
+            f"{f['departure_time']}-{f['arrival_time']} ({f['duration']}, {stops}), from INR {f['price']:,.0f}")
+
+
+ai_grounding = GroundingContext(
+    loaders={
+        "hotels": _ai_hotel_candidates,
+        "restaurants": _ai_restaurant_candidates,
+        "flights": _ai_flight_candidates,
+    },
+    formatters={
+        "hotels": _format_ai_hotel,
+        "restaurants": _format_ai_restaurant,
+        "flights": _format_ai_flight,
+    },
+    cities_loader=_ai_known_cities,
+    ttl_seconds=float(os.environ.get("AI_CONTEXT_TTL_SECONDS", "300")),
+    token_budget=int(os.environ.get("AI_CONTEXT_TOKEN_BUDGET", "400")),
+)
+
+
+@router.get("/data/hotels")
+def get_hotels_for_ai(location: Optional[str] = None, limit: int = 10, db: Session = Depends(get_db)):
+    """
+    Top-rated hotels (in `location`, if given) for AI recommendations (`limit` up to 100)
+    """
+    limit = min(max(limit, 0), AI_DATA_MAX_LIMIT)
+    city = ai_grounding.canonical_city(db, location)
+    if limit > AI_CONTEXT_CANDIDATES:
+        hotels = _ai_hotel_candidates(db, city, limit=limit)
+    else:
+        hotels = ai_grounding.summary(db, "hotels", city)[:limit]
+    return {"hotels": hotels, "count": len(hotels)}
+
+@router.get("/data/flights")
+def get_flights_for_ai(origin: Optional[str] = None, destination: Optional[str] = None, limit: int = 10,
+                       db: Session = Depends(get_db)):
+    """
+    Cheapest flights (filtered by origin / destination city) for AI recommendations (`limit` up to 100)
+    """
+    limit = min(max(limit, 0), AI_DATA_MAX_LIMIT)
+    city, origin_city = ai_grounding.canonical_city(db, destination), ai_grounding.canonical_city(db, origin)
+    if limit > AI_CONTEXT_CANDIDATES:
+        flights = _ai_flight_candidates(db, city, origin_city, limit=limit)
+    else:
+        flights = ai_grounding.summary(db, "flights", city, origin_city)[:limit]
+    return {"flights": flights, "count": len(flights)}
+
+@router.get("/data/restaurants")
+def get_restaurants_for_ai(location: Optional[str] = None, cuisine: Optional[str] = None, limit: int = 10,
+                           db: Session = Depends(get_db)):
+    """
+    Top-rated restaurants (in `location`, serving `cuisine`) for AI recommendations (`limit` up to 100)
+
+    The cached summary only backs the unfiltered top few; a cuisine filter
+    or a larger `limit` runs its own query.
+    """
+    limit = min(max(limit, 0), AI_DATA_MAX_LIMIT)
+    city = ai_grounding.canonical_city(db, location)
+    if cuisine or limit > AI_CONTEXT_CANDIDATES:
+        restaurants = _ai_restaurant_candidates(db, city, limit=limit, cuisine=cuisine)
+    else:
+        restaurants = ai_grounding.summary(db, "restaurants", city)[:limit]
+    return {"restaurants": restaurants, "count": len(restaurants)}
+
+@router.get("/policies")
+def get_policies():
+    """
+    Get booking and refund policies for AI to explain
+    """
+    policies = {
+        "booking": {
+            "hotels": "Book hotels with ease! Pay online or at the property. Most bookings are confirmed instantly. You'll receive a voucher via email.",
+            "flights": "Flight tickets are confirmed immediately after payment. E-tickets will be sent to your email. Please check baggage allowance.",
+            "restaurants": "Restaurant reservations are confirmed based on availability. You'll receive a confirmation via email and SMS."
+        },
+        "cancellation": {
+            "hotels": "Free cancellation up to 24 hours before check-in for most hotels. Some may have different policies - check booking details.",
+            "flights": "Cancellation fees depend on airline and fare type. Refunds processed in 7-14 business days. Check fare rules before booking.",
+            "restaurants": "Cancel up to 2 hours before reservation time for full refund. Late cancellations may incur charges."
+        },
+        "refund": {
+            "general": "Refunds are processed within 7-14 business days to the original payment method. Cancellation fees (if any) will be deducted."
+        }
+    }
+    return policies
+
+
+# ===============================================
+# AI Chat Proxy - Calls Google Gemini server-side
+# ===============================================
+
+class AIChatRequest(BaseModel):
+    message: str
+    context: Optional[dict] = {}
+    # Skip the answer cache (always ask Gemini, don't store the answer)
+    bypass_cache: bool = False
+    
+    model_config = ConfigDict(extra='allow')
+
+_AI_SYSTEM_CONTEXT = (
+    "You are WanderLite AI — an advanced, friendly, and knowledgeable travel assistant integrated into a travel "
+    "planning website.\n\n"
+    "Your role:\n"
+    "- Help users find destinations, hotels, flights, and restaurants based on their preferences.\n"
+    "- Provide personalized suggestions based on location, budget, and travel type (solo, family, group, romantic).\n"
+    "- Explain booking and refund policies in simple terms.\n"
+    "- Handle trip planning, itinerary creation, and group coordination.\n"
+    "- Keep tone: friendly, clear, and human-like — never robotic.\n"
+    "- Format answers neatly with bullet points, emojis, and short paragraphs.\n\n"
+    "Rules:\n"
+    "- Stay within travel, hotels, restaurants, and flights context.\n"
+    "- Never provide fake payment or transaction details.\n"
+    "- If unrelated questions arise, politely redirect to travel assistance.\n"
+    "- If you need data (like hotel list or flight options), say: \"Would you like me to show WanderLite's latest results?\"\n"
+    "- Ask clarifying questions before giving recommendations when needed.\n\n"
+    "System Context:\n- App name: WanderLite\n- Developer: Bro\n"
+)
+
+_AI_BUSY_ANSWER = "I'm currently experiencing high demand and have temporarily reached my response limits. Please try again in a few minutes! In the meantime, feel free to explore our destinations, hotels, and flights. How can I help you plan your perfect trip? 🌍✈️"
+
+
+def _prepare_grounding(message: str) -> None:
+    with SessionLocal() as db:
+        ai_grounding.prepare(db, message)
+
+
+async def _ai_grounding_block(message: str) -> str:
+    """Live hotel/flight/restaurant candidates for the prompt ('' if not needed)"""
+    try:
+        if not ai_grounding.is_ready(message):
+            await run_in_threadpool(_prepare_grounding, message)
+        return ai_grounding.assemble(message)
+    except Exception as e:
+        logger.warning(f"AI grounding skipped: {e}")
+        return ""
+
+
+def _ai_chat_payload(req: AIChatRequest, grounding: str = "") -> dict:
+    """Gemini request body: system context, optional user context and data, message"""
+    # Build prompt with system context and optional user context
+    ctx_parts = []
+    if req.context:
+        try:
+            ctx_parts.append("Context: " + json.dumps(req.context, ensure_ascii=False))
+        except Exception:
+            pass
+    if grounding:
+        ctx_parts.append("Recommend from these WanderLite listings when they fit; don't invent others.\n\n"
+                         + grounding)
+    full_prompt = _AI_SYSTEM_CONTEXT + ("\n\n" + "\n\n".join(ctx_parts) if ctx_parts else "") + "\n\n" + req.message
+
+    return {
+        "contents": [
+            {
+                "role": "user",
+                "parts": [{"text": full_prompt}],
+            }
+        ],
+        "generationConfig": {
+            "temperature": 0.7,
+            "topK": 40,
+            "topP": 0.95,
+            "maxOutputTokens": 1024,
+        },
+        "safetySettings": [
+            {"category": "HARM_CATEGORY_HARASSMENT", "threshold": "BLOCK_MEDIUM_AND_ABOVE"},
+            {"category": "HARM_CATEGORY_HATE_SPEECH", "threshold": "BLOCK_MEDIUM_AND_ABOVE"},
+            {"category": "HARM_CATEGORY_SEXUALLY_EXPLICIT", "threshold": "BLOCK_MEDIUM_AND_ABOVE"},
+            {"category": "HARM_CATEGORY_DANGEROUS_CONTENT", "threshold": "BLOCK_MEDIUM_AND_ABOVE"},
+        ],
+    }
+
+
+def _gemini_api_key() -> str:
+    api_key = os.environ.get("GEMINI_API_KEY")
+    if not api_key:
+        raise HTTPException(status_code=500, detail="GEMINI_API_KEY not configured on server")
+    return api_key
+
+
+@router.post("/chat")
+async def ai_chat(req: AIChatRequest):
+    logger.info(f"AI Chat Request: message={req.message[:50]}..., context={req.context}")
+    api_key = _gemini_api_key()
+
+    if req.bypass_cache:
+        ai_answer_cache.bypasses += 1
+    else:
+        answer, _ = ai_answer_cache.lookup(req.message, req.context)
+        if answer:
+            return {"answer": answer, "cached": True}
+
+    grounding = await _ai_grounding_block(req.message)
+    answer, _ = await gemini.generate(api_key, _ai_chat_payload(req, grounding))
+    if answer:
+        if not req.bypass_cache:
+            ai_answer_cache.store(req.message, req.context, answer)
+        return {"answer": answer, "cached": False}
+
+    # If all models failed due to quota, return helpful message
+    logger.error("All Gemini models failed - likely quota exceeded")
+    return {"answer": _AI_BUSY_ANSWER}
+
+
+def _sse(data: dict, event: Optional[str] = None) -> str:
+    prefix = f"event: {event}\n" if event else ""
+    return f"{prefix}data: {json.dumps(data, ensure_ascii=False)}\n\n"
+
+
+@router.post("/chat/stream")
+async def ai_chat_stream(req: AIChatRequest):
+    """Same as /api/ai/chat, but forwards the answer as Server-Sent Events.
+
+    Emits `data: {"text": ...}` chunks as Gemini produces them and ends with
+    an `event: done` carrying the model, first-token latency and tokens/s.
+    If the browser disconnects, the upstream request is closed as well.
+    """
+    logger.info(f"AI Chat Stream Request: message={req.message[:50]}..., context={req.context}")
+    api_key = _gemini_api_key()
+
+    cached = None
+    if req.bypass_cache:
+        ai_answer_cache.bypasses += 1
+    else:
+        cached, _ = ai_answer_cache.lookup(req.message, req.context)
+    payload = None if cached else _ai_chat_payload(req, await _ai_grounding_block(req.message))
+
+    async def replay():
+        yield _sse({"text": cached})
+        yield _sse({"done": True, "model": None, "cached": True}, "done")
+
+    async def events():
+        parts = []
+        done = {"done": True, "model": None}
+        async with contextlib.aclosing(gemini.stream(api_key, payload)) as stream:
+            async for event in stream:
+                if "text" in event:
+                    parts.append(event["text"])
+                    yield _sse(event)
+                else:
+                    done = event
+        if not parts:
+            logger.error("All Gemini models failed - likely quota exceeded")
+            yield _sse({"text": _AI_BUSY_ANSWER})
+        elif done.get("complete") and not req.bypass_cache:
+            ai_answer_cache.store(req.message, req.context, "".join(parts))
+        yield _sse(done, "done")
+
+    return StreamingResponse(replay() if cached else events(), media_type="text/event-stream",
+                             headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"})
+
+
+@router.on_event("startup")
+def warm_ai_grounding():
+    """Precompute the AI chat's per-city hotel/flight/restaurant summaries"""
+    try:
+        with SessionLocal() as db:
+            count = ai_grounding.warm(db)
+        logger.info(f"AI grounding warmed with {count} city summaries")
+    except Exception as e:
+        logger.warning(f"AI grounding not warmed at startup: {e}")
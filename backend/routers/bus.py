@@ -0,0 +1,881 @@
+"""Bus search, seat layout, booking and tracking (/api/bus)."""
+import uuid
+from datetime import datetime, timedelta, timezone
+from typing import Dict, List, Optional
+
+from fastapi import APIRouter, Depends, HTTPException
+from sqlalchemy import func, insert
+from sqlalchemy.orm import Session
+
+from response_cache import response_cache
+from seat_holds import SeatUnavailable, seat_holds
+from seat_map import SeatAvailabilityMap, bus_seat_map_key, seat_maps
+from database import get_db
+from models import (BusBoardingPointModel, BusBookingModel, BusCityModel, BusLiveTrackingModel, BusModel,
+    BusOperatorModel, BusPassengerModel, BusRouteModel, BusScheduleModel, BusSeatAvailabilityModel,
+    BusSeatModel)
+from schemas import BusBookingCreate, BusCancellationRequest, BusSearchRequest, BusSeatLockRequest, User
+from security import get_current_user
+
+router = APIRouter(prefix="/api/bus", tags=["bus"])
+
+
+def generate_pnr():
+    """Generate a unique PNR number"""
+    import random
+    import string
+    prefix = "WL"
+    chars = ''.join(random.choices(string.ascii_uppercase + string.digits, k=8))
+    return f"{prefix}{chars}"
+
+
+def _load_bus_search_rows(db: Session, route_id: int, journey_date: str):
+    """Load everything the bus search result needs in a fixed number of queries.
+
+    Schedules are joined to their bus and operator, and seat totals, booked
+    counts and boarding/dropping points are fetched with one grouped query
+    each, so the round trips do not grow with the number of schedules.
+    Returns a list of (schedule, bus, operator, total_seats, booked_seats,
+    boarding_points, dropping_points) tuples.
+    """
+    # Get day of week (0=Monday, 6=Sunday) for Python, but also check 1-7 format
+    from datetime import datetime as dt
+    journey_dt = dt.strptime(journey_date, "%Y-%m-%d")
+    day_of_week = journey_dt.weekday()  # 0-6
+    day_of_week_1based = day_of_week + 1  # 1-7 format
+
+    # Find schedules for this route on the selected day (check both formats)
+    schedule_filter = [
+        BusScheduleModel.route_id == route_id,
+        BusScheduleModel.is_active == 1,
+        (BusScheduleModel.days_of_week.contains(str(day_of_week))) |
+        (BusScheduleModel.days_of_week.contains(str(day_of_week_1based))),
+    ]
+    schedules = db.query(BusScheduleModel, BusModel, BusOperatorModel).join(
+        BusModel, BusModel.id == BusScheduleModel.bus_id
+    ).join(
+        BusOperatorModel, BusOperatorModel.id == BusModel.operator_id
+    ).filter(*schedule_filter).order_by(BusScheduleModel.id).all()
+
+    if not schedules:
+        return []
+
+    # Sub-selects keep the statements small even for thousands of schedules
+    schedule_ids = db.query(BusScheduleModel.id).filter(*schedule_filter).subquery()
+    bus_ids = db.query(BusScheduleModel.bus_id).filter(*schedule_filter).subquery()
+
+    seat_totals = dict(
+        db.query(BusSeatModel.bus_id, func.count(BusSeatModel.id)).filter(
+            BusSeatModel.bus_id.in_(bus_ids.select()),
+            BusSeatModel.is_active == 1
+        ).group_by(BusSeatModel.bus_id).all()
+    )
+
+    booked_counts = dict(
+        db.query(BusSeatAvailabilityModel.schedule_id, func.count(BusSeatAvailabilityModel.id)).filter(
+            BusSeatAvailabilityModel.schedule_id.in_(schedule_ids.select()),
+            BusSeatAvailabilityModel.journey_date == journey_date,
+            BusSeatAvailabilityModel.status.in_(["booked", "locked"])
+        ).group_by(BusSeatAvailabilityModel.schedule_id).all()
+    )
+
+    points_by_schedule: Dict[int, Dict[str, list]] = {}
+    points = db.query(BusBoardingPointModel).filter(
+        BusBoardingPointModel.schedule_id.in_(schedule_ids.select()),
+        BusBoardingPointModel.is_active == 1
+    ).order_by(BusBoardingPointModel.id).all()
+    for point in points:
+        grouped = points_by_schedule.setdefault(point.schedule_id, {"boarding": [], "dropping": []})
+        if point.point_type in grouped:
+            grouped[point.point_type].append(point)
+
+    rows = []
+    for schedule, bus, operator in schedules:
+        grouped = points_by_schedule.get(schedule.id, {"boarding": [], "dropping": []})
+        rows.append((
+            schedule,
+            bus,
+            operator,
+            seat_totals.get(bus.id, 0),
+            booked_counts.get(schedule.id, 0),
+            grouped["boarding"],
+            grouped["dropping"],
+        ))
+    return rows
+
+
+# Cities endpoints
+@router.get("/cities")
+@response_cache.cached("bus_cities")
+def get_bus_cities(
+    search: Optional[str] = None,
+    db: Session = Depends(get_db)
+):
+    """Get list of bus cities"""
+    query = db.query(BusCityModel).filter(BusCityModel.is_active == 1)
+    if search:
+        query = query.filter(BusCityModel.name.ilike(f"%{search}%"))
+    cities = query.order_by(BusCityModel.name).all()
+    return [{"id": c.id, "name": c.name, "state": c.state} for c in cities]
+
+
+# Search buses
+@router.post("/search")
+def search_buses(
+    request: BusSearchRequest,
+    db: Session = Depends(get_db)
+):
+    """Search available buses for a route and date"""
+    # Find the route
+    route = db.query(BusRouteModel).filter(
+        BusRouteModel.from_city_id == request.from_city_id,
+        BusRouteModel.to_city_id == request.to_city_id,
+        BusRouteModel.is_active == 1
+    ).first()
+    
+    if not route:
+        return {"buses": [], "message": "No routes found"}
+
+    results = []
+    cities = {
+        c.id: c for c in db.query(BusCityModel).filter(
+            BusCityModel.id.in_([request.from_city_id, request.to_city_id])
+        ).all()
+    }
+    from_city = cities.get(request.from_city_id)
+    to_city = cities.get(request.to_city_id)
+
+    rows = _load_bus_search_rows(db, route.id, request.journey_date)
+    for schedule, bus, operator, total_seats, booked_seats, boarding_points, dropping_points in rows:
+        available_seats = total_seats - booked_seats
+
+        results.append({
+            "schedule_id": schedule.id,
+            "bus_id": bus.id,
+            "operator_name": operator.name,
+            "operator_logo": operator.logo_url,
+            "operator_rating": operator.rating,
+            "bus_type": bus.bus_type,
+            "bus_number": bus.bus_number,
+            "seat_layout": bus.seat_layout,
+            "has_upper_deck": bus.has_upper_deck,
+            "departure_time": schedule.departure_time,
+            "arrival_time": schedule.arrival_time,
+            "duration_mins": schedule.duration_mins,
+            "is_night_bus": schedule.is_night_bus,
+            "next_day_arrival": schedule.next_day_arrival,
+            "base_price": schedule.base_price,
+            "available_seats": available_seats,
+            "total_seats": total_seats,
+            "amenities": bus.amenities_data,
+            "cancellation_policy": operator.cancellation_policy,
+            "boarding_points": [{"id": bp.id, "name": bp.point_name, "time": bp.time, "address": bp.address} for bp in boarding_points],
+            "dropping_points": [{"id": dp.id, "name": dp.point_name, "time": dp.time, "address": dp.address} for dp in dropping_points],
+            "from_city": from_city.name if from_city else "",
+            "to_city": to_city.name if to_city else ""
+        })
+    
+    return {"buses": results, "total": len(results)}
+
+
+def _get_bus_seat_map(db: Session, schedule_id: int, journey_date: str, seat_ids: List[int]) -> SeatAvailabilityMap:
+    """Return the cached seat map for a bus schedule/date, loading it in one query on a miss."""
+    key = bus_seat_map_key(schedule_id, journey_date)
+    seat_map = seat_maps.get(key)
+    if seat_map is None or not seat_map.covers(seat_ids):
+        seat_map = SeatAvailabilityMap(seat_ids)
+        rows = db.query(
+            BusSeatAvailabilityModel.seat_id,
+            BusSeatAvailabilityModel.status,
+            BusSeatAvailabilityModel.locked_until,
+            BusSeatAvailabilityModel.locked_by,
+        ).filter(
+            BusSeatAvailabilityModel.schedule_id == schedule_id,
+            BusSeatAvailabilityModel.journey_date == journey_date
+        ).all()
+        for seat_id, seat_status, locked_until, locked_by in rows:
+            seat_map.set(seat_id, seat_status, locked_until, locked_by)
+        seat_maps.put(key, seat_map)
+    return seat_map
+
+
+# Get seat layout for a bus
+@router.get("/seats/{schedule_id}/{journey_date}")
+def get_seat_layout(
+    schedule_id: int,
+    journey_date: str,
+    db: Session = Depends(get_db)
+):
+    """Get seat layout and availability for a schedule"""
+    try:
+        schedule = db.query(BusScheduleModel).filter(BusScheduleModel.id == schedule_id).first()
+        if not schedule:
+            raise HTTPException(status_code=404, detail="Schedule not found")
+        
+        bus = db.query(BusModel).filter(BusModel.id == schedule.bus_id).first()
+        if not bus:
+            raise HTTPException(status_code=404, detail="Bus not found")
+            
+        seats = db.query(BusSeatModel).filter(BusSeatModel.bus_id == bus.id, BusSeatModel.is_active == 1).all()
+        
+        seat_map = _get_bus_seat_map(db, schedule_id, journey_date, [seat.id for seat in seats])
+
+        seat_data = []
+        for seat in seats:
+            status = seat_map.status(seat.id)
+            
+            seat_data.append({
+                "id": seat.id,
+                "seat_number": seat.seat_number,
+                "seat_type": seat.seat_type,
+                "deck": seat.deck,
+                "row": seat.row_number,
+                "column": seat.column_number,
+                "position": seat.position,
+                "price_modifier": float(seat.price_modifier) if seat.price_modifier else 0.0,
+                "is_female_only": seat.is_female_only,
+                "status": status,
+                "price": float(schedule.base_price) + (float(seat.price_modifier) if seat.price_modifier else 0.0)
+            })
+        
+        return {
+            "bus_type": bus.bus_type,
+            "seat_layout": bus.seat_layout,
+            "has_upper_deck": bus.has_upper_deck,
+            "total_seats": len(seats),
+            "base_price": float(schedule.base_price),
+            "seats": seat_data
+        }
+    except HTTPException:
+        raise
+    except Exception as e:
+        print(f"Error in get_seat_layout: {e}")
+        import traceback
+        traceback.print_exc()
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+# Lock seats temporarily
+@router.post("/seats/lock")
+def lock_seats(
+    request: BusSeatLockRequest,
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """Temporarily lock selected seats for 5 minutes (all of them or none)"""
+    try:
+        lock_until = seat_holds.hold(db, "bus", (request.schedule_id, request.journey_date), request.seat_ids,
+                                     current_user.id, timedelta(minutes=5))
+    except SeatUnavailable as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return {"locked_seats": list(request.seat_ids), "expires_at": lock_until.isoformat()}
+
+
+# Create booking
+@router.post("/book")
+def create_bus_booking(
+    booking: BusBookingCreate,
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """Create a bus booking.
+
+    The statement count does not grow with the party size: every seat is
+    fetched with one IN query and priced in memory, and the passengers and
+    seat rows are written in bulk in the booking's transaction.
+    """
+    schedule = db.query(BusScheduleModel).filter(BusScheduleModel.id == booking.schedule_id).first()
+    if not schedule:
+        raise HTTPException(status_code=404, detail="Schedule not found")
+    
+    # Calculate total amount
+    seat_ids = [passenger.seat_id for passenger in booking.passengers]
+    seats = {seat.id: seat for seat in db.query(BusSeatModel).filter(BusSeatModel.id.in_(seat_ids))}
+    for seat_id in seat_ids:
+        if seat_id not in seats:
+            raise HTTPException(status_code=400, detail=f"Invalid seat ID: {seat_id}")
+    seat_prices = {seat_id: schedule.base_price + seat.price_modifier for seat_id, seat in seats.items()}
+    total_amount = sum(seat_prices[seat_id] for seat_id in seat_ids)
+    
+    # Generate PNR
+    pnr = generate_pnr()
+    
+    # Create booking
+    new_booking = BusBookingModel(
+        user_id=current_user.id,
+        schedule_id=booking.schedule_id,
+        journey_date=booking.journey_date,
+        pnr=pnr,
+        booking_status="confirmed",
+        total_amount=total_amount,
+        discount_amount=0,
+        final_amount=total_amount,
+        payment_status="paid",  # Mock payment
+        payment_method=booking.payment_method,
+        transaction_id=f"TXN{uuid.uuid4().hex[:12].upper()}",
+        boarding_point_id=booking.boarding_point_id,
+        dropping_point_id=booking.dropping_point_id,
+        contact_name=booking.contact_name,
+        contact_email=booking.contact_email,
+        contact_phone=booking.contact_phone
+    )
+    db.add(new_booking)
+    db.flush()
+    
+    # Create passengers and mark seats as booked
+    db.execute(insert(BusPassengerModel.__table__), [
+        {
+            "booking_id": new_booking.id,
+            "seat_id": passenger.seat_id,
+            "name": passenger.name,
+            "age": passenger.age,
+            "gender": passenger.gender,
+            "id_type": passenger.id_type,
+            "id_number": passenger.id_number,
+            "seat_price": seat_prices[passenger.seat_id],
+        }
+        for passenger in booking.passengers
+    ])
+    seat_holds.mark_booked(db, "bus", (booking.schedule_id, booking.journey_date), seat_ids,
+                           booking_id=new_booking.id)
+    
+    db.commit()
+    seat_map_key = bus_seat_map_key(booking.schedule_id, booking.journey_date)
+    for passenger in booking.passengers:
+        seat_maps.update(seat_map_key, passenger.seat_id, "booked")
+    
+    return {"booking_id": new_booking.id, "pnr": pnr, "message": "Booking confirmed"}
+
+
+# Get booking details / ticket
+@router.get("/booking/{booking_id}")
+def get_bus_booking(
+    booking_id: str,
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """Get bus booking details"""
+    booking = db.query(BusBookingModel).filter(
+        BusBookingModel.id == booking_id,
+        BusBookingModel.user_id == current_user.id
+    ).first()
+    
+    if not booking:
+        raise HTTPException(status_code=404, detail="Booking not found")
+    
+    schedule = db.query(BusScheduleModel).filter(BusScheduleModel.id == booking.schedule_id).first()
+    bus = db.query(BusModel).filter(BusModel.id == schedule.bus_id).first()
+    operator = db.query(BusOperatorModel).filter(BusOperatorModel.id == bus.operator_id).first()
+    route = db.query(BusRouteModel).filter(BusRouteModel.id == schedule.route_id).first()
+    from_city = db.query(BusCityModel).filter(BusCityModel.id == route.from_city_id).first()
+    to_city = db.query(BusCityModel).filter(BusCityModel.id == route.to_city_id).first()
+    
+    boarding_point = db.query(BusBoardingPointModel).filter(BusBoardingPointModel.id == booking.boarding_point_id).first()
+    dropping_point = db.query(BusBoardingPointModel).filter(BusBoardingPointModel.id == booking.dropping_point_id).first()
+    
+    passengers = db.query(BusPassengerModel).filter(BusPassengerModel.booking_id == booking.id).all()
+    passenger_list = []
+    for p in passengers:
+        seat = db.query(BusSeatModel).filter(BusSeatModel.id == p.seat_id).first()
+        passenger_list.append({
+            "name": p.name,
+            "age": p.age,
+            "gender": p.gender,
+            "seat_number": seat.seat_number if seat else "",
+            "seat_type": seat.seat_type if seat else "",
+            "seat_price": p.seat_price
+        })
+    
+    return {
+        "id": booking.id,
+        "pnr": booking.pnr,
+        "booking_status": booking.booking_status,
+        "journey_date": booking.journey_date,
+        "total_amount": booking.total_amount,
+        "discount_amount": booking.discount_amount,
+        "final_amount": booking.final_amount,
+        "payment_status": booking.payment_status,
+        "payment_method": booking.payment_method,
+        "transaction_id": booking.transaction_id,
+        "operator_name": operator.name,
+        "operator_logo": operator.logo_url,
+        "operator_rating": operator.rating,
+        "bus_type": bus.bus_type,
+        "bus_number": bus.bus_number,
+        "from_city": from_city.name,
+        "to_city": to_city.name,
+        "departure_time": schedule.departure_time,
+        "arrival_time": schedule.arrival_time,
+        "duration_mins": schedule.duration_mins,
+        "is_night_bus": schedule.is_night_bus,
+        "next_day_arrival": schedule.next_day_arrival,
+        "boarding_point": boarding_point.point_name if boarding_point else "",
+        "boarding_time": boarding_point.time if boarding_point else "",
+        "boarding_address": boarding_point.address if boarding_point else "",
+        "dropping_point": dropping_point.point_name if dropping_point else "",
+        "dropping_time": dropping_point.time if dropping_point else "",
+        "dropping_address": dropping_point.address if dropping_point else "",
+        "passengers": passenger_list,
+        "contact_name": booking.contact_name,
+        "contact_email": booking.contact_email,
+        "contact_phone": booking.contact_phone,
+        "amenities": bus.amenities_data,
+        "cancellation_policy": operator.cancellation_policy,
+        "created_at": booking.created_at.isoformat() if booking.created_at else None
+    }
+
+
+# Get user's bus bookings
+@router.get("/my-bookings")
+def get_my_bus_bookings(
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """Get all bus bookings for current user"""
+    bookings = db.query(BusBookingModel).filter(
+        BusBookingModel.user_id == current_user.id
+    ).order_by(BusBookingModel.created_at.desc()).all()
+    
+    results = []
+    for booking in bookings:
+        schedule = db.query(BusScheduleModel).filter(BusScheduleModel.id == booking.schedule_id).first()
+        bus = db.query(BusModel).filter(BusModel.id == schedule.bus_id).first()
+        operator = db.query(BusOperatorModel).filter(BusOperatorModel.id == bus.operator_id).first()
+        route = db.query(BusRouteModel).filter(BusRouteModel.id == schedule.route_id).first()
+        from_city = db.query(BusCityModel).filter(BusCityModel.id == route.from_city_id).first()
+        to_city = db.query(BusCityModel).filter(BusCityModel.id == route.to_city_id).first()
+        
+        passengers = db.query(BusPassengerModel).filter(BusPassengerModel.booking_id == booking.id).all()
+        
+        results.append({
+            "id": booking.id,
+            "pnr": booking.pnr,
+            "booking_status": booking.booking_status,
+            "journey_date": booking.journey_date,
+            "final_amount": booking.final_amount,
+            "operator_name": operator.name,
+            "bus_type": bus.bus_type,
+            "from_city": from_city.name,
+            "to_city": to_city.name,
+            "departure_time": schedule.departure_time,
+            "passenger_count": len(passengers),
+            "created_at": booking.created_at.isoformat() if booking.created_at else None
+        })
+    
+    return results
+
+
+# Cancel booking
+@router.post("/cancel")
+def cancel_bus_booking(
+    request: BusCancellationRequest,
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """Cancel a bus booking"""
+    booking = db.query(BusBookingModel).filter(
+        BusBookingModel.id == request.booking_id,
+        BusBookingModel.user_id == current_user.id
+    ).first()
+    
+    if not booking:
+        raise HTTPException(status_code=404, detail="Booking not found")
+    
+    if booking.booking_status == "cancelled":
+        raise HTTPException(status_code=400, detail="Booking already cancelled")
+    
+    if booking.booking_status == "completed":
+        raise HTTPException(status_code=400, detail="Cannot cancel completed journey")
+    
+    schedule = db.query(BusScheduleModel).filter(BusScheduleModel.id == booking.schedule_id).first()
+    
+    # Calculate refund based on time before departure
+    from datetime import datetime as dt
+    journey_dt = dt.strptime(f"{booking.journey_date} {schedule.departure_time}", "%Y-%m-%d %H:%M")
+    now = dt.now()
+    hours_before = (journey_dt - now).total_seconds() / 3600
+    
+    refund_percentage = 0
+    if hours_before > 24:
+        refund_percentage = 90
+    elif hours_before > 12:
+        refund_percentage = 50
+    elif hours_before > 6:
+        refund_percentage = 25
+    # No refund if less than 6 hours
+    
+    refund_amount = (booking.final_amount * refund_percentage) / 100
+    
+    # Update booking
+    booking.booking_status = "cancelled"
+    booking.cancelled_at = datetime.now(timezone.utc)
+    booking.refund_amount = refund_amount
+    booking.refund_status = "processed" if refund_amount > 0 else "no_refund"
+    
+    # Release seats
+    passengers = db.query(BusPassengerModel).filter(BusPassengerModel.booking_id == booking.id).all()
+    for passenger in passengers:
+        availability = db.query(BusSeatAvailabilityModel).filter(
+            BusSeatAvailabilityModel.booking_id == booking.id,
+            BusSeatAvailabilityModel.seat_id == passenger.seat_id
+        ).first()
+        if availability:
+            db.delete(availability)
+    
+    db.commit()
+    seat_map_key = bus_seat_map_key(booking.schedule_id, booking.journey_date)
+    for passenger in passengers:
+        seat_maps.update(seat_map_key, passenger.seat_id, "available")
+    
+    return {
+        "message": "Booking cancelled",
+        "refund_percentage": refund_percentage,
+        "refund_amount": refund_amount,
+        "refund_status": booking.refund_status
+    }
+
+
+# Get live tracking
+@router.get("/tracking/{booking_id}")
+def get_bus_tracking(
+    booking_id: str,
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """Get live tracking for a booked bus"""
+    booking = db.query(BusBookingModel).filter(
+        BusBookingModel.id == booking_id,
+        BusBookingModel.user_id == current_user.id
+    ).first()
+    
+    if not booking:
+        raise HTTPException(status_code=404, detail="Booking not found")
+    
+    if booking.booking_status != "confirmed":
+        raise HTTPException(status_code=400, detail="Tracking only available for confirmed bookings")
+    
+    tracking = db.query(BusLiveTrackingModel).filter(
+        BusLiveTrackingModel.schedule_id == booking.schedule_id,
+        BusLiveTrackingModel.journey_date == booking.journey_date
+    ).first()
+    
+    if not tracking:
+        return {
+            "status": "not_started",
+            "message": "Bus tracking will be available once the journey starts"
+        }
+    
+    return {
+        "status": tracking.status,
+        "latitude": tracking.current_latitude,
+        "longitude": tracking.current_longitude,
+        "speed_kmph": tracking.speed_kmph,
+        "eta_mins": tracking.eta_mins,
+        "last_updated": tracking.last_updated.isoformat() if tracking.last_updated else None
+    }
+
+
+# =============================
+# Bus Data Seed Endpoint
+# =============================
+@router.post("/seed")
+def seed_bus_data(db: Session = Depends(get_db)):
+    """Seed initial bus data for demo purposes"""
+    
+    # Check if data already exists
+    existing_cities = db.query(BusCityModel).count()
+    if existing_cities > 0:
+        return {"message": "Bus data already seeded", "cities": existing_cities}
+    
+    # Indian Cities with coordinates
+    cities_data = [
+        {"name": "Chennai", "state": "Tamil Nadu", "country": "India", "latitude": 13.0827, "longitude": 80.2707},
+        {"name": "Bangalore", "state": "Karnataka", "country": "India", "latitude": 12.9716, "longitude": 77.5946},
+        {"name": "Mumbai", "state": "Maharashtra", "country": "India", "latitude": 19.0760, "longitude": 72.8777},
+        {"name": "Delhi", "state": "Delhi", "country": "India", "latitude": 28.7041, "longitude": 77.1025},
+        {"name": "Hyderabad", "state": "Telangana", "country": "India", "latitude": 17.3850, "longitude": 78.4867},
+        {"name": "Pune", "state": "Maharashtra", "country": "India", "latitude": 18.5204, "longitude": 73.8567},
+        {"name": "Coimbatore", "state": "Tamil Nadu", "country": "India", "latitude": 11.0168, "longitude": 76.9558},
+        {"name": "Madurai", "state": "Tamil Nadu", "country": "India", "latitude": 9.9252, "longitude": 78.1198},
+        {"name": "Mysore", "state": "Karnataka", "country": "India", "latitude": 12.2958, "longitude": 76.6394},
+        {"name": "Trichy", "state": "Tamil Nadu", "country": "India", "latitude": 10.7905, "longitude": 78.7047},
+        {"name": "Salem", "state": "Tamil Nadu", "country": "India", "latitude": 11.6643, "longitude": 78.1460},
+        {"name": "Vijayawada", "state": "Andhra Pradesh", "country": "India", "latitude": 16.5062, "longitude": 80.6480},
+        {"name": "Tirupati", "state": "Andhra Pradesh", "country": "India", "latitude": 13.6288, "longitude": 79.4192},
+        {"name": "Kochi", "state": "Kerala", "country": "India", "latitude": 9.9312, "longitude": 76.2673},
+        {"name": "Trivandrum", "state": "Kerala", "country": "India", "latitude": 8.5241, "longitude": 76.9366},
+    ]
+    
+    # Create cities
+    city_map = {}
+    for city_data in cities_data:
+        city = BusCityModel(**city_data)
+        db.add(city)
+        db.flush()
+        city_map[city_data["name"]] = city.id
+    
+    # Bus Operators
+    operators_data = [
+        {
+            "name": "SRS Travels",
+            "logo_url": "/images/srs-logo.png",
+            "rating": 4.2,
+            "cancellation_policy": "Free cancellation up to 24 hours before departure. 50% refund within 12-24 hours.",
+            "amenities": "WiFi,Charging Point,Water Bottle,Blanket,Snacks"
+        },
+        {
+            "name": "VRL Travels",
+            "logo_url": "/images/vrl-logo.png",
+            "rating": 4.5,
+            "cancellation_policy": "90% refund if cancelled 48 hours before. 50% refund within 24-48 hours.",
+            "amenities": "WiFi,Charging Point,Water Bottle,Blanket,GPS Tracking"
+        },
+        {
+            "name": "KPN Travels",
+            "logo_url": "/images/kpn-logo.png",
+            "rating": 4.3,
+            "cancellation_policy": "Free cancellation up to 6 hours before departure.",
+            "amenities": "Charging Point,Water Bottle,Reading Light,Emergency Exit"
+        },
+        {
+            "name": "Orange Travels",
+            "logo_url": "/images/orange-logo.png",
+            "rating": 4.0,
+            "cancellation_policy": "75% refund up to 24 hours before departure.",
+            "amenities": "WiFi,Charging Point,Blanket,TV,Snacks"
+        },
+        {
+            "name": "KSRTC",
+            "logo_url": "/images/ksrtc-logo.png",
+            "rating": 3.8,
+            "cancellation_policy": "No refunds for government buses.",
+            "amenities": "Charging Point,Reading Light"
+        },
+        {
+            "name": "Parveen Travels",
+            "logo_url": "/images/parveen-logo.png",
+            "rating": 4.4,
+            "cancellation_policy": "85% refund up to 12 hours before departure.",
+            "amenities": "WiFi,Charging Point,Water Bottle,Blanket,Pillow"
+        }
+    ]
+    
+    operator_map = {}
+    for op_data in operators_data:
+        operator = BusOperatorModel(**op_data)
+        db.add(operator)
+        db.flush()
+        operator_map[op_data["name"]] = operator.id
+    
+    # Routes (one-way distances in km and time in minutes)
+    routes_data = [
+        {"from": "Chennai", "to": "Bangalore", "distance": 350, "duration": 360},
+        {"from": "Chennai", "to": "Coimbatore", "distance": 500, "duration": 480},
+        {"from": "Chennai", "to": "Madurai", "distance": 460, "duration": 450},
+        {"from": "Chennai", "to": "Trichy", "distance": 320, "duration": 300},
+        {"from": "Chennai", "to": "Hyderabad", "distance": 630, "duration": 600},
+        {"from": "Chennai", "to": "Tirupati", "distance": 135, "duration": 180},
+        {"from": "Bangalore", "to": "Chennai", "distance": 350, "duration": 360},
+        {"from": "Bangalore", "to": "Mysore", "distance": 150, "duration": 180},
+        {"from": "Bangalore", "to": "Hyderabad", "distance": 570, "duration": 540},
+        {"from": "Bangalore", "to": "Mumbai", "distance": 980, "duration": 900},
+        {"from": "Bangalore", "to": "Coimbatore", "distance": 360, "duration": 360},
+        {"from": "Bangalore", "to": "Kochi", "distance": 560, "duration": 540},
+        {"from": "Mumbai", "to": "Pune", "distance": 150, "duration": 180},
+        {"from": "Mumbai", "to": "Bangalore", "distance": 980, "duration": 900},
+        {"from": "Mumbai", "to": "Hyderabad", "distance": 710, "duration": 660},
+        {"from": "Delhi", "to": "Mumbai", "distance": 1400, "duration": 1200},
+        {"from": "Hyderabad", "to": "Bangalore", "distance": 570, "duration": 540},
+        {"from": "Hyderabad", "to": "Vijayawada", "distance": 275, "duration": 300},
+        {"from": "Coimbatore", "to": "Chennai", "distance": 500, "duration": 480},
+        {"from": "Coimbatore", "to": "Kochi", "distance": 195, "duration": 240},
+        {"from": "Kochi", "to": "Trivandrum", "distance": 200, "duration": 240},
+    ]
+    
+    route_map = {}
+    for route_data in routes_data:
+        route = BusRouteModel(
+            from_city_id=city_map[route_data["from"]],
+            to_city_id=city_map[route_data["to"]],
+            distance_km=route_data["distance"],
+            estimated_duration_mins=route_data["duration"]
+        )
+        db.add(route)
+        db.flush()
+        route_key = f"{route_data['from']}-{route_data['to']}"
+        route_map[route_key] = route.id
+    
+    # Buses and their seat configurations
+    buses_data = [
+        {"operator": "SRS Travels", "number": "TN01AB1234", "type": "Sleeper", "seats": 30, "layout": "2+1", "upper_deck": True},
+        {"operator": "SRS Travels", "number": "TN01AB1235", "type": "AC Seater", "seats": 44, "layout": "2+2", "upper_deck": False},
+        {"operator": "VRL Travels", "number": "KA01CD5678", "type": "AC Sleeper", "seats": 36, "layout": "2+1", "upper_deck": True},
+        {"operator": "VRL Travels", "number": "KA01CD5679", "type": "Multi-Axle Volvo", "seats": 40, "layout": "2+2", "upper_deck": False},
+        {"operator": "KPN Travels", "number": "TN02EF9012", "type": "Semi Sleeper", "seats": 38, "layout": "2+2", "upper_deck": False},
+        {"operator": "KPN Travels", "number": "TN02EF9013", "type": "AC Sleeper", "seats": 30, "layout": "2+1", "upper_deck": True},
+        {"operator": "Orange Travels", "number": "AP03GH3456", "type": "Volvo AC", "seats": 44, "layout": "2+2", "upper_deck": False},
+        {"operator": "Orange Travels", "number": "AP03GH3457", "type": "Sleeper", "seats": 36, "layout": "2+1", "upper_deck": True},
+        {"operator": "KSRTC", "number": "KA04IJ7890", "type": "Non AC Seater", "seats": 52, "layout": "2+3", "upper_deck": False},
+        {"operator": "KSRTC", "number": "KA04IJ7891", "type": "AC Seater", "seats": 44, "layout": "2+2", "upper_deck": False},
+        {"operator": "Parveen Travels", "number": "TN05KL1122", "type": "Multi-Axle AC Sleeper", "seats": 30, "layout": "2+1", "upper_deck": True},
+        {"operator": "Parveen Travels", "number": "TN05KL1123", "type": "Volvo B11R", "seats": 40, "layout": "2+2", "upper_deck": False},
+    ]
+    
+    # Helper function to generate seat layouts
+    def create_bus_seats(db_session, bus_id, layout, total_seats, has_upper_deck):
+        """Generate seats for a bus based on layout"""
+        seats_per_row = sum(int(x) for x in layout.split('+'))
+        decks = ["lower", "upper"] if has_upper_deck else ["lower"]
+        seats_per_deck = total_seats // len(decks)
+        rows_per_deck = max(1, seats_per_deck // seats_per_row)
+        
+        seat_num = 1
+        for deck in decks:
+            for row in range(1, rows_per_deck + 1):
+                col = 1
+                for section in layout.split('+'):
+                    for _ in range(int(section)):
+                        position = "window" if col == 1 or col == seats_per_row else "aisle"
+                        
+                        seat = BusSeatModel(
+                            bus_id=bus_id,
+                            seat_number=f"{deck[0].upper()}{seat_num}",
+                            seat_type="sleeper" if has_upper_deck else "seater",
+                            deck=deck,
+                            row_number=row,
+                            column_number=col,
+                            position=position,
+                            price_modifier=1.1 if position == "window" else 1.0,
+                            is_female_only=row == rows_per_deck and col == 1
+                        )
+                        db_session.add(seat)
+                        seat_num += 1
+                        col += 1
+    
+    bus_map = {}
+    for bus_data in buses_data:
+        bus = BusModel(
+            operator_id=operator_map[bus_data["operator"]],
+            bus_number=bus_data["number"],
+            bus_type=bus_data["type"],
+            total_seats=bus_data["seats"],
+            seat_layout=bus_data["layout"],
+            has_upper_deck=bus_data["upper_deck"]
+        )
+        db.add(bus)
+        db.flush()
+        bus_map[bus_data["number"]] = bus.id
+        
+        # Generate seats for this bus
+        create_bus_seats(db, bus.id, bus_data["layout"], bus_data["seats"], bus_data["upper_deck"])
+    
+    # Schedules with departure times
+    schedules_data = [
+        # Chennai - Bangalore (Multiple timings)
+        {"bus": "TN01AB1234", "route": "Chennai-Bangalore", "dep": "21:00", "arr": "05:00", "days": "1,2,3,4,5,6,7", "price": 850, "night": True, "next_day": True},
+        {"bus": "TN01AB1235", "route": "Chennai-Bangalore", "dep": "06:00", "arr": "12:00", "days": "1,2,3,4,5,6,7", "price": 650, "night": False, "next_day": False},
+        {"bus": "KA01CD5678", "route": "Chennai-Bangalore", "dep": "22:30", "arr": "06:30", "days": "1,2,3,4,5,6,7", "price": 1100, "night": True, "next_day": True},
+        {"bus": "KA01CD5679", "route": "Chennai-Bangalore", "dep": "08:00", "arr": "14:00", "days": "1,2,3,4,5,6,7", "price": 900, "night": False, "next_day": False},
+        # Chennai - Coimbatore
+        {"bus": "TN02EF9012", "route": "Chennai-Coimbatore", "dep": "21:30", "arr": "06:30", "days": "1,2,3,4,5,6,7", "price": 750, "night": True, "next_day": True},
+        {"bus": "TN02EF9013", "route": "Chennai-Coimbatore", "dep": "22:00", "arr": "07:00", "days": "1,2,3,4,5,6,7", "price": 950, "night": True, "next_day": True},
+        # Chennai - Hyderabad
+        {"bus": "AP03GH3456", "route": "Chennai-Hyderabad", "dep": "18:00", "arr": "06:00", "days": "1,2,3,4,5,6,7", "price": 1200, "night": True, "next_day": True},
+        {"bus": "AP03GH3457", "route": "Chennai-Hyderabad", "dep": "20:00", "arr": "08:00", "days": "1,2,3,4,5,6,7", "price": 1050, "night": True, "next_day": True},
+        # Bangalore - Chennai
+        {"bus": "TN01AB1234", "route": "Bangalore-Chennai", "dep": "21:00", "arr": "05:00", "days": "1,2,3,4,5,6,7", "price": 850, "night": True, "next_day": True},
+        {"bus": "KA01CD5679", "route": "Bangalore-Chennai", "dep": "07:00", "arr": "13:00", "days": "1,2,3,4,5,6,7", "price": 900, "night": False, "next_day": False},
+        # Bangalore - Mysore
+        {"bus": "KA04IJ7890", "route": "Bangalore-Mysore", "dep": "06:00", "arr": "09:00", "days": "1,2,3,4,5,6,7", "price": 350, "night": False, "next_day": False},
+        {"bus": "KA04IJ7891", "route": "Bangalore-Mysore", "dep": "08:00", "arr": "11:00", "days": "1,2,3,4,5,6,7", "price": 450, "night": False, "next_day": False},
+        # Bangalore - Hyderabad
+        {"bus": "KA01CD5678", "route": "Bangalore-Hyderabad", "dep": "20:00", "arr": "05:00", "days": "1,2,3,4,5,6,7", "price": 1100, "night": True, "next_day": True},
+        # Bangalore - Kochi
+        {"bus": "TN05KL1122", "route": "Bangalore-Kochi", "dep": "21:30", "arr": "06:30", "days": "1,2,3,4,5,6,7", "price": 950, "night": True, "next_day": True},
+        # Mumbai - Pune
+        {"bus": "TN05KL1123", "route": "Mumbai-Pune", "dep": "06:00", "arr": "09:00", "days": "1,2,3,4,5,6,7", "price": 450, "night": False, "next_day": False},
+        {"bus": "AP03GH3456", "route": "Mumbai-Pune", "dep": "18:00", "arr": "21:00", "days": "1,2,3,4,5,6,7", "price": 500, "night": False, "next_day": False},
+        # Hyderabad - Vijayawada
+        {"bus": "AP03GH3457", "route": "Hyderabad-Vijayawada", "dep": "06:00", "arr": "11:00", "days": "1,2,3,4,5,6,7", "price": 450, "night": False, "next_day": False},
+        # Coimbatore - Kochi
+        {"bus": "TN02EF9012", "route": "Coimbatore-Kochi", "dep": "07:00", "arr": "11:00", "days": "1,2,3,4,5,6,7", "price": 400, "night": False, "next_day": False},
+    ]
+    
+    schedule_map = {}
+    for sched_data in schedules_data:
+        if sched_data["route"] not in route_map:
+            continue
+        schedule = BusScheduleModel(
+            bus_id=bus_map[sched_data["bus"]],
+            route_id=route_map[sched_data["route"]],
+            departure_time=sched_data["dep"],
+            arrival_time=sched_data["arr"],
+            duration_mins=int(sched_data["arr"].split(':')[0]) * 60 - int(sched_data["dep"].split(':')[0]) * 60 if not sched_data["next_day"] else 480,
+            days_of_week=sched_data["days"],
+            base_price=sched_data["price"],
+            is_night_bus=sched_data["night"],
+            next_day_arrival=sched_data["next_day"]
+        )
+        db.add(schedule)
+        db.flush()
+        schedule_map[f"{sched_data['bus']}-{sched_data['route']}"] = schedule.id
+        
+        # Add boarding and dropping points for each schedule
+        route_cities = sched_data["route"].split("-")
+        from_city = route_cities[0]
+        to_city = route_cities[1]
+        
+        # Boarding points (from city)
+        boarding_points = [
+            {"city": from_city, "name": f"{from_city} Central Bus Stand", "address": f"Central Bus Station, {from_city}", "time": sched_data["dep"], "type": "boarding"},
+            {"city": from_city, "name": f"{from_city} Koyambedu" if from_city == "Chennai" else f"{from_city} Main Terminal", "address": f"Main Terminal, {from_city}", "time": add_minutes_to_time(sched_data["dep"], 15), "type": "boarding"},
+        ]
+        
+        # Dropping points (to city)
+        dropping_points = [
+            {"city": to_city, "name": f"{to_city} Central Bus Stand", "address": f"Central Bus Station, {to_city}", "time": sched_data["arr"], "type": "dropping"},
+            {"city": to_city, "name": f"{to_city} Railway Station", "address": f"Near Railway Station, {to_city}", "time": add_minutes_to_time(sched_data["arr"], -15), "type": "dropping"},
+        ]
+        
+        for bp in boarding_points:
+            point = BusBoardingPointModel(
+                schedule_id=schedule.id,
+                city_id=city_map[bp["city"]],
+                point_name=bp["name"],
+                address=bp["address"],
+                time=bp["time"],
+                point_type=bp["type"]
+            )
+            db.add(point)
+        
+        for dp in dropping_points:
+            point = BusBoardingPointModel(
+                schedule_id=schedule.id,
+                city_id=city_map[dp["city"]],
+                point_name=dp["name"],
+                address=dp["address"],
+                time=dp["time"],
+                point_type=dp["type"]
+            )
+            db.add(point)
+    
+    db.commit()
+    response_cache.invalidate("bus_cities")
+    
+    return {
+        "message": "Bus data seeded successfully",
+        "cities": len(cities_data),
+        "operators": len(operators_data),
+        "routes": len(routes_data),
+        "buses": len(buses_data),
+        "schedules": len(schedule_map)
+    }
+
+
+def add_minutes_to_time(time_str: str, minutes: int) -> str:
+    """Add minutes to a time string (HH:MM)"""
+    hours, mins = map(int, time_str.split(':'))
+    total_mins = hours * 60 + mins + minutes
+    new_hours = (total_mins // 60) % 24
+    new_mins = total_mins % 60
+    return f"{new_hours:02d}:{new_mins:02d}"
@@ -0,0 +1,1054 @@
+"""Flight search, seat maps, booking and tracking (/api/flight)."""
+import logging
+import uuid
+from datetime import datetime, timedelta
+from typing import List
+
+from fastapi import APIRouter, Depends, HTTPException
+from sqlalchemy import insert
+from sqlalchemy.orm import Session
+
+from flight_schedules import flight_schedules
+from flight_search import AirportNotFound, flight_network
+from response_cache import response_cache
+from seat_holds import SeatUnavailable, seat_holds
+from seat_map import SeatAvailabilityMap, flight_seat_map_key, seat_maps
+from database import SessionLocal, get_db
+from models import (AircraftModel, AirlineModel, AirportModel, FlightBookingModel, FlightModel,
+    FlightPassengerModel, FlightRouteModel, FlightScheduleModel, FlightSeatAvailabilityModel, FlightSeatModel,
+    FlightSegmentModel)
+from schemas import (FlightBookingCreate, FlightCancellationRequest, FlightSearchRequest,
+    FlightSeatLockRequest, User)
+from security import get_current_user
+
+logger = logging.getLogger(__name__)
+
+router = APIRouter(prefix="/api/flight", tags=["Flights"])
+
+
+def generate_pnr_flight():
+    """Generate a 6-character alphanumeric PNR"""
+    import random
+    import string
+    chars = string.ascii_uppercase + string.digits
+    return ''.join(random.choices(chars, k=6))
+
+
+def generate_booking_reference():
+    """Generate booking reference"""
+    import random
+    return f"WL{random.randint(100000, 999999)}"
+
+
+def generate_ticket_number():
+    """Generate ticket number"""
+    import random
+    return f"{random.randint(100, 999)}-{random.randint(1000000000, 9999999999)}"
+
+
+# Get all airports
+@router.get("/airports")
+@response_cache.cached("airports")
+def get_airports(db: Session = Depends(get_db)):
+    """Get all active airports"""
+    airports = db.query(AirportModel).filter(AirportModel.is_active == 1).order_by(AirportModel.city).all()
+    return [
+        {
+            "id": a.id,
+            "code": a.code,
+            "name": a.name,
+            "city": a.city,
+            "country": a.country,
+            "latitude": a.latitude,
+            "longitude": a.longitude
+        }
+        for a in airports
+    ]
+
+
+# Get all airlines
+@router.get("/airlines")
+@response_cache.cached("airlines")
+def get_airlines(db: Session = Depends(get_db)):
+    """Get all active airlines"""
+    airlines = db.query(AirlineModel).filter(AirlineModel.is_active == 1).order_by(AirlineModel.name).all()
+    return [
+        {
+            "id": a.id,
+            "code": a.code,
+            "name": a.name,
+            "logo_url": a.logo_url,
+            "country": a.country
+        }
+        for a in airlines
+    ]
+
+
+# Search flights
+@router.post("/search")
+def search_flights(
+    search: FlightSearchRequest,
+    db: Session = Depends(get_db)
+):
+    """Search for available flights.
+
+    Airports, airlines and the timetable come from the in-memory flight
+    network (flight_search.py); the search sends one query, for the dated
+    schedules of the candidate legs of both directions. A round trip no
+    longer fetches its two legs concurrently on separate sessions: with
+    the timetable in memory, one shared IN query covers both, on the
+    request's own session. Read-only: schedules are created ahead of time
+    by the schedule materialiser, and flights without one on the date are
+    not listed. `outbound`/`return` hold the direct flights as before;
+    one-stop itineraries are under `outbound_connections` and
+    `return_connections`.
+    """
+    legs = [(search.origin_code, search.destination_code, search.departure_date)]
+    if search.trip_type == "round_trip" and search.return_date:
+        legs.append((search.destination_code, search.origin_code, search.return_date))
+    try:
+        results = flight_network.search_legs(
+            db, [(origin, destination, datetime.strptime(day, "%Y-%m-%d").date())
+                 for origin, destination, day in legs],
+            passengers=search.passengers_adult + search.passengers_child,
+            seat_class=search.seat_class, max_stops=search.max_stops,
+        )
+    except AirportNotFound as e:
+        raise HTTPException(status_code=404, detail=str(e))
+    outbound, outbound_connections = results[0]
+    inbound, return_connections = results[1] if len(results) > 1 else ([], [])
+    return {
+        "outbound": outbound,
+        "return": inbound,
+        "outbound_connections": outbound_connections,
+        "return_connections": return_connections,
+    }
+
+
+def _get_flight_seat_map(db: Session, schedule_id: int, seat_ids: List[int]) -> SeatAvailabilityMap:
+    """Return the cached seat map for a flight schedule, loading it in one query on a miss."""
+    key = flight_seat_map_key(schedule_id)
+    seat_map = seat_maps.get(key)
+    if seat_map is None or not seat_map.covers(seat_ids):
+        # Flight schedules cover every cabin, so extend a partial map rather than dropping seats
+        known = dict.fromkeys(seat_map.seat_index) if seat_map is not None else {}
+        known.update(dict.fromkeys(seat_ids))
+        seat_map = SeatAvailabilityMap(known)
+        rows = db.query(
+            FlightSeatAvailabilityModel.seat_id,
+            FlightSeatAvailabilityModel.status,
+            FlightSeatAvailabilityModel.locked_until,
+            FlightSeatAvailabilityModel.locked_by,
+        ).filter(FlightSeatAvailabilityModel.schedule_id == schedule_id).all()
+        for seat_id, seat_status, locked_until, locked_by in rows:
+            seat_map.set(seat_id, seat_status, locked_until, locked_by)
+        seat_maps.put(key, seat_map)
+    return seat_map
+
+
+# Get seat layout for a flight schedule
+@router.get("/seats/{schedule_id}")
+def get_flight_seats(
+    schedule_id: int,
+    seat_class: str = "economy",
+    db: Session = Depends(get_db)
+):
+    """Get seat layout and availability for a flight schedule"""
+    schedule = db.query(FlightScheduleModel).filter(FlightScheduleModel.id == schedule_id).first()
+    if not schedule:
+        raise HTTPException(status_code=404, detail="Schedule not found")
+    
+    flight = db.query(FlightModel).filter(FlightModel.id == schedule.flight_id).first()
+    aircraft = db.query(AircraftModel).filter(AircraftModel.id == flight.aircraft_id).first()
+    
+    # Get seats for this aircraft
+    seats = db.query(FlightSeatModel).filter(
+        FlightSeatModel.aircraft_id == aircraft.id,
+        FlightSeatModel.seat_class == seat_class,
+        FlightSeatModel.is_active == 1
+    ).order_by(FlightSeatModel.row_number, FlightSeatModel.column_letter).all()
+    
+    seat_data = []
+    base_price = schedule.economy_price if seat_class == "economy" else (schedule.business_price or schedule.economy_price * 3)
+    
+    seat_map = _get_flight_seat_map(db, schedule_id, [seat.id for seat in seats])
+
+    for seat in seats:
+        status = seat_map.status(seat.id)
+        
+        seat_data.append({
+            "id": seat.id,
+            "seat_number": seat.seat_number,
+            "seat_class": seat.seat_class,
+            "seat_type": seat.seat_type,
+            "row_number": seat.row_number,
+            "column_letter": seat.column_letter,
+            "is_extra_legroom": seat.is_extra_legroom,
+            "is_emergency_exit": seat.is_emergency_exit,
+            "price_modifier": seat.price_modifier,
+            "status": status,
+            "price": base_price + seat.price_modifier
+        })
+    
+    return {
+        "aircraft_model": aircraft.model,
+        "seat_layout": aircraft.seat_layout,
+        "seat_class": seat_class,
+        "base_price": base_price,
+        "total_seats": len(seats),
+        "seats": seat_data
+    }
+
+
+# Lock seats temporarily
+@router.post("/seats/lock")
+def lock_flight_seats(
+    request: FlightSeatLockRequest,
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """Temporarily lock selected seats for 7 minutes (all of them or none)"""
+    try:
+        lock_until = seat_holds.hold(db, "flight", (request.schedule_id,), request.seat_ids, current_user.id,
+                                     timedelta(minutes=7))
+    except SeatUnavailable as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return {"locked_seats": list(request.seat_ids), "expires_at": lock_until.isoformat()}
+
+
+def _flight_fare(schedule: FlightScheduleModel, seat, passenger: dict) -> float:
+    """One passenger's fare: cabin price plus seat modifier, with the child/infant discount"""
+    seat_class = passenger.get("seat_class", "economy")
+    base_price = schedule.economy_price if seat_class == "economy" else (schedule.business_price or schedule.economy_price * 3)
+    if seat is not None:
+        base_price += seat.price_modifier
+    if passenger["passenger_type"] == "infant":
+        return base_price * 0.1  # 10% for infants
+    if passenger["passenger_type"] == "child":
+        return base_price * 0.75  # 75% for children
+    return base_price
+
+
+# Create flight booking
+@router.post("/book")
+def create_flight_booking(
+    booking: FlightBookingCreate,
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """Create a flight booking.
+
+    The statement count does not grow with the party size: schedules and
+    seats are fetched with one IN query each and priced in memory, and the
+    passengers and seat rows are written in bulk in the booking's
+    transaction (a few statements per segment, none per passenger).
+    """
+    pnr = generate_pnr_flight()
+    booking_ref = generate_booking_reference()
+    
+    # Validate all segments and calculate total
+    schedule_ids = {segment_data["schedule_id"] for segment_data in booking.segments}
+    schedules = {schedule.id: schedule for schedule in
+                 db.query(FlightScheduleModel).filter(FlightScheduleModel.id.in_(schedule_ids))}
+    if len(schedules) != len(schedule_ids):
+        raise HTTPException(status_code=404, detail="Flight schedule not found")
+    seat_ids = {passenger["seat_id"] for segment_data in booking.segments
+                for passenger in segment_data["passengers"] if passenger.get("seat_id")}
+    seats = {seat.id: seat for seat in
+             db.query(FlightSeatModel).filter(FlightSeatModel.id.in_(seat_ids))} if seat_ids else {}
+    
+    total_amount = 0
+    for segment_data in booking.segments:
+        schedule = schedules[segment_data["schedule_id"]]
+        for passenger in segment_data["passengers"]:
+            total_amount += _flight_fare(schedule, seats.get(passenger.get("seat_id")), passenger)
+    
+    # Add taxes and fees (mock)
+    taxes = total_amount * 0.12  # 12% taxes
+    convenience_fee = 199
+    final_amount = total_amount + taxes + convenience_fee
+    
+    # Create booking
+    new_booking = FlightBookingModel(
+        user_id=current_user.id,
+        booking_reference=booking_ref,
+        pnr=pnr,
+        trip_type=booking.trip_type,
+        booking_status="confirmed",
+        total_amount=total_amount,
+        discount_amount=0,
+        final_amount=final_amount,
+        payment_status="paid",
+        payment_method=booking.payment_method,
+        transaction_id=f"TXN{uuid.uuid4().hex[:12].upper()}",
+        contact_name=booking.contact_name,
+        contact_email=booking.contact_email,
+        contact_phone=booking.contact_phone
+    )
+    db.add(new_booking)
+    db.flush()
+    
+    # Create segments (one flush for all of them)
+    segments = []
+    for idx, segment_data in enumerate(booking.segments):
+        segment_type = "outbound"
+        if booking.trip_type == "round_trip" and idx == 1:
+            segment_type = "return"
+        elif booking.trip_type == "multi_city":
+            segment_type = "multi_city"
+        
+        segments.append(FlightSegmentModel(
+            booking_id=new_booking.id,
+            segment_order=idx + 1,
+            schedule_id=segment_data["schedule_id"],
+            segment_type=segment_type,
+            segment_pnr=generate_pnr_flight()
+        ))
+    db.add_all(segments)
+    db.flush()
+    
+    # Create passengers, mark seats as booked and update available seats
+    passenger_rows = []
+    booked_seats = []
+    for segment, segment_data in zip(segments, booking.segments):
+        schedule = schedules[segment_data["schedule_id"]]
+        segment_seats = []
+        seat_class = "economy"
+        for passenger in segment_data["passengers"]:
+            seat_class = passenger.get("seat_class", "economy")
+            seat = seats.get(passenger.get("seat_id"))
+            if seat:
+                segment_seats.append(seat.id)
+            passenger_rows.append({
+                "booking_id": new_booking.id,
+                "segment_id": segment.id,
+                "seat_id": passenger.get("seat_id"),
+                "passenger_type": passenger["passenger_type"],
+                "title": passenger["title"],
+                "first_name": passenger["first_name"],
+                "last_name": passenger["last_name"],
+                "date_of_birth": passenger.get("date_of_birth"),
+                "gender": passenger["gender"],
+                "nationality": passenger.get("nationality"),
+                "passport_number": passenger.get("passport_number"),
+                "seat_number": seat.seat_number if seat else None,
+                "seat_class": seat_class,
+                "meal_preference": passenger.get("meal_preference"),
+                "special_assistance": passenger.get("special_assistance"),
+                "ticket_number": generate_ticket_number(),
+                "fare_amount": _flight_fare(schedule, seat, passenger),
+            })
+        seat_holds.mark_booked(db, "flight", (schedule.id,), segment_seats)
+        booked_seats.extend((schedule.id, seat_id) for seat_id in segment_seats)
+        
+        # Update available seats (the segment's last passenger decides the cabin, as before)
+        passenger_count = len([p for p in segment_data["passengers"] if p["passenger_type"] != "infant"])
+        if seat_class == "economy":
+            schedule.available_economy = max(0, schedule.available_economy - passenger_count)
+        else:
+            if schedule.available_business:
+                schedule.available_business = max(0, schedule.available_business - passenger_count)
+    if passenger_rows:
+        db.execute(insert(FlightPassengerModel.__table__), passenger_rows)
+    
+    db.commit()
+    for schedule_id, seat_id in booked_seats:
+        seat_maps.update(flight_seat_map_key(schedule_id), seat_id, "booked")
+    
+    return {
+        "booking_id": new_booking.id,
+        "booking_reference": booking_ref,
+        "pnr": pnr,
+        "total_amount": total_amount,
+        "taxes": taxes,
+        "convenience_fee": convenience_fee,
+        "final_amount": final_amount,
+        "status": "confirmed"
+    }
+
+
+# Get booking details
+@router.get("/booking/{booking_id}")
+def get_flight_booking(
+    booking_id: int,
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """Get flight booking details"""
+    booking = db.query(FlightBookingModel).filter(
+        FlightBookingModel.id == booking_id,
+        FlightBookingModel.user_id == current_user.id
+    ).first()
+    
+    if not booking:
+        raise HTTPException(status_code=404, detail="Booking not found")
+    
+    # Get segments with flight details
+    segments = db.query(FlightSegmentModel).filter(
+        FlightSegmentModel.booking_id == booking.id
+    ).order_by(FlightSegmentModel.segment_order).all()
+    
+    segment_data = []
+    for segment in segments:
+        schedule = db.query(FlightScheduleModel).filter(FlightScheduleModel.id == segment.schedule_id).first()
+        flight = db.query(FlightModel).filter(FlightModel.id == schedule.flight_id).first()
+        airline = db.query(AirlineModel).filter(AirlineModel.id == flight.airline_id).first()
+        route = db.query(FlightRouteModel).filter(FlightRouteModel.id == flight.route_id).first()
+        origin = db.query(AirportModel).filter(AirportModel.id == route.origin_airport_id).first()
+        dest = db.query(AirportModel).filter(AirportModel.id == route.destination_airport_id).first()
+        aircraft = db.query(AircraftModel).filter(AircraftModel.id == flight.aircraft_id).first()
+        
+        # Get passengers for this segment
+        passengers = db.query(FlightPassengerModel).filter(
+            FlightPassengerModel.segment_id == segment.id
+        ).all()
+        
+        passenger_data = [{
+            "id": p.id,
+            "passenger_type": p.passenger_type,
+            "title": p.title,
+            "first_name": p.first_name,
+            "last_name": p.last_name,
+            "gender": p.gender,
+            "seat_number": p.seat_number,
+            "seat_class": p.seat_class,
+            "ticket_number": p.ticket_number,
+            "fare_amount": p.fare_amount
+        } for p in passengers]
+        
+        segment_data.append({
+            "segment_id": segment.id,
+            "segment_order": segment.segment_order,
+            "segment_type": segment.segment_type,
+            "segment_pnr": segment.segment_pnr,
+            "flight_number": flight.flight_number,
+            "airline_name": airline.name,
+            "airline_code": airline.code,
+            "airline_logo": airline.logo_url,
+            "aircraft_model": aircraft.model,
+            "origin_code": origin.code,
+            "origin_city": origin.city,
+            "origin_airport": origin.name,
+            "destination_code": dest.code,
+            "destination_city": dest.city,
+            "destination_airport": dest.name,
+            "departure_time": flight.departure_time,
+            "arrival_time": flight.arrival_time,
+            "departure_datetime": schedule.departure_datetime.isoformat(),
+            "arrival_datetime": schedule.arrival_datetime.isoformat(),
+            "duration_mins": flight.duration_mins,
+            "gate": schedule.gate,
+            "terminal": schedule.terminal,
+            "status": schedule.status,
+            "passengers": passenger_data
+        })
+    
+    return {
+        "id": booking.id,
+        "booking_reference": booking.booking_reference,
+        "pnr": booking.pnr,
+        "trip_type": booking.trip_type,
+        "booking_status": booking.booking_status,
+        "total_amount": booking.total_amount,
+        "final_amount": booking.final_amount,
+        "payment_status": booking.payment_status,
+        "contact_name": booking.contact_name,
+        "contact_email": booking.contact_email,
+        "contact_phone": booking.contact_phone,
+        "segments": segment_data,
+        "created_at": booking.created_at.isoformat()
+    }
+
+
+# Get booking by reference (PNR or booking_reference)
+@router.get("/booking/ref/{ref}")
+def get_flight_booking_by_ref(
+    ref: str,
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """Get flight booking details by PNR or booking reference"""
+    # Try to find by PNR first
+    booking = db.query(FlightBookingModel).filter(
+        FlightBookingModel.pnr == ref,
+        FlightBookingModel.user_id == current_user.id
+    ).first()
+    
+    # If not found, try booking reference
+    if not booking:
+        booking = db.query(FlightBookingModel).filter(
+            FlightBookingModel.booking_reference == ref,
+            FlightBookingModel.user_id == current_user.id
+        ).first()
+    
+    if not booking:
+        raise HTTPException(status_code=404, detail="Booking not found")
+    
+    # Get segments with flight details
+    segments = db.query(FlightSegmentModel).filter(
+        FlightSegmentModel.booking_id == booking.id
+    ).order_by(FlightSegmentModel.segment_order).all()
+    
+    segment_data = []
+    for segment in segments:
+        schedule = db.query(FlightScheduleModel).filter(FlightScheduleModel.id == segment.schedule_id).first()
+        flight = db.query(FlightModel).filter(FlightModel.id == schedule.flight_id).first()
+        airline = db.query(AirlineModel).filter(AirlineModel.id == flight.airline_id).first()
+        route = db.query(FlightRouteModel).filter(FlightRouteModel.id == flight.route_id).first()
+        origin = db.query(AirportModel).filter(AirportModel.id == route.origin_airport_id).first()
+        dest = db.query(AirportModel).filter(AirportModel.id == route.destination_airport_id).first()
+        aircraft = db.query(AircraftModel).filter(AircraftModel.id == flight.aircraft_id).first()
+        
+        # Get passengers for this segment
+        passengers = db.query(FlightPassengerModel).filter(
+            FlightPassengerModel.segment_id == segment.id
+        ).all()
+        
+        passenger_data = [{
+            "id": p.id,
+            "passenger_type": p.passenger_type,
+            "title": p.title,
+            "first_name": p.first_name,
+            "last_name": p.last_name,
+            "gender": p.gender,
+            "seat_number": p.seat_number,
+            "seat_class": p.seat_class,
+            "ticket_number": p.ticket_number,
+            "fare_amount": p.fare_amount,
+            "meal_preference": p.meal_preference
+        } for p in passengers]
+        
+        segment_data.append({
+            "segment_id": segment.id,
+            "segment_order": segment.segment_order,
+            "segment_type": segment.segment_type,
+            "segment_pnr": segment.segment_pnr,
+            "flight_number": flight.flight_number,
+            "airline_name": airline.name,
+            "airline_code": airline.code,
+            "airline_logo": airline.logo_url,
+            "aircraft_model": aircraft.model,
+            "origin_code": origin.code,
+            "origin_city": origin.city,
+            "origin_airport": origin.name,
+            "destination_code": dest.code,
+            "destination_city": dest.city,
+            "destination_airport": dest.name,
+            "departure_time": flight.departure_time,
+            "arrival_time": flight.arrival_time,
+            "departure_datetime": schedule.departure_datetime.isoformat() if schedule.departure_datetime else None,
+            "arrival_datetime": schedule.arrival_datetime.isoformat() if schedule.arrival_datetime else None,
+            "departure_date": schedule.departure_datetime.strftime("%Y-%m-%d") if schedule.departure_datetime else None,
+            "arrival_date": schedule.arrival_datetime.strftime("%Y-%m-%d") if schedule.arrival_datetime else None,
+            "duration_mins": flight.duration_mins,
+            "gate": schedule.gate,
+            "terminal": schedule.terminal,
+            "status": schedule.status,
+            "passengers": passenger_data,
+            "baggage": "15kg Cabin, 25kg Check-in"
+        })
+    
+    return {
+        "id": booking.id,
+        "booking_reference": booking.booking_reference,
+        "pnr": booking.pnr,
+        "trip_type": booking.trip_type,
+        "booking_status": booking.booking_status,
+        "total_amount": booking.total_amount,
+        "discount_amount": booking.discount_amount,
+        "final_amount": booking.final_amount,
+        "payment_status": booking.payment_status,
+        "payment_method": booking.payment_method,
+        "contact_name": booking.contact_name,
+        "contact_email": booking.contact_email,
+        "contact_phone": booking.contact_phone,
+        "passengers": [p for seg in segment_data for p in seg["passengers"]],
+        "segments": segment_data,
+        "seat_class": segment_data[0]["passengers"][0]["seat_class"] if segment_data and segment_data[0]["passengers"] else "economy",
+        "created_at": booking.created_at.isoformat()
+    }
+
+
+# Get user's flight bookings
+@router.get("/my-bookings")
+def get_my_flight_bookings(
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """Get all flight bookings for the current user"""
+    bookings = db.query(FlightBookingModel).filter(
+        FlightBookingModel.user_id == current_user.id
+    ).order_by(FlightBookingModel.created_at.desc()).all()
+    
+    result = []
+    for booking in bookings:
+        # Get first segment for summary
+        segment = db.query(FlightSegmentModel).filter(
+            FlightSegmentModel.booking_id == booking.id,
+            FlightSegmentModel.segment_order == 1
+        ).first()
+        
+        if segment:
+            schedule = db.query(FlightScheduleModel).filter(FlightScheduleModel.id == segment.schedule_id).first()
+            flight = db.query(FlightModel).filter(FlightModel.id == schedule.flight_id).first()
+            airline = db.query(AirlineModel).filter(AirlineModel.id == flight.airline_id).first()
+            route = db.query(FlightRouteModel).filter(FlightRouteModel.id == flight.route_id).first()
+            origin = db.query(AirportModel).filter(AirportModel.id == route.origin_airport_id).first()
+            dest = db.query(AirportModel).filter(AirportModel.id == route.destination_airport_id).first()
+            
+            passenger_count = db.query(FlightPassengerModel).filter(
+                FlightPassengerModel.booking_id == booking.id
+            ).count()
+            
+            result.append({
+                "id": booking.id,
+                "booking_reference": booking.booking_reference,
+                "pnr": booking.pnr,
+                "trip_type": booking.trip_type,
+                "booking_status": booking.booking_status,
+                "flight_number": flight.flight_number,
+                "airline_name": airline.name,
+                "airline_logo": airline.logo_url,
+                "origin_code": origin.code,
+                "origin_city": origin.city,
+                "destination_code": dest.code,
+                "destination_city": dest.city,
+                "departure_datetime": schedule.departure_datetime.isoformat(),
+                "final_amount": booking.final_amount,
+                "passenger_count": passenger_count,
+                "created_at": booking.created_at.isoformat()
+            })
+    
+    return result
+
+
+# Cancel flight booking
+@router.post("/cancel")
+def cancel_flight_booking(
+    request: FlightCancellationRequest,
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """Cancel a flight booking with refund calculation"""
+    booking = db.query(FlightBookingModel).filter(
+        FlightBookingModel.id == request.booking_id,
+        FlightBookingModel.user_id == current_user.id
+    ).first()
+    
+    if not booking:
+        raise HTTPException(status_code=404, detail="Booking not found")
+    
+    if booking.booking_status == "cancelled":
+        raise HTTPException(status_code=400, detail="Booking already cancelled")
+    
+    # Get first segment to check departure time
+    segment = db.query(FlightSegmentModel).filter(
+        FlightSegmentModel.booking_id == booking.id,
+        FlightSegmentModel.segment_order == 1
+    ).first()
+    
+    schedule = db.query(FlightScheduleModel).filter(FlightScheduleModel.id == segment.schedule_id).first()
+    
+    # Calculate refund based on time to departure
+    now = datetime.now()
+    departure = schedule.departure_datetime
+    hours_to_departure = (departure - now).total_seconds() / 3600
+    
+    refund_percentage = 0
+    if hours_to_departure > 48:
+        refund_percentage = 80
+    elif hours_to_departure > 24:
+        refund_percentage = 50
+    elif hours_to_departure > 6:
+        refund_percentage = 25
+    
+    refund_amount = booking.final_amount * refund_percentage / 100
+    
+    # Update booking status
+    booking.booking_status = "cancelled"
+    booking.cancelled_at = datetime.now()
+    booking.refund_amount = refund_amount
+    
+    # Release seats
+    released_seats = []
+    segments = db.query(FlightSegmentModel).filter(FlightSegmentModel.booking_id == booking.id).all()
+    for seg in segments:
+        passengers = db.query(FlightPassengerModel).filter(FlightPassengerModel.segment_id == seg.id).all()
+        for passenger in passengers:
+            if passenger.seat_id:
+                availability = db.query(FlightSeatAvailabilityModel).filter(
+                    FlightSeatAvailabilityModel.schedule_id == seg.schedule_id,
+                    FlightSeatAvailabilityModel.seat_id == passenger.seat_id
+                ).first()
+                if availability:
+                    availability.status = "available"
+                    availability.locked_by = None
+                    availability.locked_until = None
+                    released_seats.append((seg.schedule_id, passenger.seat_id))
+        
+        # Restore seat count
+        schedule = db.query(FlightScheduleModel).filter(FlightScheduleModel.id == seg.schedule_id).first()
+        passenger_count = len([p for p in passengers if p.passenger_type != "infant"])
+        if passengers and passengers[0].seat_class == "economy":
+            schedule.available_economy += passenger_count
+        else:
+            if schedule.available_business is not None:
+                schedule.available_business += passenger_count
+    
+    db.commit()
+    for schedule_id, seat_id in released_seats:
+        seat_maps.update(flight_seat_map_key(schedule_id), seat_id, "available")
+    
+    return {
+        "booking_id": booking.id,
+        "status": "cancelled",
+        "refund_percentage": refund_percentage,
+        "refund_amount": refund_amount,
+        "message": f"Booking cancelled. {refund_percentage}% refund of ₹{refund_amount:.0f} will be processed."
+    }
+
+
+# Get flight tracking
+@router.get("/tracking/{schedule_id}")
+def get_flight_tracking(
+    schedule_id: int,
+    db: Session = Depends(get_db)
+):
+    """Get simulated live flight tracking"""
+    schedule = db.query(FlightScheduleModel).filter(FlightScheduleModel.id == schedule_id).first()
+    if not schedule:
+        raise HTTPException(status_code=404, detail="Schedule not found")
+    
+    flight = db.query(FlightModel).filter(FlightModel.id == schedule.flight_id).first()
+    route = db.query(FlightRouteModel).filter(FlightRouteModel.id == flight.route_id).first()
+    origin = db.query(AirportModel).filter(AirportModel.id == route.origin_airport_id).first()
+    dest = db.query(AirportModel).filter(AirportModel.id == route.destination_airport_id).first()
+    
+    now = datetime.now()
+    dep = schedule.departure_datetime
+    arr = schedule.arrival_datetime
+    
+    # Calculate progress
+    if now < dep:
+        progress = 0
+        status = "scheduled"
+        if (dep - now).total_seconds() < 3600:
+            status = "boarding"
+    elif now > arr:
+        progress = 100
+        status = "landed"
+    else:
+        total_duration = (arr - dep).total_seconds()
+        elapsed = (now - dep).total_seconds()
+        progress = min(100, (elapsed / total_duration) * 100)
+        status = "in_air"
+    
+    # Interpolate position
+    if origin.latitude and origin.longitude and dest.latitude and dest.longitude:
+        current_lat = origin.latitude + (dest.latitude - origin.latitude) * (progress / 100)
+        current_lng = origin.longitude + (dest.longitude - origin.longitude) * (progress / 100)
+    else:
+        current_lat = None
+        current_lng = None
+    
+    # Calculate ETA
+    if progress < 100:
+        remaining_mins = int((arr - now).total_seconds() / 60)
+    else:
+        remaining_mins = 0
+    
+    return {
+        "schedule_id": schedule_id,
+        "flight_number": flight.flight_number,
+        "status": status,
+        "progress_percentage": round(progress, 1),
+        "current_latitude": current_lat,
+        "current_longitude": current_lng,
+        "altitude_ft": 35000 if status == "in_air" else 0,
+        "speed_kmph": 850 if status == "in_air" else 0,
+        "origin": {"code": origin.code, "city": origin.city, "lat": origin.latitude, "lng": origin.longitude},
+        "destination": {"code": dest.code, "city": dest.city, "lat": dest.latitude, "lng": dest.longitude},
+        "departure_time": schedule.departure_datetime.isoformat(),
+        "arrival_time": schedule.arrival_datetime.isoformat(),
+        "eta_mins": remaining_mins
+    }
+
+
+# Seed flight data
+@router.post("/seed")
+def seed_flight_data(db: Session = Depends(get_db)):
+    """Seed flight database with sample data"""
+    import random
+    
+    # Check if already seeded
+    existing = db.query(AirportModel).first()
+    if existing:
+        return {"message": "Flight data already seeded"}
+    
+    # Indian airports
+    airports_data = [
+        {"code": "DEL", "name": "Indira Gandhi International Airport", "city": "Delhi", "country": "India", "lat": 28.5562, "lng": 77.1000, "tz": "Asia/Kolkata"},
+        {"code": "BOM", "name": "Chhatrapati Shivaji Maharaj International Airport", "city": "Mumbai", "country": "India", "lat": 19.0896, "lng": 72.8656, "tz": "Asia/Kolkata"},
+        {"code": "BLR", "name": "Kempegowda International Airport", "city": "Bangalore", "country": "India", "lat": 13.1986, "lng": 77.7066, "tz": "Asia/Kolkata"},
+        {"code": "MAA", "name": "Chennai International Airport", "city": "Chennai", "country": "India", "lat": 12.9941, "lng": 80.1709, "tz": "Asia/Kolkata"},
+        {"code": "HYD", "name": "Rajiv Gandhi International Airport", "city": "Hyderabad", "country": "India", "lat": 17.2403, "lng": 78.4294, "tz": "Asia/Kolkata"},
+        {"code": "CCU", "name": "Netaji Subhas Chandra Bose International Airport", "city": "Kolkata", "country": "India", "lat": 22.6547, "lng": 88.4467, "tz": "Asia/Kolkata"},
+        {"code": "COK", "name": "Cochin International Airport", "city": "Kochi", "country": "India", "lat": 10.1520, "lng": 76.4019, "tz": "Asia/Kolkata"},
+        {"code": "PNQ", "name": "Pune Airport", "city": "Pune", "country": "India", "lat": 18.5822, "lng": 73.9197, "tz": "Asia/Kolkata"},
+        {"code": "GOI", "name": "Goa International Airport", "city": "Goa", "country": "India", "lat": 15.3808, "lng": 73.8314, "tz": "Asia/Kolkata"},
+        {"code": "AMD", "name": "Sardar Vallabhbhai Patel International Airport", "city": "Ahmedabad", "country": "India", "lat": 23.0772, "lng": 72.6347, "tz": "Asia/Kolkata"},
+        {"code": "JAI", "name": "Jaipur International Airport", "city": "Jaipur", "country": "India", "lat": 26.8242, "lng": 75.8122, "tz": "Asia/Kolkata"},
+        {"code": "LKO", "name": "Chaudhary Charan Singh International Airport", "city": "Lucknow", "country": "India", "lat": 26.7606, "lng": 80.8893, "tz": "Asia/Kolkata"},
+        # International
+        {"code": "DXB", "name": "Dubai International Airport", "city": "Dubai", "country": "UAE", "lat": 25.2532, "lng": 55.3657, "tz": "Asia/Dubai"},
+        {"code": "SIN", "name": "Singapore Changi Airport", "city": "Singapore", "country": "Singapore", "lat": 1.3644, "lng": 103.9915, "tz": "Asia/Singapore"},
+        {"code": "LHR", "name": "London Heathrow Airport", "city": "London", "country": "UK", "lat": 51.4700, "lng": -0.4543, "tz": "Europe/London"},
+    ]
+    
+    for a in airports_data:
+        airport = AirportModel(
+            code=a["code"], name=a["name"], city=a["city"], country=a["country"],
+            latitude=a["lat"], longitude=a["lng"], timezone=a["tz"]
+        )
+        db.add(airport)
+    db.flush()
+    
+    # Airlines
+    airlines_data = [
+        {"code": "6E", "name": "IndiGo", "logo": "/images/airlines/indigo.png", "country": "India"},
+        {"code": "AI", "name": "Air India", "logo": "/images/airlines/airindia.png", "country": "India"},
+        {"code": "SG", "name": "SpiceJet", "logo": "/images/airlines/spicejet.png", "country": "India"},
+        {"code": "UK", "name": "Vistara", "logo": "/images/airlines/vistara.png", "country": "India"},
+        {"code": "I5", "name": "Air India Express", "logo": "/images/airlines/airindia-express.png", "country": "India"},
+        {"code": "G8", "name": "Go First", "logo": "/images/airlines/gofirst.png", "country": "India"},
+        {"code": "EK", "name": "Emirates", "logo": "/images/airlines/emirates.png", "country": "UAE"},
+        {"code": "SQ", "name": "Singapore Airlines", "logo": "/images/airlines/singapore.png", "country": "Singapore"},
+    ]
+    
+    for a in airlines_data:
+        airline = AirlineModel(code=a["code"], name=a["name"], logo_url=a["logo"], country=a["country"])
+        db.add(airline)
+    db.flush()
+    
+    # Aircraft
+    aircraft_data = [
+        {"model": "Airbus A320", "manufacturer": "Airbus", "total": 180, "economy": 168, "business": 12, "layout": "3-3"},
+        {"model": "Airbus A321", "manufacturer": "Airbus", "total": 220, "economy": 200, "business": 20, "layout": "3-3"},
+        {"model": "Boeing 737-800", "manufacturer": "Boeing", "total": 189, "economy": 177, "business": 12, "layout": "3-3"},
+        {"model": "Boeing 787 Dreamliner", "manufacturer": "Boeing", "total": 256, "economy": 232, "business": 24, "layout": "3-3-3"},
+        {"model": "Airbus A320neo", "manufacturer": "Airbus", "total": 186, "economy": 174, "business": 12, "layout": "3-3"},
+    ]
+    
+    for a in aircraft_data:
+        aircraft = AircraftModel(
+            model=a["model"], manufacturer=a["manufacturer"], total_seats=a["total"],
+            economy_seats=a["economy"], business_seats=a["business"], seat_layout=a["layout"]
+        )
+        db.add(aircraft)
+    db.flush()
+    
+    # Generate seats for each aircraft
+    aircraft_list = db.query(AircraftModel).all()
+    for aircraft in aircraft_list:
+        layout = aircraft.seat_layout.split('-')
+        cols_per_side = int(layout[0])
+        total_cols = cols_per_side * 2
+        
+        # Column letters based on layout
+        if total_cols == 6:
+            columns = ['A', 'B', 'C', 'D', 'E', 'F']
+        else:
+            columns = ['A', 'B', 'C', 'D', 'E', 'F', 'G', 'H', 'J'][:total_cols]
+        
+        # Business class rows (first 2-4 rows)
+        business_rows = aircraft.business_seats // total_cols if aircraft.business_seats > 0 else 0
+        
+        row = 1
+        # Business class seats
+        for r in range(business_rows):
+            for col in columns:
+                seat_type = "window" if col in ['A', columns[-1]] else ("aisle" if col in ['C', 'D'] else "middle")
+                seat = FlightSeatModel(
+                    aircraft_id=aircraft.id,
+                    seat_number=f"{row}{col}",
+                    seat_class="business",
+                    seat_type=seat_type,
+                    row_number=row,
+                    column_letter=col,
+                    is_extra_legroom=1,
+                    price_modifier=500
+                )
+                db.add(seat)
+            row += 1
+        
+        # Economy class seats
+        economy_rows = aircraft.economy_seats // total_cols
+        for r in range(economy_rows):
+            for col in columns:
+                seat_type = "window" if col in ['A', columns[-1]] else ("aisle" if col in ['C', 'D'] else "middle")
+                is_extra_legroom = 1 if row in [business_rows + 1, business_rows + 12, business_rows + 13] else 0
+                is_emergency = 1 if row in [business_rows + 12, business_rows + 13] else 0
+                price_mod = 200 if is_extra_legroom else (50 if seat_type == "window" else 0)
+                
+                seat = FlightSeatModel(
+                    aircraft_id=aircraft.id,
+                    seat_number=f"{row}{col}",
+                    seat_class="economy",
+                    seat_type=seat_type,
+                    row_number=row,
+                    column_letter=col,
+                    is_extra_legroom=is_extra_legroom,
+                    is_emergency_exit=is_emergency,
+                    price_modifier=price_mod
+                )
+                db.add(seat)
+            row += 1
+    
+    db.flush()
+    
+    # Routes (major Indian routes)
+    airport_map = {a.code: a.id for a in db.query(AirportModel).all()}
+    
+    routes_data = [
+        ("DEL", "BOM", 1148, 130), ("BOM", "DEL", 1148, 130),
+        ("DEL", "BLR", 1740, 165), ("BLR", "DEL", 1740, 165),
+        ("DEL", "MAA", 1760, 170), ("MAA", "DEL", 1760, 170),
+        ("DEL", "HYD", 1260, 140), ("HYD", "DEL", 1260, 140),
+        ("BOM", "BLR", 842, 95), ("BLR", "BOM", 842, 95),
+        ("BOM", "MAA", 1028, 110), ("MAA", "BOM", 1028, 110),
+        ("BOM", "HYD", 617, 80), ("HYD", "BOM", 617, 80),
+        ("BLR", "MAA", 284, 55), ("MAA", "BLR", 284, 55),
+        ("BLR", "HYD", 502, 70), ("HYD", "BLR", 502, 70),
+        ("DEL", "CCU", 1305, 145), ("CCU", "DEL", 1305, 145),
+        ("BOM", "GOI", 439, 65), ("GOI", "BOM", 439, 65),
+        ("DEL", "GOI", 1500, 155), ("GOI", "DEL", 1500, 155),
+        ("BLR", "COK", 340, 60), ("COK", "BLR", 340, 60),
+        ("MAA", "COK", 520, 75), ("COK", "MAA", 520, 75),
+        # International
+        ("DEL", "DXB", 2200, 210), ("DXB", "DEL", 2200, 210),
+        ("BOM", "DXB", 1930, 190), ("DXB", "BOM", 1930, 190),
+        ("DEL", "SIN", 4150, 330), ("SIN", "DEL", 4150, 330),
+        ("BOM", "LHR", 7200, 540), ("LHR", "BOM", 7200, 540),
+    ]
+    
+    for origin, dest, dist, dur in routes_data:
+        if origin in airport_map and dest in airport_map:
+            route = FlightRouteModel(
+                origin_airport_id=airport_map[origin],
+                destination_airport_id=airport_map[dest],
+                distance_km=dist,
+                estimated_duration_mins=dur
+            )
+            db.add(route)
+    
+    db.flush()
+    
+    # Flights
+    airline_map = {a.code: a.id for a in db.query(AirlineModel).all()}
+    aircraft_list = db.query(AircraftModel).all()
+    routes = db.query(FlightRouteModel).all()
+    
+    flight_times = [
+        ("06:00", "08:10"), ("07:30", "09:40"), ("09:00", "11:15"),
+        ("10:30", "12:45"), ("12:00", "14:10"), ("14:30", "16:45"),
+        ("16:00", "18:15"), ("18:30", "20:40"), ("20:00", "22:10"),
+        ("22:30", "00:45"),  # Overnight
+    ]
+    
+    for route in routes:
+        origin = db.query(AirportModel).filter(AirportModel.id == route.origin_airport_id).first()
+        dest = db.query(AirportModel).filter(AirportModel.id == route.destination_airport_id).first()
+        
+        # Create 2-4 flights per route
+        num_flights = random.randint(2, 4)
+        used_times = set()
+        
+        for _ in range(num_flights):
+            airline_code = random.choice(list(airline_map.keys())[:6])  # Indian airlines
+            if route.distance_km and route.distance_km > 3000:
+                airline_code = random.choice(["AI", "EK", "SQ"])  # International
+            
+            aircraft = random.choice(aircraft_list)
+            
+            # Pick unique departure time
+            time_idx = random.randint(0, len(flight_times) - 1)
+            while time_idx in used_times and len(used_times) < len(flight_times):
+                time_idx = random.randint(0, len(flight_times) - 1)
+            used_times.add(time_idx)
+            
+            dep_time, arr_time = flight_times[time_idx]
+            
+            # Adjust arrival time based on actual duration
+            dep_hour, dep_min = map(int, dep_time.split(':'))
+            total_mins = dep_hour * 60 + dep_min + route.estimated_duration_mins
+            arr_hour = (total_mins // 60) % 24
+            arr_min = total_mins % 60
+            arr_time = f"{arr_hour:02d}:{arr_min:02d}"
+            is_overnight = 1 if total_mins >= 24 * 60 else 0
+            
+            flight_num = f"{airline_code}{random.randint(100, 999)}"
+            base_price = max(2500, route.distance_km * 3 + random.randint(-500, 500)) if route.distance_km else random.randint(3000, 8000)
+            
+            flight = FlightModel(
+                flight_number=flight_num,
+                airline_id=airline_map[airline_code],
+                route_id=route.id,
+                aircraft_id=aircraft.id,
+                departure_time=dep_time,
+                arrival_time=arr_time,
+                duration_mins=route.estimated_duration_mins,
+                stops=0,
+                days_of_week="1,2,3,4,5,6,7",
+                base_price_economy=base_price,
+                base_price_business=base_price * 3,
+                is_overnight=is_overnight,
+                is_refundable=random.choice([0, 1]),
+                meal_included=random.choice([0, 1])
+            )
+            db.add(flight)
+    
+    db.commit()
+    response_cache.invalidate("airports", "airlines")
+    flight_network.invalidate()
+    # Searchable right away rather than after the next background pass
+    flight_schedules.materialise(db)
+    
+    # Count created entities
+    airport_count = db.query(AirportModel).count()
+    airline_count = db.query(AirlineModel).count()
+    aircraft_count = db.query(AircraftModel).count()
+    route_count = db.query(FlightRouteModel).count()
+    flight_count = db.query(FlightModel).count()
+    seat_count = db.query(FlightSeatModel).count()
+    
+    return {
+        "message": "Flight data seeded successfully",
+        "airports": airport_count,
+        "airlines": airline_count,
+        "aircraft": aircraft_count,
+        "routes": route_count,
+        "flights": flight_count,
+        "seats": seat_count
+    }
+
+
+@router.on_event("startup")
+def warm_flight_network():
+    """Load the flight network before the first search arrives"""
+    try:
+        with SessionLocal() as db:
+            count = flight_network.rebuild(db)
+        logger.info(f"Flight network loaded with {count} flights")
+    except Exception as e:
+        logger.warning(f"Flight network not loaded at startup: {e}")
+
+
+@router.on_event("startup")
+async def start_flight_schedule_materialiser():
+    """Materialise the schedule window in the background, then keep it rolling"""
+    flight_schedules.start(SessionLocal)
+
+
+@router.on_event("shutdown")
+async def stop_flight_schedule_materialiser():
+    await flight_schedules.stop()
@@ -0,0 +1,330 @@
+"""Payment confirmation, tickets and receipts, payment profiles and
+transaction history (/api)."""
+import logging
+import uuid
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import List, Optional
+
+from fastapi import APIRouter, Depends, HTTPException
+from sqlalchemy.orm import Session
+
+from database import get_db
+from models import PaymentProfileModel, PaymentReceiptModel, ServiceBookingModel, TransactionModel, UserModel
+from schemas import (MockPaymentRequest, PaymentProfileStatus, PaymentProfileSubmit, PaymentRequest,
+    PaymentResponse, ReceiptRecord, TransactionRecord, User)
+from security import decrypt_field, encrypt_field, get_current_user
+from documents import (_generate_flight_ticket_pdf, _generate_hotel_receipt_pdf, _generate_hotel_voucher_pdf,
+    _generate_receipt_pdf, _generate_restaurant_receipt_pdf, _qr_decrypt)
+
+logger = logging.getLogger(__name__)
+router = APIRouter(prefix="/api")
+
+
+@router.post("/payment/confirm", response_model=PaymentResponse)
+def confirm_payment(payload: PaymentRequest, db: Session = Depends(get_db)):
+    try:
+        upload_dir = Path('uploads')
+        upload_dir.mkdir(exist_ok=True)
+        
+        booking_ref = payload.booking_ref or f"WL-{datetime.now(timezone.utc).strftime('%Y%m%d')}-{str(uuid.uuid4())[:8].upper()}"
+        
+        # Check if this is a service booking (flight/hotel/restaurant)
+        service_booking = None
+        if payload.booking_ref:
+            service_booking = db.query(ServiceBookingModel).filter(
+                ServiceBookingModel.booking_ref == payload.booking_ref
+            ).first()
+        
+        # Generate appropriate ticket/voucher based on service type
+        ticket_url = None
+        receipt_url: Optional[str] = None
+        try:
+            if service_booking:
+                service_data = service_booking.service_data
+                guest_info = {
+                    'full_name': payload.full_name,
+                    'email': payload.email,
+                    'phone': payload.phone,
+                    'method': payload.method,
+                    'credential': payload.credential,
+                }
+                
+                if service_booking.service_type == 'flight':
+                    ticket_url = _generate_flight_ticket_pdf(service_data, booking_ref, guest_info, upload_dir)
+                    # For flights we keep the generic payment receipt as well
+                elif service_booking.service_type == 'hotel':
+                    # Generate a rich hotel receipt and also provide a hotel voucher PDF as e-ticket
+                    receipt_url = _generate_hotel_receipt_pdf(service_data, booking_ref, guest_info, payload.amount, payload.__dict__.get('currency', 'INR'), upload_dir)
+                    ticket_url = _generate_hotel_voucher_pdf(service_data, booking_ref, guest_info, upload_dir)
+                elif service_booking.service_type == 'restaurant':
+                    # Generate a branded dining receipt
+                    receipt_url = _generate_restaurant_receipt_pdf(service_data, booking_ref, guest_info, payload.amount, payload.__dict__.get('currency', 'INR'), upload_dir)
+                
+                # Update service booking status to Confirmed
+                service_booking.status = 'Confirmed'
+                db.commit()
+        except Exception as e:
+            logger.warning(f"Failed to generate specialized receipt/ticket: {e}")
+            # Continue with generic receipt generation
+        
+        # Generate a generic payment receipt only if not already generated a specialized one
+        if not receipt_url:
+            receipt_url = _generate_receipt_pdf(payload, upload_dir)
+        
+        # Save receipt record to database
+        receipt_record = PaymentReceiptModel(
+            user_id=None,  # TODO: link to current user if authenticated
+            booking_ref=booking_ref,
+            destination=payload.destination,
+            start_date=payload.start_date,
+            end_date=payload.end_date,
+            travelers=payload.travelers,
+            full_name=payload.full_name,
+            email=payload.email,
+            phone=payload.phone,
+            payment_method=payload.method,
+            amount=payload.amount,
+            receipt_url=receipt_url,
+        )
+        db.add(receipt_record)
+        db.commit()
+        
+        # Return both receipt and ticket (if applicable)
+        response_data = {
+            'status': 'success',
+            'booking_ref': booking_ref,
+            'receipt_url': receipt_url
+        }
+        
+        if ticket_url:
+            response_data['ticket_url'] = ticket_url
+        
+        return PaymentResponse(**response_data)
+    except Exception as e:
+        logger.exception("Payment confirmation failed")
+        raise HTTPException(status_code=500, detail=f"Failed to confirm payment: {str(e)}")
+
+
+@router.get("/tickets/verify")
+def verify_ticket(token: str, db: Session = Depends(get_db)):
+    """Decrypt QR token and return real-time booking details for verification."""
+    try:
+        data = _qr_decrypt(token)
+        booking_ref = data.get('br')
+        service_type = data.get('stype')
+        if not booking_ref:
+            raise HTTPException(status_code=400, detail="Invalid token")
+
+        # Try service booking by booking_ref
+        service_booking = db.query(ServiceBookingModel).filter(
+            ServiceBookingModel.booking_ref == booking_ref
+        ).first()
+        service_json = None
+        if service_booking:
+            service_json = service_booking.service_data or None
+
+        # Try receipt by booking_ref for payer details
+        receipt = db.query(PaymentReceiptModel).filter(
+            PaymentReceiptModel.booking_ref == booking_ref
+        ).order_by(PaymentReceiptModel.created_at.desc()).first()
+
+        return {
+            'status': 'valid',
+            'booking_ref': booking_ref,
+            'service_type': service_type,
+            'service': service_json,
+            'receipt': {
+                'full_name': receipt.full_name if receipt else None,
+                'email': receipt.email if receipt else None,
+                'phone': receipt.phone if receipt else None,
+                'amount': receipt.amount if receipt else None,
+                'destination': receipt.destination if receipt else None,
+                'start_date': receipt.start_date if receipt else None,
+                'end_date': receipt.end_date if receipt else None,
+                'travelers': receipt.travelers if receipt else None,
+            } if receipt else None
+        }
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.exception("Ticket verification failed")
+        raise HTTPException(status_code=400, detail=f"Invalid or expired token: {e}")
+
+
+@router.get("/receipts", response_model=List[ReceiptRecord])
+def list_receipts(db: Session = Depends(get_db)):
+    """List all payment receipts (for now returns all; TODO: filter by user_id)."""
+    rows = db.query(PaymentReceiptModel).order_by(PaymentReceiptModel.created_at.desc()).all()
+    return [
+        ReceiptRecord(
+            id=r.id,
+            booking_ref=r.booking_ref,
+            destination=r.destination,
+            start_date=r.start_date,
+            end_date=r.end_date,
+            travelers=r.travelers,
+            full_name=r.full_name,
+            email=r.email,
+            phone=r.phone,
+            payment_method=r.payment_method,
+            amount=r.amount,
+            receipt_url=r.receipt_url,
+            created_at=r.created_at,
+        ) for r in rows
+    ]
+
+
+# =============================
+# Payment Profile Endpoints
+# =============================
+@router.post("/payment-profile")
+def submit_payment_profile(
+    profile: PaymentProfileSubmit,
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """Submit payment profile with encrypted bank details"""
+    
+    # Check if profile already exists
+    existing = db.query(PaymentProfileModel).filter(PaymentProfileModel.user_id == current_user.id).first()
+    if existing:
+        raise HTTPException(status_code=400, detail="Payment profile already exists")
+    
+    # Encrypt sensitive fields
+    account_encrypted = encrypt_field(profile.account_number)
+    ifsc_encrypted = encrypt_field(profile.ifsc)
+    upi_encrypted = encrypt_field(profile.upi) if profile.upi else None
+    
+    # Create payment profile
+    payment_profile = PaymentProfileModel(
+        user_id=current_user.id,
+        account_holder_name=profile.account_holder_name,
+        bank_name=profile.bank_name,
+        account_number_encrypted=account_encrypted,
+        ifsc_encrypted=ifsc_encrypted,
+        upi_encrypted=upi_encrypted,
+        default_method=profile.default_method,
+        created_at=datetime.now(timezone.utc)
+    )
+    db.add(payment_profile)
+    
+    # Update user payment profile flag
+    user_row = db.query(UserModel).filter(UserModel.id == current_user.id).first()
+    if user_row:
+        user_row.payment_profile_completed = 1
+    
+    db.commit()
+    
+    return {
+        "message": "Payment profile saved successfully",
+        "is_payment_profile_completed": True
+    }
+
+
+@router.get("/payment-profile/status", response_model=PaymentProfileStatus)
+def get_payment_profile_status(current_user: User = Depends(get_current_user), db: Session = Depends(get_db)):
+    """Get payment profile status (never return decrypted data)"""
+    profile = db.query(PaymentProfileModel).filter(PaymentProfileModel.user_id == current_user.id).first()
+    
+    if not profile:
+        return PaymentProfileStatus(is_completed=False, is_payment_profile_completed=False)
+    
+    # Decrypt only to get last 4 digits for display
+    account_number = decrypt_field(profile.account_number_encrypted)
+    last_4 = account_number[-4:] if len(account_number) >= 4 else "****"
+    
+    return PaymentProfileStatus(
+        is_completed=True,
+        is_payment_profile_completed=True,
+        account_holder_name=profile.account_holder_name,
+        bank_name=profile.bank_name,
+        account_last_4=last_4,
+        default_method=profile.default_method,
+        created_at=profile.created_at
+    )
+
+
+# =============================
+# Mock Payment Endpoint
+# =============================
+@router.post("/payments/mock")
+def mock_payment(
+    request: MockPaymentRequest,
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """Simulate payment processing (always succeeds for demo)"""
+    
+    # Get booking details
+    booking = db.query(ServiceBookingModel).filter(ServiceBookingModel.id == request.booking_id).first()
+    if not booking:
+        raise HTTPException(status_code=404, detail="Booking not found")
+    
+    # Determine payment method
+    payment_method = request.payment_method
+    if not payment_method:
+        # Check if user has payment profile
+        profile = db.query(PaymentProfileModel).filter(PaymentProfileModel.user_id == current_user.id).first()
+        if profile:
+            payment_method = f"saved_{profile.default_method}"
+        else:
+            payment_method = "one_time_card"
+    
+    # Create transaction record
+    transaction = TransactionModel(
+        user_id=current_user.id,
+        booking_id=request.booking_id,
+        service_type=request.service_type or booking.service_type,
+        amount=request.amount,
+        currency=request.currency,
+        payment_method=payment_method,
+        status="success",
+        created_at=datetime.now(timezone.utc)
+    )
+    db.add(transaction)
+    
+    # Update booking status to paid
+    booking.status = "Paid"
+    
+    db.commit()
+    
+    return {
+        "transaction_id": transaction.id,
+        "status": "completed",
+        "payment_method": payment_method,
+        "amount": request.amount,
+        "currency": request.currency
+    }
+
+
+# =============================
+# Transactions History
+# =============================
+@router.get("/transactions", response_model=List[TransactionRecord])
+def get_transactions(
+    service_type: Optional[str] = None,
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """Get user transaction history with optional filtering"""
+    query = db.query(TransactionModel).filter(TransactionModel.user_id == current_user.id)
+    
+    if service_type:
+        query = query.filter(TransactionModel.service_type == service_type)
+    
+    transactions = query.order_by(TransactionModel.created_at.desc()).all()
+    
+    return [
+        TransactionRecord(
+            id=t.id,
+            booking_id=t.booking_id,
+            service_type=t.service_type,
+            amount=t.amount,
+            currency=t.currency,
+            payment_method=t.payment_method,
+            status=t.status,
+            created_at=t.created_at
+        )
+        for t in transactions
+    ]
@@ -0,0 +1,70 @@
+"""WebSocket endpoint for real-time notifications (/ws/notifications)."""
+import asyncio
+import logging
+
+from fastapi import APIRouter, WebSocket, WebSocketDisconnect
+from fastapi.concurrency import run_in_threadpool
+from jose import JWTError, jwt
+
+from database import SessionLocal
+from models import NotificationModel
+from security import ALGORITHM, SECRET_KEY
+from notifications import notification_manager
+
+router = APIRouter()
+
+
+# =============================
+# WebSocket Endpoint for Real-Time Notifications
+# =============================
+def _count_unread_notifications(user_id: str) -> int:
+    with SessionLocal() as db:
+        return db.query(NotificationModel).filter(
+            NotificationModel.user_id == user_id,
+            NotificationModel.is_read == 0
+        ).count()
+
+
+@router.websocket("/ws/notifications/{token}")
+async def websocket_notification_endpoint(websocket: WebSocket, token: str):
+    """WebSocket endpoint for real-time notifications"""
+    # Validate token and get user
+    try:
+        payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
+        user_id = payload.get("sub")
+        if not user_id:
+            await websocket.close(code=4001, reason="Invalid token")
+            return
+    except JWTError as e:
+        await websocket.close(code=4001, reason="Invalid token")
+        return
+    
+    # Connect the WebSocket
+    await notification_manager.connect(websocket, user_id)
+    
+    try:
+        # Send initial unread count
+        unread_count = await run_in_threadpool(_count_unread_notifications, user_id)
+        await websocket.send_json({
+            "type": "init",
+            "unread_count": unread_count
+        })
+        
+        # Keep connection alive and listen for pings
+        while True:
+            try:
+                data = await asyncio.wait_for(websocket.receive_text(), timeout=30)
+                # Handle ping/pong to keep connection alive
+                if data == "ping":
+                    await websocket.send_text("pong")
+            except asyncio.TimeoutError:
+                # Send heartbeat
+                try:
+                    await websocket.send_json({"type": "heartbeat"})
+                except:
+                    break
+    except WebSocketDisconnect:
+        notification_manager.disconnect(websocket, user_id)
+    except Exception as e:
+        logging.error(f"WebSocket error for user {user_id}: {e}")
+        notification_manager.disconnect(websocket, user_id)
@@ -0,0 +1,1302 @@
+"""Pydantic request and response schemas shared by the routers."""
+import uuid
+from datetime import datetime, timezone
+from typing import List, Optional
+
+from pydantic import BaseModel, ConfigDict, Field
+
+
+# Define Models
+class StatusCheck(BaseModel):
+    model_config = ConfigDict(extra="ignore")  # Ignore MongoDB's _id field
+
+    id: str = Field(default_factory=lambda: str(uuid.uuid4()))
+    client_name: str
+    timestamp: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+
+class StatusCheckCreate(BaseModel):
+    client_name: str
+
+class User(BaseModel):
+    model_config = ConfigDict(extra="ignore")
+
+    id: str = Field(default_factory=lambda: str(uuid.uuid4()))
+    email: str
+    username: str
+    hashed_password: Optional[str] = None
+    created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+    profile_image: Optional[str] = None
+
+class UserCreate(BaseModel):
+    email: str
+    username: str
+    password: str
+
+class UserLogin(BaseModel):
+    email: str
+    password: str
+
+class LoginRequest(BaseModel):
+    email: str
+    password: str
+
+class Token(BaseModel):
+    access_token: str
+    token_type: str
+
+
+class UserPublic(BaseModel):
+    id: str
+    email: str
+    username: str
+    created_at: datetime
+    name: Optional[str] = None
+    phone: Optional[str] = None
+    profile_image: Optional[str] = None
+    favorite_travel_type: Optional[str] = None
+    preferred_budget_range: Optional[str] = None
+    climate_preference: Optional[str] = None
+    food_preference: Optional[str] = None
+    language_preference: Optional[str] = None
+    notifications_enabled: Optional[int] = 1
+    is_kyc_completed: Optional[int] = 0
+    payment_profile_completed: Optional[int] = 0
+
+
+class KYCSubmit(BaseModel):
+    full_name: str
+    dob: str  # YYYY-MM-DD
+    gender: str  # male / female / other
+    nationality: str
+    id_type: str  # aadhaar / passport / voterid
+    id_number: str  # will be hashed
+    address_line: str
+    city: str
+    state: str
+    country: str
+    pincode: str
+    # File URLs handled separately via multipart upload
+
+
+class KYCStatus(BaseModel):
+    is_completed: bool
+    verification_status: Optional[str] = None  # pending / verified / rejected
+    full_name: Optional[str] = None
+    created_at: Optional[datetime] = None
+
+
+class PaymentProfileSubmit(BaseModel):
+    account_holder_name: str
+    bank_name: str
+    account_number: str  # will be encrypted
+    ifsc: str  # will be encrypted
+    upi: Optional[str] = None  # will be encrypted
+    default_method: str = "bank"  # bank / upi
+
+
+class PaymentProfileStatus(BaseModel):
+    is_completed: bool
+    is_payment_profile_completed: Optional[bool] = False
+    account_holder_name: Optional[str] = None
+    bank_name: Optional[str] = None
+    account_last_4: Optional[str] = None  # masked
+    default_method: Optional[str] = None
+    created_at: Optional[datetime] = None
+
+
+class TransactionRecord(BaseModel):
+    id: str
+    booking_id: Optional[str] = None
+    service_type: Optional[str] = None
+    amount: float
+    currency: str
+
+
+class MockPaymentRequest(BaseModel):
+    booking_id: str
+    service_type: Optional[str] = None
+    amount: float
+    currency: str = "INR"
+    payment_method: Optional[str] = None
+
+
+class ProfileUpdate(BaseModel):
+    name: Optional[str] = None
+    username: Optional[str] = None
+    phone: Optional[str] = None
+    favorite_travel_type: Optional[str] = None
+    preferred_budget_range: Optional[str] = None
+    climate_preference: Optional[str] = None
+    food_preference: Optional[str] = None
+    language_preference: Optional[str] = None
+    notifications_enabled: Optional[bool] = None
+
+
+class PasswordChange(BaseModel):
+    current_password: str
+    new_password: str
+
+
+# =============================
+# Admin Panel Pydantic Schemas
+# =============================
+class AdminLogin(BaseModel):
+    email: str
+    password: str
+
+
+class AdminToken(BaseModel):
+    access_token: str
+    token_type: str
+    admin: dict
+
+
+class AdminPublic(BaseModel):
+    id: int
+    email: str
+    username: str
+    role: str
+    is_active: bool
+    last_login: Optional[datetime] = None
+    created_at: datetime
+
+
+class AdminCreate(BaseModel):
+    email: str
+    username: str
+    password: str
+    role: str = "support"
+
+
+class AdminPasswordChange(BaseModel):
+    current_password: str
+    new_password: str
+
+
+class DashboardStats(BaseModel):
+    total_users: int
+    total_bookings: int
+    total_revenue: float
+    pending_kyc: int
+    active_trips: int
+    recent_bookings: List[dict] = []
+    bookings_by_day: List[dict] = []
+    revenue_by_month: List[dict] = []
+    top_destinations: List[dict] = []
+
+
+class UserListItem(BaseModel):
+    id: str
+    email: str
+    username: str
+    name: Optional[str] = None
+    phone: Optional[str] = None
+    is_kyc_completed: int
+    is_blocked: Optional[int] = 0
+    created_at: datetime
+
+
+class UserDetail(BaseModel):
+    id: str
+    email: str
+    username: str
+    name: Optional[str] = None
+    phone: Optional[str] = None
+    is_kyc_completed: int
+    payment_profile_completed: int
+    is_blocked: Optional[int] = 0
+    created_at: datetime
+    kyc_details: Optional[dict] = None
+    bookings: List[dict] = []
+    transactions: List[dict] = []
+
+
+class KYCReviewItem(BaseModel):
+    id: int
+    user_id: str
+    user_email: str
+    user_name: str
+    full_name: str
+    id_type: str
+    verification_status: str
+    submitted_at: Optional[datetime] = None
+    created_at: datetime
+
+
+class KYCReviewAction(BaseModel):
+    action: str  # approve / reject
+    reason: Optional[str] = None
+
+
+class BookingListItem(BaseModel):
+    id: str
+    user_id: Optional[str] = None
+    user_email: Optional[str] = None
+    service_type: str
+    booking_ref: str
+    total_price: float
+    currency: str
+    status: str
+    created_at: datetime
+
+
+class TransactionListItem(BaseModel):
+    id: int
+    user_id: str
+    user_email: Optional[str] = None
+    booking_id: Optional[str] = None
+    service_type: Optional[str] = None
+    amount: float
+    currency: str
+    payment_method: str
+    status: str
+    created_at: datetime
+
+
+class DestinationCreate(BaseModel):
+    name: str
+    description: Optional[str] = None
+    category: Optional[str] = None
+    country: Optional[str] = None
+    state: Optional[str] = None
+    city: Optional[str] = None
+    image_url: Optional[str] = None
+    latitude: Optional[float] = None
+    longitude: Optional[float] = None
+    is_active: int = 1
+
+
+class DestinationUpdate(BaseModel):
+    name: Optional[str] = None
+    description: Optional[str] = None
+    category: Optional[str] = None
+    country: Optional[str] = None
+    state: Optional[str] = None
+    city: Optional[str] = None
+    image_url: Optional[str] = None
+    latitude: Optional[float] = None
+    longitude: Optional[float] = None
+    is_active: Optional[int] = None
+
+
+class NotificationCreate(BaseModel):
+    user_id: Optional[str] = None  # None = all users
+    title: str
+    message: str
+    notification_type: str = "info"
+
+
+class PlatformSettingUpdate(BaseModel):
+    maintenance_mode: Optional[bool] = None
+    bookings_enabled: Optional[bool] = None
+    new_user_registration: Optional[bool] = None
+
+
+class AuditLogItem(BaseModel):
+    id: int
+    admin_id: Optional[int] = None
+    admin_email: Optional[str] = None
+    action: str
+    entity_type: Optional[str] = None
+    entity_id: Optional[str] = None
+    details: Optional[str] = None
+    ip_address: Optional[str] = None
+    created_at: datetime
+
+
+# =============================
+# Bus Booking Pydantic Schemas
+# =============================
+class BusCityCreate(BaseModel):
+    name: str
+    state: Optional[str] = None
+    country: str = "India"
+    latitude: Optional[float] = None
+    longitude: Optional[float] = None
+
+
+class BusCityResponse(BaseModel):
+    id: int
+    name: str
+    state: Optional[str] = None
+    country: str
+    is_active: int
+
+
+class BusOperatorCreate(BaseModel):
+    name: str
+    logo_url: Optional[str] = None
+    rating: float = 4.0
+    contact_phone: Optional[str] = None
+    contact_email: Optional[str] = None
+    cancellation_policy: Optional[str] = None
+    amenities: Optional[str] = None  # JSON string
+
+
+class BusRouteCreate(BaseModel):
+    from_city_id: int
+    to_city_id: int
+    distance_km: Optional[float] = None
+    estimated_duration_mins: Optional[int] = None
+
+
+class BusCreate(BaseModel):
+    operator_id: int
+    bus_number: str
+    bus_type: str
+    total_seats: int
+    seat_layout: str = "2+2"
+    has_upper_deck: int = 0
+    amenities: Optional[str] = None
+
+
+class BusScheduleCreate(BaseModel):
+    bus_id: int
+    route_id: int
+    departure_time: str
+    arrival_time: str
+    duration_mins: Optional[int] = None
+    days_of_week: str = "0,1,2,3,4,5,6"
+    base_price: float
+    is_night_bus: int = 0
+    next_day_arrival: int = 0
+
+
+class BusBoardingPointCreate(BaseModel):
+    schedule_id: int
+    city_id: int
+    point_name: str
+    address: Optional[str] = None
+    time: str
+    latitude: Optional[float] = None
+    longitude: Optional[float] = None
+    point_type: str = "boarding"
+
+
+class BusSearchRequest(BaseModel):
+    from_city_id: int
+    to_city_id: int
+    journey_date: str  # YYYY-MM-DD
+    return_date: Optional[str] = None
+
+
+class BusSeatSelection(BaseModel):
+    seat_id: int
+    schedule_id: int
+    journey_date: str
+
+
+class BusSeatLockRequest(BaseModel):
+    schedule_id: int
+    journey_date: str
+    seat_ids: List[int]
+
+
+class BusPassengerInfo(BaseModel):
+    seat_id: int
+    name: str
+    age: int
+    gender: str
+    id_type: Optional[str] = None
+    id_number: Optional[str] = None
+
+
+class BusBookingCreate(BaseModel):
+    schedule_id: int
+    journey_date: str
+    passengers: List[BusPassengerInfo]
+    boarding_point_id: int
+    dropping_point_id: int
+    contact_name: str
+    contact_email: str
+    contact_phone: str
+    payment_method: str = "mock"
+
+
+class BusTicketResponse(BaseModel):
+    id: str
+    pnr: str
+    booking_status: str
+    journey_date: str
+    total_amount: float
+    final_amount: float
+    payment_status: str
+    operator_name: str
+    bus_type: str
+    bus_number: str
+    from_city: str
+    to_city: str
+    departure_time: str
+    arrival_time: str
+    boarding_point: str
+    boarding_time: str
+    dropping_point: str
+    dropping_time: str
+    passengers: List[dict]
+    amenities: List[str]
+    cancellation_policy: str
+    created_at: datetime
+
+
+class BusCancellationRequest(BaseModel):
+    booking_id: str
+    reason: Optional[str] = None
+
+
+# =============================
+# Flight Booking Pydantic Schemas
+# =============================
+
+class AirportCreate(BaseModel):
+    code: str
+    name: str
+    city: str
+    country: str
+    latitude: Optional[float] = None
+    longitude: Optional[float] = None
+    timezone: Optional[str] = None
+
+class AirportResponse(BaseModel):
+    id: int
+    code: str
+    name: str
+    city: str
+    country: str
+    latitude: Optional[float] = None
+    longitude: Optional[float] = None
+
+class AirlineCreate(BaseModel):
+    code: str
+    name: str
+    logo_url: Optional[str] = None
+    country: Optional[str] = None
+
+class AirlineResponse(BaseModel):
+    id: int
+    code: str
+    name: str
+    logo_url: Optional[str] = None
+    country: Optional[str] = None
+
+class AircraftCreate(BaseModel):
+    model: str
+    manufacturer: Optional[str] = None
+    total_seats: int
+    economy_seats: int
+    business_seats: int = 0
+    seat_layout: str  # e.g., "3-3"
+
+class FlightRouteCreate(BaseModel):
+    origin_airport_id: int
+    destination_airport_id: int
+    distance_km: Optional[int] = None
+    estimated_duration_mins: Optional[int] = None
+
+class FlightCreate(BaseModel):
+    flight_number: str
+    airline_id: int
+    route_id: int
+    aircraft_id: int
+    departure_time: str
+    arrival_time: str
+    duration_mins: int
+    stops: int = 0
+    stop_airports: Optional[str] = None
+    days_of_week: str
+    base_price_economy: float
+    base_price_business: Optional[float] = None
+    is_overnight: int = 0
+    is_refundable: int = 1
+    baggage_allowance: str = "15kg check-in, 7kg cabin"
+    meal_included: int = 0
+
+class FlightSearchRequest(BaseModel):
+    origin_code: str  # Airport code or city
+    destination_code: str
+    departure_date: str  # YYYY-MM-DD
+    return_date: Optional[str] = None  # For round trip
+    trip_type: str = "one_way"  # one_way, round_trip, multi_city
+    passengers_adult: int = 1
+    passengers_child: int = 0
+    passengers_infant: int = 0
+    seat_class: str = "economy"  # economy, business
+    max_stops: int = 1  # 0 = direct flights only
+
+class FlightSearchResult(BaseModel):
+    schedule_id: int
+    flight_id: int
+    flight_number: str
+    airline_id: int
+    airline_name: str
+    airline_code: str
+    airline_logo: Optional[str] = None
+    origin_code: str
+    origin_city: str
+    origin_airport: str
+    destination_code: str
+    destination_city: str
+    destination_airport: str
+    departure_time: str
+    arrival_time: str
+    departure_datetime: str
+    arrival_datetime: str
+    duration_mins: int
+    stops: int
+    stop_airports: Optional[str] = None
+    is_overnight: int
+    is_refundable: int
+    baggage_allowance: str
+    meal_included: int
+    economy_price: float
+    business_price: Optional[float] = None
+    available_economy: int
+    available_business: int
+    gate: Optional[str] = None
+    terminal: Optional[str] = None
+    status: str
+
+class FlightSeatResponse(BaseModel):
+    id: int
+    seat_number: str
+    seat_class: str
+    seat_type: str
+    row_number: int
+    column_letter: str
+    is_extra_legroom: int
+    is_emergency_exit: int
+    price_modifier: float
+    status: str
+    price: float
+
+class FlightSeatLockRequest(BaseModel):
+    schedule_id: int
+    seat_ids: List[int]
+
+class FlightPassengerInfo(BaseModel):
+    seat_id: Optional[int] = None
+    passenger_type: str  # adult, child, infant
+    title: str  # Mr, Mrs, Ms, Master, Miss
+    first_name: str
+    last_name: str
+    date_of_birth: Optional[str] = None
+    gender: str
+    nationality: Optional[str] = None
+    passport_number: Optional[str] = None
+    meal_preference: Optional[str] = None
+    special_assistance: Optional[str] = None
+    seat_class: str = "economy"
+
+class FlightBookingCreate(BaseModel):
+    trip_type: str  # one_way, round_trip, multi_city
+    segments: List[dict]  # [{schedule_id, passengers: [FlightPassengerInfo]}]
+    contact_name: str
+    contact_email: str
+    contact_phone: str
+    payment_method: str = "mock"
+
+class FlightTicketResponse(BaseModel):
+    id: int
+    booking_reference: str
+    pnr: str
+    trip_type: str
+    booking_status: str
+    total_amount: float
+    final_amount: float
+    payment_status: str
+    contact_name: str
+    contact_email: str
+    contact_phone: str
+    segments: List[dict]
+    created_at: str
+
+class FlightCancellationRequest(BaseModel):
+    booking_id: int
+    reason: Optional[str] = None
+
+
+class Trip(BaseModel):
+    model_config = ConfigDict(extra="ignore")
+
+    id: str = Field(default_factory=lambda: str(uuid.uuid4()))
+    user_id: str
+    destination: str
+    days: int
+    budget: str
+    currency: str
+    total_cost: float = 0
+    start_date: Optional[datetime] = None
+    end_date: Optional[datetime] = None
+    travelers: Optional[int] = None
+    itinerary: List[dict]
+    created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+    images: List[str] = []
+
+class TripCreate(BaseModel):
+    destination: str
+    days: int
+    budget: str
+    currency: str
+    total_cost: Optional[float] = 0
+    start_date: Optional[datetime] = None
+    end_date: Optional[datetime] = None
+    travelers: Optional[int] = None
+    itinerary: List[dict]
+
+class Booking(BaseModel):
+    id: str
+    destination: str
+    start_date: Optional[datetime] = None
+    end_date: Optional[datetime] = None
+    travelers: int
+    package_type: Optional[str] = None
+    hotel_name: Optional[str] = None
+    flight_number: Optional[str] = None
+    total_price: float
+    currency: str
+    booking_ref: str
+    status: str = "Confirmed"
+    created_at: datetime
+
+class BookingCreate(BaseModel):
+    trip_id: Optional[str] = None
+    destination: str
+    start_date: Optional[datetime] = None
+    end_date: Optional[datetime] = None
+    travelers: int = 1
+    package_type: Optional[str] = None
+    hotel_name: Optional[str] = None
+    flight_number: Optional[str] = None
+    total_price: float
+    currency: str = "INR"
+
+class GalleryPost(BaseModel):
+    id: str
+    image_url: str
+    caption: Optional[str] = None
+    location: Optional[str] = None
+    tags: List[str] = []
+    likes: int
+    created_at: datetime
+
+class Destination(BaseModel):
+    model_config = ConfigDict(extra="ignore")
+
+    id: str = Field(default_factory=lambda: str(uuid.uuid4()))
+    name: str
+    category: str
+    image: str
+    short_description: str
+    description: str
+    best_time: str
+    weather: dict
+    attractions: List[str]
+    activities: List[str]
+
+# Payment models
+class PaymentRequest(BaseModel):
+    booking_ref: Optional[str] = None
+    destination: Optional[str] = None
+    start_date: Optional[datetime] = None
+    end_date: Optional[datetime] = None
+    travelers: Optional[int] = None
+
+    full_name: str
+    email: str
+    phone: str
+    method: str  # Card / UPI / Wallet
+    credential: str  # Card Number / UPI ID / Wallet ID
+    amount: float
+
+class PaymentResponse(BaseModel):
+    status: str
+    booking_ref: str
+    receipt_url: str
+    ticket_url: Optional[str] = None  # For service-specific tickets (flight/hotel/restaurant)
+
+
+class ReceiptRecord(BaseModel):
+    id: str
+    booking_ref: str
+    destination: Optional[str] = None
+    start_date: Optional[datetime] = None
+    end_date: Optional[datetime] = None
+    travelers: Optional[int] = None
+    full_name: str
+    email: str
+    phone: str
+    payment_method: str
+    amount: float
+    receipt_url: str
+    created_at: datetime
+
+class ChecklistItem(BaseModel):
+    id: str
+    booking_id: Optional[str] = None
+    trip_id: Optional[str] = None
+    item_name: str
+    category: Optional[str] = None
+    is_packed: bool
+    is_auto_generated: bool
+    created_at: datetime
+
+class ChecklistItemCreate(BaseModel):
+    booking_id: Optional[str] = None
+    trip_id: Optional[str] = None
+    item_name: str
+    category: Optional[str] = None
+
+class BookingStatusUpdate(BaseModel):
+    status: str  # Confirmed / Cancelled / Completed
+
+
+# Service Booking Models
+class ServiceBookingCreate(BaseModel):
+    service_type: str  # flight / hotel / restaurant
+    service_json: str  # JSON string of service details
+    total_price: float
+    currency: str = "INR"
+
+
+class ServiceBookingResponse(BaseModel):
+    id: str
+    user_id: str
+    service_type: str
+    service_json: str
+    total_price: float
+    currency: str
+    booking_ref: str
+    status: str
+    created_at: datetime
+
+
+# Search Query Models
+class FlightSearchQuery(BaseModel):
+    origin: str
+    destination: str
+    date: Optional[str] = None
+    travelers: int = 1
+
+
+class HotelSearchQuery(BaseModel):
+    destination: str
+    check_in: Optional[str] = None
+    check_out: Optional[str] = None
+    guests: int = 1
+    min_rating: Optional[float] = None
+    max_price: Optional[float] = None
+
+
+# =============================
+# Hotel Pydantic Schemas (Advanced)
+# =============================
+
+class HotelSearchRequest(BaseModel):
+    city: str
+    check_in_date: Optional[str] = None  # YYYY-MM-DD
+    check_out_date: Optional[str] = None  # YYYY-MM-DD
+    adults: int = 2
+    children: int = 0
+    rooms: int = 1
+    star_rating: Optional[List[int]] = None  # [3, 4, 5]
+    min_price: Optional[float] = None
+    max_price: Optional[float] = None
+    amenities: Optional[List[str]] = None
+    hotel_type: Optional[str] = None
+    free_cancellation: Optional[bool] = None
+    breakfast_included: Optional[bool] = None
+    sort_by: str = "popularity"  # popularity, price_low, price_high, rating, distance
+    page: int = 1
+    limit: int = 20
+    cursor: Optional[str] = None  # next_cursor of the previous page; takes precedence over page
+
+
+class HotelCityResponse(BaseModel):
+    id: int
+    name: str
+    state: str
+    country: str
+    hotel_count: int
+
+
+class HotelAmenity(BaseModel):
+    name: str
+    icon: str
+    category: str
+
+
+class HotelImage(BaseModel):
+    url: str
+    caption: Optional[str] = None
+    is_primary: bool = False
+
+
+class HotelPolicy(BaseModel):
+    title: str
+    description: str
+    category: str  # check_in, cancellation, children, pets, etc.
+
+
+class HotelListItem(BaseModel):
+    id: int
+    name: str
+    slug: str
+    star_category: int
+    hotel_type: Optional[str]
+    city: str
+    state: str
+    address: Optional[str]
+    latitude: Optional[float]
+    longitude: Optional[float]
+    rating: float
+    reviews_count: int
+    price_per_night: float
+    original_price: Optional[float]
+    currency: str
+    primary_image: Optional[str]
+    amenities: List[str]
+    free_cancellation: bool
+    breakfast_included: bool
+    distance_from_center: Optional[float]
+    landmark: Optional[str]
+
+
+class HotelDetailResponse(BaseModel):
+    id: int
+    name: str
+    slug: str
+    description: Optional[str]
+    star_category: int
+    hotel_type: Optional[str]
+    city: str
+    state: str
+    country: str
+    address: Optional[str]
+    latitude: Optional[float]
+    longitude: Optional[float]
+    landmark: Optional[str]
+    distance_from_center: Optional[float]
+    rating: float
+    reviews_count: int
+    price_per_night: float
+    original_price: Optional[float]
+    currency: str
+    amenities: List[dict]
+    images: List[dict]
+    policies: List[dict]
+    check_in_time: str
+    check_out_time: str
+    contact_phone: Optional[str]
+    contact_email: Optional[str]
+    gst_number: Optional[str]
+    free_cancellation: bool
+    breakfast_included: bool
+    total_rooms: int
+
+
+class HotelRoomResponse(BaseModel):
+    id: int
+    hotel_id: int
+    room_type: str
+    room_name: str
+    description: Optional[str]
+    max_guests: int
+    max_adults: int
+    max_children: int
+    bed_type: str
+    room_size_sqft: Optional[int]
+    view_type: Optional[str]
+    price_per_night: float
+    original_price: Optional[float]
+    discount_percent: float
+    amenities: List[str]
+    images: List[str]
+    inclusions: List[str]
+    cancellation_policy: Optional[str]
+    available_rooms: int
+    is_refundable: bool
+
+
+class HotelBookingCreate(BaseModel):
+    hotel_id: int
+    room_id: int
+    check_in_date: str
+    check_out_date: str
+    rooms_booked: int = 1
+    adults: int = 2
+    children: int = 0
+    guest_name: str
+    guest_email: str
+    guest_phone: str
+    guest_nationality: str = "Indian"
+    special_requests: Optional[str] = None
+
+
+class HotelBookingResponse(BaseModel):
+    booking_id: str
+    booking_reference: str
+    hotel_name: str
+    hotel_address: Optional[str]
+    hotel_phone: Optional[str]
+    hotel_email: Optional[str]
+    hotel_star: int
+    hotel_gst: Optional[str]
+    room_type: str
+    room_name: str
+    bed_type: str
+    check_in_date: str
+    check_out_date: str
+    check_in_time: str
+    check_out_time: str
+    nights: int
+    rooms_booked: int
+    adults: int
+    children: int
+    guest_name: str
+    guest_email: str
+    guest_phone: str
+    guest_nationality: str
+    special_requests: Optional[str]
+    base_price: float
+    taxes: float
+    service_charge: float
+    discount_amount: float
+    total_amount: float
+    currency: str
+    payment_status: str
+    payment_method: Optional[str]
+    transaction_id: Optional[str]
+    booking_status: str
+    qr_code: Optional[str]
+    created_at: datetime
+
+
+class HotelReviewCreate(BaseModel):
+    hotel_id: int
+    booking_id: Optional[int] = None
+    rating: float
+    cleanliness_rating: Optional[float] = None
+    service_rating: Optional[float] = None
+    location_rating: Optional[float] = None
+    value_rating: Optional[float] = None
+    title: Optional[str] = None
+    review_text: Optional[str] = None
+    pros: Optional[str] = None
+    cons: Optional[str] = None
+    travel_type: Optional[str] = None
+
+
+class HotelReviewResponse(BaseModel):
+    id: int
+    hotel_id: int
+    user_name: str
+    rating: float
+    cleanliness_rating: Optional[float]
+    service_rating: Optional[float]
+    location_rating: Optional[float]
+    value_rating: Optional[float]
+    title: Optional[str]
+    review_text: Optional[str]
+    pros: Optional[str]
+    cons: Optional[str]
+    travel_type: Optional[str]
+    is_verified: bool
+    helpful_count: int
+    created_at: datetime
+
+
+# =============================
+# Advanced Restaurant Pydantic Schemas
+# =============================
+
+class RestaurantSearchRequest(BaseModel):
+    city: str
+    date: Optional[str] = None  # YYYY-MM-DD
+    time: Optional[str] = None  # HH:MM
+    guests: int = 2
+    cuisines: Optional[List[str]] = None
+    is_pure_veg: Optional[bool] = None
+    has_bar: Optional[bool] = None
+    price_category: Optional[str] = None  # budget, moderate, expensive, premium
+    min_rating: Optional[float] = None
+    has_outdoor_seating: Optional[bool] = None
+    has_ac: Optional[bool] = None
+    sort_by: str = "popularity"  # popularity, rating, price_low, price_high, distance
+    page: int = 1
+    limit: int = 20
+    cursor: Optional[str] = None  # next_cursor of the previous page; takes precedence over page
+    include_total: Optional[bool] = None  # counted by default only for page-number requests
+
+
+class RestaurantCityResponse(BaseModel):
+    city: str
+    restaurant_count: int
+
+
+class RestaurantListItem(BaseModel):
+    id: int
+    name: str
+    slug: Optional[str]
+    city: str
+    locality: Optional[str]
+    address: Optional[str]
+    cuisines: List[str]
+    restaurant_type: Optional[str]
+    rating: float
+    total_reviews: int
+    price_for_two: int
+    price_category: str
+    is_pure_veg: bool
+    has_bar: bool
+    is_family_friendly: bool
+    has_outdoor_seating: bool
+    has_ac: bool
+    has_delivery: bool
+    avg_delivery_time: int
+    opening_time: str
+    closing_time: str
+    is_open_now: bool
+    cover_image: Optional[str]
+    images: List[str]
+    amenities: List[str]
+    is_featured: bool
+    is_trending: bool
+
+
+class RestaurantDetailResponse(BaseModel):
+    id: int
+    name: str
+    slug: Optional[str]
+    description: Optional[str]
+    city: str
+    locality: Optional[str]
+    address: Optional[str]
+    latitude: Optional[float]
+    longitude: Optional[float]
+    cuisines: List[str]
+    restaurant_type: Optional[str]
+    rating: float
+    total_reviews: int
+    food_rating: Optional[float]
+    service_rating: Optional[float]
+    ambience_rating: Optional[float]
+    price_for_two: int
+    price_category: str
+    is_pure_veg: bool
+    has_bar: bool
+    is_family_friendly: bool
+    has_outdoor_seating: bool
+    has_ac: bool
+    has_wifi: bool
+    has_parking: bool
+    accepts_reservations: bool
+    has_live_music: bool
+    has_private_dining: bool
+    has_delivery: bool
+    has_takeaway: bool
+    avg_delivery_time: int
+    opening_time: str
+    closing_time: str
+    is_open_now: bool
+    weekly_off: Optional[str]
+    images: List[dict]
+    logo_url: Optional[str]
+    cover_image: Optional[str]
+    phone: Optional[str]
+    email: Optional[str]
+    website: Optional[str]
+    amenities: List[dict]
+    is_featured: bool
+    is_trending: bool
+
+
+class RestaurantTableResponse(BaseModel):
+    id: int
+    restaurant_id: int
+    table_number: str
+    capacity: int
+    table_type: str
+    seating_type: str
+    is_ac: bool
+    floor: int
+    description: Optional[str]
+    min_booking_amount: int
+    is_available: bool = True
+
+
+class TimeSlotResponse(BaseModel):
+    slot_time: str
+    slot_type: str
+    is_peak_hour: bool
+    peak_hour_charge_percent: float
+    is_available: bool
+    available_tables: int
+
+
+class MenuCategoryResponse(BaseModel):
+    id: int
+    name: str
+    description: Optional[str]
+    image_url: Optional[str]
+    items_count: int
+
+
+class MenuItemResponse(BaseModel):
+    id: int
+    restaurant_id: int
+    category_id: Optional[int]
+    category_name: Optional[str]
+    name: str
+    description: Optional[str]
+    price: float
+    discounted_price: Optional[float]
+    is_veg: bool
+    is_bestseller: bool
+    is_chef_special: bool
+    is_new: bool
+    spice_level: int
+    prep_time_mins: int
+    serves: int
+    image_url: Optional[str]
+    available_for_preorder: bool
+    is_available: bool
+
+
+class TableBookingCreate(BaseModel):
+    restaurant_id: int
+    booking_date: str  # YYYY-MM-DD
+    time_slot: str  # HH:MM
+    guests_count: int
+    table_id: Optional[int] = None
+    seating_preference: Optional[str] = None  # indoor, outdoor, ac, non_ac
+    guest_name: str
+    guest_phone: str
+    guest_email: Optional[str] = None
+    special_requests: Optional[str] = None
+    occasion: Optional[str] = None  # Birthday, Anniversary, Date, Business
+    payment_method: Optional[str] = None
+
+
+class TableBookingResponse(BaseModel):
+    id: int
+    booking_reference: str
+    restaurant_id: int
+    restaurant_name: str
+    restaurant_address: Optional[str]
+    restaurant_phone: Optional[str]
+    booking_date: str
+    time_slot: str
+    guests_count: int
+    table_number: Optional[str]
+    table_type: Optional[str]
+    seating_preference: Optional[str]
+    guest_name: str
+    guest_phone: str
+    guest_email: Optional[str]
+    special_requests: Optional[str]
+    occasion: Optional[str]
+    base_amount: float
+    peak_hour_charge: float
+    service_charge: float
+    gst: float
+    total_amount: float
+    advance_paid: float
+    payment_status: str
+    payment_method: Optional[str]
+    booking_status: str
+    qr_code: Optional[str]
+    created_at: datetime
+
+
+class PreOrderCreate(BaseModel):
+    restaurant_id: int
+    booking_id: Optional[int] = None
+    order_date: str  # YYYY-MM-DD
+    arrival_time: str  # HH:MM
+    guests_count: int
+    guest_name: str
+    guest_phone: str
+    special_instructions: Optional[str] = None
+    items: List[dict]  # [{item_id, quantity}]
+    payment_method: Optional[str] = None
+
+
+class PreOrderResponse(BaseModel):
+    id: int
+    order_reference: str
+    restaurant_id: int
+    restaurant_name: str
+    booking_id: Optional[int]
+    order_date: str
+    arrival_time: str
+    guests_count: int
+    guest_name: str
+    guest_phone: str
+    special_instructions: Optional[str]
+    items: List[dict]
+    estimated_prep_time: int
+    ready_by_time: Optional[str]
+    subtotal: float
+    gst: float
+    packaging_charge: float
+    total_amount: float
+    payment_status: str
+    payment_method: Optional[str]
+    order_status: str
+    qr_code: Optional[str]
+    created_at: datetime
+
+
+class JoinQueueRequest(BaseModel):
+    restaurant_id: int
+    guests_count: int
+    guest_name: str
+    guest_phone: str
+
+
+class QueueResponse(BaseModel):
+    id: int
+    queue_number: str
+    restaurant_id: int
+    restaurant_name: str
+    queue_date: str
+    join_time: datetime
+    guests_count: int
+    guest_name: str
+    guest_phone: str
+    position: int
+    estimated_wait_mins: int
+    status: str
+    qr_code: Optional[str]
+
+
+class RestaurantReviewCreate(BaseModel):
+    restaurant_id: int
+    booking_id: Optional[int] = None
+    overall_rating: float
+    food_rating: Optional[float] = None
+    service_rating: Optional[float] = None
+    ambience_rating: Optional[float] = None
+    value_rating: Optional[float] = None
+    title: Optional[str] = None
+    review_text: Optional[str] = None
+    dining_type: Optional[str] = None
+    visit_type: Optional[str] = None
+
+
+class RestaurantReviewResponse(BaseModel):
+    id: int
+    restaurant_id: int
+    user_name: str
+    overall_rating: float
+    food_rating: Optional[float]
+    service_rating: Optional[float]
+    ambience_rating: Optional[float]
+    value_rating: Optional[float]
+    title: Optional[str]
+    review_text: Optional[str]
+    dining_type: Optional[str]
+    visit_type: Optional[str]
+    images: List[str]
+    is_verified: bool
+    helpful_count: int
+    created_at: datetime
@@ -0,0 +1,42 @@
+#!/usr/bin/env python3
+"""Create the declared indexes an existing database is missing.
+
+The server does this at startup; run it by hand to index a large MySQL
+database before deploying, or to see what is missing:
+
+    python scripts/apply_indexes.py           (from backend/)
+    python scripts/apply_indexes.py --check   # list missing indexes only
+
+Uses MYSQL_URL from the environment / backend/.env, like the server.
+"""
+import argparse
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+import database  # noqa: E402
+import models  # noqa: E402,F401  (registers the tables on Base.metadata)
+from db_indexes import ensure_indexes, missing_indexes  # noqa: E402
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--check", action="store_true", help="list missing indexes without creating them")
+    args = parser.parse_args()
+
+    missing = missing_indexes(database.engine, database.Base.metadata)
+    for index in missing:
+        print(f"missing {index.name} on {index.table.name}({', '.join(c.name for c in index.columns)})")
+    if args.check:
+        print(f"{len(missing)} declared indexes missing")
+        return 1 if missing else 0
+    start = time.perf_counter()
+    created = ensure_indexes(database.engine, database.Base.metadata)
+    print(f"created {len(created)} of {len(missing)} missing indexes in {time.perf_counter() - start:.1f}s")
+    return 0 if len(created) == len(missing) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,53 @@
+#!/usr/bin/env python3
+"""Rebuild the daily booking/revenue rollups from the source tables.
+
+The server keeps booking_daily_rollups up to date on every ORM write and
+fills it once at startup when it is empty. Run this after bulk SQL edits
+to bookings, service_bookings or transactions, or to check for drift:
+
+    python scripts/backfill_booking_rollups.py           (from backend/)
+    python scripts/backfill_booking_rollups.py --check   # report drift only
+
+Uses MYSQL_URL from the environment / backend/.env, like the server.
+"""
+import argparse
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+import database  # noqa: E402
+import models  # noqa: E402
+
+
+def snapshot(db):
+    m = models.BookingDailyRollupModel
+    return {(r.day, r.kind, r.service_type, r.status): (r.total_count, round(r.total_amount, 2))
+            for r in db.query(m)}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--check", action="store_true", help="compare with a rebuild, then roll back")
+    args = parser.parse_args()
+
+    database.Base.metadata.create_all(bind=database.engine, tables=[models.BookingDailyRollupModel.__table__])
+    with database.SessionLocal() as db:
+        before = snapshot(db)
+        start = time.perf_counter()
+        rows = models.booking_rollups.rebuild(db, commit=not args.check)
+        elapsed = time.perf_counter() - start
+        after = snapshot(db)
+        if args.check:
+            db.rollback()
+        drift = sorted(key for key in before.keys() | after.keys() if before.get(key) != after.get(key))
+        for key in drift[:20]:
+            print(f"drift {key}: stored {before.get(key)} actual {after.get(key)}")
+        verb = "checked" if args.check else "rebuilt"
+        print(f"{verb} {rows} rollup rows in {elapsed:.2f}s; {len(drift)} differed")
+    return 1 if args.check and drift else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""Benchmark: Gemini calls saved by the AI chat answer cache.
+
+Replays a synthetic chat log (intents x cities, each phrased several ways)
+and reports the hit rate with the exact layer only and with the MinHash
+similarity layer, the cost of a lookup, and any wrong answers served
+(a hit whose stored answer was for a different question). Then
+drives /api/ai/chat against a fake Gemini server to check that hits skip
+the upstream call and that `bypass_cache` does not.
+
+Usage (from backend/): python scripts/bench_ai_answer_cache.py
+"""
+import os
+import random
+import time
+
+os.environ["GEMINI_API_KEY"] = "bench-key"
+
+from fastapi.testclient import TestClient  # noqa: E402
+
+from bench_common import StubHTTPServer, load_server  # noqa: E402
+
+server = load_server()
+from answer_cache import AnswerCache, ai_answer_cache  # noqa: E402
+from gemini_client import gemini  # noqa: E402
+
+MESSAGES = 5000
+INTENTS = [
+    "best hotels in {city}",
+    "cheap flights to {city}",
+    "top restaurants in {city}",
+    "things to do in {city}",
+    "best time to visit {city}",
+    "3 day itinerary for {city}",
+    "5 day itinerary for {city}",
+    "cheap flights from {city} to Delhi",
+    "cheap flights from Delhi to {city}",
+]
+POLICIES = ["refund policy for flights", "hotel cancellation policy", "how do I change my booking date"]
+CITIES = ["Goa", "Delhi", "Mumbai", "Jaipur", "Kolkata", "Manali", "Kochi", "Udaipur", "Shimla", "Agra"]
+PHRASINGS = [
+    "{q}", "{Q}?", "please {q}", "can you show me {q}", "{q} please", "what are the {q}",
+    "Hi! {Q}", "I want to know the {q}", "tell me {q} thanks", "{Q}!!",
+    # Extra words the normaliser keeps; only the similarity layer matches these
+    "{Q} asap", "quick question, {q}", "{q} this weekend", "{Q} - urgent",
+]
+
+
+def chat_log(rng):
+    topics = [(i, c) for i in INTENTS for c in CITIES] + [(p, None) for p in POLICIES]
+    weights = [1 / (rank + 1) for rank in range(len(topics))]  # a few hot questions
+    for _ in range(MESSAGES):
+        intent, city = rng.choices(topics, weights)[0]
+        question = intent.format(city=city) if city else intent
+        phrasing = rng.choice(PHRASINGS)
+        yield question, phrasing.format(q=question, Q=question.capitalize())
+
+
+def replay(cache, log):
+    wrong = 0
+    start = time.perf_counter()
+    for question, message in log:
+        answer, _ = cache.lookup(message, {})
+        if answer is None:
+            cache.store(message, {}, question)
+        elif answer != question:
+            wrong += 1
+    elapsed = time.perf_counter() - start
+    return cache.stats(), wrong, elapsed / len(log) * 1e6
+
+
+def fake_gemini(path, query, body=None):
+    if ":generateContent" in path:
+        text = body["contents"][0]["parts"][0]["text"].rsplit("\n", 1)[-1]
+        return 200, {"candidates": [{"content": {"parts": [{"text": f"Answer to: {text}"}]}}]}
+    return 200, {"models": [{"name": "models/gemini-1.5-flash", "supportedGenerationMethods": ["generateContent"]}]}
+
+
+def main():
+    log = list(chat_log(random.Random(7)))
+    print(f"{'layer':<22} {'hit rate':>9} {'wrong':>6} {'us/msg':>8}   ({MESSAGES} messages)")
+    for name, similarity in (("exact only", None), ("exact + MinHash 0.7", 0.7), ("exact + MinHash 0.5", 0.5)):
+        stats, wrong, per_message = replay(AnswerCache(similarity=similarity), log)
+        print(f"{name:<22} {stats['hit_rate']:>9.3f} {wrong:>6} {per_message:>8.1f}")
+        assert wrong == 0, f"{name}: served {wrong} answers for a different question"
+
+    with StubHTTPServer({"/models": fake_gemini}) as stub, TestClient(server.app) as client:
+        gemini.base_url = stub.base_url
+        ai_answer_cache.clear()
+
+        def ask(message, **extra):
+            response = client.post("/api/ai/chat", json={"message": message, **extra})
+            assert response.status_code == 200, response.text
+            return response.json()
+
+        first = ask("Best hotels in Goa?")
+        calls = stub.requests
+        again = ask("can you show me the best hotels in goa please")
+        assert again == {"answer": first["answer"], "cached": True} and stub.requests == calls
+        assert ask("Best hotels in Goa asap")["cached"] is True and ai_answer_cache.similar_hits == 1
+        assert ask("Best hotels in Delhi?")["cached"] is False
+        calls = stub.requests
+        assert ask("Best hotels in Goa?", bypass_cache=True)["cached"] is False and stub.requests == calls + 1
+        print(f"endpoint stats: {ai_answer_cache.stats()}")
+    print("OK: near-duplicate prompts reuse answers without cross-topic mistakes")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,149 @@
+#!/usr/bin/env python3
+"""Benchmark: grounding AI chat prompts in real hotel/flight/restaurant data.
+
+Seeds hotels, restaurants and flights through the real /seed handlers, then
+  * checks that travel questions get a block of real listings (names that
+    exist in the tables, the right city and direction) and that other
+    messages get none,
+  * checks every block stays inside AI_CONTEXT_TOKEN_BUDGET,
+  * times prompt assembly cold (summaries loaded from the database) and
+    warm (precomputed per-city summaries, target < 5 ms),
+  * checks /api/ai/data/* now returns rows from the tables, that a
+    cuisine filter or a limit above the summary size sees every matching
+    row, and that unknown locations there do not grow the summary cache.
+
+Usage (from backend/): python scripts/bench_ai_context.py
+"""
+import time
+
+from fastapi.testclient import TestClient
+
+from bench_common import load_server
+
+server = load_server()
+from database import SessionLocal  # noqa: E402
+from models import HotelModel, RestaurantModel  # noqa: E402
+from routers.ai import AI_CONTEXT_CANDIDATES, ai_grounding  # noqa: E402
+from routers.flight import seed_flight_data  # noqa: E402
+from routers.hotel import seed_hotel_data  # noqa: E402
+from routers.restaurant import seed_restaurants  # noqa: E402
+from ai_context import CHARS_PER_TOKEN  # noqa: E402
+
+grounding = ai_grounding
+MESSAGES = [
+    "best hotels in Goa",
+    "where should we stay in Jaipur for a honeymoon?",
+    "good restaurants in Mumbai",
+    "cheap flights from Delhi to Mumbai",
+    "any flights to Bangalore from Chennai next week",
+    "plan a 3 day trip to Kolkata",
+    "hotels and food in Delhi",
+]
+NO_DATA = ["what is your refund policy?", "hello there", "best hotels anywhere", "tell me about Goa"]
+
+
+def cold_assemble(message):
+    grounding.invalidate()
+    start = time.perf_counter()
+    with SessionLocal() as db:
+        grounding.prepare(db, message)
+    block = grounding.assemble(message)
+    return (time.perf_counter() - start) * 1000, block
+
+
+def warm_assemble(message, repeat=200):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        assert grounding.is_ready(message)
+        block = grounding.assemble(message)
+    return (time.perf_counter() - start) * 1000 / repeat, block
+
+
+def check_data_queries(client):
+    """?cuisine= and large limits are answered from the tables, not the top-10 summary"""
+    with SessionLocal() as db:
+        rows = db.query(RestaurantModel).filter(RestaurantModel.city == "Mumbai", RestaurantModel.is_active == 1) \
+            .order_by(RestaurantModel.rating.desc(), RestaurantModel.total_reviews.desc()).all()
+    # A cuisine served outside the top 10 (or listed after a restaurant's first three)
+    cuisine = next(c for r in rows[10:] + rows for c in (r.cuisines or [])[3:] + (r.cuisines or []))
+    expected = [r.name for r in rows if any(cuisine.lower() in c.lower() for c in r.cuisines or [])][:50]
+    found = client.get("/api/ai/data/restaurants",
+                       params={"location": "Mumbai", "cuisine": cuisine, "limit": 50}).json()
+    assert [r["name"] for r in found["restaurants"]] == expected, (cuisine, found)
+    many = client.get("/api/ai/data/restaurants", params={"location": "Mumbai", "limit": 50}).json()
+    assert many["count"] == min(len(rows), 50), many["count"]
+    many = client.get("/api/ai/data/hotels", params={"location": "Delhi", "limit": 50}).json()
+    assert many["count"] > AI_CONTEXT_CANDIDATES and all("Delhi" in h["location"] for h in many["hotels"]), many
+    print(f"cuisine {cuisine!r} in Mumbai: {len(expected)} restaurants of {len(rows)}; "
+          f"limit 50 gives {many['count']} Delhi hotels")
+
+
+def main():
+    with SessionLocal() as db:
+        seed_hotel_data(db)
+        seed_restaurants(db)
+        seed_flight_data(db)
+        hotel_names = {n for (n,) in db.query(HotelModel.name)}
+        restaurant_names = {n for (n,) in db.query(RestaurantModel.name)}
+
+    print(f"{'message':<48} {'cold ms':>8} {'warm ms':>8} {'tokens':>7}")
+    for message in MESSAGES:
+        cold, block = cold_assemble(message)
+        assert block, f"no grounding for {message!r}"
+        with SessionLocal() as db:
+            summaries = grounding.warm(db)
+        warm, again = warm_assemble(message)
+        assert again == block
+        tokens = len(block) / CHARS_PER_TOKEN
+        assert tokens <= grounding.token_budget, (message, tokens)
+        assert warm < 5, f"warm assembly took {warm:.2f} ms"
+        print(f"{message:<48} {cold:>8.2f} {warm:>8.3f} {tokens:>7.0f}")
+
+    def assemble(message):
+        if not grounding.is_ready(message):
+            with SessionLocal() as db:
+                grounding.prepare(db, message)
+        return grounding.assemble(message)
+
+    block = assemble("best hotels in Goa")
+    listed = [line[2:].split(":")[0] for line in block.splitlines() if line.startswith("- ")]
+    assert block.startswith("Hotels in Goa") and listed and set(listed) <= hotel_names, block
+    block = assemble("good restaurants in Mumbai")
+    listed = {line[2:].split(" (")[0].split(":")[0] for line in block.splitlines() if line.startswith("- ")}
+    assert listed and listed <= restaurant_names, block
+    block = assemble("cheap flights from Delhi to Mumbai")
+    assert block.startswith("Flights from Delhi to Mumbai") and "DEL-BOM" in block, block
+    block = assemble("any flights to Bangalore from Chennai next week")
+    assert block.startswith("Flights from Chennai to Bangalore"), block
+    for message in NO_DATA:
+        assert assemble(message) == "", message
+    print(f"no block for {len(NO_DATA)} non-data messages; {summaries} per-city summaries warm")
+
+    grounding.token_budget = 60
+    tight = assemble("hotels and food in Delhi")
+    assert tight and len(tight) <= 60 * CHARS_PER_TOKEN, tight
+    grounding.token_budget = 400
+
+    with TestClient(server.app) as client:
+        hotels = client.get("/api/ai/data/hotels", params={"location": "delhi", "limit": 3}).json()
+        assert hotels["count"] == 3 and all("Delhi" in h["location"] and h["name"] in hotel_names
+                                            for h in hotels["hotels"]), hotels
+        flights = client.get("/api/ai/data/flights", params={"origin": "Delhi", "destination": "Mumbai"}).json()
+        assert flights["count"] and all(f["origin"] == "Delhi" and f["destination"] == "Mumbai"
+                                        for f in flights["flights"]), flights
+        prices = [f["price"] for f in flights["flights"]]
+        assert prices == sorted(prices)
+        restaurants = client.get("/api/ai/data/restaurants", params={"location": "Mumbai"}).json()
+        assert restaurants["count"] and all(r["name"] in restaurant_names for r in restaurants["restaurants"])
+        check_data_queries(client)
+        cached = grounding.stats()["summaries"]
+        for n in range(50):
+            client.get("/api/ai/data/hotels", params={"location": f"nowhere {n}"})
+            client.get("/api/ai/data/flights", params={"origin": f"nowhere {n}", "destination": "Mumbai"})
+        assert grounding.stats()["summaries"] == cached, "unknown locations were cached"
+    print(f"stats: {grounding.stats()}")
+    print("OK: prompts carry real, budgeted listings only when the message needs them")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""Benchmark: streamed (SSE) vs buffered AI chat against a fake Gemini.
+
+Runs the app under uvicorn and points the Gemini client at a stub whose
+answers take CHUNKS x CHUNK_DELAY seconds to generate, then compares the
+time to the first byte of answer text for
+  * POST /api/ai/chat          (waits for the whole generateContent body)
+  * POST /api/ai/chat/stream   (forwards streamGenerateContent chunks)
+and checks that a browser hanging up mid-answer closes the upstream stream.
+
+Usage (from backend/): python scripts/bench_ai_stream.py
+"""
+import json
+import os
+import time
+
+os.environ["GEMINI_API_KEY"] = "bench-key"
+
+import httpx  # noqa: E402
+
+from bench_common import StubHTTPServer, load_server, run_uvicorn  # noqa: E402
+
+server = load_server()
+from gemini_client import gemini  # noqa: E402
+
+CHUNKS = 20
+CHUNK_DELAY = 0.05
+WORDS = "Goa has great beach hotels near Calangute and Baga ".split()
+
+
+def sse_answer():
+    for i in range(CHUNKS):
+        time.sleep(CHUNK_DELAY)
+        chunk = {"candidates": [{"content": {"parts": [{"text": f"{WORDS[i % len(WORDS)]} "}]}}],
+                 "usageMetadata": {"candidatesTokenCount": i + 1}}
+        yield f"data: {json.dumps(chunk)}\r\n\r\n"
+
+
+def route(path, query, body=None):
+    if path.endswith(":streamGenerateContent"):
+        assert query.get("alt") == "sse"
+        return 200, sse_answer()
+    if path.endswith(":generateContent"):
+        time.sleep(CHUNKS * CHUNK_DELAY)
+        text = " ".join(WORDS[i % len(WORDS)] for i in range(CHUNKS))
+        return 200, {"candidates": [{"content": {"parts": [{"text": text}]}}]}
+    return 200, {"models": [{"name": "models/gemini-1.5-flash", "supportedGenerationMethods": ["generateContent"]}]}
+
+
+def buffered(client):
+    start = time.perf_counter()
+    response = client.post("/api/ai/chat", json={"message": "best hotels in Goa", "bypass_cache": True})
+    assert response.status_code == 200 and response.json()["answer"].startswith("Goa")
+    elapsed = (time.perf_counter() - start) * 1000
+    return elapsed, elapsed
+
+
+def streamed(client, hang_up=False):
+    start = time.perf_counter()
+    first = None
+    events = []
+    with client.stream("POST", "/api/ai/chat/stream", json={"message": "best hotels in Goa", "bypass_cache": True}) as response:
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/event-stream")
+        for line in response.iter_lines():
+            if line.startswith("data:") and first is None:
+                first = (time.perf_counter() - start) * 1000
+                if hang_up:
+                    break
+            if line:
+                events.append(line)
+    assert hang_up or events[-2] == "event: done", events[-3:]
+    return first, (time.perf_counter() - start) * 1000
+
+
+def main():
+    with StubHTTPServer({"/models": route}) as stub:
+        gemini.base_url = stub.base_url
+        app_server, base_url = run_uvicorn(server.app)
+        try:
+            with httpx.Client(base_url=base_url, timeout=30) as client:
+                streamed(client)  # warm the model list
+                print(f"{'endpoint':<22} {'first text ms':>14} {'total ms':>10}")
+                for name, run in (("/api/ai/chat", buffered), ("/api/ai/chat/stream", streamed)):
+                    first, total = min(run(client) for _ in range(3))
+                    print(f"{name:<22} {first:>14.1f} {total:>10.1f}")
+
+                streamed(client, hang_up=True)
+                time.sleep(CHUNK_DELAY * 4)
+                assert stub.aborted == 1, "upstream stream should be closed when the browser leaves"
+                assert gemini.stream_metrics.cancelled == 1
+        finally:
+            app_server.should_exit = True
+    print(f"stream metrics: {gemini.stream_metrics.stats()}")
+    print("OK: chunks forwarded as SSE, hang-ups abort the upstream request")
+
+
+if __name__ == "__main__":
+    main()
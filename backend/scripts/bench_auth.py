@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+"""Benchmark: per-request cost of `get_current_user` with and without the user cache.
+
+Signs a token for a seeded user and resolves it repeatedly, first with the
+cache cleared before every call (decode + users lookup, the old behaviour)
+and then warm. Also checks that a profile update drops the cached entry.
+
+Usage (from backend/): python scripts/bench_auth.py [--calls N]
+"""
+import argparse
+import time
+
+from fastapi.security import HTTPAuthorizationCredentials
+
+from bench_common import QueryCounter, load_server
+
+load_server()
+from database import SessionLocal, engine  # noqa: E402
+from models import UserModel  # noqa: E402
+from schemas import ProfileUpdate  # noqa: E402
+from security import create_access_token, get_current_user, get_password_hash  # noqa: E402
+from routers.account import update_profile  # noqa: E402
+from auth_cache import auth_cache  # noqa: E402
+
+
+def per_call_us(fn, calls):
+    start = time.perf_counter()
+    for _ in range(calls):
+        fn()
+    return (time.perf_counter() - start) / calls * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--calls", type=int, default=2000)
+    args = parser.parse_args()
+
+    db = SessionLocal()
+    db.add(UserModel(id="bench-user", email="bench@example.com", username="bench",
+                            hashed_password=get_password_hash("secret")))
+    db.commit()
+    token = create_access_token({"sub": "bench@example.com"})
+    creds = HTTPAuthorizationCredentials(scheme="Bearer", credentials=token)
+
+    def cold():
+        auth_cache.clear()
+        return get_current_user(creds, db)
+
+    def warm():
+        return get_current_user(creds, db)
+
+    with QueryCounter(engine) as cold_q:
+        cold()
+    with QueryCounter(engine) as warm_q:
+        warm()
+
+    cold_us = per_call_us(cold, args.calls)
+    warm_us = per_call_us(warm, args.calls)
+    print(f"{'path':<10} {'queries':>8} {'us/call':>9}")
+    print(f"{'uncached':<10} {cold_q.count:>8} {cold_us:>9.1f}")
+    print(f"{'cached':<10} {warm_q.count:>8} {warm_us:>9.1f}")
+    print(f"speedup: {cold_us / warm_us:.0f}x  stats: {auth_cache.stats()}")
+
+    update_profile(ProfileUpdate(username="renamed"), warm(), db)
+    assert warm().username == "renamed", "profile update did not invalidate the cache"
+    assert warm_q.count == 0
+    db.close()
+    print("OK: cached auth skips decode and lookup; invalidation works")
+
+
+if __name__ == "__main__":
+    main()
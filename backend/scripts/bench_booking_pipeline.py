@@ -0,0 +1,188 @@
+#!/usr/bin/env python3
+"""Benchmark: statements per bus / flight booking for parties of 1 to 9.
+
+Books a bus seat set and a round-trip flight (two segments, with
+children, an infant without a seat and a passenger without a seat
+choice) for every party size through the real /book handlers, counts the
+SQL statements each booking sends, and fails unless the count is the same
+for 1 and for 9 passengers. Passenger rows, fares and booked seat rows
+are checked after every booking.
+
+With --baseline REV the handlers of routers/bus.py and routers/flight.py
+as of that git revision are loaded from git and run on the same requests
+(on other seats), to compare statement counts and check the fares match.
+
+Usage (from backend/): python scripts/bench_booking_pipeline.py [--baseline REV]
+"""
+import argparse
+from datetime import date, datetime, timedelta
+
+from bench_common import QueryCounter, load_module_at, load_server, timed
+
+load_server()
+from database import SessionLocal, engine  # noqa: E402
+from models import (AircraftModel, BusBookingModel, BusModel, BusOperatorModel, BusPassengerModel,  # noqa: E402
+                    BusScheduleModel, BusSeatAvailabilityModel, BusSeatModel, FlightBookingModel, FlightModel,
+                    FlightPassengerModel, FlightScheduleModel, FlightSeatAvailabilityModel, FlightSeatModel)
+from schemas import BusBookingCreate, FlightBookingCreate, User  # noqa: E402
+import routers.bus  # noqa: E402
+import routers.flight  # noqa: E402
+
+USER = User(id="bench-user", email="bench@example.com", username="bench")
+PARTY_SIZES = range(1, 10)
+
+
+def seed(db):
+    operator = BusOperatorModel(name="Pipeline Travels")
+    db.add(operator)
+    db.flush()
+    bus = BusModel(operator_id=operator.id, bus_number="KA-03", bus_type="AC Sleeper", total_seats=45)
+    db.add(bus)
+    db.flush()
+    bus_schedule = BusScheduleModel(bus_id=bus.id, route_id=1, departure_time="22:00",
+                                    arrival_time="06:00", base_price=1200)
+    db.add(bus_schedule)
+    aircraft = AircraftModel(model="A321", total_seats=180, economy_seats=180, seat_layout="3-3")
+    db.add(aircraft)
+    db.flush()
+    flight = FlightModel(flight_number="6E-303", airline_id=1, route_id=1, aircraft_id=aircraft.id,
+                         departure_time="08:00", arrival_time="10:00", duration_mins=120,
+                         days_of_week="1,2,3,4,5,6,7", base_price_economy=4500)
+    db.add(flight)
+    db.flush()
+    dep = datetime.now() + timedelta(days=7)
+    flight_schedules = []
+    for offset in (0, 3):
+        schedule = FlightScheduleModel(flight_id=flight.id, flight_date=(dep + timedelta(days=offset)).date().isoformat(),
+                                       departure_datetime=dep + timedelta(days=offset),
+                                       arrival_datetime=dep + timedelta(days=offset, hours=2),
+                                       economy_price=4500, business_price=13500, available_economy=180,
+                                       available_business=0)
+        db.add(schedule)
+        flight_schedules.append(schedule)
+    db.flush()
+    db.bulk_insert_mappings(BusSeatModel, [
+        {"bus_id": bus.id, "seat_number": f"L{n}", "seat_type": "sleeper", "is_active": 1,
+         "price_modifier": 50 * (n % 3)}
+        for n in range(1, 46)
+    ])
+    db.bulk_insert_mappings(FlightSeatModel, [
+        {"aircraft_id": aircraft.id, "seat_number": f"{row}{col}", "seat_class": "economy",
+         "seat_type": "window", "row_number": row, "column_letter": col, "price_modifier": 100 * (col in "AF"),
+         "is_active": 1}
+        for row in range(1, 31) for col in "ABCDEF"
+    ])
+    db.commit()
+    bus_seats = [s.id for s in db.query(BusSeatModel).filter(BusSeatModel.bus_id == bus.id)]
+    flight_seats = [s.id for s in db.query(FlightSeatModel).filter(FlightSeatModel.aircraft_id == aircraft.id)]
+    return bus_schedule.id, bus_seats, [s.id for s in flight_schedules], flight_seats
+
+
+def bus_request(schedule_id, journey_date, seat_ids):
+    return BusBookingCreate(
+        schedule_id=schedule_id, journey_date=journey_date, boarding_point_id=1, dropping_point_id=2,
+        contact_name="Bench", contact_email="bench@example.com", contact_phone="0000000000",
+        passengers=[{"seat_id": seat_id, "name": f"P{i}", "age": 30, "gender": "F"}
+                    for i, seat_id in enumerate(seat_ids)])
+
+
+def flight_passengers(seat_ids, size):
+    passengers = []
+    for i in range(size):
+        passenger_type = "infant" if i == 3 else "child" if i % 4 == 1 else "adult"
+        passengers.append({
+            "passenger_type": passenger_type, "title": "Ms", "first_name": f"P{i}", "last_name": "Bench",
+            "gender": "F", "seat_class": "economy",
+            # infants sit on a lap; the ninth passenger skips seat selection
+            "seat_id": None if passenger_type == "infant" or i == 8 else seat_ids.pop(0),
+        })
+    return passengers
+
+
+def flight_request(schedule_ids, seat_pools, size):
+    return FlightBookingCreate(
+        trip_type="round_trip", contact_name="Bench", contact_email="bench@example.com",
+        contact_phone="0000000000",
+        segments=[{"schedule_id": schedule_id, "passengers": flight_passengers(pool, size)}
+                  for schedule_id, pool in zip(schedule_ids, seat_pools)])
+
+
+def book_bus(handler, schedule_id, journey_date, seat_ids):
+    with SessionLocal() as db:
+        with QueryCounter(engine) as counter:
+            result = handler(bus_request(schedule_id, journey_date, seat_ids), USER, db)
+        booking = db.get(BusBookingModel, result["booking_id"])
+        passengers = db.query(BusPassengerModel).filter(BusPassengerModel.booking_id == booking.id).count()
+        booked = db.query(BusSeatAvailabilityModel).filter(
+            BusSeatAvailabilityModel.booking_id == booking.id, BusSeatAvailabilityModel.status == "booked").count()
+        assert passengers == booked == len(seat_ids), (passengers, booked, len(seat_ids))
+        return counter.count, float(booking.total_amount)
+
+
+def book_flight(handler, schedule_ids, seat_pools, size):
+    request = flight_request(schedule_ids, seat_pools, size)
+    seated = [p["seat_id"] for segment in request.segments for p in segment["passengers"] if p["seat_id"]]
+    with SessionLocal() as db:
+        with QueryCounter(engine) as counter:
+            result = handler(request, USER, db)
+        booking = db.query(FlightBookingModel).filter(FlightBookingModel.id == result["booking_id"]).one()
+        fares = sorted(fare for (fare,) in db.query(FlightPassengerModel.fare_amount)
+                       .filter(FlightPassengerModel.booking_id == booking.id))
+        booked = db.query(FlightSeatAvailabilityModel).filter(
+            FlightSeatAvailabilityModel.seat_id.in_(seated), FlightSeatAvailabilityModel.status == "booked").count()
+        assert len(fares) == 2 * size and booked == len(seated), (len(fares), booked, len(seated))
+        return counter.count, round(result["final_amount"], 2), fares
+
+
+def run(label, bus_handler, flight_handler, schedule_ids, bus_seats, flight_seats, journey_date):
+    bus_schedule, flight_schedules = schedule_ids
+    bus_pool, flight_pools = list(bus_seats), [list(flight_seats), list(flight_seats)]
+    rows = []
+    for size in PARTY_SIZES:
+        bus_count, bus_total = book_bus(bus_handler, bus_schedule, journey_date,
+                                        [bus_pool.pop(0) for _ in range(size)])
+        flight_count, flight_total, fares = book_flight(flight_handler, flight_schedules, flight_pools, size)
+        rows.append((size, bus_count, bus_total, flight_count, flight_total, fares))
+    print(f"\n{label}")
+    print(f"{'party':>6}{'bus stmts':>11}{'bus total':>11}{'flight stmts':>14}{'flight total':>14}")
+    for size, bus_count, bus_total, flight_count, flight_total, _ in rows:
+        print(f"{size:>6}{bus_count:>11}{bus_total:>11.0f}{flight_count:>14}{flight_total:>14.2f}")
+    return rows
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--baseline", help="git revision whose bus/flight booking handlers to compare with")
+    args = parser.parse_args()
+
+    with SessionLocal() as db:
+        bus_schedule, bus_seats, flight_schedules, flight_seats = seed(db)
+    journey = (date.today() + timedelta(days=7)).isoformat()
+    # Each implementation books its own seats: bus seats on its own date, flight seats from its own half
+    rows = run("current handlers", routers.bus.create_bus_booking, routers.flight.create_flight_booking,
+               (bus_schedule, flight_schedules), bus_seats, flight_seats[:90], journey)
+    for column, name in ((1, "bus"), (3, "flight")):
+        counts = {row[column] for row in rows}
+        assert len(counts) == 1, f"{name} statements grow with the party size: {[row[column] for row in rows]}"
+
+    if args.baseline:
+        old_bus = load_module_at(args.baseline, "routers/bus.py", "baseline_bus")
+        old_flight = load_module_at(args.baseline, "routers/flight.py", "baseline_flight")
+        old_journey = (date.today() + timedelta(days=8)).isoformat()
+        old_rows = run(f"handlers as of {args.baseline}", old_bus.create_bus_booking, old_flight.create_flight_booking,
+                       (bus_schedule, flight_schedules), bus_seats, flight_seats[90:], old_journey)
+        for new, old in zip(rows, old_rows):
+            assert new[2] == old[2], f"bus total differs for {new[0]} passengers: {new[2]} vs {old[2]}"
+            assert new[4] == old[4] and new[5] == old[5], f"flight fares differ for {new[0]} passengers"
+        print("fares and totals match the baseline")
+
+    # Time 9-passenger bookings on a date whose seats are all still free
+    parties = iter([bus_seats[i:i + 9] for i in range(0, 45, 9)])
+    later = (date.today() + timedelta(days=9)).isoformat()
+    ms = timed(lambda: book_bus(routers.bus.create_bus_booking, bus_schedule, later, next(parties)), repeat=5)
+    print(f"\nbus booking for 9 passengers: {ms:.2f} ms")
+    print("OK: statements per booking do not depend on the party size")
+
+
+if __name__ == "__main__":
+    main()
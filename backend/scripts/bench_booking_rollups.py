@@ -0,0 +1,187 @@
+#!/usr/bin/env python3
+"""Benchmark: admin dashboard and booking report from the daily rollups.
+
+1. Drives ORM writes the way the handlers do (new bookings, payments,
+   status changes, cancellations, a deletion, a rolled-back write) and
+   checks the incrementally maintained rollups match a full rebuild.
+2. Pads service_bookings / transactions to each --sizes row count (bulk
+   insert + rebuild) and times GET /api/admin/dashboard and
+   /api/admin/reports/bookings against the original implementations,
+   checking both return the same numbers (a few padded rows have no
+   created_at, as legacy rows can), and that the report and its NDJSON
+   export cover the same bookings for date ranges with an end date.
+
+Usage (from backend/): python scripts/bench_booking_rollups.py [--sizes 1000 10000 100000]
+"""
+import argparse
+import asyncio
+import random
+import uuid
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy import text
+
+from bench_common import QueryCounter, load_server, timed
+
+load_server()
+from database import SessionLocal, engine  # noqa: E402
+from models import (BookingDailyRollupModel, BookingModel, ServiceBookingModel,  # noqa: E402
+                    TransactionModel, UserModel, booking_rollups)
+from routers.admin import booking_report, get_dashboard_stats  # noqa: E402
+SB, TX, U = ServiceBookingModel, TransactionModel, UserModel
+rollups = booking_rollups
+TYPES = ["flight", "hotel", "restaurant", "bus"]
+STATUSES = ["Pending", "Paid", "Confirmed", "Cancelled", "Completed"]
+
+
+def old_dashboard(db):
+    """The pre-rollup dashboard numbers, kept as the reference."""
+    total_bookings = db.query(SB).count() + db.query(BookingModel).count()
+    revenue = db.query(TX).filter(TX.status == "success").with_entities(
+        text("COALESCE(SUM(amount), 0)")).scalar() or 0
+    recent = []
+    for b in db.query(SB).order_by(SB.created_at.desc()).limit(5).all():
+        user = db.query(U).filter(U.id == b.user_id).first()
+        recent.append((b.id, user.email if user else "N/A"))
+    by_day = []
+    for i in range(7):
+        day = datetime.now(timezone.utc).date() - timedelta(days=6 - i)
+        by_day.append(db.query(SB).filter(text(f"DATE(created_at) = '{day}'")).count())
+    return total_bookings, round(float(revenue), 2), recent, by_day
+
+
+def new_dashboard(db):
+    stats = get_dashboard_stats(admin=None, db=db)
+    recent = [(b["id"], b["user_email"]) for b in stats.recent_bookings]
+    return (stats.total_bookings, round(stats.total_revenue, 2), recent,
+            [d["count"] for d in stats.bookings_by_day])
+
+
+def old_report(db, start_date=None, end_date=None):
+    query = db.query(SB)
+    if start_date:
+        query = query.filter(SB.created_at >= start_date)
+    if end_date:
+        query = query.filter(SB.created_at <= end_date)
+    by_type, by_status, revenue = {}, {}, 0
+    for b in query.all():
+        by_type[b.service_type] = by_type.get(b.service_type, 0) + 1
+        by_status[b.status] = by_status.get(b.status, 0) + 1
+        if b.status in ["Confirmed", "Paid", "Completed"]:
+            revenue += b.total_price
+    return query.count(), by_type, by_status, round(revenue, 2)
+
+
+def new_report(db, start_date=None, end_date=None):
+    r = booking_report(start_date=start_date, end_date=end_date, admin=None, db=db)
+    return r["total_bookings"], r["by_service_type"], r["by_status"], round(r["total_revenue"], 2)
+
+
+def export_count(db, start_date=None, end_date=None):
+    response = booking_report(start_date=start_date, end_date=end_date, export="ndjson", admin=None, db=db)
+
+    async def lines():
+        return sum([chunk.count("\n") async for chunk in response.body_iterator])
+    return asyncio.run(lines())
+
+
+def snapshot(db):
+    return {(r.day, r.kind, r.service_type, r.status): (r.total_count, round(r.total_amount, 2))
+            for r in db.query(BookingDailyRollupModel) if r.total_count or abs(r.total_amount) > 1e-6}
+
+
+def check_incremental(rng):
+    with SessionLocal() as db:
+        user = U(id=str(uuid.uuid4()), email="rollups@example.com", username="rollups", hashed_password="x")
+        db.add(user)
+        db.commit()
+        bookings = []
+        for i in range(200):
+            b = SB(user_id=user.id, service_type=rng.choice(TYPES), service_json="{}",
+                   total_price=rng.randint(500, 20000), booking_ref=f"RB{i:06d}",
+                   created_at=datetime.now(timezone.utc) - timedelta(days=rng.randint(0, 10)))
+            db.add(b)
+            bookings.append(b)
+        db.commit()
+        for b in bookings[:120]:  # pay: transaction + status change, like simulate_payment
+            db.add(TX(user_id=user.id, booking_id=b.id, service_type=b.service_type, amount=b.total_price,
+                      payment_method="one_time_card", status=rng.choice(["success", "success", "failed"])))
+            b.status = "Paid"
+        db.commit()
+        for b in bookings[100:140]:  # expired after the commit above
+            b.status = rng.choice(["Cancelled", "Confirmed", "Completed"])
+        bookings[0].total_price += 999
+        db.commit()
+        db.delete(bookings[150])
+        db.commit()
+        bookings[151].status = "Cancelled"
+        db.flush()
+        db.rollback()
+        db.add(BookingModel(user_id=user.id, destination="Goa", total_price=15000, booking_ref="TRIP1"))
+        db.commit()
+
+        incremental = snapshot(db)
+        rollups.rebuild(db)
+        rebuilt = snapshot(db)
+        assert incremental == rebuilt, sorted(set(incremental.items()) ^ set(rebuilt.items()))[:6]
+        print(f"incremental rollups match a rebuild ({len(rebuilt)} rows, {rollups.deltas_applied} deltas)")
+
+
+def pad(db, size, rng):
+    have = db.query(SB).count()
+    now = datetime.now(timezone.utc)
+    users = [u for (u,) in db.query(U.id)]
+    rows, txs = [], []
+    for i in range(have, size):
+        created = now - timedelta(days=rng.randint(0, 720), seconds=rng.randint(0, 86399)) if i % 200 else None
+        booking_id = str(uuid.uuid4())
+        price = float(rng.randint(500, 20000))
+        status = rng.choice(STATUSES)
+        rows.append({"id": booking_id, "user_id": rng.choice(users), "service_type": rng.choice(TYPES),
+                     "service_json": "{}", "total_price": price, "currency": "INR",
+                     "booking_ref": f"PB{i:08d}", "status": status, "created_at": created})
+        if status != "Pending":
+            txs.append({"user_id": rng.choice(users), "booking_id": booking_id, "amount": price,
+                        "currency": "INR", "payment_method": "one_time_card", "status": "success",
+                        "created_at": created})
+    if rows:
+        db.execute(SB.__table__.insert(), rows)
+        db.execute(TX.__table__.insert(), txs)
+        db.commit()
+    rollups.rebuild(db)  # bulk inserts bypass the ORM events
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 10000, 100000])
+    args = parser.parse_args()
+    rng = random.Random(5)
+    check_incremental(rng)
+
+    today = datetime.now(timezone.utc).date()
+    window = [(None, None), ((today - timedelta(days=90)).isoformat(), None)]
+    ranges = [(None, None), ((today - timedelta(days=90)).isoformat(), (today - timedelta(days=30)).isoformat()),
+              (None, (today - timedelta(days=1)).isoformat())]
+    print(f"{'bookings':>9} {'old dash ms':>12} {'new dash ms':>12} {'old report ms':>14} "
+          f"{'new report ms':>14} {'old q':>6} {'new q':>6}")
+    for size in args.sizes:
+        with SessionLocal() as db:
+            pad(db, size, rng)
+            assert old_dashboard(db) == new_dashboard(db)
+            for start_date, end_date in window:
+                assert old_report(db, start_date, end_date) == new_report(db, start_date, end_date), start_date
+            for start_date, end_date in ranges:
+                assert new_report(db, start_date, end_date)[0] == export_count(db, start_date, end_date), \
+                    (start_date, end_date)
+            with QueryCounter(engine) as old_q:
+                old_dashboard(db)
+            with QueryCounter(engine) as new_q:
+                new_dashboard(db)
+            print(f"{size:>9} {timed(lambda: old_dashboard(db), 3):>12.1f} {timed(lambda: new_dashboard(db), 3):>12.1f} "
+                  f"{timed(lambda: old_report(db), 3):>14.1f} {timed(lambda: new_report(db), 3):>14.1f} "
+                  f"{old_q.count:>6} {new_q.count:>6}")
+    print("OK: dashboard and report numbers match the original queries; exports cover the same days")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""Benchmark: SQL round trips for POST /api/bus/search.
+
+Seeds a single corridor with a growing number of schedules (10 -> 1,000) and
+checks that the number of statements issued by `search_buses` stays constant.
+
+Usage (from backend/): python scripts/bench_bus_search.py
+"""
+from datetime import date, timedelta
+
+from bench_common import QueryCounter, load_server, timed
+
+SIZES = [10, 100, 1000]
+SEATS_PER_BUS = 40
+
+load_server()
+from database import SessionLocal, engine  # noqa: E402
+from models import (BusBoardingPointModel, BusCityModel, BusModel, BusOperatorModel,  # noqa: E402
+                    BusRouteModel, BusScheduleModel, BusSeatAvailabilityModel, BusSeatModel)
+from schemas import BusSearchRequest  # noqa: E402
+from routers.bus import search_buses  # noqa: E402
+
+
+def seed_corridor(db):
+    origin = BusCityModel(name="Chennai", state="Tamil Nadu")
+    dest = BusCityModel(name="Bangalore", state="Karnataka")
+    db.add_all([origin, dest])
+    db.flush()
+    route = BusRouteModel(from_city_id=origin.id, to_city_id=dest.id, distance_km=350)
+    operator = BusOperatorModel(name="Bench Travels", rating=4.2)
+    db.add_all([route, operator])
+    db.commit()
+    return origin.id, dest.id, route.id, operator.id
+
+
+def add_schedules(db, route_id, operator_id, journey_date, count):
+    for i in range(count):
+        bus = BusModel(
+            operator_id=operator_id,
+            bus_number=f"TN-{i:05d}",
+            bus_type="AC Sleeper",
+            total_seats=SEATS_PER_BUS,
+            amenities='["wifi", "charging"]',
+        )
+        db.add(bus)
+        db.flush()
+        schedule = BusScheduleModel(
+            bus_id=bus.id,
+            route_id=route_id,
+            departure_time="21:00",
+            arrival_time="05:00",
+            duration_mins=480,
+            base_price=899,
+        )
+        db.add(schedule)
+        db.flush()
+        db.bulk_insert_mappings(BusSeatModel, [
+            {"bus_id": bus.id, "seat_number": f"L{n}", "is_active": 1, "price_modifier": 0}
+            for n in range(1, SEATS_PER_BUS + 1)
+        ])
+        db.bulk_insert_mappings(BusBoardingPointModel, [
+            {"schedule_id": schedule.id, "city_id": 1, "point_name": "Koyambedu", "time": "21:00", "point_type": "boarding", "is_active": 1},
+            {"schedule_id": schedule.id, "city_id": 2, "point_name": "Majestic", "time": "05:00", "point_type": "dropping", "is_active": 1},
+        ])
+        db.add(BusSeatAvailabilityModel(
+            schedule_id=schedule.id, seat_id=1, journey_date=journey_date, status="booked"
+        ))
+    db.commit()
+
+
+def main():
+    journey_date = (date.today() + timedelta(days=7)).isoformat()
+    db = SessionLocal()
+    from_id, to_id, route_id, operator_id = seed_corridor(db)
+    request = BusSearchRequest(from_city_id=from_id, to_city_id=to_id, journey_date=journey_date)
+
+    seeded = 0
+    counts = []
+    print(f"{'schedules':>10} {'queries':>8} {'best ms':>9}")
+    for size in SIZES:
+        add_schedules(db, route_id, operator_id, journey_date, size - seeded)
+        seeded = size
+        db.expire_all()
+
+        with QueryCounter(engine) as counter:
+            result = search_buses(request, db)
+        assert result["total"] == size, result.get("total")
+        elapsed = timed(lambda: search_buses(request, db))
+        counts.append(counter.count)
+        print(f"{size:>10} {counter.count:>8} {elapsed:>9.1f}")
+
+    db.close()
+    assert len(set(counts)) == 1, f"query count grew with result size: {counts}"
+    print("OK: query count is constant")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,184 @@
+"""Shared helpers for the backend benchmark scripts.
+
+Each benchmark imports the real `server` module against a throwaway SQLite
+database so that it never touches the developer's wanderlite.db.
+"""
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+BACKEND_DIR = Path(__file__).resolve().parents[1]
+
+
+def load_server(db_url: str = None):
+    """Import server.py bound to a scratch database and create its tables."""
+    if db_url is None:
+        tmp_dir = tempfile.mkdtemp(prefix="wanderlite_bench_")
+        db_url = f"sqlite:///{Path(tmp_dir) / 'bench.db'}"
+    os.environ["MYSQL_URL"] = db_url
+    if str(BACKEND_DIR) not in sys.path:
+        sys.path.insert(0, str(BACKEND_DIR))
+    import server
+    from database import Base, engine
+    Base.metadata.create_all(bind=engine)
+    return server
+
+
+class QueryCounter:
+    """Count SQL statements sent to an engine inside a `with` block."""
+
+    def __init__(self, engine):
+        self.engine = engine
+        self.count = 0
+
+    def _on_execute(self, conn, cursor, statement, parameters, context, executemany):
+        self.count += 1
+
+    def __enter__(self):
+        from sqlalchemy import event
+        event.listen(self.engine, "before_cursor_execute", self._on_execute)
+        return self
+
+    def __exit__(self, *exc):
+        from sqlalchemy import event
+        event.remove(self.engine, "before_cursor_execute", self._on_execute)
+        return False
+
+
+def run_uvicorn(app, port: int = None):
+    """Serve `app` with uvicorn on a background thread; returns (server, base_url)."""
+    import socket
+    import threading
+    import uvicorn
+
+    if port is None:
+        with socket.socket() as sock:
+            sock.bind(("127.0.0.1", 0))
+            port = sock.getsockname()[1]
+    app_server = uvicorn.Server(uvicorn.Config(app, host="127.0.0.1", port=port, log_level="warning"))
+    threading.Thread(target=app_server.run, daemon=True).start()
+    while not app_server.started:
+        time.sleep(0.05)
+    return app_server, f"http://127.0.0.1:{port}"
+
+
+def load_module_at(rev: str, path: str, name: str):
+    """backend/<path> as of git revision `rev`, executed as a separate module called `name`"""
+    import subprocess
+    import types
+
+    source = subprocess.run(["git", "show", f"{rev}:backend/{path}"], cwd=BACKEND_DIR,
+                            capture_output=True, text=True, check=True).stdout
+    module = types.ModuleType(name)
+    exec(compile(source, f"{rev}:{path}", "exec"), module.__dict__)
+    return module
+
+
+def timed(fn, repeat: int = 5):
+    """Return the best wall time in milliseconds over `repeat` calls."""
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        elapsed = (time.perf_counter() - start) * 1000
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+class StubHTTPServer:
+    """Local JSON server standing in for a third-party API.
+
+    `routes` maps a path prefix to a callable `(path, query) -> (status, body)`;
+    POST routes also get the decoded JSON request body as a third argument.
+    A route may return an iterator of strings as the body to stream it
+    (chunked, e.g. Server-Sent Events); `aborted` counts streams the client
+    hung up on.
+    Every response is delayed by `latency` seconds to mimic a remote host.
+    Use as a context manager; `base_url` is valid inside the block.
+    """
+
+    def __init__(self, routes, latency: float = 0.0):
+        self.routes = routes
+        self.latency = latency
+        self.requests = 0
+        self.connections = set()
+        self.aborted = 0
+
+    def __enter__(self):
+        import json
+        import threading
+        from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+        from urllib.parse import parse_qs, urlsplit
+
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def do_GET(self):
+                self._dispatch()
+
+            def do_POST(self):
+                length = int(self.headers.get("Content-Length") or 0)
+                self._dispatch(json.loads(self.rfile.read(length) or b"null"))
+
+            def _dispatch(self, *request_body):
+                stub.requests += 1
+                stub.connections.add(self.client_address)
+                time.sleep(stub.latency)
+                parts = urlsplit(self.path)
+                query = {k: v[0] for k, v in parse_qs(parts.query).items()}
+                status, body = 404, {"error": "no route"}
+                for prefix, route in stub.routes.items():
+                    if parts.path.startswith(prefix):
+                        status, body = route(parts.path, query, *request_body)
+                        break
+                if hasattr(body, "__next__"):
+                    self._stream(status, body)
+                    return
+                payload = json.dumps(body).encode()
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(payload)))
+                self.end_headers()
+                self.wfile.write(payload)
+
+            def _stream(self, status, chunks):
+                self.send_response(status)
+                self.send_header("Content-Type", "text/event-stream")
+                self.send_header("Transfer-Encoding", "chunked")
+                self.end_headers()
+                try:
+                    for chunk in chunks:
+                        data = chunk.encode()
+                        self.wfile.write(b"%x\r\n%s\r\n" % (len(data), data))
+                        self.wfile.flush()
+                    self.wfile.write(b"0\r\n\r\n")
+                except ConnectionError:
+                    stub.aborted += 1
+                    self.close_connection = True
+
+            def log_message(self, *args):
+                pass
+
+        class Server(ThreadingHTTPServer):
+            request_queue_size = 128  # the default backlog of 5 stalls concurrent clients
+
+            def handle_error(self, request, client_address):
+                # Clients cancelling in-flight calls is expected, not an error
+                if not isinstance(sys.exc_info()[1], ConnectionError):
+                    super().handle_error(request, client_address)
+
+        self._server = Server(("127.0.0.1", 0), Handler)
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        self.base_url = f"http://127.0.0.1:{self._server.server_address[1]}"
+        return self
+
+    def __exit__(self, *exc):
+        self._server.shutdown()
+        self._server.server_close()
+        return False
@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""Benchmark: GET /api/destinations fan-out against a slow stub upstream.
+
+Points OpenTripMap and OpenWeather at a local stub server that answers
+every call after LATENCY seconds, then measures
+  * cold: empty cache, all 8 cities x 3 lookups fetched concurrently
+    (the old serial loop needed ~24 x LATENCY; all lookups hit one stub
+    host here, so HTTP_CLIENT_MAX_PER_HOST keeps at most 10 in flight),
+  * warm: everything served from the per-city TTL cache, no upstream calls,
+  * deadline: an upstream slower than DESTINATIONS_DEADLINE_SECONDS (1 s
+    here) still answers on time with defaults, and the late results fill the cache.
+
+Usage (from backend/): python scripts/bench_destinations.py
+"""
+import os
+import time
+
+os.environ["OPENWEATHER_API_KEY"] = "bench-key"
+os.environ["DESTINATIONS_DEADLINE_SECONDS"] = "1.0"
+
+from fastapi.testclient import TestClient  # noqa: E402
+
+from bench_common import StubHTTPServer, load_server  # noqa: E402
+
+server = load_server()
+from routers.travel import DESTINATIONS_DEADLINE_SECONDS, destination_cache  # noqa: E402
+from routers import travel  # noqa: E402
+
+LATENCY = 0.2
+SLOW_LATENCY = 1.5
+
+
+def geoname(path, query):
+    return 200, {"xid": f"X-{query['name'][:4]}", "wikipedia_extracts": {"text": f"About {query['name']}"}}
+
+
+def radius(path, query):
+    return 200, {"features": [{"properties": {"name": f"Sight {i} @{query['lat']}"}} for i in range(3)]}
+
+
+def weather(path, query):
+    return 200, {"main": {"temp": 21.5, "humidity": 40}, "weather": [{"description": "clear sky"}]}
+
+
+ROUTES = {"/places/geoname": geoname, "/places/radius": radius, "/data/2.5/weather": weather}
+
+
+def get(client):
+    start = time.perf_counter()
+    response = client.get("/api/destinations")
+    elapsed = (time.perf_counter() - start) * 1000
+    assert response.status_code == 200, response.text
+    return elapsed, response.json()
+
+
+def main():
+    with StubHTTPServer(ROUTES, latency=LATENCY) as stub, TestClient(server.app) as client:
+        travel.OPENTRIPMAP_BASE_URL = stub.base_url
+        travel.OPENWEATHER_BASE_URL = stub.base_url
+        destination_cache.clear()
+
+        cold, body = get(client)
+        calls = stub.requests
+        assert len(body) == 8 and calls == 24, (len(body), calls)
+        assert all(d["weather"]["condition"] == "clear sky" and d["attractions"][0].startswith("Sight")
+                   for d in body)
+        warm = min(get(client)[0] for _ in range(20))
+        assert stub.requests == calls, "warm requests must not touch the network"
+
+        print(f"upstream latency {LATENCY * 1000:.0f} ms, serial estimate {calls * LATENCY * 1000:.0f} ms")
+        print(f"{'cold ms':>10} {'warm ms':>10}")
+        print(f"{cold:>10.1f} {warm:>10.2f}")
+
+        # Upstream slower than the deadline: answer on time with defaults
+        stub.latency = SLOW_LATENCY
+        destination_cache.clear()
+        elapsed, body = get(client)
+        deadline_ms = DESTINATIONS_DEADLINE_SECONDS * 1000
+        assert elapsed < deadline_ms + 500, elapsed
+        assert all(d["weather"]["condition"] == "Sunny" for d in body)
+        # ...and the in-flight lookups land in the cache for the next caller
+        time.sleep(SLOW_LATENCY * 3 + 0.5)  # three waves of HTTP_CLIENT_MAX_PER_HOST
+        calls = stub.requests
+        _, body = get(client)
+        assert stub.requests == calls and body[0]["weather"]["condition"] == "clear sky"
+        print(f"deadline: answered in {elapsed:.0f} ms with a {SLOW_LATENCY * 1000:.0f} ms upstream")
+
+    print("OK: concurrent fan-out, warm cache and deadline behave")
+
+
+if __name__ == "__main__":
+    main()
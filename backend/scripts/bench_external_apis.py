@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""Benchmark: weather, reverse geocode and FX endpoints against a stub upstream.
+
+Points OpenWeather and CurrencyAPI at a local stub server that answers
+after LATENCY seconds, then for each endpoint measures the cold (network)
+and warm (cached) latency through the ASGI stack and checks that
+  * the pooled client reuses keep-alive connections,
+  * nearby coordinates share one reverse-geocode entry,
+  * a 503 from upstream is retried,
+  * a stale FX rate is served immediately and refreshed in the background.
+
+Usage (from backend/): python scripts/bench_external_apis.py
+"""
+import os
+import time
+
+os.environ["OPENWEATHER_API_KEY"] = "bench-key"
+os.environ["CURRENCY_API_KEY"] = "bench-key"
+
+from fastapi.testclient import TestClient  # noqa: E402
+
+from bench_common import StubHTTPServer, load_server  # noqa: E402
+
+server = load_server()
+from routers.travel import FX_REFRESH_SECONDS, fx_rate_cache, geocode_cache, weather_cache  # noqa: E402
+from routers import travel  # noqa: E402
+
+LATENCY = 0.1
+fx_rate = {"value": 83.0}
+flaky = {"failures": 0}
+
+
+def weather(path, query):
+    return 200, {"main": {"temp": 30.0, "humidity": 70}, "weather": [{"description": "haze"}]}
+
+
+def reverse(path, query):
+    if flaky["failures"]:
+        flaky["failures"] -= 1
+        return 503, {"error": "busy"}
+    return 200, [{"name": f"Town {query['lat']},{query['lon']}", "country": "IN"}]
+
+
+def latest(path, query):
+    return 200, {"data": {query["currencies"]: {"value": fx_rate["value"]}}}
+
+
+ROUTES = {"/data/2.5/weather": weather, "/geo/1.0/reverse": reverse, "/latest": latest}
+ENDPOINTS = [
+    ("weather", "/api/weather/Kolkata"),
+    ("geolocate", "/api/geolocate?lat=22.5726&lon=88.3639"),
+    ("currency", "/api/currency/convert?amount=10&from_currency=USD&to_currency=INR"),
+]
+
+
+def get(client, url):
+    start = time.perf_counter()
+    response = client.get(url)
+    elapsed = (time.perf_counter() - start) * 1000
+    assert response.status_code == 200, (url, response.text)
+    return elapsed, response.json()
+
+
+def main():
+    with StubHTTPServer(ROUTES, latency=LATENCY) as stub, TestClient(server.app) as client:
+        travel.OPENWEATHER_BASE_URL = stub.base_url
+        travel.CURRENCYAPI_BASE_URL = stub.base_url
+
+        print(f"{'endpoint':<10} {'cold ms':>8} {'warm ms':>8}   (upstream latency {LATENCY * 1000:.0f} ms)")
+        for name, url in ENDPOINTS:
+            cold, body = get(client, url)
+            calls = stub.requests
+            warm = min(get(client, url)[0] for _ in range(20))
+            assert stub.requests == calls, f"{name}: warm requests must not touch the network"
+            print(f"{name:<10} {cold:>8.1f} {warm:>8.2f}")
+        assert get(client, "/api/weather/Kolkata")[1]["condition"] == "haze"
+        assert get(client, ENDPOINTS[2][1])[1]["converted_amount"] == 830.0
+
+        # Keep-alive: misses for new keys reuse pooled connections
+        for i in range(10):
+            get(client, f"/api/weather/City{i}")
+        print(f"upstream requests {stub.requests}, TCP connections {len(stub.connections)}")
+        assert len(stub.connections) < stub.requests
+
+        # Coordinates within the rounding cell share one entry
+        calls = stub.requests
+        _, near = get(client, "/api/geolocate?lat=22.5741&lon=88.3612")
+        assert stub.requests == calls and near["city"].startswith("Town")
+
+        # Transient 503s are retried
+        flaky["failures"] = 1
+        _, body = get(client, "/api/geolocate?lat=12.97&lon=77.59")
+        assert body["city"] == "Town 12.97,77.59", body
+
+        # Stale FX rates are served at once and refreshed behind the request
+        fx_rate_cache.fresh_seconds = 0.0
+        fx_rate["value"] = 84.0
+        elapsed, body = get(client, ENDPOINTS[2][1])
+        assert body["converted_amount"] == 830.0 and elapsed < LATENCY * 1000, (body, elapsed)
+        time.sleep(LATENCY * 3)
+        fx_rate_cache.fresh_seconds = FX_REFRESH_SECONDS
+        assert get(client, ENDPOINTS[2][1])[1]["converted_amount"] == 840.0
+
+        print({name: cache.stats() for name, cache in (("weather", weather_cache),
+                                                        ("geocode", geocode_cache),
+                                                        ("fx", fx_rate_cache))})
+    print("OK: pooled client, caches, retries and background FX refresh behave")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,175 @@
+#!/usr/bin/env python3
+"""Benchmark: flight search with schedules materialised ahead of time.
+
+Builds a synthetic 200-flight network (20 airports, 50 routes, 4 flights
+per route, some not flying every day), then:
+  * materialises the schedule window and times the pass, plus a second
+    pass that has nothing left to insert;
+  * times /search for 25 route/date pairs inside the window: the first
+    search of each pair (cold) and a repeat (warm). It fails if a
+    search sends any INSERT, UPDATE or DELETE, or finds no flights;
+  * creates a flight through the admin handler and checks the next search
+    lists it, without waiting for the background pass;
+  * with --baseline REV, runs the search handler of routers/flight.py as
+    of that revision on 25 dates beyond the window, where it still has to
+    create the schedules (cold), and again on the same dates (warm).
+
+Usage (from backend/): python scripts/bench_flight_schedules.py [--days 120] [--baseline REV]
+"""
+import argparse
+import asyncio
+import random
+import statistics
+import time
+from datetime import date, timedelta
+
+from sqlalchemy import event, func
+
+from bench_common import load_module_at, load_server
+
+load_server()
+from database import SessionLocal, engine  # noqa: E402
+from flight_schedules import flight_schedules  # noqa: E402
+from models import (AircraftModel, AirlineModel, AirportModel, FlightModel, FlightRouteModel,  # noqa: E402
+                    FlightScheduleModel)
+from schemas import FlightCreate, FlightSearchRequest  # noqa: E402
+import routers.admin  # noqa: E402
+import routers.flight  # noqa: E402
+
+AIRPORTS = 20
+ROUTES = 50
+FLIGHTS_PER_ROUTE = 4
+
+
+def seed(db):
+    rng = random.Random(3)
+    db.add_all([AirportModel(code=f"Q{n:02d}", name=f"Airport {n}", city=f"Town {n}", country="India")
+                for n in range(AIRPORTS)])
+    db.add_all([AirlineModel(code=f"X{n}", name=f"Airline {n}") for n in range(4)])
+    db.add(AircraftModel(model="A320", total_seats=180, economy_seats=168, business_seats=12, seat_layout="3-3"))
+    db.flush()
+    airports = [a.id for a in db.query(AirportModel)]
+    airlines = [a.id for a in db.query(AirlineModel)]
+    aircraft = db.query(AircraftModel).first().id
+    pairs = set()
+    while len(pairs) < ROUTES:
+        origin, dest = rng.sample(airports, 2)
+        pairs.add((origin, dest))
+    routes = [FlightRouteModel(origin_airport_id=o, destination_airport_id=d, distance_km=rng.randint(300, 2500),
+                               estimated_duration_mins=rng.randint(60, 240)) for o, d in sorted(pairs)]
+    db.add_all(routes)
+    db.flush()
+    for route in routes:
+        for n in range(FLIGHTS_PER_ROUTE):
+            hour = 6 + 4 * n
+            days = "1,2,3,4,5,6,7" if n % 2 == 0 else "1,3,5,7"
+            db.add(FlightModel(flight_number=f"X{route.id}{n}", airline_id=rng.choice(airlines), route_id=route.id,
+                               aircraft_id=aircraft, departure_time=f"{hour:02d}:00",
+                               arrival_time=f"{(hour + 2) % 24:02d}:00", duration_mins=120, days_of_week=days,
+                               base_price_economy=rng.randint(3000, 9000), base_price_business=15000,
+                               is_overnight=int(hour + 2 >= 24)))
+    db.commit()
+    return [(db.get(AirportModel, r.origin_airport_id).code, db.get(AirportModel, r.destination_airport_id).code)
+            for r in routes]
+
+
+class WriteCounter:
+    """Counts INSERT / UPDATE / DELETE statements inside a `with` block"""
+
+    def __init__(self):
+        self.writes = 0
+
+    def _on_execute(self, conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().split(None, 1)[0].upper() in ("INSERT", "UPDATE", "DELETE"):
+            self.writes += 1
+
+    def __enter__(self):
+        event.listen(engine, "before_cursor_execute", self._on_execute)
+        return self
+
+    def __exit__(self, *exc):
+        event.remove(engine, "before_cursor_execute", self._on_execute)
+        return False
+
+
+def search(handler, origin, dest, day):
+    with SessionLocal() as db:
+        start = time.perf_counter()
+        result = handler(FlightSearchRequest(origin_code=origin, destination_code=dest,
+                                             departure_date=day.isoformat()), db)
+        if asyncio.iscoroutine(result):
+            result = asyncio.run(result)
+        return (time.perf_counter() - start) * 1000, result["outbound"]
+
+
+def check_new_flight(routes, days):
+    """A flight created by an admin is searchable straight away"""
+    origin, dest = routes[0]
+    with SessionLocal() as db:
+        ids = {a.code: a.id for a in db.query(AirportModel).filter(AirportModel.code.in_((origin, dest)))}
+        route = db.query(FlightRouteModel).filter(FlightRouteModel.origin_airport_id == ids[origin],
+                                                  FlightRouteModel.destination_airport_id == ids[dest]).first()
+        sample = db.query(FlightModel).filter(FlightModel.route_id == route.id).first()
+        created = routers.admin.admin_create_flight(FlightCreate(
+            flight_number="xnew1", airline_id=sample.airline_id, route_id=route.id, aircraft_id=sample.aircraft_id,
+            departure_time="23:00", arrival_time="23:50", duration_mins=50, days_of_week="1,2,3,4,5,6,7",
+            base_price_economy=1000), admin=None, db=db)
+    day = date.today() + timedelta(days=days - 1)
+    flights = search(routers.flight.search_flights, origin, dest, day)[1]
+    assert created["id"] in {flight["flight_id"] for flight in flights}, "new flight is not searchable"
+    print(f"\nadmin-created flight {created['id']} listed on {origin}-{dest} {day.isoformat()} (last day of the window)")
+
+
+def run_searches(label, handler, cases):
+    cold, warm, found = [], [], 0
+    with WriteCounter() as writes:
+        for origin, dest, day in cases:
+            ms, flights = search(handler, origin, dest, day)
+            cold.append(ms)
+            found += len(flights)
+        cold_writes = writes.writes
+        for origin, dest, day in cases:
+            warm.append(search(handler, origin, dest, day)[0])
+    print(f"{label:<34}{statistics.median(cold):>10.2f}{statistics.median(warm):>10.2f}"
+          f"{found:>9}{cold_writes:>8}{writes.writes - cold_writes:>12}")
+    return found, writes.writes
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--days", type=int, default=flight_schedules.window_days)
+    parser.add_argument("--baseline", help="git revision whose search_flights to compare with")
+    args = parser.parse_args()
+
+    with SessionLocal() as db:
+        routes = seed(db)
+        start = time.perf_counter()
+        written = flight_schedules.materialise(db, days=args.days)
+        first_ms = (time.perf_counter() - start) * 1000
+        start = time.perf_counter()
+        again = flight_schedules.materialise(db, days=args.days)
+        again_ms = (time.perf_counter() - start) * 1000
+        stored = db.query(func.count(FlightScheduleModel.id)).scalar()
+    flights = ROUTES * FLIGHTS_PER_ROUTE
+    print(f"materialise {flights} flights x {args.days} days: {written} schedules in {first_ms:.0f} ms; "
+          f"re-run wrote {again} in {again_ms:.0f} ms")
+    assert again == 0 and stored == written
+
+    rng = random.Random(5)
+    today = date.today()
+    inside = [(*rng.choice(routes), today + timedelta(days=rng.randrange(1, args.days))) for _ in range(25)]
+    print(f"\n{'search (25 route/date pairs)':<34}{'cold ms':>10}{'warm ms':>10}{'flights':>9}{'writes':>8}"
+          f"{'warm writes':>12}")
+    found, writes = run_searches("read-only, materialised window", routers.flight.search_flights, inside)
+    assert found and writes == 0, "search must only read"
+    check_new_flight(routes, args.days)
+
+    if args.baseline:
+        old = load_module_at(args.baseline, "routers/flight.py", "baseline_flight")
+        beyond = [(origin, dest, day + timedelta(days=args.days)) for origin, dest, day in inside]
+        run_searches(f"creating schedules @ {args.baseline}", old.search_flights, beyond)
+    print("OK: search reads the materialised schedules and writes nothing")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,177 @@
+#!/usr/bin/env python3
+"""Benchmark: flight search on a synthetic 500-airport network.
+
+Builds 20 fully connected hubs and 480 spoke airports flying to two hubs
+each (about 2,300 routes and 5,000 flights), materialises three days of
+schedules, then:
+  * times the flight network load;
+  * runs 25 hub-to-hub searches (direct flights plus connections via
+    other hubs), 25 searches between spokes of one hub (connections only)
+    and 25 such round trips, counting statements and timing each;
+  * checks every connection: consecutive legs through the hub, a layover
+    inside the connection rules, and both schedules on their dates;
+  * with --baseline REV, runs the search handler of routers/flight.py as
+    of that revision on the same searches and checks it lists the same
+    direct flights.
+
+Usage (from backend/): python scripts/bench_flight_search.py [--baseline REV]
+"""
+import argparse
+import asyncio
+import random
+import statistics
+import time
+from datetime import date, datetime, timedelta
+
+from bench_common import QueryCounter, load_module_at, load_server
+
+load_server()
+from database import SessionLocal, engine  # noqa: E402
+from flight_schedules import flight_schedules  # noqa: E402
+from flight_search import flight_network  # noqa: E402
+from models import AircraftModel, AirlineModel, AirportModel, FlightModel, FlightRouteModel  # noqa: E402
+from schemas import FlightSearchRequest  # noqa: E402
+import routers.flight  # noqa: E402
+
+AIRPORTS = 500
+HUBS = 20
+SEARCHES = 25
+# One loop for every call of the async handler, as under uvicorn
+LOOP = asyncio.new_event_loop()
+
+
+def code(n):
+    return f"P{n:03d}"
+
+
+def seed(db):
+    rng = random.Random(7)
+    db.add_all([AirportModel(code=code(n), name=f"Airport {n}", city=f"Town {n:03d}", country="India")
+                for n in range(AIRPORTS)])
+    db.add_all([AirlineModel(code=f"Y{n}", name=f"Airline {n}") for n in range(6)])
+    db.add(AircraftModel(model="A320", total_seats=180, economy_seats=168, business_seats=12, seat_layout="3-3"))
+    db.flush()
+    airport_ids = {a.code: a.id for a in db.query(AirportModel)}
+    airlines = [a.id for a in db.query(AirlineModel)]
+    aircraft = db.query(AircraftModel).first().id
+
+    pairs = {}  # (origin, destination) -> flights per day
+    spokes = {hub: [] for hub in range(HUBS)}
+    for a in range(HUBS):
+        for b in range(HUBS):
+            if a != b:
+                pairs[(a, b)] = 3
+    for spoke in range(HUBS, AIRPORTS):
+        for hub in rng.sample(range(HUBS), 2):
+            pairs[(spoke, hub)] = pairs[(hub, spoke)] = 2
+            spokes[hub].append(spoke)
+    routes = [FlightRouteModel(origin_airport_id=airport_ids[code(o)], destination_airport_id=airport_ids[code(d)],
+                               distance_km=rng.randint(300, 2500), estimated_duration_mins=120)
+              for o, d in sorted(pairs)]
+    db.add_all(routes)
+    db.flush()
+    flights = []
+    for route, per_day in zip(routes, (pairs[pair] for pair in sorted(pairs))):
+        for n in range(per_day):
+            departs = rng.randrange(5 * 60, 22 * 60, 5)
+            duration = rng.randint(60, 180)
+            arrives = departs + duration
+            flights.append({
+                "flight_number": f"Y{route.id}{n}", "airline_id": rng.choice(airlines), "route_id": route.id,
+                "aircraft_id": aircraft, "departure_time": f"{departs // 60:02d}:{departs % 60:02d}",
+                "arrival_time": f"{arrives // 60 % 24:02d}:{arrives % 60:02d}", "duration_mins": duration,
+                "days_of_week": "1,2,3,4,5,6,7" if n % 2 == 0 else "1,2,3,5,6",
+                "base_price_economy": rng.randint(2500, 9000), "base_price_business": 15000,
+                "is_overnight": int(arrives >= 24 * 60),
+            })
+    db.bulk_insert_mappings(FlightModel, flights)
+    db.commit()
+    return len(routes), len(flights), spokes
+
+
+def search(handler, origin, dest, day, round_trip=False):
+    request = FlightSearchRequest(origin_code=origin, destination_code=dest, departure_date=day.isoformat(),
+                                  trip_type="round_trip" if round_trip else "one_way",
+                                  return_date=(day + timedelta(days=1)).isoformat() if round_trip else None)
+    with SessionLocal() as db, QueryCounter(engine) as queries:
+        start = time.perf_counter()
+        result = handler(request, db)
+        if asyncio.iscoroutine(result):
+            result = LOOP.run_until_complete(result)
+        return (time.perf_counter() - start) * 1000, queries.count, result
+
+
+def check_connections(result, origin, dest, day):
+    rules = flight_network.rules
+    for direction, start, end, first_day in (("outbound", origin, dest, day),
+                                             ("return", dest, origin, day + timedelta(days=1))):
+        for itinerary in result.get(f"{direction}_connections", []):
+            first, second = itinerary["segments"]
+            assert first["origin_code"] == start and second["destination_code"] == end, itinerary
+            assert first["destination_code"] == second["origin_code"] == itinerary["via_code"], itinerary
+            assert first["departure_datetime"].startswith(first_day.isoformat()), itinerary
+            layover = (datetime.fromisoformat(second["departure_datetime"])
+                       - datetime.fromisoformat(first["arrival_datetime"])).total_seconds() / 60
+            minimum = rules.min_mins if first["airline_id"] == second["airline_id"] else rules.interline_mins
+            assert minimum <= layover <= rules.max_mins, (layover, itinerary)
+
+
+def run(label, handler, cases, round_trip=False, check=False):
+    times, statements, direct, connecting, results = [], [], 0, 0, []
+    for origin, dest, day in cases:
+        ms, count, result = search(handler, origin, dest, day, round_trip)
+        times.append(ms)
+        statements.append(count)
+        direct += len(result["outbound"]) + len(result["return"])
+        connecting += len(result.get("outbound_connections", [])) + len(result.get("return_connections", []))
+        if check:
+            check_connections(result, origin, dest, day)
+        results.append(result)
+    print(f"{label:<40}{statistics.median(times):>9.2f}{max(times):>9.2f}{statistics.median(statements):>8.0f}"
+          f"{max(statements):>6}{direct:>8}{connecting:>8}")
+    return results
+
+
+def direct_ids(results):
+    return [sorted(f["schedule_id"] for f in r["outbound"] + r["return"]) for r in results]
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--baseline", help="git revision whose search_flights to compare with")
+    args = parser.parse_args()
+
+    with SessionLocal() as db:
+        routes, flights, spokes = seed(db)
+        written = flight_schedules.materialise(db, days=3)
+        start = time.perf_counter()
+        loaded = flight_network.rebuild(db)
+        load_ms = (time.perf_counter() - start) * 1000
+    print(f"{AIRPORTS} airports, {routes} routes, {flights} flights, {written} schedules over 3 days; "
+          f"network of {loaded} flights loaded in {load_ms:.0f} ms")
+
+    rng = random.Random(9)
+    day = date.today()
+    hub_cases = [(code(a), code(b), day) for a, b in (rng.sample(range(HUBS), 2) for _ in range(SEARCHES))]
+    # Spokes sharing a hub, so every pair is one stop apart
+    spoke_cases = [(code(a), code(b), day) for a, b in
+                   (rng.sample(spokes[rng.randrange(HUBS)], 2) for _ in range(SEARCHES))]
+    cases = [("hub to hub", hub_cases, False), ("spoke to spoke", spoke_cases, False),
+             ("spoke to spoke, round trip", spoke_cases, True)]
+
+    print(f"\n{'search (25 each)':<40}{'med ms':>9}{'max ms':>9}{'stmts':>8}{'max':>6}{'direct':>8}{'1-stop':>8}")
+    current = {label: run(f"{label}: network", routers.flight.search_flights, searches, round_trip, check=True)
+               for label, searches, round_trip in cases}
+    assert sum(bool(r["outbound_connections"]) for r in current["spoke to spoke"]) > SEARCHES // 2, \
+        "most spoke pairs should have a connection"
+    if args.baseline:
+        old = load_module_at(args.baseline, "routers/flight.py", "baseline_flight")
+        for label, searches, round_trip in cases:
+            baseline = run(f"{label}: @ {args.baseline}", old.search_flights, searches, round_trip)
+            assert direct_ids(baseline) == direct_ids(current[label]), f"{label}: direct flights differ"
+        print("direct flights match the baseline")
+    print("OK: every connection respects the connection rules")
+
+
+if __name__ == "__main__":
+    main()
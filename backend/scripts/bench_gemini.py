@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""Benchmark: /api/ai/chat against a fake Gemini server.
+
+The fake upstream lists four models: the two preferred ones are out of
+quota (429 with a RetryInfo delay), `gemini-pro` takes SLOW seconds and
+`gemini-1.0-pro` answers after FAST seconds. Measures
+  * the first message (model list fetched, 429s discovered),
+  * repeat messages (model list cached, quota-exhausted models skipped by
+    their circuit breakers, slow model hedged by the fast one),
+  * a full quota outage (fallback answer, then no upstream calls at all),
+  * an upstream slower than GEMINI_DEADLINE_SECONDS.
+The old proxy tried models one after another, so every message in this
+scenario paid a model-list call, two 429s and the full SLOW call.
+
+Usage (from backend/): python scripts/bench_gemini.py
+"""
+import os
+import time
+
+os.environ["GEMINI_API_KEY"] = "bench-key"
+os.environ["GEMINI_HEDGE_DELAY_SECONDS"] = "0.3"
+os.environ["GEMINI_DEADLINE_SECONDS"] = "2"
+
+from fastapi.testclient import TestClient  # noqa: E402
+
+from bench_common import StubHTTPServer, load_server  # noqa: E402
+
+server = load_server()
+from gemini_client import gemini  # noqa: E402
+
+FAST = 0.1
+SLOW = 3.0
+calls = {}
+behaviour = {
+    "gemini-1.5-flash": "quota",
+    "gemini-1.5-pro": "quota",
+    "gemini-pro": "slow",
+    "gemini-1.0-pro": "fast",
+}
+
+
+def list_models(path, query):
+    return 200, {"models": [
+        {"name": f"models/{name}", "supportedGenerationMethods": ["generateContent"]}
+        for name in ("gemini-1.0-pro", "gemini-pro", "gemini-1.5-pro", "gemini-1.5-flash")
+    ]}
+
+
+def generate(path, query, body):
+    model = path.split("/")[-1].split(":")[0]
+    calls[model] = calls.get(model, 0) + 1
+    mode = behaviour[model]
+    if mode == "quota":
+        return 429, {"error": {"code": 429, "details": [{"retryDelay": "30s"}]}}
+    time.sleep(SLOW if mode == "slow" else FAST)
+    return 200, {"candidates": [{"content": {"parts": [{"text": f"answer from {model}"}]}}]}
+
+
+def route(path, query, body=None):
+    return generate(path, query, body) if ":generateContent" in path else list_models(path, query)
+
+
+def chat(client, message="best hotels in Goa"):
+    start = time.perf_counter()
+    response = client.post("/api/ai/chat", json={"message": message, "bypass_cache": True})
+    elapsed = (time.perf_counter() - start) * 1000
+    assert response.status_code == 200, response.text
+    return elapsed, response.json()["answer"]
+
+
+def main():
+    with StubHTTPServer({"/models": route}) as stub, TestClient(server.app) as client:
+        gemini.base_url = stub.base_url
+
+        first, answer = chat(client)
+        assert answer == "answer from gemini-1.0-pro", answer
+        list_calls = stub.requests - sum(calls.values())
+        quota_calls = calls["gemini-1.5-flash"] + calls["gemini-1.5-pro"]
+
+        repeat = min(chat(client)[0] for _ in range(5))
+        assert stub.requests - sum(calls.values()) == list_calls == 1, "model list must be cached"
+        assert calls["gemini-1.5-flash"] + calls["gemini-1.5-pro"] == quota_calls == 2, calls
+        print(f"{'scenario':<28} {'ms':>8}")
+        print(f"{'first message':<28} {first:>8.1f}")
+        print(f"{'repeat (breakers, hedge)':<28} {repeat:>8.1f}   old sequential ~{SLOW * 1000:.0f}+")
+
+        # Every model out of quota: fallback answer, then breakers stop upstream calls
+        behaviour.update({"gemini-pro": "quota", "gemini-1.0-pro": "quota"})
+        gemini.breakers.clear()
+        exhausted, answer = chat(client)
+        assert "high demand" in answer
+        before = stub.requests
+        skipped, answer = chat(client)
+        assert stub.requests == before and "high demand" in answer
+        print(f"{'quota outage':<28} {exhausted:>8.1f}")
+        print(f"{'quota outage, breakers open':<28} {skipped:>8.1f}")
+
+        # Every model slower than the deadline
+        behaviour.update({m: "slow" for m in behaviour})
+        gemini.breakers.clear()
+        slow, answer = chat(client)
+        assert "high demand" in answer and slow < gemini.deadline * 1000 + 500, slow
+        print(f"{'all slow (deadline 2 s)':<28} {slow:>8.1f}")
+
+    print("OK: model list cached, breakers skip 429s, hedging and deadline behave")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+"""Benchmark: POST /api/hotel/search served from the in-memory index.
+
+Seeds the bundled hotel dataset (~1,200 hotels) through the real /seed
+handler, then for a mix of filter/sort/page combinations
+  * checks the index returns the same totals and the same hotels as the
+    original SQL query (ILIKE + COUNT + OFFSET/LIMIT), and
+  * times both.
+Finally pads the table with synthetic hotels up to --scale and times the
+index alone, to show it keeps up at 100k rows.
+
+Usage (from backend/): python scripts/bench_hotel_search.py [--scale 100000]
+"""
+import argparse
+import json
+import random
+import time
+
+from bench_common import load_server, timed
+
+load_server()
+from database import SessionLocal  # noqa: E402
+from models import HotelModel  # noqa: E402
+from schemas import HotelSearchRequest  # noqa: E402
+from routers.hotel import hotel_search_index, parse_json_field, search_hotels, seed_hotel_data  # noqa: E402
+H = HotelModel
+
+QUERIES = [
+    dict(city="Delhi"),
+    dict(city="mumbai", sort_by="price_low"),
+    dict(city="Goa", sort_by="rating", star_rating=[4, 5]),
+    dict(city="a", sort_by="price_high", min_price=3000, max_price=9000, page=2),
+    dict(city="Jaipur", sort_by="distance", free_cancellation=True),
+    dict(city="Bangalore", breakfast_included=True, limit=50),
+    dict(city="nowhere"),
+]
+
+
+def sql_search(db, req):
+    """The pre-index implementation, kept as the reference."""
+    query = db.query(H).filter(H.is_active == 1, H.city.ilike(f"%{req.city}%"))
+    if req.star_rating:
+        query = query.filter(H.star_category.in_(req.star_rating))
+    if req.min_price:
+        query = query.filter(H.price_per_night >= req.min_price)
+    if req.max_price:
+        query = query.filter(H.price_per_night <= req.max_price)
+    if req.free_cancellation:
+        query = query.filter(H.free_cancellation == 1)
+    if req.breakfast_included:
+        query = query.filter(H.breakfast_included == 1)
+    order = {
+        "price_low": (H.price_per_night.asc(), H.id),
+        "price_high": (H.price_per_night.desc(), H.id),
+        "rating": (H.rating.desc(), H.id),
+        "distance": (H.distance_from_center.asc(), H.id),
+    }.get(req.sort_by, (H.reviews_count.desc(), H.rating.desc(), H.id))
+    query = query.order_by(*order)
+    total = query.count()
+    rows = query.offset((req.page - 1) * req.limit).limit(req.limit).all()
+    for row in rows:
+        parse_json_field(row.amenities, [])
+        parse_json_field(row.images, [])
+    return total, [row.id for row in rows]
+
+
+def pad_hotels(db, target):
+    existing = db.query(H).count()
+    cities = [c for (c,) in db.query(H.city).distinct()] or ["Delhi"]
+    rng = random.Random(7)
+    batch = []
+    for i in range(existing, target):
+        batch.append({
+            "name": f"Synthetic {i}", "slug": f"synthetic-{i}", "star_category": rng.randint(1, 5),
+            "city": rng.choice(cities), "state": "X", "rating": round(rng.uniform(2.5, 4.9), 1),
+            "reviews_count": rng.randint(0, 2000), "price_per_night": rng.randint(800, 25000),
+            "distance_from_center": round(rng.uniform(0.5, 15), 1),
+            "amenities": json.dumps(["WiFi", "Parking"]), "images": json.dumps(["https://example.com/h.jpg"]),
+            "free_cancellation": rng.randint(0, 1), "breakfast_included": rng.randint(0, 1), "is_active": 1,
+        })
+        if len(batch) == 5000:
+            db.bulk_insert_mappings(H, batch)
+            batch = []
+    if batch:
+        db.bulk_insert_mappings(H, batch)
+    db.commit()
+    hotel_search_index.invalidate()
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--scale", type=int, default=100000)
+    args = parser.parse_args()
+
+    db = SessionLocal()
+    seeded = seed_hotel_data(db)
+    print(f"seeded {seeded.get('hotels')} hotels")
+    requests = [HotelSearchRequest(**q) for q in QUERIES]
+
+    print(f"{'query':<44} {'total':>6} {'sql ms':>8} {'index ms':>9}")
+    for req in requests:
+        result = search_hotels(req, db)
+        ref_total, ref_ids = sql_search(db, req)
+        assert result["total"] == ref_total, (req, result["total"], ref_total)
+        assert [h["id"] for h in result["hotels"]] == ref_ids, req
+        label = ",".join(f"{k}={v}" for k, v in req.model_dump(exclude_defaults=True).items())
+        print(f"{label[:44]:<44} {ref_total:>6} {timed(lambda: sql_search(db, req)):>8.2f} "
+              f"{timed(lambda: search_hotels(req, db)):>9.3f}")
+
+    pad_hotels(db, args.scale)
+    start = time.perf_counter()
+    search_hotels(requests[0], db)
+    print(f"\nrebuild at {args.scale} hotels: {(time.perf_counter() - start) * 1000:.0f} ms")
+    for req in requests[:4]:
+        print(f"{req.city:<12} sort={req.sort_by:<11} index {timed(lambda: search_hotels(req, db)):>7.3f} ms")
+    db.close()
+    print("OK: index matches the SQL search")
+
+
+if __name__ == "__main__":
+    main()
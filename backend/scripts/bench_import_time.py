@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""Benchmark: import cost of the app and of the maintenance entry points.
+
+Runs `python -X importtime -c "import <module>"` in fresh interpreters
+(against a scratch SQLite database, so nothing connects to MySQL) and
+reports the median cumulative import time of:
+  * `server` with every router (what uvicorn pays before serving),
+  * `server` with APP_ROUTERS=bus,flight (a worker serving a subset),
+  * `database` + `models` (scripts/migrate.py and the other maintenance
+    scripts),
+  * optionally the monolithic server.py from an older revision
+    (--baseline REV, e.g. the commit before the router split),
+then lists the modules with the highest self time in the full app.
+
+Usage (from backend/): python scripts/bench_import_time.py [--runs 5] [--baseline REV]
+"""
+import argparse
+import os
+import re
+import statistics
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+from bench_common import BACKEND_DIR
+
+LINE = re.compile(r"import time:\s+(\d+) \|\s+(\d+) \| (\s*)(\S+)")
+
+
+def import_time(statement, target, env=None, cwd=BACKEND_DIR, pythonpath=None):
+    """(cumulative ms of `target`, {module: self ms}) for one fresh interpreter"""
+    tmp_dir = tempfile.mkdtemp(prefix="wanderlite_importtime_")
+    run_env = dict(os.environ, MYSQL_URL=f"sqlite:///{Path(tmp_dir) / 'bench.db'}", **(env or {}))
+    if pythonpath:
+        run_env["PYTHONPATH"] = os.pathsep.join(map(str, pythonpath))
+    proc = subprocess.run([sys.executable, "-X", "importtime", "-c", statement], cwd=cwd, env=run_env,
+                          capture_output=True, text=True)
+    if proc.returncode:
+        raise RuntimeError(f"{statement!r} failed:\n{proc.stderr[-2000:]}")
+    cumulative, self_ms = 0.0, {}
+    for match in LINE.finditer(proc.stderr):
+        own, total, indent, name = match.groups()
+        self_ms[name] = int(own) / 1000
+        if not indent and name in target:
+            cumulative += int(total) / 1000
+    return cumulative, self_ms
+
+
+def median_import_time(runs, *args, **kwargs):
+    samples = [import_time(*args, **kwargs) for _ in range(runs)]
+    return statistics.median(total for total, _ in samples), samples[-1][1]
+
+
+def baseline_server(rev, tmp_dir):
+    """Write server.py as of `rev` into tmp_dir; None if git cannot provide it"""
+    proc = subprocess.run(["git", "show", f"{rev}:backend/server.py"], cwd=BACKEND_DIR,
+                          capture_output=True, text=True)
+    if proc.returncode:
+        print(f"baseline {rev}: {proc.stderr.strip()}")
+        return None
+    (tmp_dir / "server.py").write_text(proc.stdout)
+    return tmp_dir
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--baseline", help="git revision whose backend/server.py to measure for comparison")
+    parser.add_argument("--top", type=int, default=12)
+    args = parser.parse_args()
+
+    cases = [
+        ("server, all routers", "import server", {"server"}, {}),
+        ("server, APP_ROUTERS=bus,flight", "import server", {"server"}, {"APP_ROUTERS": "bus,flight"}),
+        ("database + models (maintenance)", "import database, models", {"database", "models"}, {}),
+    ]
+    print(f"{'import':<36}{'median ms':>10}")
+    full_self = None
+    for label, statement, target, env in cases:
+        total, self_ms = median_import_time(args.runs, statement, target, env=env)
+        full_self = full_self or self_ms
+        print(f"{label:<36}{total:>10.1f}")
+
+    if args.baseline:
+        old_dir = baseline_server(args.baseline, Path(tempfile.mkdtemp(prefix="wanderlite_baseline_")))
+        if old_dir:
+            # the old module still imports its helpers (migrations, keyset, ...) from backend/
+            total, _ = median_import_time(args.runs, "import server", {"server"}, cwd=old_dir,
+                                          pythonpath=[old_dir, BACKEND_DIR])
+            print(f"{'server.py @ ' + args.baseline:<36}{total:>10.1f}")
+
+    print(f"\nhighest self time, full app ({args.top}):")
+    for name, ms in sorted(full_self.items(), key=lambda kv: -kv[1])[:args.top]:
+        print(f"  {name:<40}{ms:>8.1f} ms")
+
+    lazy = ("qrcode", "pandas", "fpdf", "cryptography.fernet")
+    loaded = [name for name in lazy if name in full_self]
+    assert not loaded, f"imported at startup, expected on first use: {loaded}"
+    print(f"OK: {', '.join(lazy)} are not imported at startup")
+
+
+if __name__ == "__main__":
+    main()
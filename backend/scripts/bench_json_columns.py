@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""Benchmark: CPU time per 1,000 rows spent decoding JSON Text columns.
+
+Seeds 1,000 hotels, rooms, buses and service bookings with payloads shaped
+like the /seed data, then, for each request-sized pass (fresh session, as a
+new request would get), compares
+  * the old path: `json.loads` on every JSON column of every row, and
+  * the parsed_json accessors (amenities_data, images_data, ...).
+Each row is read twice per pass, as the detail + list endpoints do.
+
+Usage (from backend/): python scripts/bench_json_columns.py
+"""
+import json
+import time
+
+from bench_common import load_server
+
+load_server()
+from database import SessionLocal  # noqa: E402
+from models import BusModel, HotelModel, HotelRoomModel, ServiceBookingModel  # noqa: E402
+from routers.hotel import get_featured_hotels  # noqa: E402
+from json_columns import json_parse_cache  # noqa: E402
+
+ROWS = 1000
+PASSES = 5
+AMENITIES = [json.dumps([f"Amenity {i}" for i in range(n)]) for n in (6, 10, 14, 18, 22)]
+IMAGES = [json.dumps([{"url": f"https://img.example.com/{s}/{i}.jpg", "caption": f"View {i}", "is_primary": i == 0}
+                      for i in range(5)]) for s in range(5)]
+
+
+def seed(db):
+    policies = json.dumps({"check_in": "14:00", "check_out": "11:00", "pets": False, "smoking": False})
+    db.bulk_insert_mappings(HotelModel, [
+        {"name": f"Hotel {i}", "slug": f"hotel-{i}", "star_category": 1 + i % 5, "city": "Goa", "state": "Goa",
+         "price_per_night": 2000 + i, "amenities": AMENITIES[i % 5], "images": IMAGES[i % 5], "policies": policies}
+        for i in range(ROWS)
+    ])
+    db.bulk_insert_mappings(HotelRoomModel, [
+        {"hotel_id": 1 + i, "room_type": "Deluxe", "room_name": "Deluxe Room", "bed_type": "King",
+         "price_per_night": 3000, "amenities": AMENITIES[i % 5], "images": json.dumps([f"https://img/{i % 5}.jpg"] * 3),
+         "inclusions": json.dumps(["Daily Housekeeping", "Free WiFi"])}
+        for i in range(ROWS)
+    ])
+    db.bulk_insert_mappings(BusModel, [
+        {"operator_id": 1, "bus_number": f"TN-{i}", "bus_type": "AC Sleeper", "total_seats": 40,
+         "amenities": AMENITIES[i % 5]}
+        for i in range(ROWS)
+    ])
+    db.bulk_insert_mappings(ServiceBookingModel, [
+        {"id": f"sb-{i}", "service_type": "hotel", "booking_ref": f"REF{i}", "total_price": 5000,
+         "service_json": json.dumps({"hotel": f"Hotel {i}", "nights": 2, "guests": [{"name": "A"}, {"name": "B"}]})}
+        for i in range(ROWS)
+    ])
+    db.commit()
+
+
+CASES = [
+    ("hotels", HotelModel, ("amenities", "images", "policies")),
+    ("hotel_rooms", HotelRoomModel, ("amenities", "images", "inclusions")),
+    ("buses", BusModel, ("amenities",)),
+    ("service_bookings", ServiceBookingModel, ("service_json",)),
+]
+ACCESSORS = {"service_json": "service_data"}
+
+
+def cpu_ms_per_pass(model, render):
+    """Best CPU time over PASSES fresh-session passes."""
+    best = None
+    for _ in range(PASSES):
+        with SessionLocal() as db:
+            rows = db.query(model).all()
+            start = time.process_time()
+            for _ in range(2):
+                for row in rows:
+                    render(row)
+            elapsed = time.process_time() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best * 1000
+
+
+def main():
+    with SessionLocal() as db:
+        seed(db)
+
+    print(f"{'table':<18} {'json.loads ms':>14} {'parsed_json ms':>15}   (CPU per {ROWS} rows x2 reads)")
+    for name, model, columns in CASES:
+        accessors = [ACCESSORS.get(c, f"{c}_data") for c in columns]
+
+        def old(row):
+            return [json.loads(getattr(row, c)) for c in columns]
+
+        def new(row):
+            return [getattr(row, a) for a in accessors]
+
+        with SessionLocal() as db:
+            row = db.query(model).first()
+            assert old(row) == new(row), name
+        json_parse_cache.clear()
+        print(f"{name:<18} {cpu_ms_per_pass(model, old):>14.2f} {cpu_ms_per_pass(model, new):>15.2f}")
+
+    with SessionLocal() as db:
+        featured = get_featured_hotels(limit=5, db=db)
+    assert all(h["primary_image"] for h in featured["hotels"]) or not featured["hotels"]
+    print("OK: accessors match json.loads")
+
+
+if __name__ == "__main__":
+    main()
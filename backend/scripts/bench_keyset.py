@@ -0,0 +1,202 @@
+#!/usr/bin/env python3
+"""Benchmark: keyset (cursor) pagination vs OFFSET on deep pages.
+
+1. Walks every listing page by page with `cursor` and checks the rows
+   come out exactly once, in the same order as one ORDER BY over the
+   whole filtered table (timestamps and ratings are seeded with many
+   ties, so the id tie-breaker matters): admin bookings, notifications,
+   hotel / restaurant reviews, restaurant search and hotel search for
+   every sort order.
+2. Times GET /api/admin/bookings, GET /api/notifications and POST
+   /api/restaurant/search + /api/hotel/search at increasing depths with
+   `page=` (OFFSET) and with the equivalent `cursor=`, checking both
+   return the same page.
+
+Usage (from backend/): python scripts/bench_keyset.py [--rows 300000]
+"""
+import argparse
+import json
+import random
+import time
+import uuid
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+
+from fastapi.testclient import TestClient
+
+from bench_common import load_server, timed
+
+server = load_server()
+from database import SessionLocal, engine  # noqa: E402
+from keyset import newest_first  # noqa: E402
+from models import (HotelModel, HotelReviewModel, NotificationModel, RestaurantModel,  # noqa: E402
+                    RestaurantReviewModel, ServiceBookingModel)
+from security import get_current_admin, get_current_user  # noqa: E402
+from routers.hotel import hotel_search_index  # noqa: E402
+from routers.restaurant import RESTAURANT_SORT_KEYS  # noqa: E402
+SB, N = ServiceBookingModel, NotificationModel
+R, H = RestaurantModel, HotelModel
+HR, RR = HotelReviewModel, RestaurantReviewModel
+USER_ID = str(uuid.uuid4())
+
+
+def seed(rows, rng):
+    now = datetime.now(timezone.utc).replace(second=0, microsecond=0)
+
+    def minutes_ago(spread):  # whole minutes, so many rows share a timestamp
+        return now - timedelta(minutes=rng.randint(0, spread))
+
+    with engine.begin() as conn:
+        for start in range(0, rows, 50000):
+            # No user_id: the listing's per-row user lookup would dominate the timings
+            conn.execute(SB.__table__.insert(), [{
+                "id": str(uuid.uuid4()), "service_type": rng.choice(("flight", "hotel", "restaurant", "bus")),
+                "service_json": "{}", "total_price": 1000.0, "currency": "INR", "booking_ref": f"KS{i:08d}",
+                "status": rng.choice(("Pending", "Paid", "Confirmed", "Cancelled")),
+                "created_at": minutes_ago(rows // 3),
+            } for i in range(start, min(start + 50000, rows))])
+        conn.execute(N.__table__.insert(), [{
+            "user_id": USER_ID if i % 4 else str(uuid.uuid4()), "title": f"n{i}", "message": "m",
+            "notification_type": "system", "is_read": i % 3 == 0, "created_at": minutes_ago(rows // 30),
+        } for i in range(rows // 5)])
+        conn.execute(R.__table__.insert(), [{
+            "name": f"Restaurant {i}", "city": rng.choice(("Delhi", "New Delhi", "Mumbai")),
+            "rating": rng.choice((3.5, 4.0, 4.2, 4.5)), "price_for_two": rng.choice((400, 800, 1500)),
+            "popularity_score": rng.randint(0, 50), "cuisines": ["Indian"], "is_active": 1,
+        } for i in range(rows // 10)])
+        conn.execute(H.__table__.insert(), [{
+            "name": f"Hotel {i}", "slug": f"hotel-{i}", "city": rng.choice(("Delhi", "Mumbai")), "state": "X",
+            "star_category": rng.randint(1, 5), "rating": rng.choice((3.5, 4.0, 4.5, None)),
+            "reviews_count": rng.randint(0, 20), "price_per_night": rng.choice((1500, 2500, 4000)),
+            "distance_from_center": rng.choice((1.0, 2.5, None)), "amenities": json.dumps(["WiFi"]),
+            "images": "[]", "is_active": 1,
+        } for i in range(rows // 10)])
+        for model, parent in ((HR, "hotel_id"), (RR, "restaurant_id")):
+            rating = "rating" if model is HR else "overall_rating"
+            conn.execute(model.__table__.insert(), [{
+                parent: 1 + i % 3, "user_id": USER_ID, rating: 4.0, "is_active": 1,
+                "created_at": minutes_ago(rows // 300).replace(tzinfo=None),
+            } for i in range(rows // 20)])
+    hotel_search_index.invalidate()
+
+
+def walk(fetch, limit):
+    """Follow next_cursor from the first page to the end; returns the ids in order."""
+    ids, cursor, pages = [], None, 0
+    while True:
+        items, cursor = fetch(cursor, limit)
+        ids.extend(items)
+        pages += 1
+        if not cursor:
+            return ids, pages
+
+
+def admin_bookings(client, **params):
+    response = client.get("/api/admin/bookings", params=params)
+    assert response.status_code == 200, response.text
+    return [b["id"] for b in response.json()], response.headers.get("x-next-cursor")
+
+
+def body_page(key, item_key="id"):
+    def fetch(response):
+        assert response.status_code == 200, response.text
+        data = response.json()
+        return [x[item_key] for x in data[key]], data["next_cursor"]
+    return fetch
+
+
+def check_walks(client, db):
+    checks = []
+    order = newest_first(SB)
+    expected = [b.id for b in db.query(SB.id, SB.created_at).filter(SB.status == "Paid").order_by(
+        *[k.column.desc() for k in order])]
+    checks.append(("admin bookings status=Paid", expected, lambda c, n: admin_bookings(
+        client, status="Paid", limit=n, **({"cursor": c} if c else {}))))
+
+    expected = [n.id for n in db.query(N.id).filter(N.user_id == USER_ID).order_by(N.created_at.desc(), N.id.desc())]
+    notifications = body_page("notifications")
+    checks.append(("notifications", expected, lambda c, n: notifications(client.get(
+        "/api/notifications", params={"limit": n, **({"cursor": c} if c else {})}))))
+
+    for model, url, key in ((HR, "/api/hotel/2/reviews", "reviews"),
+                            (RR, "/api/restaurant/2/reviews", "reviews")):
+        parent = model.hotel_id if model is HR else model.restaurant_id
+        expected = [r.id for r in db.query(model.id).filter(parent == 2, model.is_active == 1).order_by(
+            model.created_at.desc(), model.id.desc())]
+        checks.append((url, expected, lambda c, n, url=url, key=key: body_page(key)(client.get(
+            url, params={"limit": n, **({"cursor": c} if c else {})}))))
+
+    for sort_by, keys in RESTAURANT_SORT_KEYS.items():
+        expected = [r.id for r in db.query(R.id).filter(R.is_active == 1, R.city.ilike("%delhi%")).order_by(
+            *[k.column.desc() if k.descending else k.column.asc() for k in keys])]
+        checks.append((f"restaurant search {sort_by}", expected, lambda c, n, s=sort_by: body_page("restaurants")(
+            client.post("/api/restaurant/search", json={"city": "delhi", "sort_by": s, "limit": n, "cursor": c}))))
+
+    for sort_by in ("popularity", "price_low", "price_high", "rating", "distance"):
+        hotels = client.post("/api/hotel/search", json={"city": "Delhi", "sort_by": sort_by, "limit": 100000})
+        expected = [h["id"] for h in hotels.json()["hotels"]]
+        checks.append((f"hotel search {sort_by}", expected, lambda c, n, s=sort_by: body_page("hotels")(
+            client.post("/api/hotel/search", json={"city": "Delhi", "sort_by": s, "limit": n, "cursor": c}))))
+
+    print(f"{'cursor walk':<32} {'rows':>8} {'pages':>6} {'s':>6}")
+    for name, expected, fetch in checks:
+        start = time.perf_counter()
+        ids, pages = walk(fetch, 500)
+        assert ids == expected, (name, len(ids), len(expected))
+        print(f"{name:<32} {len(ids):>8} {pages:>6} {time.perf_counter() - start:>6.1f}")
+
+
+def time_depths(client, rows):
+    limit = 20
+    cases = [
+        ("GET /api/admin/bookings", lambda p: admin_bookings(client, **p), rows),
+        ("GET /api/notifications", lambda p: body_page("notifications")(
+            client.get("/api/notifications", params=p)), rows * 3 // 20),
+        ("POST /api/restaurant/search", lambda p: body_page("restaurants")(
+            client.post("/api/restaurant/search", json={"city": "Delhi", "sort_by": "rating", **p})), rows // 15),
+        ("POST /api/hotel/search", lambda p: body_page("hotels")(
+            client.post("/api/hotel/search", json={"city": "Delhi", "sort_by": "price_low", **p})), rows // 20),
+    ]
+    print(f"\n{'endpoint':<28} {'depth':>8} {'offset ms':>10} {'cursor ms':>10} {'speed-up':>9}")
+    for name, fetch_page, size in cases:
+        for depth in (0, size // 100, size // 10, size // 2, size - limit * 2):
+            depth -= depth % limit
+            cursor = fetch_page({"page": 1, "limit": depth})[1] if depth else None
+            by_offset = {"page": depth // limit + 1, "limit": limit}
+            by_cursor = {"cursor": cursor, "limit": limit} if cursor else {"limit": limit}
+            assert fetch_page(by_offset)[0] == fetch_page(by_cursor)[0], (name, depth)
+            offset_ms = timed(lambda: fetch_page(by_offset), 3)
+            cursor_ms = timed(lambda: fetch_page(by_cursor), 3)
+            print(f"{name:<28} {depth:>8} {offset_ms:>10.1f} {cursor_ms:>10.1f} {offset_ms / cursor_ms:>8.1f}x")
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, default=300_000)
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    seed(args.rows, random.Random(11))
+    print(f"seeded {args.rows} bookings (plus notifications, reviews, restaurants, hotels) "
+          f"in {time.perf_counter() - start:.1f}s")
+
+    server.app.dependency_overrides[get_current_admin] = lambda: None
+    server.app.dependency_overrides[get_current_user] = lambda: SimpleNamespace(id=USER_ID)
+    with TestClient(server.app) as client, SessionLocal() as db:
+        check_walks(client, db)
+        time_depths(client, args.rows)
+
+        bad = client.get("/api/admin/bookings", params={"cursor": "not-a-cursor"})
+        assert bad.status_code == 400, bad.text
+        rating_cursor = client.post("/api/restaurant/search", json={"city": "Delhi", "sort_by": "rating"}).json()
+        wrong_sort = client.post("/api/restaurant/search", json={
+            "city": "Delhi", "sort_by": "price_low", "cursor": rating_cursor["next_cursor"]})
+        assert wrong_sort.status_code == 400, wrong_sort.text
+        counted = client.get("/api/admin/bookings", params={"include_total": True, "status": "Paid"})
+        assert int(counted.headers["x-total-count"]) == db.query(SB).filter(SB.status == "Paid").count()
+    server.app.dependency_overrides.clear()
+    print("OK: cursor pages match OFFSET pages and walk every row exactly once")
+
+
+if __name__ == "__main__":
+    main()
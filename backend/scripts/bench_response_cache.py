@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""Benchmark: catalogue endpoints with the tag-invalidated response cache.
+
+Seeds hotels, restaurants, flights and buses through their /seed routes,
+then for every cached catalogue endpoint measures the cold (rendered) and
+warm (cached bytes) latency through the ASGI stack, checks the ETag
+round-trip (If-None-Match -> 304) and that a write to the underlying table
+invalidates the entry.
+
+Usage (from backend/): python scripts/bench_response_cache.py
+"""
+import time
+
+from fastapi.testclient import TestClient
+
+from bench_common import load_server
+
+server = load_server()
+from database import SessionLocal  # noqa: E402
+from models import BusCityModel  # noqa: E402
+from response_cache import response_cache  # noqa: E402
+
+ENDPOINTS = [
+    "/api/hotel/cities",
+    "/api/hotel/popular-cities?limit=12",
+    "/api/hotel/featured",
+    "/api/restaurant/cities",
+    "/api/restaurant/popular-cities",
+    "/api/restaurant/featured?city=Kolkata",
+    "/api/restaurant/popular",
+    "/api/flight/airports",
+    "/api/flight/airlines",
+    "/api/bus/cities",
+]
+
+
+def best_ms(client, url, repeat=20):
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        response = client.get(url)
+        elapsed = (time.perf_counter() - start) * 1000
+        assert response.status_code == 200, (url, response.status_code)
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def main():
+    client = TestClient(server.app)
+    for seed in ("/api/hotel/seed", "/api/restaurant/seed", "/api/flight/seed", "/api/bus/seed"):
+        assert client.post(seed).status_code == 200, seed
+
+    print(f"{'endpoint':<40} {'cold ms':>8} {'warm ms':>8}")
+    for url in ENDPOINTS:
+        response_cache.clear()
+        start = time.perf_counter()
+        first = client.get(url)
+        cold = (time.perf_counter() - start) * 1000
+        assert first.status_code == 200, (url, first.status_code)
+        etag = first.headers["etag"]
+        assert client.get(url, headers={"If-None-Match": etag}).status_code == 304, url
+        print(f"{url:<40} {cold:>8.2f} {best_ms(client, url):>8.2f}")
+
+    # Query params are normalised: order and unknown params do not split entries
+    client.get("/api/hotel/popular-cities?limit=12")
+    hits = response_cache.hits
+    client.get("/api/hotel/popular-cities?_=123&limit=12")
+    assert response_cache.hits == hits + 1
+
+    # A write to the underlying table invalidates dependent entries
+    before = client.get("/api/bus/cities").json()
+    db = SessionLocal()
+    db.add(BusCityModel(name="Zz Bench City", state="Nowhere"))
+    db.commit()
+    db.close()
+    assert client.get("/api/bus/cities").json() == before, "entry should still be cached"
+    response_cache.invalidate("bus_cities")
+    after = client.get("/api/bus/cities").json()
+    assert len(after) == len(before) + 1, "invalidation did not refresh the entry"
+
+    print(f"stats: {response_cache.stats()}")
+    print("OK: cached responses, ETags and tag invalidation behave")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""Benchmark: SQL round trips for the bus and flight seat layout endpoints.
+
+Seeds a 45-seat sleeper and a 180-seat A320, books and locks a few seats
+through the real handlers, then checks that
+  * a layout costs a fixed handful of queries (not one per seat),
+  * a warm layout reuses the cached seat map, and
+  * the write-through map agrees with a map freshly loaded from the DB.
+
+Usage (from backend/): python scripts/bench_seat_layout.py
+"""
+from datetime import date, datetime, timedelta
+
+from bench_common import QueryCounter, load_server, timed
+
+load_server()
+from database import SessionLocal, engine  # noqa: E402
+from models import (AircraftModel, BusModel, BusOperatorModel, BusScheduleModel, BusSeatModel,  # noqa: E402
+                    FlightModel, FlightScheduleModel, FlightSeatModel)
+from schemas import BusSeatLockRequest, FlightSeatLockRequest, User  # noqa: E402
+from routers.bus import get_seat_layout, lock_seats  # noqa: E402
+from routers.flight import get_flight_seats, lock_flight_seats  # noqa: E402
+from seat_map import seat_maps  # noqa: E402  (imported after server picks the DB)
+
+USER = User(id="bench-user", email="bench@example.com", username="bench")
+
+
+def seed_bus(db, journey_date):
+    operator = BusOperatorModel(name="Bench Travels")
+    db.add(operator)
+    db.flush()
+    bus = BusModel(operator_id=operator.id, bus_number="KA-01", bus_type="AC Sleeper", total_seats=45)
+    db.add(bus)
+    db.flush()
+    schedule = BusScheduleModel(bus_id=bus.id, route_id=1, departure_time="22:00",
+                                       arrival_time="06:00", base_price=1200)
+    db.add(schedule)
+    db.flush()
+    db.bulk_insert_mappings(BusSeatModel, [
+        {"bus_id": bus.id, "seat_number": f"L{n}", "seat_type": "sleeper", "is_active": 1, "price_modifier": 0}
+        for n in range(1, 46)
+    ])
+    db.commit()
+    seat_ids = [s.id for s in db.query(BusSeatModel).filter(BusSeatModel.bus_id == bus.id)]
+    return schedule.id, seat_ids
+
+
+def seed_flight(db):
+    aircraft = AircraftModel(model="A320", total_seats=180, economy_seats=180, seat_layout="3-3")
+    db.add(aircraft)
+    db.flush()
+    flight = FlightModel(flight_number="6E-101", airline_id=1, route_id=1, aircraft_id=aircraft.id,
+                                departure_time="08:00", arrival_time="10:00", duration_mins=120,
+                                days_of_week="1,2,3,4,5,6,7", base_price_economy=4500)
+    db.add(flight)
+    db.flush()
+    dep = datetime.now() + timedelta(days=7)
+    schedule = FlightScheduleModel(flight_id=flight.id, flight_date=dep.date().isoformat(),
+                                          departure_datetime=dep, arrival_datetime=dep + timedelta(hours=2),
+                                          economy_price=4500, available_economy=180)
+    db.add(schedule)
+    db.flush()
+    db.bulk_insert_mappings(FlightSeatModel, [
+        {"aircraft_id": aircraft.id, "seat_number": f"{row}{col}", "seat_class": "economy",
+         "seat_type": "window", "row_number": row, "column_letter": col, "price_modifier": 0, "is_active": 1}
+        for row in range(1, 31) for col in "ABCDEF"
+    ])
+    db.commit()
+    seat_ids = [s.id for s in db.query(FlightSeatModel).filter(FlightSeatModel.aircraft_id == aircraft.id)]
+    return schedule.id, seat_ids
+
+
+def statuses(layout):
+    return {seat["id"]: seat["status"] for seat in layout["seats"]}
+
+
+def main():
+    journey_date = (date.today() + timedelta(days=7)).isoformat()
+    db = SessionLocal()
+    bus_schedule, bus_seats = seed_bus(db, journey_date)
+    flight_schedule, flight_seats = seed_flight(db)
+
+    # Writes go through the real handlers so the cached maps are exercised
+    get_seat_layout(bus_schedule, journey_date, db)
+    lock_seats(BusSeatLockRequest(
+        schedule_id=bus_schedule, journey_date=journey_date, seat_ids=bus_seats[:3]), USER, db)
+    get_flight_seats(flight_schedule, "economy", db)
+    lock_flight_seats(FlightSeatLockRequest(
+        schedule_id=flight_schedule, seat_ids=flight_seats[10:14]), USER, db)
+
+    cases = [
+        ("bus 45 seats", lambda: get_seat_layout(bus_schedule, journey_date, db)),
+        ("flight 180 seats", lambda: get_flight_seats(flight_schedule, "economy", db)),
+    ]
+    print(f"{'layout':<18} {'cold q':>7} {'warm q':>7} {'warm ms':>8}")
+    for name, call in cases:
+        warm_result = call()
+        seat_maps.clear()
+        with QueryCounter(engine) as cold:
+            cold_result = call()
+        with QueryCounter(engine) as warm:
+            call()
+        assert statuses(warm_result) == statuses(cold_result), f"{name}: cached map diverged from DB"
+        assert cold.count <= 5, f"{name}: {cold.count} queries"
+        print(f"{name:<18} {cold.count:>7} {warm.count:>7} {timed(call):>8.2f}")
+
+    locked = [s for s, st in statuses(cases[0][1]()).items() if st == "locked"]
+    assert locked == bus_seats[:3], locked
+    db.close()
+    print("OK: layouts render without per-seat queries")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,145 @@
+#!/usr/bin/env python3
+"""Stress test: authenticated requests never starve each other of connections.
+
+Starts the real app under uvicorn with a small connection pool and a short
+DB_POOL_TIMEOUT, seeds --requests users (distinct tokens, so every auth
+lookup misses the user cache), one admin and a two-airport timetable,
+then fires all of these at once:
+  * GET /api/kyc/status, one per user (get_current_user + handler query),
+  * GET /api/admin/me, --requests times (get_current_admin),
+  * POST /api/flight/search, --requests round trips (both directions),
+  * GET /api/admin/users?export=csv, --exports downloads, which stream on
+    sessions of their own.
+
+A sync dependency and the sync handler run in separate thread hops. If a
+request kept its pooled connection from one hop to the next while the
+worker threads were all taken by requests waiting for a connection, the
+waits would end in pool timeouts and 500s. Exports hold a connection for
+the whole download, so at most EXPORT_MAX_CONCURRENT of them may stream
+at once, each admitted like a request. Every response must be 200 and
+every export must list all the users.
+
+Usage (from backend/): python scripts/check_db_concurrency.py [--requests 100] [--pool-size 10] [--max-overflow 20]
+       [--exports 20]
+"""
+import argparse
+import asyncio
+import os
+import time
+from collections import Counter
+from datetime import date, timedelta
+
+
+def parse_args():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--requests", type=int, default=100)
+    parser.add_argument("--pool-size", type=int, default=10)
+    parser.add_argument("--max-overflow", type=int, default=20)
+    parser.add_argument("--pool-timeout", type=int, default=10)
+    parser.add_argument("--exports", type=int, default=20)
+    return parser.parse_args()
+
+
+args = parse_args()
+# The pool is sized when database.py is imported, so set it before load_server
+os.environ["DB_POOL_SIZE"] = str(args.pool_size)
+os.environ["DB_MAX_OVERFLOW"] = str(args.max_overflow)
+os.environ["DB_POOL_TIMEOUT"] = str(args.pool_timeout)
+
+import httpx  # noqa: E402
+
+from bench_common import load_server, run_uvicorn  # noqa: E402
+
+load_server()
+from app_factory import create_app  # noqa: E402
+from database import SessionLocal, engine  # noqa: E402
+from db_pool import pool_status  # noqa: E402
+from flight_schedules import flight_schedules  # noqa: E402
+from models import (AdminModel, AircraftModel, AirlineModel, AirportModel, FlightModel,  # noqa: E402
+                    FlightRouteModel, UserModel)
+from security import create_access_token, create_admin_token, get_password_hash  # noqa: E402
+
+
+def seed(users):
+    hashed = get_password_hash("secret")
+    with SessionLocal() as db:
+        db.add_all([UserModel(id=f"load-{i}", email=f"load-{i}@example.com", username=f"load-{i}",
+                              hashed_password=hashed) for i in range(users)])
+        admin = AdminModel(email="load-admin@example.com", username="load-admin", hashed_password=hashed,
+                           role="admin", is_active=1)
+        db.add(admin)
+        seed_flights(db)
+        db.commit()
+        flight_schedules.materialise(db, days=3)
+        admin_token = create_admin_token(admin.id, admin.email, admin.role)
+    user_tokens = [create_access_token({"sub": f"load-{i}@example.com"}) for i in range(users)]
+    return user_tokens, admin_token
+
+
+def seed_flights(db):
+    db.add_all([AirportModel(code=code, name=f"{code} Airport", city=f"{code} City", country="India")
+                for code in ("LDA", "LDB")])
+    db.add(AirlineModel(code="LD", name="Load Air"))
+    db.add(AircraftModel(model="A320", total_seats=180, economy_seats=168, business_seats=12, seat_layout="3-3"))
+    db.flush()
+    airports = [a.id for a in db.query(AirportModel).order_by(AirportModel.code)]
+    airline, aircraft = db.query(AirlineModel).first().id, db.query(AircraftModel).first().id
+    for n, (origin, dest) in enumerate((airports, airports[::-1])):
+        route = FlightRouteModel(origin_airport_id=origin, destination_airport_id=dest, distance_km=900,
+                                 estimated_duration_mins=90)
+        db.add(route)
+        db.flush()
+        db.add(FlightModel(flight_number=f"LD{n}", airline_id=airline, route_id=route.id, aircraft_id=aircraft,
+                           departure_time="09:00", arrival_time="10:30", duration_mins=90,
+                           days_of_week="1,2,3,4,5,6,7", base_price_economy=4000, base_price_business=12000))
+
+
+def requests_for(user_tokens, admin_token):
+    calls = [("GET", "/api/kyc/status", token, None) for token in user_tokens]
+    calls += [("GET", "/api/admin/me", admin_token, None) for _ in user_tokens]
+    tomorrow = date.today() + timedelta(days=1)
+    search = {"origin_code": "LDA", "destination_code": "LDB", "trip_type": "round_trip",
+              "departure_date": tomorrow.isoformat(), "return_date": (tomorrow + timedelta(days=1)).isoformat()}
+    calls += [("POST", "/api/flight/search", token, search) for token in user_tokens]
+    calls += [("GET", "/api/admin/users?export=csv", admin_token, None) for _ in range(args.exports)]
+    return calls
+
+
+async def fire(base_url, calls):
+    limits = httpx.Limits(max_connections=len(calls), max_keepalive_connections=len(calls))
+    async with httpx.AsyncClient(base_url=base_url, limits=limits, timeout=120) as client:
+        async def call(method, path, token, body):
+            response = await client.request(method, path, json=body, headers={"Authorization": f"Bearer {token}"})
+            if path == "/api/flight/search" and response.status_code == 200:
+                assert response.json()["outbound"] and response.json()["return"], response.json()
+            if "export=" in path and response.status_code == 200:
+                assert len(response.text.splitlines()) == args.requests + 1, "export is missing rows"
+            return path, response.status_code
+
+        return await asyncio.gather(*(call(*c) for c in calls))
+
+
+def main():
+    user_tokens, admin_token = seed(args.requests)
+    calls = requests_for(user_tokens, admin_token)
+    app_server, base_url = run_uvicorn(create_app())
+    try:
+        start = time.perf_counter()
+        results = asyncio.run(fire(base_url, calls))
+        elapsed = time.perf_counter() - start
+    finally:
+        app_server.should_exit = True
+    statuses = Counter(results)
+    pool = pool_status(engine)
+    print(f"pool {args.pool_size}+{args.max_overflow}, {len(calls)} concurrent requests in {elapsed:.2f} s")
+    for (path, status), count in sorted(statuses.items()):
+        print(f"  {path:<30}{status:>5}{count:>6}")
+    print(f"  peak connections {pool.get('peak_checked_out')}, pool timeouts {pool.get('timeouts')}, "
+          f"max wait {pool.get('max_wait_ms')} ms")
+    failed = sum(count for (_, status), count in statuses.items() if status != 200)
+    assert not failed, f"{failed} requests failed"
+    print("OK: every request got a connection")
+
+
+if __name__ == "__main__":
+    main()
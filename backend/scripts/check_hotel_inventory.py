@@ -0,0 +1,221 @@
+#!/usr/bin/env python3
+"""Stress test: concurrent hotel bookings never sell more rooms than a night has.
+
+Seeds a hotel with a 5-room room type, then:
+  * releases --bookers simultaneous bookings (1-2 rooms, overlapping 1-4
+    night stays inside a 10-night window) through the real /book
+    handler, from threads and then from --processes forked workers
+    (where the in-process striped locks are not shared); afterwards no
+    night may have more rooms booked than the room type has, and every
+    night's inventory row must equal total_rooms minus the rooms booked;
+  * races --bookers bookings for the last free room of one night: exactly
+    one may succeed. The old handler (a read-then-write of the global
+    `available_rooms` counter, kept below as the reference) is replayed
+    on the same race to show what the check catches;
+  * cancels every booking and checks each night is back to total_rooms;
+  * checks the dated room list and hotel search agree with the inventory
+    (a sold-out stay hides the hotel, the next free night shows it).
+
+Usage (from backend/): python scripts/check_hotel_inventory.py [--bookers 200] [--processes 4]
+"""
+import argparse
+import multiprocessing
+import random
+import threading
+import time
+from collections import Counter
+from datetime import date, timedelta
+
+from fastapi import HTTPException
+
+from bench_common import load_server, timed
+
+load_server()
+from database import SessionLocal, engine  # noqa: E402
+from hotel_inventory import hotel_inventory, stay_dates  # noqa: E402
+from models import HotelBookingModel, HotelModel, HotelRoomAvailabilityModel, HotelRoomModel  # noqa: E402
+from schemas import HotelBookingCreate, HotelSearchRequest, User  # noqa: E402
+from routers.hotel import (cancel_hotel_booking, create_hotel_booking, get_hotel_rooms,  # noqa: E402
+                           hotel_search_index, search_hotels)
+
+TOTAL_ROOMS = 5
+FIRST_NIGHT = date.today() + timedelta(days=30)
+
+
+def night(n):
+    return (FIRST_NIGHT + timedelta(days=n)).isoformat()
+
+
+def seed(db):
+    hotel = HotelModel(name="Inventory Residency", slug="inventory-residency", star_category=3,
+                       city="Stresspur", state="Karnataka", price_per_night=3000, is_active=1)
+    db.add(hotel)
+    db.flush()
+    room = HotelRoomModel(hotel_id=hotel.id, room_type="Deluxe", room_name="Deluxe Room", bed_type="King",
+                          price_per_night=3000, total_rooms=TOTAL_ROOMS, available_rooms=TOTAL_ROOMS, is_active=1)
+    db.add(room)
+    db.commit()
+    hotel_search_index.invalidate()
+    return hotel.id, room.id
+
+
+def workload(n, hotel_id, room_id, seed_value=11):
+    rng = random.Random(seed_value)
+    jobs = []
+    for i in range(n):
+        start = rng.randrange(0, 9)
+        jobs.append((hotel_id, room_id, night(start), night(min(start + rng.randint(1, 4), 10)),
+                     rng.randint(1, 2), f"guest-{i}"))
+    return jobs
+
+
+def book(job, handler=create_hotel_booking):
+    hotel_id, room_id, check_in, check_out, rooms, user_id = job
+    user = User(id=user_id, email=f"{user_id}@example.com", username=user_id)
+    request = HotelBookingCreate(hotel_id=hotel_id, room_id=room_id, check_in_date=check_in,
+                                 check_out_date=check_out, rooms_booked=rooms, guest_name=user_id,
+                                 guest_email=f"{user_id}@example.com", guest_phone="0000000000")
+    with SessionLocal() as db:
+        try:
+            return handler(request, user, db)["booking_reference"]
+        except HTTPException as e:
+            assert e.status_code == 400, e.detail
+            return None
+
+
+def run_threads(jobs, handler=create_hotel_booking):
+    barrier = threading.Barrier(len(jobs))
+    results = [None] * len(jobs)
+
+    def worker(i, job):
+        barrier.wait()
+        results[i] = (job, book(job, handler))
+
+    threads = [threading.Thread(target=worker, args=(i, job)) for i, job in enumerate(jobs)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    return results
+
+
+def _process_worker(jobs, barrier, queue):
+    engine.dispose(close=False)
+    barrier.wait()
+    queue.put(run_threads(jobs))
+
+
+def run_processes(jobs, processes):
+    ctx = multiprocessing.get_context("fork")
+    barrier, queue = ctx.Barrier(processes), ctx.Queue()
+    procs = [ctx.Process(target=_process_worker, args=(jobs[i::processes], barrier, queue))
+             for i in range(processes)]
+    for p in procs:
+        p.start()
+    results = [r for _ in procs for r in queue.get(timeout=300)]
+    for p in procs:
+        p.join()
+    assert all(p.exitcode == 0 for p in procs)
+    return results
+
+
+def booked_per_night(db, room_id):
+    booked = Counter()
+    for check_in, check_out, rooms in db.query(HotelBookingModel.check_in_date, HotelBookingModel.check_out_date,
+                                               HotelBookingModel.rooms_booked).filter(
+            HotelBookingModel.room_id == room_id, HotelBookingModel.booking_status == "confirmed"):
+        for day in stay_dates(check_in, check_out):
+            booked[day] += rooms
+    return booked
+
+
+def inventory(db, room_id):
+    return dict(db.query(HotelRoomAvailabilityModel.date, HotelRoomAvailabilityModel.available_rooms)
+                .filter(HotelRoomAvailabilityModel.room_id == room_id))
+
+
+def check(label, results, room_id):
+    with SessionLocal() as db:
+        booked = booked_per_night(db, room_id)
+        stored = inventory(db, room_id)
+    over = {day: rooms for day, rooms in booked.items() if rooms > TOTAL_ROOMS}
+    assert not over, f"{label}: overbooked nights {over}"
+    assert all(stored.get(day, TOTAL_ROOMS) == TOTAL_ROOMS - booked[day] for day in map(night, range(10))), \
+        f"{label}: inventory rows do not match the bookings"
+    ok = sum(1 for _, ref in results if ref)
+    print(f"{label:<30}{len(results):>8}{ok:>8}{len(results) - ok:>9}{max(booked.values(), default=0):>12}")
+
+
+def cancel_all(room_id):
+    with SessionLocal() as db:
+        bookings = db.query(HotelBookingModel.booking_reference, HotelBookingModel.user_id).filter(
+            HotelBookingModel.room_id == room_id, HotelBookingModel.booking_status == "confirmed").all()
+    for reference, user_id in bookings:
+        with SessionLocal() as db:
+            cancel_hotel_booking(reference, "stress test", User(id=user_id, email="x@example.com", username="x"), db)
+    with SessionLocal() as db:
+        stored = inventory(db, room_id)
+    assert all(rooms == TOTAL_ROOMS for rooms in stored.values()), f"cancelled rooms not returned: {stored}"
+    return len(bookings)
+
+
+def legacy_create_hotel_booking(booking, current_user, db):
+    """The pre-inventory check and decrement of the global counter, kept as the reference."""
+    room = db.query(HotelRoomModel).filter(HotelRoomModel.id == booking.room_id).first()
+    if room.available_rooms < booking.rooms_booked:
+        raise HTTPException(status_code=400, detail="Not enough rooms available")
+    time.sleep(0.001)  # the pricing and QR code work between the check and the write
+    room.available_rooms -= booking.rooms_booked
+    db.commit()
+    return {"booking_reference": current_user.id}
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--bookers", type=int, default=200)
+    parser.add_argument("--processes", type=int, default=4)
+    args = parser.parse_args()
+
+    with SessionLocal() as db:
+        hotel_id, room_id = seed(db)
+    jobs = workload(args.bookers, hotel_id, room_id)
+
+    print(f"{'run':<30}{'bookers':>8}{'booked':>8}{'refused':>9}{'max/night':>12}")
+    check(f"{args.bookers} threads", run_threads(jobs), room_id)
+    cancelled = cancel_all(room_id)
+    check(f"{args.processes} processes", run_processes(jobs, args.processes), room_id)
+    cancelled += cancel_all(room_id)
+    print(f"cancelled {cancelled} bookings; every night is back to {TOTAL_ROOMS} rooms")
+
+    # The last room of one night: fill it to one free room, then race for it
+    fill = [(hotel_id, room_id, night(5), night(6), 1, f"filler-{i}") for i in range(TOTAL_ROOMS - 1)]
+    assert all(ref for _, ref in run_threads(fill))
+    last = [(hotel_id, room_id, night(5), night(6), 1, f"racer-{i}") for i in range(args.bookers)]
+    winners = sum(1 for _, ref in run_threads(last) if ref)
+    assert winners == 1, f"{winners} bookings got the last room"
+    with SessionLocal() as db:
+        db.query(HotelRoomModel).filter(HotelRoomModel.id == room_id).update({"available_rooms": 1})
+        db.commit()
+    legacy_winners = sum(1 for _, ref in run_threads(last, legacy_create_hotel_booking) if ref)
+    print(f"last room, {args.bookers} racers: {winners} booked (old counter handler: {legacy_winners})")
+
+    # Dated reads agree with the inventory: night 5 is sold out, night 6 is not
+    with SessionLocal() as db:
+        sold_out = get_hotel_rooms(hotel_id, night(5), night(6), 2, db)["rooms"][0]["available_rooms"]
+        free = get_hotel_rooms(hotel_id, night(5), night(7), 2, db)["rooms"][0]["available_rooms"]
+        next_night = get_hotel_rooms(hotel_id, night(6), night(7), 2, db)["rooms"][0]["available_rooms"]
+        hidden = search_hotels(HotelSearchRequest(city="Stresspur", check_in_date=night(4), check_out_date=night(6)), db)
+        shown = search_hotels(HotelSearchRequest(city="Stresspur", check_in_date=night(6), check_out_date=night(8)), db)
+        undated = search_hotels(HotelSearchRequest(city="Stresspur"), db)
+    assert (sold_out, free, next_night) == (0, 0, TOTAL_ROOMS), (sold_out, free, next_night)
+    assert hidden["total"] == 0 and shown["total"] == 1 and undated["total"] == 1
+    print("dated room list and search hide the sold-out night")
+
+    with SessionLocal() as db:
+        stay = timed(lambda: hotel_inventory.free_rooms(db, [(room_id, TOTAL_ROOMS)], night(0), night(10)), repeat=20)
+    print(f"free rooms over a 10-night stay: {stay:.2f} ms")
+    print("OK: no night was booked beyond its rooms; cancellations return them")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,219 @@
+#!/usr/bin/env python3
+"""Check the versioned migration runner and compare startup schema costs.
+
+* a fresh database is migrated to the latest version, and a second run
+  applies nothing;
+* a "legacy" database (tables from before the version table, without the
+  booking status columns, user flags and index pack, with duplicate seat
+  availability, hotel inventory and flight schedule rows, and hotel
+  bookings made against the old global room counter) is brought up to the
+  same schema, the confirmed future stays are backfilled into the
+  per-night inventory and each flight keeps one schedule per day;
+* a database where two schedules of one flight and day both have
+  bookings fails migration 8 and keeps its old schedule index until they
+  are merged, then migrates;
+* N worker processes starting together on a fresh database apply every
+  migration exactly once between them;
+* startup cost on an up-to-date database: the version check against the
+  old create_all + index check + four ALTER TABLE attempts.
+
+Usage (from backend/): python scripts/check_migrations.py [--workers 4]
+"""
+import argparse
+import multiprocessing
+import tempfile
+from pathlib import Path
+
+from sqlalchemy import create_engine, inspect, text
+
+from bench_common import load_server, timed
+
+load_server()
+from database import Base  # noqa: E402
+from db_indexes import ensure_indexes, missing_indexes  # noqa: E402
+from migrations import MigrationRunner  # noqa: E402
+
+metadata = Base.metadata
+TMP = Path(tempfile.mkdtemp(prefix="wanderlite_migrations_"))
+
+
+def scratch_engine(name):
+    return create_engine(f"sqlite:///{TMP / name}")
+
+
+def check_fresh():
+    runner = MigrationRunner(scratch_engine("fresh.db"), metadata)
+    assert runner.current() == 0
+    applied = runner.upgrade()
+    assert applied == [m.version for m in runner.migrations], applied
+    assert runner.upgrade() == [], "second run must be a no-op"
+    assert runner.status()["pending"] == []
+    print(f"fresh database: applied {applied}, re-run applied nothing")
+
+
+def check_legacy():
+    engine = scratch_engine("legacy.db")
+    metadata.create_all(engine)
+    with engine.begin() as conn:
+        for table in ("bus_seat_availability", "flight_seat_availability", "hotel_room_availability",
+                      "flight_schedules"):
+            for ix in inspect(conn).get_indexes(table):
+                conn.execute(text(f'DROP INDEX "{ix["name"]}"'))
+        # Seat rows as the old read-then-write lock could leave them: two per seat
+        conn.execute(text("CREATE INDEX ix_bus_seat_availability_schedule_date_seat "
+                          "ON bus_seat_availability (schedule_id, journey_date, seat_id)"))
+        conn.execute(text("INSERT INTO bus_seat_availability (schedule_id, seat_id, journey_date, status, booking_id) "
+                          "VALUES (1, 1, '2030-01-01', 'locked', NULL), (1, 1, '2030-01-01', 'booked', 'bb1'), "
+                          "(1, 2, '2030-01-01', 'locked', NULL)"))
+        conn.execute(text("INSERT INTO flight_seat_availability (schedule_id, seat_id, status, locked_by) "
+                          "VALUES (1, 1, 'locked', 'u1'), (1, 1, 'locked', 'u2')"))
+        # Flight schedules created by two concurrent searches; seats were held on the second one
+        conn.execute(text("CREATE INDEX ix_flight_schedules_flight_date ON flight_schedules (flight_id, flight_date)"))
+        for schedule_id, day in ((2, "2030-01-01"), (1, "2030-01-01"), (3, "2030-01-02")):
+            conn.execute(text("INSERT INTO flight_schedules (id, flight_id, flight_date, departure_datetime, "
+                              "arrival_datetime, economy_price, available_economy) "
+                              "VALUES (:id, 1, :day, :day, :day, 5000, 150)"), {"id": schedule_id, "day": day})
+        # Hotel nights: a duplicated inventory row, and stays booked before per-night inventory
+        conn.execute(text("INSERT INTO hotel_rooms (id, hotel_id, room_type, room_name, bed_type, price_per_night, "
+                          "total_rooms, available_rooms) VALUES (1, 1, 'Deluxe', 'Deluxe', 'King', 2000, 5, 1)"))
+        conn.execute(text("INSERT INTO hotel_room_availability (room_id, date, available_rooms, price) "
+                          "VALUES (1, '2030-01-01', 4, 2000), (1, '2030-01-01', 3, 2000)"))
+        for ref, check_in, check_out, status in (("H1", "2030-01-01", "2030-01-03", "confirmed"),
+                                                 ("H2", "2030-01-02", "2030-01-03", "cancelled"),
+                                                 ("H3", "2020-01-01", "2020-01-02", "confirmed")):
+            conn.execute(text(
+                "INSERT INTO hotel_bookings (booking_id, booking_reference, user_id, hotel_id, room_id, check_in_date, "
+                "check_out_date, nights, rooms_booked, guest_name, guest_email, guest_phone, base_price, taxes, "
+                "total_amount, booking_status) VALUES (:ref, :ref, 'u1', 1, 1, :check_in, :check_out, 2, 2, 'G', "
+                "'g@example.com', '0', 1, 1, 1, :status)"),
+                {"ref": ref, "check_in": check_in, "check_out": check_out, "status": status})
+        for column in ("status", "cancelled_at", "completed_at"):
+            conn.execute(text(f"ALTER TABLE bookings DROP COLUMN {column}"))
+        conn.execute(text("ALTER TABLE users DROP COLUMN is_kyc_completed"))
+    runner = MigrationRunner(engine, metadata)
+    applied = runner.upgrade()
+    inspector = inspect(engine)
+    booking_columns = {c["name"] for c in inspector.get_columns("bookings")}
+    user_columns = {c["name"] for c in inspector.get_columns("users")}
+    assert {"status", "cancelled_at", "completed_at"} <= booking_columns
+    assert {"is_kyc_completed", "is_blocked"} <= user_columns
+    assert missing_indexes(engine, metadata) == []
+    with engine.connect() as conn:
+        settings = conn.execute(text("SELECT COUNT(*) FROM platform_settings")).scalar()
+        conn.execute(text("INSERT INTO bookings (id, user_id, destination, booking_ref) "
+                          "VALUES ('b1', 'u1', 'Goa', 'REF1')"))
+        status = conn.execute(text("SELECT status FROM bookings WHERE id = 'b1'")).scalar()
+        bus_seats = conn.execute(text("SELECT seat_id, status FROM bus_seat_availability ORDER BY seat_id")).all()
+        flight_seats = conn.execute(text("SELECT COUNT(*) FROM flight_seat_availability")).scalar()
+        nights = conn.execute(text("SELECT date, available_rooms FROM hotel_room_availability ORDER BY date")).all()
+        schedules = conn.execute(text("SELECT id FROM flight_schedules ORDER BY id")).scalars().all()
+    # 2030-01-01 keeps the row with fewer rooms left; 2030-01-02 is backfilled from the confirmed stay
+    assert [tuple(row) for row in nights] == [("2030-01-01", 3), ("2030-01-02", 3)], nights
+    # Schedule 1 carries the held seats, so its unreferenced twin (2) goes
+    assert schedules == [1, 3], schedules
+    assert settings == 3 and status == "Confirmed", (settings, status)
+    assert [tuple(row) for row in bus_seats] == [(1, "booked"), (2, "locked")] and flight_seats == 1, \
+        (bus_seats, flight_seats)
+    assert "ix_bus_seat_availability_schedule_date_seat" not in \
+        {ix["name"] for ix in inspector.get_indexes("bus_seat_availability")}
+    print(f"legacy database: applied {applied}; columns, indexes, settings, one row per seat, "
+          f"hotel nights restored and one schedule per flight and day")
+
+
+def check_unmerged_schedules():
+    engine = scratch_engine("unmerged.db")
+    metadata.create_all(engine)
+    with engine.begin() as conn:
+        for ix in inspect(conn).get_indexes("flight_schedules"):
+            conn.execute(text(f'DROP INDEX "{ix["name"]}"'))
+        conn.execute(text("CREATE INDEX ix_flight_schedules_flight_date ON flight_schedules (flight_id, flight_date)"))
+        for schedule_id in (1, 2):
+            conn.execute(text("INSERT INTO flight_schedules (id, flight_id, flight_date, departure_datetime, "
+                              "arrival_datetime, economy_price, available_economy) "
+                              "VALUES (:id, 1, '2030-01-01', '2030-01-01', '2030-01-01', 5000, 150)"), {"id": schedule_id})
+            conn.execute(text("INSERT INTO flight_segments (booking_id, segment_order, schedule_id, segment_type, "
+                              "segment_pnr) VALUES (:id, 1, :id, 'outbound', 'PNR')"), {"id": schedule_id})
+    runner = MigrationRunner(engine, metadata)
+    try:
+        runner.upgrade()
+    except RuntimeError as e:
+        print(f"unmerged booked schedules: migration failed as expected ({e})")
+    else:
+        raise AssertionError("migration 8 must fail while booked schedules are duplicated")
+    indexes = {ix["name"] for ix in inspect(engine).get_indexes("flight_schedules")}
+    assert runner.current() < 8 and "ix_flight_schedules_flight_date" in indexes, (runner.current(), indexes)
+    with engine.begin() as conn:
+        conn.execute(text("UPDATE flight_segments SET schedule_id = 1"))
+    applied = runner.upgrade()
+    indexes = {ix["name"] for ix in inspect(engine).get_indexes("flight_schedules")}
+    assert 8 in applied and indexes >= {"ux_flight_schedules_flight_date"} \
+        and "ix_flight_schedules_flight_date" not in indexes, (applied, indexes)
+    print("after merging them: migrated, unique schedule key in place of the old index")
+
+
+def _worker(url, barrier, results):
+    runner = MigrationRunner(create_engine(url), metadata, lock_timeout=60)
+    barrier.wait()
+    results.put(runner.upgrade())
+
+
+def check_concurrent(workers):
+    url = f"sqlite:///{TMP / 'workers.db'}"
+    ctx = multiprocessing.get_context("fork")
+    barrier, results = ctx.Barrier(workers), ctx.Queue()
+    procs = [ctx.Process(target=_worker, args=(url, barrier, results)) for _ in range(workers)]
+    for p in procs:
+        p.start()
+    applied = [results.get(timeout=120) for _ in procs]
+    for p in procs:
+        p.join()
+    assert all(p.exitcode == 0 for p in procs)
+    versions = sorted(v for run in applied for v in run)
+    runner = MigrationRunner(create_engine(url), metadata)
+    assert versions == [m.version for m in runner.migrations], applied
+    with runner.engine.connect() as conn:
+        rows = conn.execute(text("SELECT COUNT(*) FROM schema_migrations")).scalar()
+    assert rows == runner.latest
+    print(f"{workers} workers starting together: {sorted(map(len, applied), reverse=True)} "
+          f"migrations applied per worker, each version once")
+
+
+def legacy_startup(engine):
+    """What every worker did at startup before the migration runner."""
+    metadata.create_all(bind=engine)
+    ensure_indexes(engine, metadata)
+    with engine.connect() as conn:
+        for ddl in ("ALTER TABLE bookings ADD COLUMN status VARCHAR(20) DEFAULT 'Confirmed'",
+                    "ALTER TABLE bookings ADD COLUMN cancelled_at DATETIME NULL",
+                    "ALTER TABLE bookings ADD COLUMN completed_at DATETIME NULL",
+                    "ALTER TABLE users ADD COLUMN is_blocked INTEGER DEFAULT 0"):
+            try:
+                conn.execute(text(ddl))
+            except Exception:
+                pass
+
+
+def compare_startup():
+    engine = scratch_engine("startup.db")
+    runner = MigrationRunner(engine, metadata)
+    runner.upgrade()
+    old_ms = timed(lambda: legacy_startup(engine), repeat=10)
+    new_ms = timed(lambda: runner.current() == runner.latest, repeat=10)
+    print(f"\n{'startup schema step':<44}{'ms':>8}")
+    print(f"{'create_all + index check + 4 ALTER TABLE':<44}{old_ms:>8.2f}")
+    print(f"{'schema version check':<44}{new_ms:>8.2f}")
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--workers", type=int, default=4)
+    args = parser.parse_args()
+    check_fresh()
+    check_legacy()
+    check_unmerged_schedules()
+    check_concurrent(args.workers)
+    compare_startup()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,168 @@
+#!/usr/bin/env python3
+"""CI check: hot endpoints must not full-scan the hot tables.
+
+Seeds the demo flight, bus, hotel and restaurant data into a scratch
+SQLite database, turns on the slow-query monitor's scan check, drives the
+hot paths (flight/bus search, seat maps and seat locks, the expired-hold
+sweep, dated hotel search, room lists and bookings, restaurant queue status, notifications, reviews, "my bookings",
+admin listings) and exits 1 if any statement full-scanned one of
+HOT_TABLES. Every flagged statement is printed with its plan.
+
+With --self-test it first drops the declared index pack, checks the
+detector reports the scans, re-applies the indexes with the same
+`ensure_indexes` migration the server runs at startup and checks again.
+
+Usage (from backend/): python scripts/check_query_plans.py [--self-test]
+"""
+import argparse
+import sys
+import uuid
+from datetime import date, timedelta
+from types import SimpleNamespace
+
+from fastapi.testclient import TestClient
+from sqlalchemy import inspect, text
+
+from bench_common import load_server
+
+server = load_server()
+from database import Base, SessionLocal, engine, slow_queries  # noqa: E402
+from models import (AirportModel, BusRouteModel, BusScheduleModel, FlightRouteModel, HotelModel,  # noqa: E402
+                    HotelRoomModel, RestaurantQueueModel)
+from security import get_current_admin, get_current_user  # noqa: E402
+from routers.bus import seed_bus_data  # noqa: E402
+from routers.flight import seed_flight_data  # noqa: E402
+from routers.hotel import seed_hotel_data  # noqa: E402
+from routers.restaurant import seed_restaurants  # noqa: E402
+from db_indexes import ensure_indexes  # noqa: E402
+from seat_holds import seat_holds  # noqa: E402
+monitor = slow_queries
+
+# Tables that grow with traffic and sit behind per-request lookups
+HOT_TABLES = {
+    "bus_seat_availability", "flight_seat_availability", "flight_schedules", "restaurant_queue",
+    "notifications", "hotel_reviews", "restaurant_reviews", "flight_segments", "flight_passengers",
+    "bus_passengers", "flight_bookings", "bus_bookings", "hotel_bookings", "service_bookings",
+    "transactions", "users", "audit_logs", "hotel_rooms", "hotel_room_availability",
+}
+USER_ID = str(uuid.uuid4())
+
+
+def seed():
+    with SessionLocal() as db:
+        seed_flight_data(db)
+        seed_bus_data(db)
+        seed_hotel_data(db)
+        seed_restaurants(db)
+        db.add(RestaurantQueueModel(
+            queue_number="Q001", user_id=USER_ID, restaurant_id=1, queue_date=date.today(),
+            guests_count=2, guest_name="CI", guest_phone="0000000000", position=1))
+        db.commit()
+
+
+def hot_requests(client):
+    """(label, response) for every hot read path; the statements are what matters."""
+    journey = (date.today() + timedelta(days=7)).isoformat()
+    with SessionLocal() as db:
+        route = db.query(FlightRouteModel).first()
+        origin = db.get(AirportModel, route.origin_airport_id).code
+        dest = db.get(AirportModel, route.destination_airport_id).code
+        bus_route = db.query(BusRouteModel).first()
+        bus_schedule = db.query(BusScheduleModel).filter_by(route_id=bus_route.id).first()
+        hotel = db.query(HotelModel).first()
+        room = db.query(HotelRoomModel).filter_by(hotel_id=hotel.id).first()
+
+    flights = client.post("/api/flight/search", json={
+        "origin_code": origin, "destination_code": dest, "departure_date": journey})
+    yield "flight search", flights
+    outbound = flights.json().get("outbound") or [{}]
+    schedule_id = outbound[0].get("schedule_id", 1)
+    flight_seats = client.get(f"/api/flight/seats/{schedule_id}")
+    yield "flight seats", flight_seats
+    yield "flight seat lock", client.post("/api/flight/seats/lock", json={
+        "schedule_id": schedule_id, "seat_ids": [seat["id"] for seat in flight_seats.json()["seats"][:2]]})
+    yield "bus search", client.post("/api/bus/search", json={
+        "from_city_id": bus_route.from_city_id, "to_city_id": bus_route.to_city_id, "journey_date": journey})
+    bus_seats = client.get(f"/api/bus/seats/{bus_schedule.id}/{journey}")
+    yield "bus seats", bus_seats
+    yield "bus seat lock", client.post("/api/bus/seats/lock", json={
+        "schedule_id": bus_schedule.id, "journey_date": journey,
+        "seat_ids": [seat["id"] for seat in bus_seats.json()["seats"][:2]]})
+    seat_holds.sweep(SessionLocal)
+    yield "expired-hold sweep", SimpleNamespace(status_code=200)
+    check_out = (date.today() + timedelta(days=9)).isoformat()
+    yield "hotel search with dates", client.post("/api/hotel/search", json={
+        "city": hotel.city, "check_in_date": journey, "check_out_date": check_out})
+    yield "hotel rooms with dates", client.get(f"/api/hotel/{hotel.id}/rooms",
+                                               params={"check_in": journey, "check_out": check_out})
+    yield "hotel booking", client.post("/api/hotel/book", json={
+        "hotel_id": hotel.id, "room_id": room.id, "check_in_date": journey, "check_out_date": check_out,
+        "guest_name": "CI", "guest_email": "ci@example.com", "guest_phone": "0000000000"})
+    yield "queue status", client.get("/api/restaurant/queue/1/status")
+    yield "notifications", client.get("/api/notifications")
+    yield "unread notifications", client.get("/api/notifications", params={"unread_only": True})
+    yield "hotel reviews", client.get("/api/hotel/1/reviews")
+    yield "restaurant reviews", client.get("/api/restaurant/1/reviews")
+    for kind in ("flight", "bus", "hotel"):
+        yield f"{kind} my-bookings", client.get(f"/api/{kind}/my-bookings")
+    for url in ("/api/admin/users", "/api/admin/bookings", "/api/admin/transactions", "/api/admin/audit-logs",
+                "/api/admin/bus/bookings"):
+        yield url, client.get(url)
+
+
+def run_check(client, label):
+    monitor.reset()
+    for name, response in hot_requests(client):
+        if response.status_code >= 500:
+            print(f"  {name}: HTTP {response.status_code}")
+    scans = monitor.scans()
+    hot = sorted(t for t in scans if t in HOT_TABLES)
+    print(f"{label}: {monitor.stats()['statements']} statements; full scans of hot tables: {hot or 'none'}")
+    if hot:
+        for statement in monitor.scan_statements():
+            if set(statement["full_scans"]) & HOT_TABLES:
+                print(f"  {statement['sql'][:160]}\n    plan: {'; '.join(statement['plan'])}")
+    return hot
+
+
+def drop_index_pack():
+    dropped = []
+    declared = {ix.name for table in Base.metadata.sorted_tables for ix in table.indexes}
+    with engine.begin() as conn:
+        for table in HOT_TABLES:
+            for ix in inspect(conn).get_indexes(table):
+                if ix["name"] in declared:
+                    conn.execute(text(f'DROP INDEX "{ix["name"]}"'))
+                    dropped.append(ix["name"])
+    return dropped
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--self-test", action="store_true",
+                        help="drop the index pack first and check the detector notices")
+    args = parser.parse_args()
+
+    seed()
+    monitor.scan_check = True
+    server.app.dependency_overrides[get_current_admin] = lambda: None
+    server.app.dependency_overrides[get_current_user] = lambda: SimpleNamespace(id=USER_ID)
+    with TestClient(server.app) as client:
+        if args.self_test:
+            dropped = drop_index_pack()
+            hot = run_check(client, f"without the index pack ({len(dropped)} indexes dropped)")
+            assert hot, "the scan check missed the dropped indexes"
+            created = ensure_indexes(engine, Base.metadata)
+            assert sorted(created) == sorted(dropped), (created, dropped)
+            print(f"ensure_indexes re-created {len(created)} indexes")
+        hot = run_check(client, "with the index pack")
+    server.app.dependency_overrides.clear()
+    if hot:
+        print("FAIL: hot tables are full-scanned")
+        return 1
+    print("OK: no hot table is full-scanned")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,292 @@
+#!/usr/bin/env python3
+"""Stress test: concurrent seat locks never hand one seat to two users.
+
+Seeds a 40-seat bus schedule and a 60-seat flight schedule, then releases
+--lockers simultaneous lock requests (random users, 1-4 random seats
+each, half bus / half flight) through the real /seats/lock handlers:
+  * in one process, one thread per locker;
+  * across --processes forked workers, where the in-process striped
+    locks are not shared and only the database keeps holds atomic.
+Every granted hold is still live when the run ends, so a seat granted to
+two different users is a double-hold. The check also requires exactly
+one availability row per seat, held by the user it was granted to.
+
+The same workload is replayed against the old read-then-write handler
+(kept below as the reference) on a table without the unique key, to
+show what the check catches. Finally the holds are expired and swept.
+
+Usage (from backend/): python scripts/check_seat_holds.py [--lockers 500] [--processes 4]
+"""
+import argparse
+import multiprocessing
+import random
+import statistics
+import threading
+import time
+from collections import defaultdict
+from datetime import date, datetime, timedelta, timezone
+
+from fastapi import HTTPException
+from sqlalchemy import create_engine, func, update
+from sqlalchemy.orm import sessionmaker
+
+from bench_common import load_server, timed
+
+load_server()
+from database import Base, SessionLocal, engine  # noqa: E402
+from models import (AircraftModel, BusModel, BusOperatorModel, BusScheduleModel,  # noqa: E402
+                    BusSeatAvailabilityModel, BusSeatModel, FlightModel, FlightScheduleModel,
+                    FlightSeatAvailabilityModel, FlightSeatModel)
+from schemas import BusSeatLockRequest, FlightSeatLockRequest, User  # noqa: E402
+from routers.bus import get_seat_layout, lock_seats  # noqa: E402
+from routers.flight import lock_flight_seats  # noqa: E402
+from seat_holds import seat_holds  # noqa: E402
+
+JOURNEY_DATE = (date.today() + timedelta(days=7)).isoformat()
+
+
+def seed(db):
+    operator = BusOperatorModel(name="Stress Travels")
+    db.add(operator)
+    db.flush()
+    bus = BusModel(operator_id=operator.id, bus_number="KA-02", bus_type="AC Seater", total_seats=40)
+    db.add(bus)
+    db.flush()
+    bus_schedule = BusScheduleModel(bus_id=bus.id, route_id=1, departure_time="21:00",
+                                    arrival_time="05:00", base_price=900)
+    db.add(bus_schedule)
+    aircraft = AircraftModel(model="ATR72", total_seats=60, economy_seats=60, seat_layout="2-2")
+    db.add(aircraft)
+    db.flush()
+    flight = FlightModel(flight_number="6E-202", airline_id=1, route_id=1, aircraft_id=aircraft.id,
+                         departure_time="08:00", arrival_time="09:30", duration_mins=90,
+                         days_of_week="1,2,3,4,5,6,7", base_price_economy=3200)
+    db.add(flight)
+    db.flush()
+    dep = datetime.now() + timedelta(days=7)
+    flight_schedule = FlightScheduleModel(flight_id=flight.id, flight_date=dep.date().isoformat(),
+                                          departure_datetime=dep, arrival_datetime=dep + timedelta(minutes=90),
+                                          economy_price=3200, available_economy=60)
+    db.add(flight_schedule)
+    db.flush()
+    db.bulk_insert_mappings(BusSeatModel, [
+        {"bus_id": bus.id, "seat_number": f"S{n}", "seat_type": "seater", "is_active": 1, "price_modifier": 0}
+        for n in range(1, 41)
+    ])
+    db.bulk_insert_mappings(FlightSeatModel, [
+        {"aircraft_id": aircraft.id, "seat_number": f"{row}{col}", "seat_class": "economy",
+         "seat_type": "aisle", "row_number": row, "column_letter": col, "price_modifier": 0, "is_active": 1}
+        for row in range(1, 16) for col in "ABCD"
+    ])
+    db.commit()
+    bus_seats = [s.id for s in db.query(BusSeatModel).filter(BusSeatModel.bus_id == bus.id)]
+    flight_seats = [s.id for s in db.query(FlightSeatModel).filter(FlightSeatModel.aircraft_id == aircraft.id)]
+    return bus_schedule.id, bus_seats, flight_schedule.id, flight_seats
+
+
+def workload(n, bus_schedule, bus_seats, flight_schedule, flight_seats, seed_value=7):
+    """(kind, schedule_id, seat_ids, user_id) per locker; 200 users, so some lock twice."""
+    rng = random.Random(seed_value)
+    jobs = []
+    for i in range(n):
+        kind = "bus" if i % 2 == 0 else "flight"
+        pool = bus_seats if kind == "bus" else flight_seats
+        seats = rng.sample(pool, rng.randint(1, 4))
+        jobs.append((kind, bus_schedule if kind == "bus" else flight_schedule, seats, f"user-{rng.randrange(200)}"))
+    return jobs
+
+
+def lock(job, session_factory, bus_lock=None):
+    kind, schedule_id, seats, user_id = job
+    user = User(id=user_id, email=f"{user_id}@example.com", username=user_id)
+    db = session_factory()
+    try:
+        if kind == "bus":
+            request = BusSeatLockRequest(schedule_id=schedule_id, journey_date=JOURNEY_DATE, seat_ids=seats)
+            (bus_lock or lock_seats)(request, user, db)
+        else:
+            lock_flight_seats(FlightSeatLockRequest(schedule_id=schedule_id, seat_ids=seats), user, db)
+        return True
+    except HTTPException as e:
+        assert e.status_code == 400, e.detail
+        return False
+    finally:
+        db.close()
+
+
+def run_threads(jobs, session_factory, bus_lock=None):
+    """Run every job on its own thread, released together; returns [(job, granted, ms)]"""
+    barrier = threading.Barrier(len(jobs))
+    results = [None] * len(jobs)
+
+    def worker(i, job):
+        barrier.wait()
+        start = time.perf_counter()
+        granted = lock(job, session_factory, bus_lock)
+        results[i] = (job, granted, (time.perf_counter() - start) * 1000)
+
+    threads = [threading.Thread(target=worker, args=(i, job)) for i, job in enumerate(jobs)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    return results
+
+
+def _process_worker(jobs, barrier, queue):
+    engine.dispose(close=False)
+    barrier.wait()
+    queue.put(run_threads(jobs, SessionLocal))
+
+
+def run_processes(jobs, processes):
+    ctx = multiprocessing.get_context("fork")
+    barrier, queue = ctx.Barrier(processes), ctx.Queue()
+    chunks = [jobs[i::processes] for i in range(processes)]
+    procs = [ctx.Process(target=_process_worker, args=(chunk, barrier, queue)) for chunk in chunks]
+    for p in procs:
+        p.start()
+    results = [r for _ in procs for r in queue.get(timeout=300)]
+    for p in procs:
+        p.join()
+    assert all(p.exitcode == 0 for p in procs)
+    return results
+
+
+def double_holds(results):
+    """Seats granted to more than one distinct user, and the seat -> user map otherwise"""
+    holders = defaultdict(set)
+    for (kind, schedule_id, seats, user_id), granted, _ in results:
+        if granted:
+            for seat_id in seats:
+                holders[(kind, schedule_id, seat_id)].add(user_id)
+    doubles = {key: users for key, users in holders.items() if len(users) > 1}
+    return doubles, {key: next(iter(users)) for key, users in holders.items()}
+
+
+def stored_holds(db):
+    """(kind, schedule_id, seat_id) -> [locked_by, ...] for every locked row"""
+    stored = defaultdict(list)
+    for model, kind in ((BusSeatAvailabilityModel, "bus"), (FlightSeatAvailabilityModel, "flight")):
+        for schedule_id, seat_id, locked_by in db.query(model.schedule_id, model.seat_id, model.locked_by) \
+                .filter(model.status == "locked"):
+            stored[(kind, schedule_id, seat_id)].append(locked_by)
+    return stored
+
+
+def clear_holds():
+    with SessionLocal() as db:
+        db.query(BusSeatAvailabilityModel).delete()
+        db.query(FlightSeatAvailabilityModel).delete()
+        db.commit()
+
+
+def check(label, results):
+    doubles, granted = double_holds(results)
+    with SessionLocal() as db:
+        stored = stored_holds(db)
+    assert not doubles, f"{label}: double holds {dict(list(doubles.items())[:5])}"
+    assert all(len(users) == 1 for users in stored.values()), f"{label}: duplicate availability rows"
+    assert {key: users[0] for key, users in stored.items()} == granted, f"{label}: stored holders differ"
+    latencies = sorted(ms for _, _, ms in results)
+    ok = sum(1 for _, granted_, _ in results if granted_)
+    print(f"{label:<28}{len(results):>8}{ok:>9}{len(results) - ok:>9}{len(granted):>7}{0:>8}"
+          f"{statistics.median(latencies):>9.1f}{latencies[int(len(latencies) * 0.95) - 1]:>9.1f}")
+
+
+def legacy_lock_seats(request, current_user, db):
+    """The pre-seat-holds handler, kept as the reference."""
+    locked_seats = []
+    lock_until = datetime.now(timezone.utc) + timedelta(minutes=5)
+    for seat_id in request.seat_ids:
+        existing = db.query(BusSeatAvailabilityModel).filter(
+            BusSeatAvailabilityModel.schedule_id == request.schedule_id,
+            BusSeatAvailabilityModel.seat_id == seat_id,
+            BusSeatAvailabilityModel.journey_date == request.journey_date
+        ).first()
+        if existing:
+            if existing.status == "booked":
+                raise HTTPException(status_code=400, detail="Seat already booked")
+            elif existing.status == "locked" and existing.locked_until.replace(tzinfo=timezone.utc) \
+                    > datetime.now(timezone.utc):
+                if existing.locked_by != current_user.id:
+                    raise HTTPException(status_code=400, detail="Seat is temporarily unavailable")
+            existing.status = "locked"
+            existing.locked_by = current_user.id
+            existing.locked_until = lock_until
+        else:
+            db.add(BusSeatAvailabilityModel(schedule_id=request.schedule_id, seat_id=seat_id,
+                                            journey_date=request.journey_date, status="locked",
+                                            locked_by=current_user.id, locked_until=lock_until))
+        locked_seats.append(seat_id)
+    db.commit()
+    return {"locked_seats": locked_seats}
+
+
+def legacy_run(jobs):
+    """Bus jobs through the old handler, on a copy of the schema without the unique key"""
+    legacy_engine = create_engine(f"{engine.url}-legacy", connect_args={"timeout": 30})
+    Base.metadata.create_all(legacy_engine)
+    with legacy_engine.begin() as conn:
+        conn.exec_driver_sql("DROP INDEX ux_bus_seat_availability_schedule_date_seat")
+    results = run_threads([job for job in jobs if job[0] == "bus"], sessionmaker(bind=legacy_engine),
+                          bus_lock=legacy_lock_seats)
+    doubles, _ = double_holds(results)
+    with legacy_engine.connect() as conn:
+        rows = conn.exec_driver_sql("SELECT COUNT(*), COUNT(DISTINCT seat_id) FROM bus_seat_availability").one()
+    ok = sum(1 for _, granted, _ in results if granted)
+    print(f"{'old read-then-write (bus)':<28}{len(results):>8}{ok:>9}{len(results) - ok:>9}"
+          f"{rows[1]:>7}{len(doubles):>8}   ({rows[0] - rows[1]} duplicate rows)")
+
+
+def check_sweeper(bus_schedule):
+    with SessionLocal() as db:
+        held = db.query(func.count(BusSeatAvailabilityModel.id)).filter(
+            BusSeatAvailabilityModel.status == "locked").scalar()
+        held += db.query(func.count(FlightSeatAvailabilityModel.id)).filter(
+            FlightSeatAvailabilityModel.status == "locked").scalar()
+        db.execute(update(BusSeatAvailabilityModel).values(
+            locked_until=datetime.now(timezone.utc) - timedelta(minutes=1)))
+        db.execute(update(FlightSeatAvailabilityModel).values(locked_until=datetime.now() - timedelta(minutes=1)))
+        db.commit()
+        layout = get_seat_layout(bus_schedule, JOURNEY_DATE, db)
+    seat_holds.sweep_batch = 25
+    start = time.perf_counter()
+    released = seat_holds.sweep(SessionLocal)
+    elapsed = (time.perf_counter() - start) * 1000
+    with SessionLocal() as db:
+        stored = stored_holds(db)
+        after = get_seat_layout(bus_schedule, JOURNEY_DATE, db)
+    assert released == held and not stored, (released, held, len(stored))
+    assert all(seat["status"] == "available" for seat in after["seats"]), "seat map kept swept holds"
+    assert all(seat["status"] == "available" for seat in layout["seats"]), "expired holds must read as free"
+    print(f"\nsweeper: released {released} expired holds in {elapsed:.1f} ms (batches of {seat_holds.sweep_batch})")
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--lockers", type=int, default=500)
+    parser.add_argument("--processes", type=int, default=4)
+    args = parser.parse_args()
+
+    with SessionLocal() as db:
+        bus_schedule, bus_seats, flight_schedule, flight_seats = seed(db)
+    jobs = workload(args.lockers, bus_schedule, bus_seats, flight_schedule, flight_seats)
+
+    print(f"{'run':<28}{'lockers':>8}{'granted':>9}{'refused':>9}{'seats':>7}{'double':>8}"
+          f"{'p50 ms':>9}{'p95 ms':>9}")
+    check(f"{args.lockers} threads", run_threads(jobs, SessionLocal))
+    clear_holds()
+    check(f"{args.processes} processes", run_processes(jobs, args.processes))
+    legacy_run(jobs)
+
+    check_sweeper(bus_schedule)
+    # A user re-locking seats they already hold extends the hold
+    renew = [("bus", bus_schedule, bus_seats[:2], "renewing-user")]
+    assert all(granted for _, granted, _ in run_threads(renew * 3, SessionLocal))
+    print(f"uncontended bus hold: {timed(lambda: lock(renew[0], SessionLocal), repeat=20):.2f} ms")
+    print("OK: no seat was held by two users; expired holds are swept")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+"""Load test: /api/status latency while heavy hotel search traffic runs.
+
+Starts the real app under uvicorn against a scratch SQLite database seeded
+with a few thousand hotels, measures GET /api/status on its own, then again
+while a pool of clients hammers POST /api/hotel/search (an unindexed
+`ILIKE '%city%'` scan). DB-bound handlers run in the worker thread pool, so
+the event loop keeps answering cheap requests: the status p99 must stay
+within a fixed budget instead of queueing behind every search. (With
+in-process SQLite the searches still compete for CPU, so on a single core
+the loaded p99 still grows with --workers; with MySQL the worker threads
+mostly wait on the network and the gap should be much smaller.)
+
+Usage (from backend/): python scripts/load_test_event_loop.py [--hotels N]
+"""
+import argparse
+import asyncio
+import socket
+import statistics
+import threading
+import time
+
+import httpx
+import uvicorn
+
+from bench_common import load_server
+
+server = load_server()
+from database import SessionLocal  # noqa: E402
+from models import HotelModel, StatusCheckModel  # noqa: E402
+
+CITIES = ["Goa", "Jaipur", "Mumbai", "Chennai", "Kochi", "Udaipur", "Manali", "Delhi"]
+
+
+def seed_hotels(count):
+    db = SessionLocal()
+    db.bulk_insert_mappings(HotelModel, [
+        {
+            "name": f"Load Hotel {i}",
+            "slug": f"load-hotel-{i}",
+            "star_category": 1 + i % 5,
+            "city": CITIES[i % len(CITIES)],
+            "state": "Somewhere",
+            "rating": (i % 50) / 10,
+            "reviews_count": i % 997,
+            "price_per_night": 1000 + (i * 37) % 9000,
+            "amenities": '["wifi", "pool", "spa"]',
+            "images": '["https://example.com/a.jpg"]',
+            "is_active": 1,
+        }
+        for i in range(count)
+    ])
+    db.add(StatusCheckModel(client_name="load-test"))
+    db.commit()
+    db.close()
+
+
+def free_port():
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def start_app(port):
+    config = uvicorn.Config(server.app, host="127.0.0.1", port=port, log_level="warning")
+    app_server = uvicorn.Server(config)
+    thread = threading.Thread(target=app_server.run, daemon=True)
+    thread.start()
+    while not app_server.started:
+        time.sleep(0.05)
+    return app_server, thread
+
+
+def percentile(samples, pct):
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * pct / 100))]
+
+
+async def probe_status(client, samples, stop, interval):
+    while not stop.is_set():
+        start = time.perf_counter()
+        response = await client.get("/api/status")
+        response.raise_for_status()
+        samples.append((time.perf_counter() - start) * 1000)
+        await asyncio.sleep(interval)
+
+
+async def search_worker(client, stop, counter):
+    i = 0
+    while not stop.is_set():
+        body = {"city": CITIES[i % len(CITIES)], "sort_by": "rating", "limit": 50}
+        response = await client.post("/api/hotel/search", json=body)
+        response.raise_for_status()
+        counter[0] += 1
+        i += 1
+
+
+async def run_phase(base_url, seconds, workers):
+    samples, counter = [], [0]
+    stop = asyncio.Event()
+    limits = httpx.Limits(max_connections=workers + 4)
+    async with httpx.AsyncClient(base_url=base_url, limits=limits, timeout=30) as client:
+        tasks = [asyncio.create_task(probe_status(client, samples, stop, 0.01))]
+        tasks += [asyncio.create_task(search_worker(client, stop, counter)) for _ in range(workers)]
+        await asyncio.sleep(seconds)
+        stop.set()
+        await asyncio.gather(*tasks)
+    return samples, counter[0]
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--hotels", type=int, default=5000)
+    parser.add_argument("--workers", type=int, default=16)
+    parser.add_argument("--seconds", type=float, default=5.0)
+    parser.add_argument("--p99-budget-ms", type=float, default=1000.0,
+                        help="fail if /api/status p99 under load exceeds this")
+    args = parser.parse_args()
+
+    seed_hotels(args.hotels)
+    port = free_port()
+    app_server, thread = start_app(port)
+    base_url = f"http://127.0.0.1:{port}"
+
+    try:
+        idle, _ = asyncio.run(run_phase(base_url, args.seconds, workers=0))
+        loaded, searches = asyncio.run(run_phase(base_url, args.seconds, workers=args.workers))
+    finally:
+        app_server.should_exit = True
+        thread.join(timeout=5)
+
+    print(f"{'phase':<22} {'n':>6} {'p50 ms':>8} {'p99 ms':>8}")
+    for name, samples in (("idle", idle), (f"{args.workers} search workers", loaded)):
+        print(f"{name:<22} {len(samples):>6} {statistics.median(samples):>8.1f} {percentile(samples, 99):>8.1f}")
+    print(f"hotel searches served: {searches} ({searches / args.seconds:.0f}/s)")
+
+    loaded_p99 = percentile(loaded, 99)
+    assert loaded_p99 <= args.p99_budget_ms, f"/api/status p99 {loaded_p99:.0f} ms under search load"
+    print(f"OK: /api/status p99 {loaded_p99 / max(percentile(idle, 99), 1.0):.1f}x idle, "
+          f"within {args.p99_budget_ms:.0f} ms budget")
+
+
+if __name__ == "__main__":
+    main()
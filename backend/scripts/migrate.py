@@ -0,0 +1,46 @@
+#!/usr/bin/env python3
+"""Bring the database schema up to the version this build expects.
+
+Workers migrate a database that is behind on their own at startup (one at
+a time, under the migration lock) unless SCHEMA_AUTO_MIGRATE=0. With
+several workers or a large MySQL database, run this once before
+deploying instead and start the workers with SCHEMA_AUTO_MIGRATE=0:
+
+    python scripts/migrate.py            (from backend/)
+    python scripts/migrate.py --status   # show the version and pending migrations
+
+Replaces the old SQLite-only migrate_db.py. Uses MYSQL_URL from the
+environment / backend/.env, like the server.
+"""
+import argparse
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+import database  # noqa: E402
+import models  # noqa: E402,F401  (registers the tables on Base.metadata)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--status", action="store_true", help="show the schema version without migrating")
+    args = parser.parse_args()
+
+    database.ensure_database()
+    status = database.schema.status()
+    print(f"schema version {status['current']} of {status['latest']}")
+    for pending in status["pending"]:
+        print(f"  pending {pending}")
+    if args.status:
+        return 1 if status["pending"] else 0
+    start = time.perf_counter()
+    applied = database.schema.upgrade()
+    print(f"applied {len(applied)} migrations in {time.perf_counter() - start:.1f}s; "
+          f"now at version {database.schema.current()}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
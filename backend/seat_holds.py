@@ -0,0 +1,299 @@
+"""Atomic seat holds for bus and flight seat maps, with expiry sweeping.
+
+The lock endpoints used to read each seat's availability row and then
+write it, with nothing in between stopping a second request: two users
+could both see a seat as free and both lock it, and two first-time locks
+inserted two rows for the same seat. Expired locks were only treated as
+free when read, so stale `locked` rows piled up.
+
+A hold now takes every requested seat in one atomic step:
+
+* rows that do not exist yet are inserted as `available` (the unique key
+  on schedule / date / seat turns a concurrent duplicate into a no-op);
+* one conditional UPDATE moves the rows to `locked` for this user, but
+  only those that are available, expired, or already held by the same
+  user. If it matches fewer rows than requested, the transaction is
+  rolled back and nothing is held. On MySQL the UPDATE's row locks order
+  concurrent holders; on SQLite the database write lock does, and an
+  in-process striped lock keeps threads of one worker holding the same
+  schedule from contending for it.
+
+A background sweeper deletes expired holds in batches (every
+SEAT_HOLD_SWEEP_SECONDS, default 30; 0 disables it). On MySQL it selects
+with `FOR UPDATE SKIP LOCKED`, so the sweepers of several workers never
+wait on each other or on a hold in progress.
+"""
+import asyncio
+import logging
+import os
+import threading
+import time
+import zlib
+from datetime import datetime, timedelta, timezone
+from typing import Any, Callable, Dict, Hashable, Iterable, List, NamedTuple, Optional, Sequence
+
+import anyio
+from sqlalchemy import and_, delete, or_, select, update
+from sqlalchemy.dialects.mysql import insert as mysql_insert
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+
+from seat_map import seat_maps
+
+logger = logging.getLogger(__name__)
+
+_SKIP_LOCKED_DIALECTS = {"mysql", "mariadb", "postgresql"}
+
+
+def utc_now() -> datetime:
+    return datetime.now(timezone.utc)
+
+
+def insert_ignore(dialect: str, table):
+    """INSERT that skips rows whose unique key already exists"""
+    if dialect in ("mysql", "mariadb"):
+        return mysql_insert(table).prefix_with("IGNORE")
+    if dialect == "postgresql":
+        return postgresql_insert(table).on_conflict_do_nothing()
+    return sqlite_insert(table).on_conflict_do_nothing()
+
+
+class SeatHoldTable(NamedTuple):
+    """A seat availability table; `scope` names the columns besides seat_id that key a row."""
+    kind: str
+    model: Any
+    scope: Sequence[str]
+    # Current time in the convention the table's locked_until uses (aware UTC or naive local)
+    clock: Callable[[], datetime]
+    # (scope values...) -> key of the cached SeatAvailabilityMap
+    map_key: Callable[..., Hashable]
+
+
+def _requested(table: SeatHoldTable, scope: Sequence[Any], seat_ids: List[int]):
+    """WHERE clause for the rows of `seat_ids` in `scope`"""
+    model = table.model
+    return and_(*(getattr(model, name) == value for name, value in zip(table.scope, scope)),
+                model.seat_id.in_(seat_ids))
+
+
+class SeatUnavailable(Exception):
+    """Some requested seats are booked or held by someone else; nothing was held."""
+
+    def __init__(self, seat_ids: List[int], booked: bool):
+        self.seat_ids = seat_ids
+        self.booked = booked
+        super().__init__("Seat already booked" if booked else "Seat is temporarily unavailable")
+
+
+class SeatHolds:
+    """Takes and sweeps seat holds on the registered availability tables."""
+
+    def __init__(self, stripes: int = 64, sweep_seconds: float = 30.0, sweep_batch: int = 500):
+        self.tables: Dict[str, SeatHoldTable] = {}
+        self._stripes = [threading.Lock() for _ in range(max(stripes, 1))]
+        self.sweep_seconds = sweep_seconds
+        self.sweep_batch = sweep_batch
+        self._sweeper = None
+        self._stats_lock = threading.Lock()
+        self.holds = 0
+        self.conflicts = 0
+        self.released = 0
+        self.sweeps = 0
+        self.last_sweep_ms = 0.0
+
+    def register(self, table: SeatHoldTable) -> None:
+        self.tables[table.kind] = table
+
+    def _stripe(self, kind: str, scope: Sequence[Any]) -> threading.Lock:
+        key = repr((kind, *scope)).encode()
+        return self._stripes[zlib.crc32(key) % len(self._stripes)]
+
+    def _count(self, name: str, n: int = 1) -> None:
+        with self._stats_lock:
+            setattr(self, name, getattr(self, name) + n)
+
+    # ----- holds ---------------------------------------------------------------
+
+    def hold(self, db, kind: str, scope: Sequence[Any], seat_ids: Iterable[int], user_id: str,
+             ttl: timedelta) -> datetime:
+        """Hold every seat in `seat_ids` for `user_id` until the returned time, or none of them.
+
+        Raises SeatUnavailable when a seat is booked or held by another user.
+        Commits `db` on success and rolls it back on failure.
+        """
+        table = self.tables[kind]
+        seat_ids = sorted(set(seat_ids))
+        if not seat_ids:
+            return table.clock() + ttl
+        requested = _requested(table, scope, seat_ids)
+        if db.get_bind().dialect.name == "sqlite":
+            with self._stripe(kind, scope):
+                until = self._hold(db, table, requested, scope, seat_ids, user_id, ttl)
+        else:
+            until = self._hold(db, table, requested, scope, seat_ids, user_id, ttl)
+        if until is None:
+            # Outside the stripe: after the rollback this needs a pooled connection of its own
+            self._count("conflicts")
+            error = self._unavailable(db, table, requested, table.clock(), user_id)
+            db.rollback()
+            raise error
+        self._count("holds")
+        key = table.map_key(*scope)
+        for seat_id in seat_ids:
+            seat_maps.update(key, seat_id, "locked", until, user_id)
+        return until
+
+    def _hold(self, db, table: SeatHoldTable, requested, scope, seat_ids, user_id, ttl) -> Optional[datetime]:
+        """Claim the seats and commit; None (rolled back) if any is not claimable"""
+        model = table.model
+        now = table.clock()
+        until = now + ttl
+        try:
+            self._ensure_rows(db, table, scope, seat_ids, requested)
+            claimable = or_(
+                model.status == "available",
+                and_(model.status == "locked",
+                     or_(model.locked_until.is_(None), model.locked_until <= now, model.locked_by == user_id)),
+            )
+            result = db.execute(
+                update(model).where(requested, claimable)
+                .values(status="locked", locked_by=user_id, locked_until=until)
+                .execution_options(synchronize_session=False)
+            )
+            if result.rowcount != len(seat_ids):
+                db.rollback()
+                return None
+            db.commit()
+            return until
+        except Exception:
+            db.rollback()
+            raise
+
+    def _ensure_rows(self, db, table: SeatHoldTable, scope, seat_ids, requested) -> None:
+        """Insert an `available` row for every requested seat that has none"""
+        model = table.model
+        present = set(db.execute(select(model.seat_id).where(requested)).scalars())
+        missing = [seat_id for seat_id in seat_ids if seat_id not in present]
+        if missing:
+            base = dict(zip(table.scope, scope), status="available")
+            db.execute(insert_ignore(db.get_bind().dialect.name, model.__table__),
+                       [dict(base, seat_id=seat_id) for seat_id in missing])
+
+    def mark_booked(self, db, kind: str, scope: Sequence[Any], seat_ids: Iterable[int], **values: Any) -> None:
+        """Set the seats' rows to `booked` (plus `values`) in the caller's transaction.
+
+        A fixed number of statements however many seats: one SELECT, at most
+        one multi-row INSERT and one UPDATE. The caller commits, then writes
+        the change through to the seat map.
+        """
+        table = self.tables[kind]
+        seat_ids = sorted(set(seat_ids))
+        if not seat_ids:
+            return
+        model = table.model
+        requested = _requested(table, scope, seat_ids)
+        self._ensure_rows(db, table, scope, seat_ids, requested)
+        db.execute(update(model).where(requested)
+                   .values(status="booked", locked_by=None, locked_until=None, **values)
+                   .execution_options(synchronize_session=False))
+
+    def _unavailable(self, db, table: SeatHoldTable, requested, now: datetime, user_id: str) -> SeatUnavailable:
+        model = table.model
+        rows = db.execute(select(model.seat_id, model.status, model.locked_until, model.locked_by)
+                          .where(requested)).all()
+        booked = [seat_id for seat_id, status, _, _ in rows if status not in ("available", "locked")]
+        held = [seat_id for seat_id, status, until, by in rows
+                if status == "locked" and until is not None and _after(until, now) and by != user_id]
+        return SeatUnavailable(sorted(booked or held), booked=bool(booked))
+
+    # ----- expiry sweeping -----------------------------------------------------
+
+    def sweep(self, session_factory) -> int:
+        """Delete every expired hold, `sweep_batch` rows per transaction; returns the count."""
+        start = time.perf_counter()
+        released = 0
+        for table in self.tables.values():
+            released += self._sweep_table(session_factory, table)
+        with self._stats_lock:
+            self.released += released
+            self.sweeps += 1
+            self.last_sweep_ms = round((time.perf_counter() - start) * 1000, 2)
+        return released
+
+    def _sweep_table(self, session_factory, table: SeatHoldTable) -> int:
+        model = table.model
+        scope_columns = [getattr(model, name) for name in table.scope]
+        released = 0
+        while True:
+            with session_factory() as db:
+                now = table.clock()
+                expired = and_(model.status == "locked", model.locked_until <= now)
+                query = select(model.id, *scope_columns).where(expired).limit(self.sweep_batch)
+                if db.get_bind().dialect.name in _SKIP_LOCKED_DIALECTS:
+                    query = query.with_for_update(skip_locked=True)
+                rows = db.execute(query).all()
+                if not rows:
+                    break
+                # Re-check expiry: a hold may have renewed a row since it was selected
+                result = db.execute(delete(model).where(model.id.in_([row[0] for row in rows]), expired)
+                                    .execution_options(synchronize_session=False))
+                db.commit()
+            released += result.rowcount
+            # Reload the affected cached maps rather than guess which rows went
+            for key in {table.map_key(*row[1:]) for row in rows}:
+                seat_maps.invalidate(key)
+            if len(rows) < self.sweep_batch:
+                break
+        return released
+
+    async def _sweep_forever(self, session_factory) -> None:
+        while True:
+            await asyncio.sleep(self.sweep_seconds)
+            try:
+                released = await anyio.to_thread.run_sync(self.sweep, session_factory)
+                if released:
+                    logger.info(f"Released {released} expired seat holds")
+            except Exception as e:
+                logger.warning(f"Seat hold sweep failed: {e}")
+
+    def start_sweeper(self, session_factory) -> None:
+        """Run `sweep` every sweep_seconds on the running event loop (no-op if disabled or running)."""
+        if self.sweep_seconds <= 0 or (self._sweeper is not None and not self._sweeper.done()):
+            return
+        self._sweeper = asyncio.ensure_future(self._sweep_forever(session_factory))
+
+    async def stop_sweeper(self) -> None:
+        if self._sweeper is not None:
+            self._sweeper.cancel()
+            try:
+                await self._sweeper
+            except asyncio.CancelledError:
+                pass
+            self._sweeper = None
+
+    def stats(self) -> Dict[str, Any]:
+        with self._stats_lock:
+            return {
+                "holds": self.holds,
+                "conflicts": self.conflicts,
+                "released": self.released,
+                "sweeps": self.sweeps,
+                "last_sweep_ms": self.last_sweep_ms,
+                "sweep_seconds": self.sweep_seconds,
+                "sweep_batch": self.sweep_batch,
+                "sweeper_running": self._sweeper is not None and not self._sweeper.done(),
+            }
+
+
+def _after(value: datetime, now: datetime) -> bool:
+    # Stored values come back naive from SQLite / MySQL even for timezone=True columns
+    if value.tzinfo is None and now.tzinfo is not None:
+        now = now.replace(tzinfo=None)
+    return value > now
+
+
+seat_holds = SeatHolds(
+    stripes=int(os.environ.get("SEAT_HOLD_STRIPES", "64")),
+    sweep_seconds=float(os.environ.get("SEAT_HOLD_SWEEP_SECONDS", "30")),
+    sweep_batch=int(os.environ.get("SEAT_HOLD_SWEEP_BATCH", "500")),
+)
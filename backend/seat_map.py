@@ -0,0 +1,138 @@
+"""Compact seat availability maps for bus and flight seat layouts.
+
+A map holds one status byte per seat of a (schedule, journey date) pair,
+indexed by the seat's position in the vehicle's seat list, plus a sparse
+table of lock expiries. Layout endpoints render from the map instead of
+querying the availability table once per seat, and the lock/book/cancel
+endpoints write their changes through so the cached map stays current.
+"""
+import os
+import threading
+import time
+from collections import OrderedDict
+from datetime import datetime, timezone
+from typing import Dict, Hashable, Iterable, Optional
+
+STATUS_AVAILABLE = 0
+STATUS_LOCKED = 1
+STATUS_BOOKED = 2
+STATUS_BLOCKED = 3
+
+STATUS_NAMES = ("available", "locked", "booked", "blocked")
+STATUS_CODES = {name: code for code, name in enumerate(STATUS_NAMES)}
+
+
+def _lock_active(lock_time: Optional[datetime]) -> bool:
+    """True while a lock has not expired (handles naive and aware datetimes)."""
+    if not lock_time:
+        return False
+    now = datetime.now(timezone.utc) if lock_time.tzinfo is not None else datetime.now()
+    return lock_time > now
+
+
+def bus_seat_map_key(schedule_id: int, journey_date: str) -> Hashable:
+    return ("bus", schedule_id, journey_date)
+
+
+def flight_seat_map_key(schedule_id: int) -> Hashable:
+    return ("flight", schedule_id, None)
+
+
+class SeatAvailabilityMap:
+    """Status codes for every seat of one schedule on one date."""
+
+    __slots__ = ("seat_index", "codes", "locked_until", "locked_by")
+
+    def __init__(self, seat_ids: Iterable[int]):
+        self.seat_index: Dict[int, int] = {seat_id: i for i, seat_id in enumerate(seat_ids)}
+        self.codes = bytearray(len(self.seat_index))
+        self.locked_until: Dict[int, datetime] = {}
+        self.locked_by: Dict[int, str] = {}
+
+    def covers(self, seat_ids: Iterable[int]) -> bool:
+        """True if every seat in `seat_ids` has a slot in this map."""
+        return all(seat_id in self.seat_index for seat_id in seat_ids)
+
+    def set(self, seat_id: int, status: str, locked_until: Optional[datetime] = None,
+            locked_by: Optional[str] = None) -> None:
+        idx = self.seat_index.get(seat_id)
+        if idx is None:
+            return
+        code = STATUS_CODES.get(status, STATUS_AVAILABLE)
+        self.codes[idx] = code
+        if code == STATUS_LOCKED:
+            self.locked_until[idx] = locked_until
+            self.locked_by[idx] = locked_by
+        else:
+            self.locked_until.pop(idx, None)
+            self.locked_by.pop(idx, None)
+
+    def status(self, seat_id: int) -> str:
+        """Effective status of a seat; expired locks read as available."""
+        idx = self.seat_index.get(seat_id)
+        if idx is None:
+            return "available"
+        code = self.codes[idx]
+        if code == STATUS_LOCKED and not _lock_active(self.locked_until.get(idx)):
+            return "available"
+        return STATUS_NAMES[code]
+
+    def count(self, *statuses: str) -> int:
+        """Number of seats whose effective status is one of `statuses`."""
+        return sum(1 for seat_id in self.seat_index if self.status(seat_id) in statuses)
+
+
+class SeatMapRegistry:
+    """Process-wide LRU of seat maps with a short TTL.
+
+    The TTL bounds how stale a map can get when another worker process
+    writes to the same schedule; within one process every write goes
+    through `update`, so reads never see stale data.
+    """
+
+    def __init__(self, max_entries: int = 2048, ttl_seconds: float = 30.0):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._entries: "OrderedDict[Hashable, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Optional[SeatAvailabilityMap]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            loaded_at, seat_map = entry
+            if time.monotonic() - loaded_at > self.ttl_seconds:
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return seat_map
+
+    def put(self, key: Hashable, seat_map: SeatAvailabilityMap) -> None:
+        with self._lock:
+            self._entries[key] = (time.monotonic(), seat_map)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def update(self, key: Hashable, seat_id: int, status: str,
+               locked_until: Optional[datetime] = None, locked_by: Optional[str] = None) -> None:
+        """Write a seat change through to a cached map (no-op if not cached)."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                entry[1].set(seat_id, status, locked_until, locked_by)
+
+    def invalidate(self, key: Hashable) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+seat_maps = SeatMapRegistry(
+    max_entries=int(os.environ.get("SEAT_MAP_MAX_ENTRIES", "2048")),
+    ttl_seconds=float(os.environ.get("SEAT_MAP_TTL_SECONDS", "30")),
+)
@@ -0,0 +1,173 @@
+"""Passwords, JWTs, field encryption and the current user / admin dependencies."""
+import hashlib
+import logging
+import os
+import threading
+from datetime import datetime, timedelta, timezone
+from typing import Optional
+
+from fastapi import Depends, HTTPException, status
+from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
+from jose import JWTError, jwt
+from passlib.context import CryptContext
+from sqlalchemy.orm import Session
+
+from auth_cache import auth_cache
+from database import get_db
+from models import AdminModel, UserModel
+from schemas import User
+
+
+# =============================
+# Encryption Utility (AES-256-GCM)
+# =============================
+ENCRYPTION_KEY = os.environ.get("ENCRYPTION_KEY")
+
+# Built on first use, like the other heavy dependencies: only KYC and payment fields are encrypted
+_fernet = None
+_fernet_lock = threading.Lock()
+
+
+def _get_fernet():
+    global _fernet, ENCRYPTION_KEY
+    if _fernet is not None:
+        return _fernet
+    # Locked so that concurrent first calls cannot each generate a different demo key
+    with _fernet_lock:
+        if _fernet is None:
+            from cryptography.fernet import Fernet
+            if not ENCRYPTION_KEY:
+                # Generate a key for demo purposes (store this in .env for production)
+                ENCRYPTION_KEY = Fernet.generate_key().decode()
+                logging.warning("No ENCRYPTION_KEY found in .env, using generated key (not persistent!)")
+            _fernet = Fernet(ENCRYPTION_KEY.encode() if isinstance(ENCRYPTION_KEY, str) else ENCRYPTION_KEY)
+        return _fernet
+
+def encrypt_field(plain_text: str) -> str:
+    """Encrypt sensitive field using Fernet (AES-128 CBC + HMAC)"""
+    if not plain_text:
+        return ""
+    return _get_fernet().encrypt(plain_text.encode()).decode()
+
+def decrypt_field(encrypted_text: str) -> str:
+    """Decrypt sensitive field"""
+    if not encrypted_text:
+        return ""
+    try:
+        return _get_fernet().decrypt(encrypted_text.encode()).decode()
+    except Exception:
+        return ""
+
+def hash_id_number(id_number: str, user_id: str) -> str:
+    """Hash ID number with user-specific salt"""
+    salt = f"{user_id}_wanderlite_salt"
+    return hashlib.sha256(f"{id_number}{salt}".encode()).hexdigest()
+
+
+# Authentication setup
+pwd_context = CryptContext(schemes=["pbkdf2_sha256"], deprecated="auto")
+
+SECRET_KEY = os.environ.get('SECRET_KEY', 'your-secret-key-here')
+ALGORITHM = "HS256"
+ACCESS_TOKEN_EXPIRE_MINUTES = 30
+
+security = HTTPBearer()
+
+# Authentication functions
+def verify_password(plain_password, hashed_password):
+    return pwd_context.verify(plain_password, hashed_password)
+
+def get_password_hash(password):
+    return pwd_context.hash(password)
+
+def create_access_token(data: dict, expires_delta: Optional[timedelta] = None):
+    to_encode = data.copy()
+    if expires_delta:
+        expire = datetime.utcnow() + expires_delta
+    else:
+        expire = datetime.utcnow() + timedelta(minutes=15)
+    to_encode.update({"exp": expire})
+    encoded_jwt = jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)
+    return encoded_jwt
+
+def get_current_user(
+    credentials: HTTPAuthorizationCredentials = Depends(security),
+    db: Session = Depends(get_db),
+):
+    credentials_exception = HTTPException(
+        status_code=status.HTTP_401_UNAUTHORIZED,
+        detail="Could not validate credentials",
+        headers={"WWW-Authenticate": "Bearer"},
+    )
+    cached = auth_cache.get(credentials.credentials)
+    if cached is not None:
+        return cached
+    try:
+        payload = jwt.decode(credentials.credentials, SECRET_KEY, algorithms=[ALGORITHM])
+        email: str = payload.get("sub")
+        if email is None:
+            raise credentials_exception
+    except JWTError:
+        raise credentials_exception
+
+    # Lookup user in the request's session (shared with the handler via get_db), then
+    # end the read so the connection goes back to the pool before the handler's thread hop
+    try:
+        user_row = db.query(UserModel).filter(UserModel.email == email).first()
+        if user_row is None:
+            raise credentials_exception
+        user = User(
+            id=user_row.id,
+            email=user_row.email,
+            username=user_row.username,
+            hashed_password=None,
+            created_at=user_row.created_at,
+            profile_image=None,
+        )
+    finally:
+        db.rollback()
+    auth_cache.put(credentials.credentials, user, payload.get("exp"))
+    return user
+
+ADMIN_SECRET_KEY = os.environ.get('ADMIN_SECRET_KEY', 'admin-super-secret-key-2025')
+
+
+def create_admin_token(admin_id: int, email: str, role: str) -> str:
+    """Create JWT token for admin"""
+    expire = datetime.now(timezone.utc) + timedelta(hours=8)
+    payload = {
+        "sub": str(admin_id),
+        "email": email,
+        "role": role,
+        "scope": "admin",
+        "exp": expire
+    }
+    return jwt.encode(payload, ADMIN_SECRET_KEY, algorithm=ALGORITHM)
+
+
+def verify_admin_token(credentials: HTTPAuthorizationCredentials = Depends(security)) -> dict:
+    """Verify admin JWT token"""
+    try:
+        payload = jwt.decode(credentials.credentials, ADMIN_SECRET_KEY, algorithms=[ALGORITHM])
+        if payload.get("scope") != "admin":
+            raise HTTPException(status_code=403, detail="Not an admin token")
+        return payload
+    except JWTError:
+        raise HTTPException(status_code=401, detail="Invalid admin credentials")
+
+
+def get_current_admin(
+    token_data: dict = Depends(verify_admin_token),
+    db: Session = Depends(get_db)
+) -> AdminModel:
+    """Get current admin from token (detached from the session, with its columns loaded)"""
+    # As in get_current_user: release the connection before the handler's thread hop
+    try:
+        admin = db.query(AdminModel).filter(AdminModel.id == int(token_data["sub"])).first()
+        if admin is not None:
+            db.expunge(admin)
+    finally:
+        db.rollback()
+    if not admin or not admin.is_active:
+        raise HTTPException(status_code=401, detail="Admin not found or inactive")
+    return admin